@@ -11,6 +11,8 @@ from google.adk.apps.app import App
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 
+from agents.adk_callbacks import attach_shared_cache
+
 logger = logging.getLogger(__name__)
 
 # ── App / runner config ───────────────────────────────────────────────────────
@@ -143,6 +145,7 @@ def get_or_build_document_runner(
             # It is also the cacheable-prefix variant for ContextCacheConfig.
             static_instruction=system_instruction,
             generate_content_config=gt.GenerateContentConfig(**gen_kwargs),
+            before_model_callback=attach_shared_cache,
         )
         app = App(
             name=APP_NAME,
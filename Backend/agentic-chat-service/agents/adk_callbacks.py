@@ -0,0 +1,32 @@
+"""Callbacks for the ADK document-chat agent (see ``adk_app``).
+
+Kept free of ADK imports so the request handling can be exercised without
+the ADK runtime; ``adk_app`` wires them into the agent.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+# Session-state key naming a live explicit cache built by another chat session
+# over the same (model, system prompt, files). Set per prompt through
+# ``Runner.run_async(state_delta=...)``; read by ``attach_shared_cache``.
+SHARED_CACHE_STATE_KEY = "shared_cache_name"
+
+
+def attach_shared_cache(callback_context: Any, llm_request: Any) -> None:
+    """before_model_callback: read the document from a shared explicit cache.
+
+    A prompt attached to another session's cache does not send the document
+    bytes, so the request must name that cache or the model answers without
+    the document. ADK's own cache for the session, once it has one, wins.
+    """
+    name = callback_context.state.get(SHARED_CACHE_STATE_KEY)
+    own = getattr(llm_request, "cache_metadata", None)
+    if not name or getattr(own, "cache_name", None):
+        return None
+    llm_request.config.cached_content = name
+    # The system instruction lives inside the cache; the API rejects both.
+    llm_request.config.system_instruction = None
+    if getattr(llm_request, "cache_config", None) is not None:
+        llm_request.cache_config = None  # don't build a second cache of the same prefix
+    return None
@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from starlette.requests import ClientDisconnect
 from fastapi.responses import JSONResponse, StreamingResponse
 
-from app.core.auth import get_current_user
+from app.core.auth import get_current_user, require_admin
 from app.core.config import get_settings
 from app.services.db import doc_conn
 from app.services.gemini_pricing import DEFAULT_CACHE_MODEL
@@ -463,6 +463,13 @@ async def cache_status(session_id: str, user: dict = Depends(get_current_user)):
     return {"success": True, "data": await gemini_cache_service.get_status(session_id, user["id"])}
 
 
+@router.get("/cache/savings")
+async def cache_savings(days: int = 7, user: dict = Depends(require_admin)):
+    """Daily savings from the shared Gemini cache registry (all users — admins only)."""
+    days = max(1, min(int(days), 90))
+    return {"success": True, "data": await gemini_cache_service.get_cache_savings(days)}
+
+
 @router.post("/cache/create")
 async def cache_create(request: Request, user: dict = Depends(get_current_user)):
     """Prime the ADK runner and explicitly create the cache immediately."""
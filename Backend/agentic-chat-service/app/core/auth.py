@@ -30,3 +30,9 @@ def get_current_user(
         "email": decoded.get("email"),
         "role": decoded.get("role") or "user",
     }
+
+
+def require_admin(user: dict = Depends(get_current_user)) -> dict:
+    if user.get("role") != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return user
@@ -75,6 +75,19 @@ class Settings(BaseSettings):
     context_cache_ttl_seconds: int = Field(
         default=300, validation_alias=AliasChoices("CONTEXT_CACHE_TTL_SECONDS", "GEMINI_CACHE_TTL_SECONDS")
     )
+    # Ceiling for the cost-aware TTL slide: a cache with a high hit rate is
+    # kept alive in TTL steps up to this while its hits outweigh its storage.
+    context_cache_max_ttl_seconds: int = Field(
+        default=3600, validation_alias=AliasChoices("CONTEXT_CACHE_MAX_TTL_SECONDS")
+    )
+    # Cache registry: hit-rate window and the total cached-token budget above
+    # which unreferenced caches are evicted, lowest value first.
+    context_cache_hit_window_seconds: int = Field(
+        default=3600, validation_alias=AliasChoices("CONTEXT_CACHE_HIT_WINDOW_SECONDS")
+    )
+    context_cache_registry_max_tokens: int = Field(
+        default=20_000_000, validation_alias=AliasChoices("CONTEXT_CACHE_REGISTRY_MAX_TOKENS")
+    )
 
 
 @lru_cache
@@ -519,7 +519,9 @@ async def stream_document_chat(ctx: dict[str, Any]) -> AsyncIterator[str]:
         # GCS fallback below fetches the bytes itself.
         file_specs = []
         if not use_claude and not disable_cache:
-            cache_is_active = await gemini_cache_service.has_active_cache(primary_file)
+            cache_is_active = await gemini_cache_service.has_active_cache(
+                primary_file, model_name=cache_model, system_instruction=system, file_ids=file_ids
+            )
             if not cache_is_active:
                 for f in files:
                     file_specs.append(
@@ -595,6 +597,7 @@ async def stream_document_chat(ctx: dict[str, Any]) -> AsyncIterator[str]:
                         model_name=cache_model,
                         llm_config=llm_req,
                         chat_session_id=final_session,
+                        file_ids=file_ids,
                     )
                 ):
                     yield line
@@ -0,0 +1,141 @@
+"""One-time parse of a sectioned draft, shared by the deterministic checks.
+
+``draft_invariants.run_all()`` runs twenty-odd checks and
+``drafting_service._structural_lint`` several more over the same compiled
+sections. Each used to re-join the sections, re-find sections by heading
+keyword and rescan every section with its own regexes for paragraph numbers,
+annexure marks, dates and table rows. A ``DraftIndex`` is built once per
+draft and memoizes those scans, so N checks cost one parse per distinct scan:
+
+- section-by-kind lookup   — ``find`` (first section whose heading contains
+  a keyword), ``body_scope``, ``ordered`` (positions sorted by ``index``);
+- per-section scans        — ``matches`` (any compiled pattern, e.g. the
+  paragraph-number map or annexure marks), ``paragraphs``, ``dates``,
+  ``table_rows``, ``table_blocks``;
+- whole-draft views        — ``text`` / ``lower`` joined with a separator.
+
+Section contents are captured when the index is built; rebuild it after
+editing sections. No LLM calls and no service imports — pure parsing.
+"""
+from __future__ import annotations
+
+import re
+from functools import cached_property
+from typing import Any, Callable, Optional, Union
+
+from app.services.draft_facts import _PARA_NUM_RE
+
+_MONTHS = {m: i + 1 for i, m in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"])}
+_DATE_RE = re.compile(
+    r"\b(\d{1,2})(?:st|nd|rd|th)?[-\s/.]*(?:day of\s+)?"
+    r"(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*[-\s/.,]*(\d{4})\b",
+    re.I,
+)
+_ATTESTATION_KEYWORDS = ("statement of truth", "affidavit", "vakalat")
+# 'Exhibit P-#' marks — the invariants and the structural lint both flag them
+# next to 'ANNEXURE P-#', so they share one scan.
+_EXHIBIT_RE = re.compile(r"\bEXHIBIT\s+P-?\d+", re.I)
+
+
+def _parse_dates(text: str) -> list[tuple[int, int, int]]:
+    out = []
+    for d, mon, y in _DATE_RE.findall(text or ""):
+        try:
+            out.append((int(y), _MONTHS[mon.lower()[:3]], int(d)))
+        except (KeyError, ValueError):
+            continue
+    return out
+
+
+class DraftIndex:
+    """Memoized scans over one snapshot of a draft's sections."""
+
+    def __init__(self, sections: list[dict[str, Any]]) -> None:
+        self.sections = list(sections)
+        self.contents = [s.get("content") or "" for s in self.sections]
+        self.headings = [str(s.get("heading", "")).lower() for s in self.sections]
+        self._memo: dict[Any, Any] = {}
+
+    @classmethod
+    def of(cls, sections: Union["DraftIndex", list[dict[str, Any]]]) -> "DraftIndex":
+        """``sections`` itself when already indexed, else a fresh index."""
+        return sections if isinstance(sections, DraftIndex) else cls(sections)
+
+    def __len__(self) -> int:
+        return len(self.sections)
+
+    def _get(self, key: Any, build: Callable[[], Any]) -> Any:
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = build()
+            return value
+
+    # ── Section lookup ──────────────────────────────────────────────────────
+
+    @cached_property
+    def ordered(self) -> list[int]:
+        """Section positions in ``index`` order (stable for ties)."""
+        return sorted(range(len(self.sections)), key=lambda i: self.sections[i].get("index", 0))
+
+    def body_scope(self, i: int) -> bool:
+        """Section ``i`` is body text, not an attestation (SoT / affidavit / vakalatnama)."""
+        return not any(k in self.headings[i] for k in _ATTESTATION_KEYWORDS)
+
+    def find(self, *keywords: str) -> Optional[int]:
+        """Position of the first section whose lowercased heading contains any of ``keywords``."""
+        def _build() -> Optional[int]:
+            for i, heading in enumerate(self.headings):
+                if any(k in heading for k in keywords):
+                    return i
+            return None
+
+        return self._get(("find", keywords), _build)
+
+    # ── Per-section scans ───────────────────────────────────────────────────
+
+    def matches(self, i: int, pattern: re.Pattern[str]) -> list[re.Match[str]]:
+        """All ``pattern`` matches in section ``i``."""
+        return self._get(("matches", pattern, i), lambda: list(pattern.finditer(self.contents[i])))
+
+    def paragraphs(self, i: int) -> list[re.Match[str]]:
+        """Numbered-paragraph lines of section ``i`` (group 1 main, group 2 sub)."""
+        return self.matches(i, _PARA_NUM_RE)
+
+    def dates(self, i: int) -> list[tuple[int, int, int]]:
+        """(year, month, day) of every spelled-month date in section ``i``."""
+        return self._get(("dates", i), lambda: _parse_dates(self.contents[i]))
+
+    def table_rows(self, i: int) -> list[str]:
+        """Lines of section ``i`` that are markdown table rows."""
+        return self._get(
+            ("rows", i), lambda: [ln for ln in self.contents[i].splitlines() if ln.strip().startswith("|")]
+        )
+
+    def table_blocks(self, i: int) -> list[list[str]]:
+        """Table rows of each blank-line-separated block of section ``i`` (≥1 row)."""
+        def _build() -> list[list[str]]:
+            if not self.table_rows(i):
+                return []
+            blocks = []
+            for block in re.split(r"\n\s*\n", self.contents[i]):
+                rows = [ln for ln in block.splitlines() if ln.strip().startswith("|")]
+                if rows:
+                    blocks.append(rows)
+            return blocks
+
+        return self._get(("blocks", i), _build)
+
+    # ── Whole-draft views ───────────────────────────────────────────────────
+
+    def text(self, sep: str = "\n") -> str:
+        """All section contents joined with ``sep``."""
+        return self._get(("text", sep), lambda: sep.join(self.contents))
+
+    def lower(self, sep: str = "\n") -> str:
+        return self._get(("lower", sep), lambda: self.text(sep).lower())
+
+    def search(self, pattern: re.Pattern[str], sep: str = "\n") -> Optional[re.Match[str]]:
+        """First ``pattern`` match in ``text(sep)``."""
+        return self._get(("search", pattern, sep), lambda: pattern.search(self.text(sep)))
@@ -13,25 +13,23 @@ assertion over the compiled draft. Used two ways:
 
 Each check returns a list of human-readable issue strings (empty = pass).
 Checks are heuristic-tolerant: they prefer false negatives over false
-positives, because a noisy gate gets ignored.
+positives, because a noisy gate gets ignored. They read the draft through a
+``DraftIndex`` (``draft_index.py``), so ``run_all()`` parses it once.
 """
 from __future__ import annotations
 
 import re
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Union
+
+from app.services.draft_index import _EXHIBIT_RE, DraftIndex, _parse_dates
+
+# Checks take the sections or a prebuilt DraftIndex of them; run_all() builds
+# the index once and hands it to every check.
+Sections = Union[list[dict], DraftIndex]
 
-_PARA_RE = re.compile(r"(?m)^\s{0,8}(\d{1,3})(?:\.(\d{1,2}))?[.)]\s")
 _LETTER_RE = re.compile(r"(?m)^\s{0,8}\(([a-z])\)\s")
 _ANNEX_RE = re.compile(r"ANNEXURE\s+P-(\d+)", re.I)
-_EXHIBIT_RE = re.compile(r"\bEXHIBIT\s+P-?\d+", re.I)
-
-_MONTHS = {m: i + 1 for i, m in enumerate(
-    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"])}
-_DATE_RE = re.compile(
-    r"\b(\d{1,2})(?:st|nd|rd|th)?[-\s/.]*(?:day of\s+)?"
-    r"(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*[-\s/.,]*(\d{4})\b",
-    re.I,
-)
+_PLACEHOLDER_RE = re.compile(r"\[DATA NOT PROVIDED:[^\]]*\]", re.I)
 
 ARGUMENTATIVE_WORDS = ("vague", "unsubstantiated", "malafide", "mala fide",
                        "frivolous", "dishonest", "blatant")
@@ -39,42 +37,19 @@ URGENCY_PHRASES = ("defeat the decree", "dissipat", "alienat", "irreparable",
                    "attachment before judgment", "court receiver")
 
 
-def _heading(s: dict) -> str:
-    return str(s.get("heading", "")).lower()
-
-
-def _body_scope(s: dict) -> bool:
-    return not any(k in _heading(s) for k in ("statement of truth", "affidavit", "vakalat"))
-
-
-def _find_section(sections: list[dict], *keywords: str) -> Optional[dict]:
-    for s in sections:
-        if any(k in _heading(s) for k in keywords):
-            return s
-    return None
-
-
-def _parse_dates(text: str) -> list[tuple[int, int, int]]:
-    out = []
-    for d, mon, y in _DATE_RE.findall(text or ""):
-        try:
-            out.append((int(y), _MONTHS[mon.lower()[:3]], int(d)))
-        except (KeyError, ValueError):
-            continue
-    return out
-
-
 # ── Numbering ──────────────────────────────────────────────────────────────
 
-def check_unique_paragraph_numbers(sections: list[dict], digest: str = "") -> list[str]:
+def check_unique_paragraph_numbers(sections: Sections, digest: str = "") -> list[str]:
     """No main paragraph number used twice across the body scope."""
+    idx = DraftIndex.of(sections)
     seen: dict[str, str] = {}
     issues = []
-    for s in sorted(sections, key=lambda x: x.get("index", 0)):
-        if not _body_scope(s):
+    for i in idx.ordered:
+        if not idx.body_scope(i):
             continue
+        s = idx.sections[i]
         local_seen: set[str] = set()
-        for m in _PARA_RE.finditer(s.get("content") or ""):
+        for m in idx.paragraphs(i):
             token = f"{m.group(1)}.{m.group(2)}" if m.group(2) else m.group(1)
             if token in local_seen:
                 continue
@@ -85,23 +60,25 @@ def check_unique_paragraph_numbers(sections: list[dict], digest: str = "") -> li
     return issues
 
 
-def check_attestation_restarts(sections: list[dict], digest: str = "") -> list[str]:
+def check_attestation_restarts(sections: Sections, digest: str = "") -> list[str]:
     """Statement of Truth / affidavit numbering restarts at 1."""
+    idx = DraftIndex.of(sections)
     issues = []
-    for s in sections:
-        if _body_scope(s):
+    for i, s in enumerate(idx.sections):
+        if idx.body_scope(i):
             continue
-        nums = [int(m.group(1)) for m in _PARA_RE.finditer(s.get("content") or "")]
+        nums = [int(m.group(1)) for m in idx.paragraphs(i)]
         if nums and nums[0] != 1:
             issues.append(f"attestation '{s.get('heading')}' starts numbering at {nums[0]}, not 1")
     return issues
 
 
-def check_prayer_letters_contiguous(sections: list[dict], digest: str = "") -> list[str]:
+def check_prayer_letters_contiguous(sections: Sections, digest: str = "") -> list[str]:
     """Lettered sub-clauses run (a),(b),(c)… without gaps."""
+    idx = DraftIndex.of(sections)
     issues = []
-    for s in sections:
-        letters = _LETTER_RE.findall(s.get("content") or "")
+    for pos, s in enumerate(idx.sections):
+        letters = [m.group(1) for m in idx.matches(pos, _LETTER_RE)]
         if len(letters) < 2:
             continue
         ascending = all(letters[i] < letters[i + 1] for i in range(len(letters) - 1))
@@ -113,32 +90,36 @@ def check_prayer_letters_contiguous(sections: list[dict], digest: str = "") -> l
 
 # ── Exhibits ───────────────────────────────────────────────────────────────
 
-def check_annexure_series_contiguous(sections: list[dict], digest: str = "") -> list[str]:
+def check_annexure_series_contiguous(sections: Sections, digest: str = "") -> list[str]:
+    idx = DraftIndex.of(sections)
     nums = set()
-    for s in sections:
-        nums.update(int(n) for n in _ANNEX_RE.findall(s.get("content") or ""))
+    for i in range(len(idx)):
+        nums.update(int(m.group(1)) for m in idx.matches(i, _ANNEX_RE))
     if not nums:
         return []
     missing = [str(n) for n in range(1, max(nums) + 1) if n not in nums]
     return [f"annexure series gaps: missing P-{', P-'.join(missing)}"] if missing else []
 
 
-def check_single_exhibit_terminology(sections: list[dict], digest: str = "") -> list[str]:
-    full = "\n".join(s.get("content") or "" for s in sections)
-    if _ANNEX_RE.search(full) and _EXHIBIT_RE.search(full):
+def check_single_exhibit_terminology(sections: Sections, digest: str = "") -> list[str]:
+    idx = DraftIndex.of(sections)
+    if idx.search(_ANNEX_RE) and idx.search(_EXHIBIT_RE):
         return ["mixed exhibit terminology: both 'ANNEXURE P-#' and 'Exhibit P-#' used"]
     return []
 
 
-def check_single_mark_per_document(sections: list[dict], digest: str = "") -> list[str]:
+_CODE_RE = re.compile(r"\b[A-Z]{2,}[A-Z0-9]*(?:[/-][A-Z0-9]{2,}){1,6}\b")
+
+
+def check_single_mark_per_document(sections: Sections, digest: str = "") -> list[str]:
     """No strong reference code (invoice/PO number) introduced under two marks."""
-    code_re = re.compile(r"\b[A-Z]{2,}[A-Z0-9]*(?:[/-][A-Z0-9]{2,}){1,6}\b")
+    idx = DraftIndex.of(sections)
     code_marks: dict[str, set[int]] = {}
-    for s in sorted(sections, key=lambda x: x.get("index", 0)):
-        text = s.get("content") or ""
-        for m in _ANNEX_RE.finditer(text):
+    for i in idx.ordered:
+        text = idx.contents[i]
+        for m in idx.matches(i, _ANNEX_RE):
             window = text[max(0, m.start() - 160):m.start()].upper()
-            for code in code_re.findall(window):
+            for code in _CODE_RE.findall(window):
                 if code.startswith(("ANNEXURE", "P-")):
                     continue
                 code_marks.setdefault(code, set()).add(int(m.group(1)))
@@ -148,10 +129,11 @@ def check_single_mark_per_document(sections: list[dict], digest: str = "") -> li
     ]
 
 
-def check_one_document_per_mark(sections: list[dict], digest: str = "") -> list[str]:
+def check_one_document_per_mark(sections: Sections, digest: str = "") -> list[str]:
     """Each mark is introduced at most once — in prose AND in table exhibit
     columns. Colly exemption is per-context (near the mark), not document-wide."""
-    text = "\n\n".join(s.get("content") or "" for s in sections)
+    idx = DraftIndex.of(sections)
+    text = idx.text("\n\n")
     issues: list[str] = []
     firsts = [
         m for m in re.finditer(
@@ -168,19 +150,19 @@ def check_one_document_per_mark(sections: list[dict], digest: str = "") -> list[
     ]
     # Table exhibit-column collisions: same mark on >=2 rows with different codes.
     row_mark = re.compile(r"\b(?:ANNEXURE|EXHIBIT)?\s*([A-Z]{1,2}[-\u2011]\d{1,3})\b")
-    code_re = re.compile(r"\b[A-Z]{2,}[A-Z0-9]*(?:[/-][A-Z0-9]{2,}){1,6}\b")
     mark_sets: dict[str, list[frozenset]] = {}
-    for ln in text.splitlines():
-        s = ln.strip()
-        if not s.startswith("|") or set(s) <= set("|-: ") or "colly" in s.lower():
-            continue
-        marks = {m.replace("\u2011", "-").upper() for m in row_mark.findall(s)}
-        if not marks:
-            continue
-        codes = frozenset(c for c in code_re.findall(s.upper())
-                          if not re.fullmatch(r"[A-Z]{1,2}-\d{1,3}", c))
-        for m in marks:
-            mark_sets.setdefault(m, []).append(codes)
+    for i in range(len(idx)):
+        for ln in idx.table_rows(i):
+            s = ln.strip()
+            if set(s) <= set("|-: ") or "colly" in s.lower():
+                continue
+            marks = {m.replace("\u2011", "-").upper() for m in row_mark.findall(s)}
+            if not marks:
+                continue
+            codes = frozenset(c for c in _CODE_RE.findall(s.upper())
+                              if not re.fullmatch(r"[A-Z]{1,2}-\d{1,3}", c))
+            for m in marks:
+                mark_sets.setdefault(m, []).append(codes)
     for m, sets in mark_sets.items():
         if len(sets) < 2:
             continue
@@ -192,13 +174,12 @@ def check_one_document_per_mark(sections: list[dict], digest: str = "") -> list[
 
 # ── Tables ─────────────────────────────────────────────────────────────────
 
-def check_no_notice_in_invoice_table(sections: list[dict], digest: str = "") -> list[str]:
+def check_no_notice_in_invoice_table(sections: Sections, digest: str = "") -> list[str]:
     """A legal notice / demand letter must not appear as an invoice-table row."""
+    idx = DraftIndex.of(sections)
     issues = []
-    for s in sections:
-        text = s.get("content") or ""
-        for tbl in re.split(r"\n\s*\n", text):
-            lines = [ln for ln in tbl.splitlines() if ln.strip().startswith("|")]
+    for i, s in enumerate(idx.sections):
+        for lines in idx.table_blocks(i):
             if len(lines) < 3:
                 continue
             header = lines[0].lower()
@@ -211,13 +192,13 @@ def check_no_notice_in_invoice_table(sections: list[dict], digest: str = "") ->
     return issues
 
 
-def check_chronology_neutral(sections: list[dict], digest: str = "") -> list[str]:
+def check_chronology_neutral(sections: Sections, digest: str = "") -> list[str]:
+    idx = DraftIndex.of(sections)
     issues = []
-    for s in sections:
-        if not any(k in _heading(s) for k in ("dates and events", "chronology")):
+    for i, heading in enumerate(idx.headings):
+        if not any(k in heading for k in ("dates and events", "chronology")):
             continue
-        rows = [ln for ln in (s.get("content") or "").splitlines() if ln.strip().startswith("|")]
-        for row in rows:
+        for row in idx.table_rows(i):
             low = row.lower()
             hits = [w for w in ARGUMENTATIVE_WORDS if w in low]
             if hits:
@@ -225,10 +206,11 @@ def check_chronology_neutral(sections: list[dict], digest: str = "") -> list[str
     return issues
 
 
-def check_no_empty_cells(sections: list[dict], digest: str = "") -> list[str]:
+def check_no_empty_cells(sections: Sections, digest: str = "") -> list[str]:
+    idx = DraftIndex.of(sections)
     issues = []
-    for s in sections:
-        rows = [ln for ln in (s.get("content") or "").splitlines() if ln.strip().startswith("|")]
+    for i, s in enumerate(idx.sections):
+        rows = idx.table_rows(i)
         for row in rows[2:] if len(rows) > 2 else []:
             cells = [c.strip() for c in row.strip().strip("|").split("|")]
             if any(c == "" for c in cells):
@@ -244,22 +226,24 @@ def _extract_ranges(text: str) -> list[tuple[int, int]]:
             re.findall(r"paragraphs?\s+(\d+)\s*(?:to|through|-|–)\s*(\d+)", text or "", re.I)]
 
 
-def check_verification_matches_statement_of_truth(sections: list[dict], digest: str = "") -> list[str]:
-    ver = _find_section(sections, "verification")
-    sot = _find_section(sections, "statement of truth")
-    if not ver or not sot:
+def check_verification_matches_statement_of_truth(sections: Sections, digest: str = "") -> list[str]:
+    idx = DraftIndex.of(sections)
+    ver = idx.find("verification")
+    sot = idx.find("statement of truth")
+    if ver is None or sot is None:
         return []
-    rv, rs = _extract_ranges(ver.get("content", "")), _extract_ranges(sot.get("content", ""))
+    rv, rs = _extract_ranges(idx.contents[ver]), _extract_ranges(idx.contents[sot])
     if rv and rs and set(rv) != set(rs):
         return [f"verification ranges {rv} != statement-of-truth ranges {rs}"]
     return []
 
 
-def check_12a_not_in_cause_of_action(sections: list[dict], digest: str = "") -> list[str]:
-    coa = _find_section(sections, "cause of action")
-    if not coa:
+def check_12a_not_in_cause_of_action(sections: Sections, digest: str = "") -> list[str]:
+    idx = DraftIndex.of(sections)
+    coa = idx.find("cause of action")
+    if coa is None:
         return []
-    text = coa.get("content", "")
+    text = idx.contents[coa]
     for m in re.finditer(r"12A", text):
         ctx = text[max(0, m.start() - 200):m.end() + 200].lower()
         # Allowed: limitation-exclusion computation. Forbidden: pleaded as accrual.
@@ -269,9 +253,8 @@ def check_12a_not_in_cause_of_action(sections: list[dict], digest: str = "") ->
     return []
 
 
-def check_interim_relief_coherence(sections: list[dict], digest: str = "") -> list[str]:
-    full = "\n".join(s.get("content") or "" for s in sections)
-    low = full.lower()
+def check_interim_relief_coherence(sections: Sections, digest: str = "") -> list[str]:
+    low = DraftIndex.of(sections).lower()
     declines = "no urgent interim relief" in low or "no interim relief is sought" in low or \
                "no interim relief is being sought" in low
     argues = any(p in low for p in URGENCY_PHRASES)
@@ -280,17 +263,18 @@ def check_interim_relief_coherence(sections: list[dict], digest: str = "") -> li
     return []
 
 
-def check_attestation_dates_order(sections: list[dict], digest: str = "") -> list[str]:
+def check_attestation_dates_order(sections: Sections, digest: str = "") -> list[str]:
     """No verification/attestation may be dated before any document it relies on."""
     doc_dates = _parse_dates(digest)
     if not doc_dates:
         return []
     latest_doc = max(doc_dates)
+    idx = DraftIndex.of(sections)
     issues = []
-    for s in sections:
-        if _body_scope(s) and "verification" not in _heading(s):
+    for i, s in enumerate(idx.sections):
+        if idx.body_scope(i) and "verification" not in idx.headings[i]:
             continue
-        att_dates = _parse_dates(s.get("content") or "")
+        att_dates = idx.dates(i)
         if att_dates and max(att_dates) < latest_doc:
             issues.append(
                 f"attestation '{s.get('heading')}' dated {max(att_dates)} predates the latest "
@@ -299,24 +283,26 @@ def check_attestation_dates_order(sections: list[dict], digest: str = "") -> lis
     return issues
 
 
-def check_no_data_not_provided_for_registered_docs(sections: list[dict], digest: str = "") -> list[str]:
-    lod = _find_section(sections, "list of documents", "index of documents", "accompanying")
-    if not lod:
+def check_no_data_not_provided_for_registered_docs(sections: Sections, digest: str = "") -> list[str]:
+    idx = DraftIndex.of(sections)
+    lod = idx.find("list of documents", "index of documents", "accompanying")
+    if lod is None:
         return []
     issues = []
-    for ln in (lod.get("content") or "").splitlines():
-        if ln.strip().startswith("|") and "data not provided" in ln.lower() \
+    for ln in idx.table_rows(lod):
+        if "data not provided" in ln.lower() \
                 and _ANNEX_RE.search(ln) is None and "annexure" in ln.lower():
             issues.append(f"List of Documents row unresolved: {ln.strip()[:70]}")
     return issues
 
 
-def check_relief_has_placeholders(sections: list[dict], digest: str = "") -> list[str]:
+def check_relief_has_placeholders(sections: Sections, digest: str = "") -> list[str]:
     """Relief/prayer sections must not contain [DATA NOT PROVIDED] markers."""
-    relief = _find_section(sections, "prayer", "relief", "order sought", "remedy")
-    if not relief:
+    idx = DraftIndex.of(sections)
+    relief = idx.find("prayer", "relief", "order sought", "remedy")
+    if relief is None:
         return []
-    if re.search(r"\[DATA NOT PROVIDED:[^\]]*\]", relief.get("content") or "", re.I):
+    if _PLACEHOLDER_RE.search(idx.contents[relief]):
         return ["relief/prayer contains unresolved [DATA NOT PROVIDED] placeholder(s)"]
     return []
 
@@ -325,14 +311,15 @@ def check_relief_has_placeholders(sections: list[dict], digest: str = "") -> lis
 check_prayer_has_placeholders = check_relief_has_placeholders
 
 
-def check_slash_option_menu_unnarrowed(sections: list[dict], digest: str = "") -> list[str]:
+def check_slash_option_menu_unnarrowed(sections: Sections, digest: str = "") -> list[str]:
     """Slash-separated option menus in caption should be narrowed when relief omits extras."""
-    full = "\n".join(s.get("content") or "" for s in sections)
+    idx = DraftIndex.of(sections)
+    full = idx.text()
     head = full[:5000]
     if not any(line.count("/") >= 2 for line in head.splitlines()):
         return []
-    relief = _find_section(sections, "prayer", "relief", "order sought")
-    pl = (relief.get("content") or "").lower() if relief else _relief_zone_from_text(full)
+    relief = idx.find("prayer", "relief", "order sought")
+    pl = idx.contents[relief].lower() if relief is not None else _relief_zone_from_text(full)
     if not pl:
         return []
     for line in head.splitlines():
@@ -363,12 +350,11 @@ def _relief_zone_from_text(text: str) -> str:
 check_generic_slash_relief_title = check_slash_option_menu_unnarrowed
 
 
-def check_caption_duplication(sections: list[dict], digest: str = "") -> list[str]:
+def check_caption_duplication(sections: Sections, digest: str = "") -> list[str]:
     """Caption must not repeat VERSUS/AND/BETWEEN separator lines."""
-    ct = _find_section(sections, "cause title", "court", "suit no", "caption", "title page")
-    text = ct.get("content") or "" if ct else "\n".join(
-        (s.get("content") or "")[:2000] for s in sections[:3]
-    )
+    idx = DraftIndex.of(sections)
+    ct = idx.find("cause title", "court", "suit no", "caption", "title page")
+    text = idx.contents[ct] if ct is not None else "\n".join(c[:2000] for c in idx.contents[:3])
     up = text.upper()
     if up.count("VERSUS") > 1 or up.count(" BETWEEN ") > 1:
         return ["caption repeats party separator — blocks duplicated"]
@@ -379,7 +365,7 @@ def check_caption_duplication(sections: list[dict], digest: str = "") -> list[st
 check_cause_title_duplication = check_caption_duplication
 
 
-def check_chronology_complete(sections: list[dict], digest: str = "") -> list[str]:
+def check_chronology_complete(sections: Sections, digest: str = "") -> list[str]:
     """Every inventory matrix row should appear in a chronology table."""
     matrix: dict[int, str] = {}
     for m in re.finditer(r"(?m)^\|\s*(\d+)\.?\s*\|(.+)$", digest or ""):
@@ -389,9 +375,9 @@ def check_chronology_complete(sections: list[dict], digest: str = "") -> list[st
             continue
     if not matrix:
         return []
-    chrono = _find_section(sections, "dates and events", "list of dates", "chronolog", "timeline")
-    body = chrono.get("content") or "" if chrono else "\n".join(s.get("content") or "" for s in sections)
-    body_l = body.lower()
+    idx = DraftIndex.of(sections)
+    chrono = idx.find("dates and events", "list of dates", "chronolog", "timeline")
+    body_l = idx.contents[chrono].lower() if chrono is not None else idx.lower()
     missing: list[str] = []
     for sn, row in sorted(matrix.items()):
         cells = [c.strip() for c in row.strip().strip("|").split("|")]
@@ -409,15 +395,15 @@ def check_chronology_complete(sections: list[dict], digest: str = "") -> list[st
     return []
 
 
-def check_no_unresolved_placeholders(sections: list[dict], digest: str = "") -> list[str]:
-    full = "\n".join(s.get("content") or "" for s in sections)
+def check_no_unresolved_placeholders(sections: Sections, digest: str = "") -> list[str]:
+    full = DraftIndex.of(sections).text()
     n = len(re.findall(r"\[DATA NOT PROVIDED:[^\]]*\]|\[MISSING:[^\]]*\]", full, re.I))
     if n:
         return [f"{n} unresolved [DATA NOT PROVIDED] / [MISSING] marker(s) remain"]
     return []
 
 
-def check_no_cross_field_literal_collision(sections: list[dict], digest: str = "") -> list[str]:
+def check_no_cross_field_literal_collision(sections: Sections, digest: str = "") -> list[str]:
     """Flag draft literals attached to a different inventory field than their source.
 
     Classic case: draft says 'Companies Act, 2020' while inventory only has 2020 under
@@ -429,12 +415,11 @@ def check_no_cross_field_literal_collision(sections: list[dict], digest: str = "
         from app.services.draft_provenance import detect_cross_field_collisions
     except Exception:
         return []
-    full = "\n".join(s.get("content") or "" for s in sections)
-    hits = detect_cross_field_collisions(full, digest)
+    hits = detect_cross_field_collisions(DraftIndex.of(sections).text(), digest)
     return [h["problem"] for h in hits]
 
 
-def check_unsafe_admissions(sections: list[dict], digest: str = "") -> list[str]:
+def check_unsafe_admissions(sections: Sections, digest: str = "") -> list[str]:
     """Unsafe 'admitted' language when liability/obligations were denied."""
     digest_l = (digest or "").lower()
     denied = any(
@@ -447,8 +432,7 @@ def check_unsafe_admissions(sections: list[dict], digest: str = "") -> list[str]
     )
     if not denied:
         return []
-    full = "\n".join(s.get("content") or "" for s in sections).lower()
-    if re.search(r"\badmitted\s+(dues|amount|liability|obligation)\b", full):
+    if re.search(r"\badmitted\s+(dues|amount|liability|obligation)\b", DraftIndex.of(sections).lower()):
         return ["uses 'admitted' for dues/amount/liability although disputed in source documents"]
     return []
 
@@ -459,7 +443,7 @@ check_unsafe_admitted_dues = check_unsafe_admissions
 
 # ── Registry / scorecard ───────────────────────────────────────────────────
 
-ALL_CHECKS: dict[str, Callable[[list[dict], str], list[str]]] = {
+ALL_CHECKS: dict[str, Callable[[Sections, str], list[str]]] = {
     "one_document_per_mark": check_one_document_per_mark,
     "unique_paragraph_numbers": check_unique_paragraph_numbers,
     "attestation_restarts": check_attestation_restarts,
@@ -490,12 +474,13 @@ ALL_CHECKS: dict[str, Callable[[list[dict], str], list[str]]] = {
 }
 
 
-def run_all(sections: list[dict[str, Any]], digest: str = "") -> dict[str, Any]:
-    """Run every invariant; return the per-draft defect scorecard."""
+def run_all(sections: Sections, digest: str = "") -> dict[str, Any]:
+    """Run every invariant over one shared DraftIndex; return the per-draft defect scorecard."""
+    idx = DraftIndex.of(sections)
     results: dict[str, list[str]] = {}
     for name, fn in ALL_CHECKS.items():
         try:
-            issues = fn(sections, digest)
+            issues = fn(idx, digest)
         except Exception as exc:  # a broken check must never break a draft
             issues = [f"check crashed: {exc}"]
         if issues:
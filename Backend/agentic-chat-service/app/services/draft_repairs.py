@@ -7,6 +7,9 @@ continuous body renumbering, verification/statement-of-truth rebuild and
 more. Order is semantics: structural deletions run BEFORE renumbering so the
 attestation ranges are computed from the final paragraph layout; the
 annexure renumber and List-of-Documents rebuild each intentionally run twice.
+The chain is the ``_REPAIR_PASSES`` table; passes share full-text scans
+(paragraph lines, body bounds, heading offsets) through a per-text index
+and report their wall time in ``info["repair_timings_ms"]``.
 
 Also home to the deterministic post-draft lints (``_factual_strength_lint``,
 ``_table_mark_collisions``) that queue findings for the revision pass.
@@ -18,7 +21,12 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, Optional
+import threading
+import time
+from bisect import bisect_right
+from itertools import accumulate
+from operator import add
+from typing import Any, Callable, NamedTuple, Optional
 
 from app.services.draft_facts import (
     _build_doc_state,
@@ -35,6 +43,45 @@ logger = logging.getLogger(__name__)
 _PARA_LINE_FULL_RE = re.compile(r"(?m)^(\s{0,8})(\d{1,3})(?:\.(\d{1,2}))?([.)])(\s)")
 
 
+class _TextIndex:
+    """Full-text scans of ONE draft version, shared by the repair passes.
+
+    Most passes leave the draft untouched, so the paragraph-line matches,
+    body bounds and heading positions one pass computes are reused by the
+    next instead of rescanning the whole draft. Keyed on the exact text: a
+    pass that changes the draft gets a fresh index on its next lookup.
+    """
+
+    __slots__ = ("text", "_memo")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._memo: dict[Any, Any] = {}
+
+    def get(self, key: Any, build: Callable[[str], Any]) -> Any:
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = build(self.text)
+            return value
+
+
+_index_local = threading.local()
+
+
+def _text_index(text: str) -> _TextIndex:
+    idx = getattr(_index_local, "index", None)
+    if idx is None or (idx.text is not text and idx.text != text):
+        idx = _TextIndex(text)
+        _index_local.index = idx
+    return idx
+
+
+def _para_line_matches(text: str) -> list[re.Match[str]]:
+    """All numbered-paragraph line matches of ``text`` (shared per text version)."""
+    return _text_index(text).get("para_lines", lambda t: list(_PARA_LINE_FULL_RE.finditer(t)))
+
+
 _PARA_REF_RE = re.compile(r"\b([Pp]aragraphs?\s+)((?:\d+(?:\.\d+)?)(?:\s*(?:,|and|to|–|-)\s*\d+(?:\.\d+)?)*)")
 
 
@@ -165,14 +212,59 @@ def _norm_caption_line(ln: str) -> str:
 
 def _shingle_containment(sample: str, corpus: str, size: int = 8, step: int = 4) -> float:
     """Fraction of `sample`'s normalized `size`-word shingles present in `corpus`."""
-    s_words = re.sub(r"[^a-z0-9]+", " ", (sample or "").lower()).split()
     c_norm = " ".join(re.sub(r"[^a-z0-9]+", " ", (corpus or "").lower()).split())
+    return _containment(sample, lambda s: s in c_norm, size, step)
+
+
+def _containment(sample: str, present: Callable[[str], bool], size: int, step: int) -> float:
+    s_words = re.sub(r"[^a-z0-9]+", " ", (sample or "").lower()).split()
     if not s_words:
         return 0.0
     if len(s_words) < size:
-        return 1.0 if " ".join(s_words) in c_norm else 0.0
+        return 1.0 if present(" ".join(s_words)) else 0.0
     shingles = [" ".join(s_words[i:i + size]) for i in range(0, len(s_words) - size + 1, step)]
-    return sum(1 for s in shingles if s in c_norm) / len(shingles)
+    return sum(1 for s in shingles if present(s)) / len(shingles)
+
+
+class _NormalizedPrefixes:
+    """`_shingle_containment` corpora for every prefix ``text[:pos]`` of one text.
+
+    The text is lowercased and tokenized once; the normalized form of any
+    prefix is then a prefix of the joined tokens (plus the cut-off part of a
+    token straddling ``pos``), so probing many restart candidates no longer
+    re-normalizes the whole document for each one. Texts whose lowercase
+    form changes length (e.g. 'İ') use the direct computation.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        low = text.lower()
+        self.exact = len(low) == len(text)
+        if not self.exact:
+            return
+        self.low = low
+        # Alternating alnum / non-alnum runs; every step below stays in C.
+        runs = re.findall(r"[a-z0-9]+|[^a-z0-9]+", low)
+        first = 0 if runs and re.match(r"[a-z0-9]", runs[0]) else 1
+        bounds = list(accumulate(map(len, runs)))
+        self.words: list[str] = runs[first::2]
+        self.ends: list[int] = bounds[first::2]
+        self.norm = " ".join(self.words)
+        self.norm_ends = list(map(add, accumulate(map(len, self.words)), range(len(self.words))))
+
+    def containment(self, sample: str, pos: int, size: int = 8, step: int = 4) -> float:
+        """``_shingle_containment(sample, text[:pos], size, step)``."""
+        if not self.exact:
+            return _shingle_containment(sample, self.text[:pos], size, step)
+        k = bisect_right(self.ends, pos)  # tokens wholly inside text[:pos]
+        limit = self.norm_ends[k - 1] if k else 0
+        start = self.ends[k] - len(self.words[k]) if k < len(self.words) else pos
+        if start < pos:  # token cut at pos
+            head = self.norm[:limit]
+            c_norm = (head + " " if head else "") + self.low[start:pos]
+            return _containment(sample, lambda s: s in c_norm, size, step)
+        norm = self.norm
+        return _containment(sample, lambda s: norm.find(s, 0, limit) != -1, size, step)
 
 
 def _strip_restarted_document(text: str) -> tuple[str, int]:
@@ -209,6 +301,7 @@ def _strip_restarted_document(text: str) -> tuple[str, int]:
         if len(matches) < 2:
             break
         opening_has_head = bool(re.search(_HEAD_RE, text[:400]))
+        prefixes: Optional[_NormalizedPrefixes] = None
         cut_at = None
         for m in matches[1:]:
             pos = m.start()
@@ -229,7 +322,9 @@ def _strip_restarted_document(text: str) -> tuple[str, int]:
             # Near a protected heading demand near-verbatim replay; elsewhere
             # the looser 0.6 bar catches lightly reworded restarts.
             bar = 0.9 if guarded else 0.6
-            if _shingle_containment(sample, text[:pos]) >= bar:
+            if prefixes is None:
+                prefixes = _NormalizedPrefixes(text)
+            if prefixes.containment(sample, pos) >= bar:
                 cut_at = pos
                 break
         if cut_at is None:
@@ -407,36 +502,51 @@ def _sanitize_statute_years(text: str, facts_digest: str = "") -> tuple[str, boo
     return new, new != text
 
 
+# Cheap necessary conditions for the `_fix_deponent_age_placeholder` rewrites:
+# each substitution below can only match where its gate does, so a draft
+# without e.g. "aged ," skips the (slow, unanchored) pattern entirely.
+_DNP_GATE_RE = re.compile(r"\[DATA NOT PROVIDED:", re.I)
+_AGED_DNP_GATE_RE = re.compile(r"aged\s*\[DATA NOT PROVIDED:", re.I)
+_AGED_COMMA_GATE_RE = re.compile(r"aged\s*,", re.I)
+_DESIGNATION_GATE_RE = re.compile(r"designation", re.I)
+_SWORN_LINE_GATE_RE = re.compile(r"(?im)^(?:Place|Dated?)\s*:?\s*(?:$|\[DATA NOT PROVIDED:)")
+
+
 def _fix_deponent_age_placeholder(text: str) -> tuple[str, bool]:
     """Neutralize missing age/designation/date slots in sworn / signature blocks."""
     new = text
-    # aged [DATA NOT PROVIDED: …] → drop the aged clause (age unknown)
-    new = re.sub(
-        r",?\s*aged\s*\[DATA NOT PROVIDED:\s*[^\]]*\]",
-        "",
-        new,
-        flags=re.I,
-    )
-    new = re.sub(
-        r"\[DATA NOT PROVIDED:\s*(?:Deponent Age|Age of Deponent|Signatory Age|"
-        r"Age|Designation|Deponent Designation|Signatory Designation|"
-        r"Date|Dated|Verification Date|Place)[^\]]*\]",
-        "____",
-        new,
-        flags=re.I,
-    )
+    if _DNP_GATE_RE.search(new):
+        if _AGED_DNP_GATE_RE.search(new):
+            # aged [DATA NOT PROVIDED: …] → drop the aged clause (age unknown)
+            new = re.sub(
+                r",?\s*aged\s*\[DATA NOT PROVIDED:\s*[^\]]*\]",
+                "",
+                new,
+                flags=re.I,
+            )
+        new = re.sub(
+            r"\[DATA NOT PROVIDED:\s*(?:Deponent Age|Age of Deponent|Signatory Age|"
+            r"Age|Designation|Deponent Designation|Signatory Designation|"
+            r"Date|Dated|Verification Date|Place)[^\]]*\]",
+            "____",
+            new,
+            flags=re.I,
+        )
     # Common sworn blanks left empty mid-sentence: "aged ," / "designation ,"
-    new = re.sub(r",?\s*aged\s*,", ",", new, flags=re.I)
-    new = re.sub(
-        r"(designation\s*(?:of\s*)?(?:the\s+)?(?:deponent|signatory)?\s*:?\s*),",
-        r"\1____,",
-        new,
-        flags=re.I,
-    )
-    new = re.sub(r"(?im)^(Place\s*:?\s*)$", r"\1 ____", new)
-    new = re.sub(r"(?im)^(Dated?\s*:?\s*)$", r"\1 ____", new)
-    new = re.sub(r"(?im)^(Place\s*:?\s*)\[DATA NOT PROVIDED:[^\]]*\]", r"\1____", new)
-    new = re.sub(r"(?im)^(Dated?\s*:?\s*)\[DATA NOT PROVIDED:[^\]]*\]", r"\1____", new)
+    if _AGED_COMMA_GATE_RE.search(new):
+        new = re.sub(r",?\s*aged\s*,", ",", new, flags=re.I)
+    if _DESIGNATION_GATE_RE.search(new):
+        new = re.sub(
+            r"(designation\s*(?:of\s*)?(?:the\s+)?(?:deponent|signatory)?\s*:?\s*),",
+            r"\1____,",
+            new,
+            flags=re.I,
+        )
+    if _SWORN_LINE_GATE_RE.search(new):
+        new = re.sub(r"(?im)^(Place\s*:?\s*)$", r"\1 ____", new)
+        new = re.sub(r"(?im)^(Dated?\s*:?\s*)$", r"\1 ____", new)
+        new = re.sub(r"(?im)^(Place\s*:?\s*)\[DATA NOT PROVIDED:[^\]]*\]", r"\1____", new)
+        new = re.sub(r"(?im)^(Dated?\s*:?\s*)\[DATA NOT PROVIDED:[^\]]*\]", r"\1____", new)
     return new, new != text
 
 
@@ -676,7 +786,7 @@ _CORRUPT_TABLE_LINE_RE = re.compile(
 
 def _paragraph_span(text: str, para_num: int) -> Optional[tuple[int, int]]:
     """Return [start, end) of numbered paragraph para_num through next main para/heading."""
-    matches = list(_PARA_LINE_FULL_RE.finditer(text))
+    matches = _para_line_matches(text)
     for i, m in enumerate(matches):
         if int(m.group(2)) != para_num or m.group(3):
             continue
@@ -698,12 +808,27 @@ def _paragraph_span(text: str, para_num: int) -> Optional[tuple[int, int]]:
     return None
 
 
+# Unanchored superset of every note pattern below, matched against the
+# lowercased draft: no hit means no note paragraph, so the per-paragraph scan
+# is skipped. Not used when the draft has a character that only matches an
+# ASCII letter case-insensitively (long s, Kelvin sign, dotted/dotless i).
+_NOTE_GATE_RE = re.compile(
+    r"note|todo\s*:|fixme\s*:|as\s+an?\s+ai|i\s+should|the\s+model\s+should|"
+    r"placeholder\s+paragraph|do\s+not\s+file|for\s+internal\s+use|review\s+comment|"
+    r"internal\s+comment|this\s+paragraph|not\s+part\s+of\s+the\s+plaint"
+)
+_CASEFOLD_ODD_CHARS = ("\u017f", "\u212a", "\u0131", "\u0130")
+
+
 def _remove_internal_note_paragraphs(text: str) -> tuple[str, list[int]]:
     """Delete paragraphs that are drafting/internal meta-notes (e.g. para 22 notes)."""
     if not text:
         return text or "", []
+    low = _text_index(text).get("lower", _lower_same_offsets)
+    if low is not None and not _NOTE_GATE_RE.search(low):
+        return text, []
     removed: list[int] = []
-    matches = list(_PARA_LINE_FULL_RE.finditer(text))
+    matches = _para_line_matches(text)
     # Walk backwards so indices stay valid
     for i in range(len(matches) - 1, -1, -1):
         m = matches[i]
@@ -797,10 +922,14 @@ def _remove_corrupted_tables(text: str) -> tuple[str, int]:
 
 def _body_region_bounds(text: str) -> tuple[int, int]:
     """Body numbered paragraphs: first main para → before prayer/verification/SoT/LoD."""
-    first = _PARA_LINE_FULL_RE.search(text)
-    if not first:
+    return _text_index(text).get("body_bounds", _scan_body_region_bounds)
+
+
+def _scan_body_region_bounds(text: str) -> tuple[int, int]:
+    matches = _para_line_matches(text)
+    if not matches:
         return 0, 0
-    start = first.start()
+    start = matches[0].start()
     end_m = re.search(
         r"(?im)^[ \t]*(?:\*\*)?(?:PRAYER|VERIFICATION|STATEMENT\s+OF\s+TRUTH|"
         r"LIST\s+OF\s+DOCUMENTS|SCHEDULE\s+[A-Z])\b",
@@ -1291,8 +1420,28 @@ def _find_markdown_table_span(text: str, start: int) -> Optional[tuple[int, int,
 
 
 def _find_region_after_heading(text: str, heading_re: re.Pattern[str]) -> int:
-    m = heading_re.search(text)
-    return m.start() if m else -1
+    idx = _text_index(text)
+
+    def _scan(t: str) -> int:
+        # The heading patterns are lowercase '(?is)' alternations; against the
+        # lowercased draft the case-sensitive twin finds the same offset
+        # several times faster.
+        body = heading_re.pattern[5:]
+        low = idx.get("lower", _lower_same_offsets)
+        if low is not None and heading_re.pattern.startswith("(?is)") and body == body.lower():
+            m = re.compile("(?s)" + body).search(low)
+        else:
+            m = heading_re.search(t)
+        return m.start() if m else -1
+
+    return idx.get(("heading", heading_re.pattern, heading_re.flags), _scan)
+
+
+def _lower_same_offsets(text: str) -> Optional[str]:
+    """``text.lower()`` when it keeps every offset and ASCII case match intact."""
+    if any(c in text for c in _CASEFOLD_ODD_CHARS):
+        return None
+    return text.lower()
 
 
 def _chrono_row_present(date_tok: str, partic: str, table_body: str) -> bool:
@@ -1601,172 +1750,148 @@ def _strip_inventory_source_mentions(text: str) -> tuple[str, int]:
     return new, count
 
 
-def _monolithic_deterministic_repairs(
-    text: str,
-    facts_digest: str = "",
-    exhibit_register: Optional[list[dict[str, str]]] = None,
-    user_instructions: str = "",
-) -> tuple[str, dict[str, Any]]:
-    """Chain all zero-LLM monolithic repairs; return (text, info dict)."""
-    info: dict[str, Any] = {}
-    # Claude often emits ATX '# heading' markers — strip before other repairs
+class _RepairContext(NamedTuple):
+    facts_digest: str
+    exhibit_register: Optional[list[dict[str, str]]]
+    user_instructions: str
+
+
+class _RepairPass(NamedTuple):
+    """One step of the monolithic repair chain.
+
+    ``run(text, ctx)`` returns (text, result); a truthy result is recorded
+    under ``info_key`` — as ``True`` when ``flag`` is set, else verbatim.
+    """
+
+    name: str
+    info_key: str
+    run: Callable[[str, _RepairContext], tuple[str, Any]]
+    flag: bool = False
+
+
+def _pass_markdown_artifacts(text: str, ctx: _RepairContext) -> tuple[str, bool]:
     cleaned = _strip_markdown_artifacts(text)
-    if cleaned != text:
-        info["markdown_artifacts_stripped"] = True
-    text = cleaned
+    return cleaned, cleaned != text
 
-    # Whole-document restart dedup FIRST — every later repair (numbering,
-    # annexures, LoD) must operate on a single copy of the document.
-    new_txt, restarts = _strip_restarted_document(text)
-    if restarts:
-        info["restarted_copies_removed"] = restarts
-    text = new_txt
-
-    new_txt, removed_notes = _remove_internal_note_paragraphs(text)
-    if removed_notes:
-        info["internal_notes_removed"] = removed_notes
-    text = new_txt
-
-    new_txt, corrupt_n = _remove_corrupted_tables(text)
-    if corrupt_n:
-        info["corrupted_tables_removed"] = corrupt_n
-    text = new_txt
-
-    new_txt, changed = _dedupe_cause_title(text)
-    if changed:
-        info["cause_title_deduped"] = True
-    text = new_txt
-
-    new_txt, changed = _narrow_slash_option_menus(text, facts_digest, user_instructions)
-    if changed:
-        info["option_menu_narrowed"] = True
-    text = new_txt
-
-    new_txt, changed = _fix_admitted_dues_wording(text, facts_digest)
-    if changed:
-        info["admitted_dues_fixed"] = True
-    text = new_txt
-
-    new_txt, changed = _sanitize_statute_years(text, facts_digest)
-    if changed:
-        info["statute_year_fixed"] = True
-    text = new_txt
 
+def _pass_field_swaps(text: str, ctx: _RepairContext) -> tuple[str, Any]:
     # Field-swap Act years (Companies Act, 2020 ← Date of Incorporation) — free
     try:
         from app.services.draft_provenance import fix_cross_field_act_years
-        new_txt, swaps = fix_cross_field_act_years(text, facts_digest)
-        if swaps:
-            info["field_swaps_fixed"] = swaps
-        text = new_txt
+        return fix_cross_field_act_years(text, ctx.facts_digest)
     except Exception as exc:
         logger.debug("Field-swap fix skipped: %s", exc)
+        return text, None
 
-    new_txt, changed = _fix_proceedings_placeholder(text)
-    if changed:
-        info["proceedings_placeholder_fixed"] = True
-    text = new_txt
-
-    new_txt, changed = _fix_deponent_age_placeholder(text)
-    if changed:
-        info["deponent_age_fixed"] = True
-    text = new_txt
-
-    new_txt, changed = _fix_unsupported_authorized_signatory(text, facts_digest)
-    if changed:
-        info["unauthorized_signatory_fixed"] = True
-    text = new_txt
-
-    new_txt, changed = _ensure_company_registration_in_body(text, facts_digest)
-    if changed:
-        info["company_registration_added"] = True
-    text = new_txt
-
-    new_txt, annex_info = _renumber_annexures(text)
-    if annex_info:
-        info["annexures"] = annex_info
-    text = new_txt
-
-    new_txt, removed_clauses = _reconcile_interim_relief_extended(text)
-    if removed_clauses:
-        info["interim_prayers_removed"] = removed_clauses
-    text = new_txt
-
-    new_txt, removed_ph = _strip_prayer_placeholders(text)
-    if removed_ph:
-        info["prayer_placeholders_removed"] = removed_ph
-    text = new_txt
-
-    new_txt, missing_events = _merge_chronology_from_digest(text, facts_digest)
-    if missing_events:
-        info["chronology_rows_added"] = missing_events
-    text = new_txt
 
-    # Body numbering AFTER structural deletions so Verification ranges are final
-    new_txt, changed = _renumber_body_paragraphs_continuous(text)
-    if changed:
-        info["body_renumbered"] = True
-    text = new_txt
-
-    new_txt, lod_changed = _rebuild_list_of_documents(text, facts_digest)
-    if lod_changed:
-        info["lod_rebuilt"] = True
-    text = new_txt
-
-    reg = exhibit_register or (_plan_exhibits(facts_digest) if facts_digest else [])
-    new_txt, cite_count = _polish_exhibit_citations(text, facts_digest, reg)
-    if cite_count:
-        info["exhibit_citations_added"] = cite_count
-    text = new_txt
+def _pass_exhibit_citations(text: str, ctx: _RepairContext) -> tuple[str, int]:
+    digest = ctx.facts_digest
+    reg = ctx.exhibit_register or (_plan_exhibits(digest) if digest else [])
+    return _polish_exhibit_citations(text, digest, reg)
 
-    # Polish can re-introduce colliding marks — compact again
-    new_txt, annex_info2 = _renumber_annexures(text)
-    if annex_info2:
-        info["annexures"] = annex_info2
-    text = new_txt
 
+_REPAIR_PASSES: tuple[_RepairPass, ...] = (
+    # Claude often emits ATX '# heading' markers — strip before other repairs
+    _RepairPass("markdown_artifacts", "markdown_artifacts_stripped", _pass_markdown_artifacts, flag=True),
+    # Whole-document restart dedup FIRST — every later repair (numbering,
+    # annexures, LoD) must operate on a single copy of the document.
+    _RepairPass("restarted_document", "restarted_copies_removed", lambda t, c: _strip_restarted_document(t)),
+    _RepairPass("internal_notes", "internal_notes_removed", lambda t, c: _remove_internal_note_paragraphs(t)),
+    _RepairPass("corrupted_tables", "corrupted_tables_removed", lambda t, c: _remove_corrupted_tables(t)),
+    _RepairPass("cause_title", "cause_title_deduped", lambda t, c: _dedupe_cause_title(t), flag=True),
+    _RepairPass(
+        "option_menus",
+        "option_menu_narrowed",
+        lambda t, c: _narrow_slash_option_menus(t, c.facts_digest, c.user_instructions),
+        flag=True,
+    ),
+    _RepairPass(
+        "admitted_dues", "admitted_dues_fixed", lambda t, c: _fix_admitted_dues_wording(t, c.facts_digest), flag=True
+    ),
+    _RepairPass("statute_years", "statute_year_fixed", lambda t, c: _sanitize_statute_years(t, c.facts_digest), flag=True),
+    _RepairPass("field_swaps", "field_swaps_fixed", _pass_field_swaps),
+    _RepairPass(
+        "proceedings_placeholder",
+        "proceedings_placeholder_fixed",
+        lambda t, c: _fix_proceedings_placeholder(t),
+        flag=True,
+    ),
+    _RepairPass("deponent_age", "deponent_age_fixed", lambda t, c: _fix_deponent_age_placeholder(t), flag=True),
+    _RepairPass(
+        "authorized_signatory",
+        "unauthorized_signatory_fixed",
+        lambda t, c: _fix_unsupported_authorized_signatory(t, c.facts_digest),
+        flag=True,
+    ),
+    _RepairPass(
+        "company_registration",
+        "company_registration_added",
+        lambda t, c: _ensure_company_registration_in_body(t, c.facts_digest),
+        flag=True,
+    ),
+    _RepairPass("annexures", "annexures", lambda t, c: _renumber_annexures(t)),
+    _RepairPass("interim_relief", "interim_prayers_removed", lambda t, c: _reconcile_interim_relief_extended(t)),
+    _RepairPass("prayer_placeholders", "prayer_placeholders_removed", lambda t, c: _strip_prayer_placeholders(t)),
+    _RepairPass(
+        "chronology", "chronology_rows_added", lambda t, c: _merge_chronology_from_digest(t, c.facts_digest)
+    ),
+    # Body numbering AFTER structural deletions so Verification ranges are final
+    _RepairPass("body_numbering", "body_renumbered", lambda t, c: _renumber_body_paragraphs_continuous(t), flag=True),
+    _RepairPass("list_of_documents", "lod_rebuilt", lambda t, c: _rebuild_list_of_documents(t, c.facts_digest), flag=True),
+    _RepairPass("exhibit_citations", "exhibit_citations_added", _pass_exhibit_citations),
+    # Polish can re-introduce colliding marks — compact again
+    _RepairPass("annexures#2", "annexures", lambda t, c: _renumber_annexures(t)),
     # LoD again so register matches final marks (incl. missing Co. Registration)
-    new_txt, lod_changed2 = _rebuild_list_of_documents(text, facts_digest)
-    if lod_changed2:
-        info["lod_rebuilt"] = True
-    text = new_txt
-
-    new_txt, resolved = _resolve_remaining_placeholders(text, facts_digest)
-    if resolved:
-        info["placeholders_resolved"] = resolved
-    text = new_txt
-
-    new_txt, sworn_fixed = _strip_all_sworn_placeholders(text)
-    if sworn_fixed:
-        info["sworn_placeholders_neutralized"] = sworn_fixed
-    text = new_txt
-
-    new_txt, changed = _fix_deponent_age_placeholder(text)
-    if changed:
-        info["deponent_age_fixed"] = True
-    text = new_txt
-
+    _RepairPass(
+        "list_of_documents#2", "lod_rebuilt", lambda t, c: _rebuild_list_of_documents(t, c.facts_digest), flag=True
+    ),
+    _RepairPass(
+        "remaining_placeholders",
+        "placeholders_resolved",
+        lambda t, c: _resolve_remaining_placeholders(t, c.facts_digest),
+    ),
+    _RepairPass("sworn_placeholders", "sworn_placeholders_neutralized", lambda t, c: _strip_all_sworn_placeholders(t)),
+    _RepairPass("deponent_age#2", "deponent_age_fixed", lambda t, c: _fix_deponent_age_placeholder(t), flag=True),
     # Final body renumber (in case LoD/polish shifted nothing but notes removed earlier)
-    new_txt, changed = _renumber_body_paragraphs_continuous(text)
-    if changed:
-        info["body_renumbered"] = True
-    text = new_txt
-
-    new_txt, changed = _rebuild_verification_and_sot(text)
-    if changed:
-        info["attestation_rebuilt"] = True
-    text = new_txt
-
-    new_txt, changed = _restart_inline_attestation_numbering(text)
-    if changed:
-        info["attestation_renumbered"] = True
-    text = new_txt
-
-    new_txt, src_stripped = _strip_inventory_source_mentions(text)
-    if src_stripped:
-        info["source_mentions_stripped"] = src_stripped
-    text = new_txt
+    _RepairPass(
+        "body_numbering#2", "body_renumbered", lambda t, c: _renumber_body_paragraphs_continuous(t), flag=True
+    ),
+    _RepairPass("attestation", "attestation_rebuilt", lambda t, c: _rebuild_verification_and_sot(t), flag=True),
+    _RepairPass(
+        "attestation_numbering",
+        "attestation_renumbered",
+        lambda t, c: _restart_inline_attestation_numbering(t),
+        flag=True,
+    ),
+    _RepairPass("source_mentions", "source_mentions_stripped", lambda t, c: _strip_inventory_source_mentions(t)),
+)
+
+
+def _monolithic_deterministic_repairs(
+    text: str,
+    facts_digest: str = "",
+    exhibit_register: Optional[list[dict[str, str]]] = None,
+    user_instructions: str = "",
+) -> tuple[str, dict[str, Any]]:
+    """Chain all zero-LLM monolithic repairs; return (text, info dict).
 
+    Runs `_REPAIR_PASSES` in order. Passes share full-text scans through
+    `_text_index` while the draft is unchanged; per-pass wall time lands in
+    ``info["repair_timings_ms"]``.
+    """
+    info: dict[str, Any] = {}
+    timings: dict[str, float] = {}
+    ctx = _RepairContext(facts_digest, exhibit_register, user_instructions)
+    try:
+        for step in _REPAIR_PASSES:
+            t0 = time.perf_counter()
+            text, result = step.run(text, ctx)
+            timings[step.name] = round((time.perf_counter() - t0) * 1000, 3)
+            if result:
+                info[step.info_key] = True if step.flag else result
+    finally:
+        _index_local.index = None  # don't pin the last draft to this thread
+    info["repair_timings_ms"] = timings
     return text, info
 
 
@@ -54,7 +54,6 @@ from app.services.drafting_strategies import (
 )
 from app.services.draft_facts import (
     _ANNEXURE_RE,
-    _PARA_NUM_RE,
     _build_doc_state,
     _build_factual_manifest,
     _extract_matrix_rows,
@@ -70,6 +69,7 @@ from app.services.draft_repairs import (
     _monolithic_deterministic_repairs,
     _table_mark_collisions,
 )
+from app.services.draft_index import _EXHIBIT_RE, DraftIndex
 from app.services.draft_grounded_extraction import (
     extract_grounded_fields,
     render_verified_fields_block,
@@ -83,6 +83,7 @@ from app.services.drafting_strategy_base import DraftMetadata
 from app.services.gcs_service import download_object_buffer, upload_file_to_gcs
 from app.services.llm_service import build_model_list
 from app.services.llm_usage_service import log_llm_usage
+from app.services.stream_pump import StreamPump
 
 logger = logging.getLogger(__name__)
 
@@ -831,42 +832,37 @@ async def _iter_gemini_draft_chunks(
     *,
     max_retries: int = 3,
 ) -> AsyncIterator[dict[str, Any]]:
-    """Stream one Gemini call; yields chunk dicts then a terminal ``done`` event."""
-
-    def _pull_chunk(iterator):
-        try:
-            return next(iterator)
-        except StopIteration:
-            return None
+    """Stream one Gemini call; yields chunk dicts then a terminal ``done`` event.
 
+    The SDK iterator is drained on a ``StreamPump`` thread (``loop`` is kept
+    for the ``iter_chunks`` signature the strategies call).
+    """
     last_err: Exception | None = None
     for attempt in range(max_retries):
         yielded_any = False
+        # Watchdog: a hung connection here used to block FOREVER — the
+        # "blinking cursor, no text, indefinitely" stall. Now it aborts
+        # and the caller falls to the next model in the chain.
+        pump = StreamPump(
+            lambda m=model, c=contents, cfg=config: client.models.generate_content_stream(
+                model=m, contents=c, config=cfg
+            ),
+            label=f"draft {model} attempt={attempt + 1}",
+            idle_timeout=DRAFT_STREAM_INACTIVITY_S,
+        )
         try:
-            sync_iter = await loop.run_in_executor(
-                None,
-                lambda m=model, c=contents, cfg=config: client.models.generate_content_stream(
-                    model=m, contents=c, config=cfg
-                ),
-            )
             finish_reason = None
             last_usage: dict[str, int] | None = None
             while True:
-                # Watchdog: a hung connection here used to block FOREVER — the
-                # "blinking cursor, no text, indefinitely" stall. Now it aborts
-                # and the caller falls to the next model in the chain.
                 try:
-                    chunk = await asyncio.wait_for(
-                        loop.run_in_executor(None, _pull_chunk, sync_iter),
-                        timeout=DRAFT_STREAM_INACTIVITY_S,
-                    )
+                    chunk = await pump.__anext__()
+                except StopAsyncIteration:
+                    break
                 except asyncio.TimeoutError:
                     raise RuntimeError(
                         f"Gemini stream stalled — no data for {DRAFT_STREAM_INACTIVITY_S}s "
                         f"(model={model})"
                     ) from None
-                if chunk is None:
-                    break
                 raw = getattr(chunk, "text", None) or ""
                 if raw:
                     yielded_any = True
@@ -893,6 +889,8 @@ async def _iter_gemini_draft_chunks(
                 await asyncio.sleep(wait_s)
                 continue
             raise
+        finally:
+            await pump.aclose()
     raise RuntimeError(f"Gemini stream failed after {max_retries} attempts: {last_err}")
 
 
@@ -1330,23 +1328,27 @@ def _delete_paragraph_containing(text: str, quote: str) -> Optional[str]:
     return (text[:start].rstrip() + "\n\n" + text[end:].lstrip()).strip()
 
 
-def _structural_lint(all_secs: list[dict[str, Any]]) -> list[Any]:
+_ANNEXURE_P_RE = re.compile(r"\bANNEXURE\s+P-?\d+", re.I)
+
+
+def _structural_lint(all_secs: list[dict[str, Any]] | DraftIndex) -> list[Any]:
     """Deterministic (non-LLM) structural checks on the compiled draft.
 
     Catches the review defects prompting alone can't guarantee away:
     duplicate paragraph numbers, annexure marks referenced but never annexed,
     and gaps in the annexure series. Findings feed the same repair loop as
-    grounding-audit violations.
+    grounding-audit violations. Scans come from a shared `DraftIndex`.
     """
     from app.services.drafting_schemas import GroundingViolation
 
+    idx = DraftIndex.of(all_secs)
     findings: list[Any] = []
 
     # ── Numbering: exact duplicate paragraph-number tokens across the draft ──
     token_locations: dict[str, list[str]] = {}
-    for s in sorted(all_secs, key=lambda x: x.get("index", 0)):
-        sid = str(s.get("section_id"))
-        for m in _PARA_NUM_RE.finditer(s.get("content") or ""):
+    for i in idx.ordered:
+        sid = str(idx.sections[i].get("section_id"))
+        for m in idx.paragraphs(i):
             token = f"{m.group(1)}.{m.group(2)}" if m.group(2) else m.group(1)
             token_locations.setdefault(token, []).append(sid)
     for token, sids in token_locations.items():
@@ -1362,12 +1364,16 @@ def _structural_lint(all_secs: list[dict[str, Any]]) -> list[Any]:
             ))
 
     # ── Exhibits: orphan references and gaps in the annexure series ──
-    full_text_by_sec = {str(s.get("section_id")): (s.get("content") or "") for s in all_secs}
+    # One entry per section id (a repeated id keeps its last content).
+    sec_by_sid: dict[str, int] = {}
+    for i, s in enumerate(idx.sections):
+        sec_by_sid[str(s.get("section_id"))] = i
     introduced: set[str] = set()
     referenced: dict[str, str] = {}  # mark -> first section that references it
     numeric_suffixes: list[int] = []
-    for sid, text in full_text_by_sec.items():
-        for m in _ANNEXURE_RE.finditer(text):
+    for sid, i in sec_by_sid.items():
+        text = idx.contents[i]
+        for m in idx.matches(i, _ANNEXURE_RE):
             mark = m.group(1).upper()
             referenced.setdefault(mark, sid)
             window = text[max(0, m.start() - 90):m.end() + 90].lower()
@@ -1403,14 +1409,18 @@ def _structural_lint(all_secs: list[dict[str, Any]]) -> list[Any]:
             ))
 
     # ── Terminology: never mix "ANNEXURE P-#" and "Exhibit P-#" ──
-    joined = "\n".join(full_text_by_sec.values())
-    if re.search(r"\bANNEXURE\s+P-?\d+", joined, re.I) and re.search(r"\bEXHIBIT\s+P-?\d+", joined, re.I):
-        for sid, text in full_text_by_sec.items():
-            m = re.search(r"\bEXHIBIT\s+P-?\d+", text, re.I)
-            if m:
+    if len(sec_by_sid) == len(idx):
+        mixed = idx.search(_ANNEXURE_P_RE) and idx.search(_EXHIBIT_RE)
+    else:
+        joined = "\n".join(idx.contents[i] for i in sec_by_sid.values())
+        mixed = _ANNEXURE_P_RE.search(joined) and _EXHIBIT_RE.search(joined)
+    if mixed:
+        for sid, i in sec_by_sid.items():
+            ex = idx.matches(i, _EXHIBIT_RE)
+            if ex:
                 findings.append(GroundingViolation(
                     section_id=sid,
-                    quote=m.group(0),
+                    quote=ex[0].group(0),
                     problem=(
                         "Mixed exhibit terminology: the draft uses both 'ANNEXURE P-#' and "
                         "'Exhibit P-#'. Rewrite using 'ANNEXURE P-#' consistently."
@@ -116,10 +116,26 @@ def upload_file_to_gcs(bucket_name: str, gcs_path: str, data: bytes, mime_type:
     return f"gs://{bucket_name}/{gcs_path}"
 
 
+def upload_fileobj_to_gcs(bucket_name: str, gcs_path: str, fileobj: Any, mime_type: str) -> str:
+    """Upload from a (seekable) file object without loading it into memory."""
+    blob = get_client().bucket(bucket_name).blob(gcs_path)
+    blob.upload_from_file(fileobj, rewind=True, content_type=mime_type or "application/octet-stream")
+    return f"gs://{bucket_name}/{gcs_path}"
+
+
 def get_object_metadata(bucket_name: str, object_path: str) -> dict[str, Any]:
     blob = get_client().bucket(bucket_name).blob(object_path)
     blob.reload()
-    return {"size": blob.size, "content_type": blob.content_type}
+    return {
+        "size": blob.size,
+        "content_type": blob.content_type,
+        "generation": blob.generation,
+        "etag": blob.etag,
+    }
+
+
+def object_exists(bucket_name: str, object_path: str) -> bool:
+    return get_client().bucket(bucket_name).blob(object_path).exists()
 
 
 def download_object_buffer(bucket_name: str, object_path: str) -> bytes:
@@ -127,11 +143,28 @@ def download_object_buffer(bucket_name: str, object_path: str) -> bytes:
     return blob.download_as_bytes()
 
 
+def download_object_to_file(
+    bucket_name: str, object_path: str, fileobj: Any, generation: int | None = None
+) -> None:
+    """Stream an object (optionally a pinned generation) into ``fileobj``."""
+    blob = get_client().bucket(bucket_name).blob(object_path, generation=generation)
+    blob.download_to_file(fileobj)
+
+
 def delete_object_if_exists(bucket_name: str, object_path: str) -> None:
     blob = get_client().bucket(bucket_name).blob(object_path)
     if blob.exists():
         blob.delete()
 
 
+def delete_prefix(bucket_name: str, prefix: str) -> int:
+    """Delete every object under ``prefix``; returns how many were deleted."""
+    deleted = 0
+    for blob in get_client().list_blobs(bucket_name, prefix=prefix):
+        blob.delete()
+        deleted += 1
+    return deleted
+
+
 def build_upload_token() -> str:
     return str(uuid.uuid4())
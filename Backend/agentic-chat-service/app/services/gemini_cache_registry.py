@@ -0,0 +1,330 @@
+"""
+gemini_cache_registry.py — content-addressed registry of Gemini explicit caches.
+
+A cached context is identified by what it contains: (model, system prompt
+hash, sorted file fingerprint). Two users or two tabs chatting over the same
+files with the same system prompt hit one registry entry, so the second
+session reuses the live cache instead of paying the setup tokens again.
+
+Each entry reference-counts the chat sessions using it (a session's
+reference lapses after a TTL without a prompt), so deleting one session's
+cache never pulls it from under another. The TTL slide is cost-aware: a
+cache is kept alive while the chance of another hit, at its recent hit rate,
+is worth more than the hourly storage it costs. ``sweep`` drops expired
+entries and picks unreferenced caches to evict on the same cost basis and
+under a token budget. Hits, setups, shared reuses and storage accrue into
+per-day savings.
+
+The registry is process-local state; gemini_cache_service persists entries,
+per-session references and the daily savings to Document_DB so other
+instances and restarts see them. The local refcounts only pick eviction
+candidates; whether a cache may actually be deleted is decided by the
+persisted reference count.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from app.services.gemini_pricing import compute_setup_cost, compute_storage_cost, get_pricing
+
+# An entry this close to expiry is treated as gone: attaching a session to a
+# cache that dies before its first request would send the question without
+# the document.
+EXPIRY_MARGIN_SECONDS = 15
+
+
+def content_key(model_name: str, system_hash: str, file_fingerprint: list[str]) -> str:
+    """Stable registry key for (model, system hash, sorted file ids)."""
+    raw = "\n".join([model_name or "", system_hash or "", ",".join(file_fingerprint)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+def _day(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).date().isoformat()
+
+
+@dataclass
+class CacheEntry:
+    key: str
+    cache_name: str
+    model_name: str
+    system_hash: str
+    file_ids: list[str]
+    document_tokens: int
+    created_at: float
+    expires_at: float
+    refs: dict[str, float] = field(default_factory=dict)  # chat session -> last prompt
+    hits: deque = field(default_factory=deque)  # recent hit timestamps
+    billed_until: float = 0.0  # storage accrued into daily stats up to here
+
+    def live(self, now: float) -> bool:
+        return self.expires_at > now + EXPIRY_MARGIN_SECONDS
+
+    @property
+    def setup_cost(self) -> float:
+        return compute_setup_cost(self.model_name, self.document_tokens)
+
+    def storage_cost(self, hours: float) -> float:
+        return compute_storage_cost(self.model_name, self.document_tokens, hours)
+
+    def hit_saving(self) -> float:
+        """Input cost one prompt saves by reading the document from the cache."""
+        pricing = get_pricing(self.model_name, context_token_count=self.document_tokens)
+        rate = float(pricing["newInputRate"]) - float(pricing["cachedInputRate"])
+        return max(0.0, self.document_tokens * rate / 1_000_000)
+
+
+class CacheRegistry:
+    def __init__(
+        self,
+        *,
+        hit_window_seconds: float = 3600.0,
+        max_tokens: int = 20_000_000,
+        clock=time.time,
+    ) -> None:
+        self._entries: dict[str, CacheEntry] = {}
+        self._by_name: dict[str, str] = {}
+        self._hit_window = float(hit_window_seconds)
+        self._max_tokens = int(max_tokens)
+        self._clock = clock
+        self._daily: dict[str, Counter] = {}
+        self._pending: dict[str, Counter] = {}  # daily deltas not yet persisted
+
+    # ── stats ────────────────────────────────────────────────────────────────
+    def _count(self, ts: float, **deltas: float) -> None:
+        day = _day(ts)
+        for target in (self._daily, self._pending):
+            bucket = target.setdefault(day, Counter())
+            for name, value in deltas.items():
+                bucket[name] += value
+
+    def _accrue_storage(self, entry: CacheEntry, until: float) -> None:
+        start = max(entry.billed_until, entry.created_at)
+        until = min(until, entry.expires_at)
+        if until > start:
+            self._count(until, storage_cost=entry.storage_cost((until - start) / 3600.0))
+            entry.billed_until = until
+
+    def take_pending(self) -> dict[str, dict[str, float]]:
+        """Daily stat deltas accumulated since the last call (for persistence)."""
+        pending, self._pending = self._pending, {}
+        return {day: dict(c) for day, c in pending.items()}
+
+    def daily_savings(self, days: int = 7) -> list[dict[str, Any]]:
+        """Process-local per-day savings, newest first."""
+        return [savings_row(day, self._daily[day]) for day in sorted(self._daily, reverse=True)[:days]]
+
+    # ── entries ──────────────────────────────────────────────────────────────
+    def get(self, key: str) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry.live(self._clock()):
+            return entry
+        return None
+
+    def adopt(self, entry: CacheEntry) -> CacheEntry:
+        """Load an entry persisted by another process (no stats are counted)."""
+        current = self._entries.get(entry.key)
+        if current is not None and current.cache_name == entry.cache_name:
+            current.expires_at = max(current.expires_at, entry.expires_at)
+            return current
+        entry.billed_until = max(entry.billed_until, self._clock())
+        self._put(entry)
+        return entry
+
+    def _put(self, entry: CacheEntry) -> None:
+        old = self._entries.get(entry.key)
+        if old is not None:
+            self._by_name.pop(old.cache_name, None)
+        self._entries[entry.key] = entry
+        self._by_name[entry.cache_name] = entry.key
+
+    def _drop(self, entry: CacheEntry, now: float) -> None:
+        self._accrue_storage(entry, now)
+        if self._entries.get(entry.key) is entry:
+            del self._entries[entry.key]
+        if self._by_name.get(entry.cache_name) == entry.key:
+            del self._by_name[entry.cache_name]
+
+    def acquire(self, key: str, session: str) -> CacheEntry | None:
+        """Attach ``session`` to the live cache for ``key`` and count a hit.
+
+        A session attaching for the first time reuses a cache another session
+        paid for; that setup is counted as saved.
+        """
+        now = self._clock()
+        entry = self.get(key)
+        if entry is None:
+            return None
+        shared = session not in entry.refs
+        entry.refs[session] = now
+        entry.hits.append(now)
+        while entry.hits and entry.hits[0] < now - self._hit_window:
+            entry.hits.popleft()
+        deltas: dict[str, float] = {"hits": 1, "hit_saved": entry.hit_saving()}
+        if shared:
+            deltas.update(
+                shared_reuses=1,
+                setup_tokens_saved=entry.document_tokens,
+                setup_cost_saved=entry.setup_cost,
+            )
+        self._count(now, **deltas)
+        return entry
+
+    def register(
+        self,
+        key: str,
+        *,
+        cache_name: str,
+        model_name: str,
+        system_hash: str,
+        file_ids: list[str],
+        document_tokens: int,
+        expires_at: float,
+        session: str,
+    ) -> CacheEntry:
+        """Record the cache a session is using; a new cache name is a paid setup."""
+        now = self._clock()
+        entry = self._entries.get(key)
+        if entry is not None and entry.cache_name == cache_name:
+            entry.expires_at = max(entry.expires_at, expires_at)
+            entry.document_tokens = document_tokens or entry.document_tokens
+            entry.refs[session] = now
+            return entry
+        refs: dict[str, float] = {}
+        hits: deque = deque()
+        if entry is not None:  # the cache was rebuilt: sessions and hit history carry over
+            self._drop(entry, now)
+            refs, hits = entry.refs, entry.hits
+        refs[session] = now
+        entry = CacheEntry(
+            key=key,
+            cache_name=cache_name,
+            model_name=model_name,
+            system_hash=system_hash,
+            file_ids=list(file_ids),
+            document_tokens=int(document_tokens or 0),
+            created_at=now,
+            expires_at=expires_at,
+            refs=refs,
+            hits=hits,
+            billed_until=now,
+        )
+        self._put(entry)
+        self._count(now, setups=1, setup_cost_paid=entry.setup_cost)
+        return entry
+
+    def release(self, session: str, cache_name: str | None = None) -> list[CacheEntry]:
+        """Drop ``session``'s references; return entries left with none."""
+        orphaned: list[CacheEntry] = []
+        keys = [self._by_name[cache_name]] if cache_name in self._by_name else list(self._entries)
+        for key in keys:
+            entry = self._entries[key]
+            if entry.refs.pop(session, None) is not None and not entry.refs:
+                orphaned.append(entry)
+        return orphaned
+
+    def discard(self, cache_name: str) -> None:
+        """Forget a cache that was deleted outside ``sweep``."""
+        key = self._by_name.get(cache_name)
+        if key is not None:
+            self._drop(self._entries[key], self._clock())
+
+    def is_shared(self, cache_name: str, session: str) -> bool:
+        """True when sessions other than ``session`` still use ``cache_name``."""
+        key = self._by_name.get(cache_name)
+        entry = self._entries.get(key) if key else None
+        return bool(entry and set(entry.refs) - {session})
+
+    # ── cost model ───────────────────────────────────────────────────────────
+    def _hit_rate(self, entry: CacheEntry, now: float) -> float:
+        """Recent hits per hour (over the hit window, or the entry's age)."""
+        recent = sum(1 for t in entry.hits if t >= now - self._hit_window)
+        span = min(self._hit_window, max(60.0, now - entry.created_at))
+        return recent * 3600.0 / span
+
+    def _net_value(self, entry: CacheEntry, rate: float, seconds: float) -> float:
+        """Expected saving minus storage cost of keeping ``entry`` for ``seconds``.
+
+        Hits arrive at ``rate`` per hour: each reads the document at the cached
+        rate, and at least one hit in the window avoids rebuilding the cache.
+        """
+        hours = seconds / 3600.0
+        expected_hits = rate * hours
+        saving = expected_hits * entry.hit_saving() + (1.0 - math.exp(-expected_hits)) * entry.setup_cost
+        return saving - entry.storage_cost(hours)
+
+    def _worth_keeping(self, entry: CacheEntry, rate: float, seconds: float) -> bool:
+        return self._net_value(entry, rate, seconds) >= 0.0
+
+    def ttl_for(self, key: str, base_ttl: int, max_ttl: int) -> int:
+        """Sliding TTL: ``base_ttl`` stepped up while the extension pays for itself."""
+        entry = self._entries.get(key)
+        if entry is None or max_ttl <= base_ttl:
+            return base_ttl
+        rate = self._hit_rate(entry, self._clock())
+        ttl = base_ttl
+        while ttl + base_ttl <= max_ttl and self._worth_keeping(entry, rate, ttl + base_ttl):
+            ttl += base_ttl
+        return ttl
+
+    def sweep(self, ref_ttl: float) -> list[CacheEntry]:
+        """Expire stale refs and entries; return caches the caller should delete.
+
+        Unreferenced caches are evicted when the next ``ref_ttl`` of storage
+        costs more than their expected hits save, then lowest value first
+        while the registry is over its token budget.
+        """
+        now = self._clock()
+        evict: list[CacheEntry] = []
+        for entry in list(self._entries.values()):
+            for session, seen in list(entry.refs.items()):
+                if seen < now - ref_ttl:
+                    del entry.refs[session]
+            if not entry.live(now):
+                self._drop(entry, now)  # Gemini deletes it at expiry
+                continue
+            self._accrue_storage(entry, now)
+            if not entry.refs and not self._worth_keeping(entry, self._hit_rate(entry, now), ref_ttl):
+                evict.append(entry)
+        for entry in evict:
+            self._drop(entry, now)
+
+        total = sum(e.document_tokens for e in self._entries.values())
+        if total > self._max_tokens:
+            idle = sorted(
+                (e for e in self._entries.values() if not e.refs),
+                key=lambda e: self._net_value(e, self._hit_rate(e, now), 3600.0),
+            )
+            for entry in idle:
+                if total <= self._max_tokens:
+                    break
+                total -= entry.document_tokens
+                self._drop(entry, now)
+                evict.append(entry)
+        return evict
+
+
+def savings_row(day: str, stats: dict[str, float] | Counter) -> dict[str, Any]:
+    """API shape of one day's registry stats."""
+    setup_saved = float(stats.get("setup_cost_saved", 0.0))
+    hit_saved = float(stats.get("hit_saved", 0.0))
+    storage = float(stats.get("storage_cost", 0.0))
+    return {
+        "day": day,
+        "hits": int(stats.get("hits", 0)),
+        "sharedReuses": int(stats.get("shared_reuses", 0)),
+        "setups": int(stats.get("setups", 0)),
+        "setupTokensSaved": int(stats.get("setup_tokens_saved", 0)),
+        "setupCostSaved": setup_saved,
+        "setupCostPaid": float(stats.get("setup_cost_paid", 0.0)),
+        "hitCostSaved": hit_saved,
+        "storageCost": storage,
+        "netSaved": setup_saved + hit_saved - storage,
+    }
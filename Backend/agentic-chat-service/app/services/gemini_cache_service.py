@@ -14,12 +14,14 @@ from typing import Any, AsyncIterator
 from app.core.config import get_settings
 from app.services.chat_helpers import is_valid_uuid
 from app.services.db import doc_conn
+from app.services.gemini_cache_registry import CacheEntry, CacheRegistry, content_key, savings_row
 from app.services.gemini_pricing import (
     DEFAULT_CACHE_MODEL,
     compute_setup_cost,
     compute_storage_cost,
     compute_usage_cost,
     get_pricing,
+    normalize_model_name,
 )
 from app.services.gcs_service import download_object_buffer, mime_from_path, parse_gcs_uri
 from app.services.llm_service import (
@@ -45,6 +47,7 @@ from app.services.llm_service import (
     continuation_attempts,
     continuation_time_budget,
 )
+from app.services.stream_pump import StreamPump
 
 logger = logging.getLogger(__name__)
 
@@ -251,6 +254,47 @@ def _ensure_schema() -> None:
                 )
                 """
             )
+            cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS gemini_cache_registry (
+                  content_key VARCHAR(32) PRIMARY KEY,
+                  cache_name TEXT NOT NULL,
+                  model_name TEXT NOT NULL,
+                  system_hash VARCHAR(16) NOT NULL DEFAULT '',
+                  file_ids TEXT[] NOT NULL DEFAULT ARRAY[]::TEXT[],
+                  document_tokens INTEGER NOT NULL DEFAULT 0,
+                  ref_count INTEGER NOT NULL DEFAULT 0,
+                  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+                  expires_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+                  updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+                )
+                """
+            )
+            cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS gemini_cache_savings_daily (
+                  day DATE PRIMARY KEY,
+                  hits INTEGER NOT NULL DEFAULT 0,
+                  shared_reuses INTEGER NOT NULL DEFAULT 0,
+                  setups INTEGER NOT NULL DEFAULT 0,
+                  setup_tokens_saved BIGINT NOT NULL DEFAULT 0,
+                  setup_cost_saved DOUBLE PRECISION NOT NULL DEFAULT 0,
+                  setup_cost_paid DOUBLE PRECISION NOT NULL DEFAULT 0,
+                  hit_saved DOUBLE PRECISION NOT NULL DEFAULT 0,
+                  storage_cost DOUBLE PRECISION NOT NULL DEFAULT 0
+                )
+                """
+            )
+            cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS gemini_cache_refs (
+                  cache_name TEXT NOT NULL,
+                  session_key TEXT NOT NULL,
+                  last_seen TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+                  PRIMARY KEY (cache_name, session_key)
+                )
+                """
+            )
             cur.execute("CREATE INDEX IF NOT EXISTS idx_gemini_cache_sessions_file_active ON gemini_cache_sessions (file_id, status, expires_at)")
             cur.execute("CREATE INDEX IF NOT EXISTS idx_query_logs_session_created ON query_logs (session_id, created_at)")
         conn.commit()
@@ -340,6 +384,285 @@ def _db_adk_cache_name(file_id: str) -> str | None:
         return None
 
 
+# ── Content-addressed cache registry ───────────────────────────────────────
+# Sessions over the same (model, system prompt, files) share one explicit
+# cache. Entries and daily savings are persisted so other instances and
+# restarts can attach to a live cache instead of paying its setup again.
+# Each session using a cache holds a row in gemini_cache_refs (lapsing after
+# a TTL without a prompt) and gemini_cache_registry.ref_count counts them; a
+# cache is only deleted by the instance whose DELETE ... WHERE ref_count <= 0
+# claims its registry row, so no instance pulls it from under another's chat.
+
+_SAVINGS_COLUMNS = (
+    "hits",
+    "shared_reuses",
+    "setups",
+    "setup_tokens_saved",
+    "setup_cost_saved",
+    "setup_cost_paid",
+    "hit_saved",
+    "storage_cost",
+)
+_SWEEP_INTERVAL_S = 60.0
+_registry: CacheRegistry | None = None
+_last_sweep = 0.0
+
+
+def _cache_registry() -> CacheRegistry:
+    global _registry
+    if _registry is None:
+        settings = get_settings()
+        _registry = CacheRegistry(
+            hit_window_seconds=settings.context_cache_hit_window_seconds,
+            max_tokens=settings.context_cache_registry_max_tokens,
+        )
+    return _registry
+
+
+def _max_ttl_seconds() -> int:
+    return max(_ttl_seconds(), int(get_settings().context_cache_max_ttl_seconds or 0))
+
+
+def _registry_key(model_name: str, system_instruction: str, file_ids: list[str]) -> str:
+    return content_key(
+        normalize_model_name(model_name or DEFAULT_CACHE_MODEL),
+        _system_hash(system_instruction),
+        _file_fingerprint(file_ids),
+    )
+
+
+def _db_registry_entry(key: str) -> CacheEntry | None:
+    """Live registry row for ``key`` written by any instance."""
+    with doc_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT content_key, cache_name, model_name, system_hash, file_ids,
+                       document_tokens, created_at, expires_at
+                FROM gemini_cache_registry
+                WHERE content_key=%s AND expires_at > NOW() + INTERVAL '15 seconds'
+                """,
+                (key,),
+            )
+            row = cur.fetchone()
+    if not row:
+        return None
+    return CacheEntry(
+        key=row["content_key"],
+        cache_name=row["cache_name"],
+        model_name=row["model_name"],
+        system_hash=row["system_hash"],
+        file_ids=list(row["file_ids"] or []),
+        document_tokens=int(row["document_tokens"] or 0),
+        created_at=row["created_at"].timestamp(),
+        expires_at=row["expires_at"].timestamp(),
+    )
+
+
+def _persist_registry_entry(entry: CacheEntry, session_key: str) -> None:
+    """Upsert ``entry`` and hold ``session_key``'s reference to its cache."""
+    with doc_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO gemini_cache_registry
+                  (content_key, cache_name, model_name, system_hash, file_ids,
+                   document_tokens, ref_count, created_at, expires_at, updated_at)
+                VALUES (%s, %s, %s, %s, %s, %s, 0, %s, %s, NOW())
+                ON CONFLICT (content_key) DO UPDATE SET
+                  cache_name = EXCLUDED.cache_name,
+                  document_tokens = EXCLUDED.document_tokens,
+                  ref_count = CASE WHEN gemini_cache_registry.cache_name = EXCLUDED.cache_name
+                                   THEN gemini_cache_registry.ref_count ELSE 0 END,
+                  created_at = CASE WHEN gemini_cache_registry.cache_name = EXCLUDED.cache_name
+                                    THEN gemini_cache_registry.created_at ELSE EXCLUDED.created_at END,
+                  expires_at = EXCLUDED.expires_at,
+                  updated_at = NOW()
+                """,
+                (
+                    entry.key,
+                    entry.cache_name,
+                    entry.model_name,
+                    entry.system_hash,
+                    entry.file_ids,
+                    entry.document_tokens,
+                    datetime.fromtimestamp(entry.created_at, tz=timezone.utc),
+                    datetime.fromtimestamp(entry.expires_at, tz=timezone.utc),
+                ),
+            )
+            # A rebuilt cache starts from ref_count 0, so re-take the reference.
+            cur.execute(
+                """
+                INSERT INTO gemini_cache_refs (cache_name, session_key, last_seen)
+                VALUES (%s, %s, NOW())
+                ON CONFLICT (cache_name, session_key) DO UPDATE SET last_seen = NOW()
+                RETURNING (xmax = 0) AS inserted
+                """,
+                (entry.cache_name, session_key),
+            )
+            row = cur.fetchone()
+            if row and row["inserted"]:
+                cur.execute(
+                    "UPDATE gemini_cache_registry SET ref_count = ref_count + 1 WHERE cache_name=%s",
+                    (entry.cache_name,),
+                )
+        conn.commit()
+
+
+def _lapse_stale_refs(cur: Any) -> None:
+    """Drop references idle past the cache TTL and decrement their counts."""
+    cur.execute(
+        """
+        WITH gone AS (
+          DELETE FROM gemini_cache_refs
+           WHERE last_seen < NOW() - make_interval(secs => %s)
+          RETURNING cache_name
+        )
+        UPDATE gemini_cache_registry r
+           SET ref_count = GREATEST(0, r.ref_count - g.n)
+          FROM (SELECT cache_name, COUNT(*) AS n FROM gone GROUP BY cache_name) g
+         WHERE r.cache_name = g.cache_name
+        """,
+        (_ttl_seconds(),),
+    )
+
+
+def _claim_unreferenced(cur: Any, cache_name: str, content_key: str | None = None) -> bool:
+    """Delete the registry row for ``cache_name`` iff no session references it.
+
+    The row delete is the claim: only the instance that wins it may delete
+    the Gemini cache.
+    """
+    sql = "DELETE FROM gemini_cache_registry WHERE cache_name=%s AND ref_count <= 0"
+    params: tuple[Any, ...] = (cache_name,)
+    if content_key is not None:
+        sql += " AND content_key=%s"
+        params += (content_key,)
+    cur.execute(sql + " RETURNING content_key", params)
+    return cur.fetchone() is not None
+
+
+def _flush_cache_savings(pending: dict[str, dict[str, float]]) -> None:
+    """Add the registry's daily stat deltas to gemini_cache_savings_daily."""
+    if not pending:
+        return
+    cols = ", ".join(_SAVINGS_COLUMNS)
+    updates = ", ".join(f"{c} = gemini_cache_savings_daily.{c} + EXCLUDED.{c}" for c in _SAVINGS_COLUMNS)
+    with doc_conn() as conn:
+        with conn.cursor() as cur:
+            for day, stats in pending.items():
+                cur.execute(
+                    f"""
+                    INSERT INTO gemini_cache_savings_daily (day, {cols})
+                    VALUES (%s, {", ".join(["%s"] * len(_SAVINGS_COLUMNS))})
+                    ON CONFLICT (day) DO UPDATE SET {updates}
+                    """,
+                    (day, *(stats.get(c, 0) for c in _SAVINGS_COLUMNS)),
+                )
+        conn.commit()
+
+
+def _evict_cached_contents(entries: list[CacheEntry]) -> None:
+    """Delete evicted Gemini caches no session references, and retire their rows.
+
+    This instance's sweep only sees its own sessions; a cache still
+    referenced in gemini_cache_refs (by a session on another instance) is
+    left alone.
+    """
+    claimed: list[CacheEntry] = []
+    with doc_conn() as conn:
+        with conn.cursor() as cur:
+            _lapse_stale_refs(cur)
+            for entry in entries:
+                if not _claim_unreferenced(cur, entry.cache_name, entry.key):
+                    logger.info("Cache %s still referenced elsewhere; not evicted", entry.cache_name)
+                    continue
+                claimed.append(entry)
+                cur.execute(
+                    """
+                    UPDATE gemini_cache_sessions
+                       SET status = 'deleted', deleted_at = NOW(), delete_reason = 'evicted'
+                     WHERE cache_name = %s AND status = 'active'
+                    """,
+                    (entry.cache_name,),
+                )
+        conn.commit()
+    if not claimed:
+        return
+    client = _get_client()
+    for entry in claimed:
+        try:
+            client.caches.delete(name=entry.cache_name)
+        except Exception as exc:
+            logger.info("Cache eviction delete skipped %s: %s", entry.cache_name, exc)
+        logger.info(
+            "Evicted cache %s (%d tokens, files=%s)", entry.cache_name, entry.document_tokens, entry.file_ids
+        )
+
+
+async def _find_shared_cache(key: str) -> CacheEntry | None:
+    """Live cache for ``key``, from this process or any other instance.
+
+    Finding it counts nothing: a hit is recorded by ``_count_cache_read``
+    once the model reports it actually read cached tokens.
+    """
+    registry = _cache_registry()
+    entry = registry.get(key)
+    if entry is None:
+        stored = await _run_blocking(lambda: _db_registry_entry(key))
+        if stored is not None:
+            entry = registry.adopt(stored)
+    return entry
+
+
+def _count_cache_read(key: str, session_key: str, cached_tokens: int) -> None:
+    """Count a registry hit (and a shared reuse) only when the cache was read."""
+    if cached_tokens > 0:
+        _cache_registry().acquire(key, session_key)
+
+
+async def _record_cache_use(
+    key: str,
+    *,
+    session_key: str,
+    cache_name: str,
+    model_name: str,
+    system_instruction: str,
+    file_ids: list[str],
+    document_tokens: int,
+    expires_at: float | None,
+) -> None:
+    """Register the cache a prompt used, persist it, and sweep the registry."""
+    global _last_sweep
+    registry = _cache_registry()
+    entry = registry.register(
+        key,
+        cache_name=cache_name,
+        model_name=model_name,
+        system_hash=_system_hash(system_instruction),
+        file_ids=_file_fingerprint(file_ids),
+        document_tokens=document_tokens,
+        expires_at=expires_at or time.time() + _ttl_seconds(),
+        session=session_key,
+    )
+    evicted: list[CacheEntry] = []
+    if time.monotonic() - _last_sweep >= _SWEEP_INTERVAL_S:
+        _last_sweep = time.monotonic()
+        evicted = registry.sweep(ref_ttl=_ttl_seconds())
+    pending = registry.take_pending()
+
+    def _persist() -> None:
+        _persist_registry_entry(entry, session_key)
+        if evicted:
+            _evict_cached_contents(evicted)
+        _flush_cache_savings(pending)
+
+    try:
+        await _run_blocking(_persist)
+    except Exception:
+        logger.exception("Failed to persist cache registry entry %s", cache_name)
+
+
 async def ask_with_context_cache(
     *,
     file_id: str,
@@ -351,13 +674,16 @@ async def ask_with_context_cache(
     llm_config: dict[str, Any] | None = None,
     chat_session_id: str | None = None,
     is_priming: bool = False,
+    file_ids: list[str] | None = None,
 ) -> AsyncIterator[dict[str, Any]]:
     """Stream document Q&A using ADK App + ContextCacheConfig (explicit Gemini caching).
 
     ADK manages the entire cache lifecycle — creation, TTL extension, refresh
     after N uses — so we never manually call validate_cache_exists or mark_deleted.
     The first query in a session primes the cache with the document; subsequent
-    queries re-use the cached context automatically.
+    queries re-use the cached context automatically. A new session whose
+    (model, system prompt, ``file_ids``) match a live cache in the registry
+    attaches to it instead of re-sending the document.
     """
     from google.genai import types as gt
     from google.adk.runners import RunConfig
@@ -369,9 +695,9 @@ async def ask_with_context_cache(
         mark_session_primed,
         DEFAULT_TTL_SECONDS,
     )
+    from agents.adk_callbacks import SHARED_CACHE_STATE_KEY
 
     session_key = chat_session_id or str(uuid.uuid4())
-    from app.services.gemini_pricing import normalize_model_name
     model = normalize_model_name(model_name or get_settings().adk_model or DEFAULT_CACHE_MODEL)
 
     # Apply Document_DB llm_chat_config.max_output_tokens to ADK generation.
@@ -408,34 +734,22 @@ async def ask_with_context_cache(
     # question-only on subsequent queries (ADK reuses the cached context).
     primed = is_session_primed(runner_key, session_key)
 
-    # Recover primed state from DB after server restart (in-memory state is lost).
-    # Only skip re-sending document bytes if a real Gemini named cache exists and
-    # is still valid — that way ADK can reference the persistent cache without needing
-    # the document bytes in the current (new, empty) in-memory session.
-    if not primed:
-        def _check_primed():
-            with doc_conn() as conn:
-                with conn.cursor() as cur:
-                    cur.execute(
-                        """
-                        SELECT questions_asked, adk_cache_name
-                        FROM gemini_cache_sessions
-                        WHERE file_id=%s::uuid AND status='active' AND expires_at > NOW()
-                          AND adk_cache_name IS NOT NULL AND adk_cache_name <> ''
-                        ORDER BY created_at DESC LIMIT 1
-                        """,
-                        (file_id,),
-                    )
-                    return cur.fetchone()
-
-        try:
-            row = await _run_blocking(_check_primed)
-            if row:
-                mark_session_primed(runner_key, session_key)
-                primed = True
-        except Exception:
-            pass  # Ignore DB errors; fall back to full document send
-    if not primed:
+    # Look the content up in the cache registry: a live cache for the same
+    # model, system prompt and files — from this session, another session, or
+    # before a restart (in-memory primed state is lost) — means the document
+    # bytes need not be re-sent. Keying on all three keeps a session from
+    # attaching to a cache built for a different model or prompt.
+    registry_key = _registry_key(model, system_instruction, file_ids or [file_id])
+    try:
+        shared_entry = await _find_shared_cache(registry_key)
+    except Exception:
+        shared_entry = None  # Ignore DB errors; fall back to full document send
+    # Attaching skips the document for THIS prompt only. The session is not
+    # primed by it (its own history never held the document), so once the
+    # shared cache is gone the next prompt sends the document again and ADK's
+    # own cache config takes over.
+    send_document = not primed and shared_entry is None
+    if send_document:
         doc_parts: list[Any] = []
         for spec in file_specs:
             buf = spec.get("buffer") or b""
@@ -457,6 +771,9 @@ async def ask_with_context_cache(
         parts = [gt.Part(text=question)]
 
     new_message = gt.Content(role="user", parts=parts)
+    # Name the shared cache on every prompt (None clears a stale one) so the
+    # model call reads it via cached_content — see adk_callbacks.attach_shared_cache.
+    shared_state = {SHARED_CACHE_STATE_KEY: shared_entry.cache_name if shared_entry else None}
 
     full = ""
     prompt = 0
@@ -481,6 +798,7 @@ async def ask_with_context_cache(
             user_id=user_id,
             session_id=adk_session_id,
             new_message=new_message,
+            state_delta=shared_state,
             run_config=RunConfig(streaming_mode=StreamingMode.SSE),
         ):
             # Accept events from the document agent OR events with no author (framework events).
@@ -553,6 +871,9 @@ async def ask_with_context_cache(
     output += curr_round_output
     curr_round_output = 0
 
+    if shared_entry is not None and not adk_cache_name and cached == 0:
+        logger.warning("Shared cache %s was not read file=%s", shared_entry.cache_name, file_id)
+
     # ── 2. Fallback / Retry if empty ────────────────────────────────────────
     had_real_content = bool(full.strip())
     if not had_real_content:
@@ -563,7 +884,7 @@ async def ask_with_context_cache(
             yield {"type": "error", "message": f"Gemini blocked the response ({finish_reason}).", "code": "EMPTY_RESPONSE"}
             return
 
-        if not primed:
+        if send_document:
             mark_session_primed(runner_key, session_key)
             primed = True
             logger.info("ADK primed session without answering — auto-retrying file=%s", file_id)
@@ -630,7 +951,7 @@ async def ask_with_context_cache(
             logger.info("ADK returned empty for primed session — falling back to GCS path")
             return
 
-    if not primed:
+    if send_document and not primed:
         mark_session_primed(runner_key, session_key)
 
     # Admin max_output_tokens is already applied; when the model still hits the
@@ -689,7 +1010,8 @@ async def ask_with_context_cache(
             # The aborted round may have died before ADK emitted cache metadata;
             # the explicit cache usually still exists — recover its name so the
             # changed-sampling direct recovery below can actually run.
-            adk_cache_name = await _run_blocking(lambda: _db_adk_cache_name(file_id))
+            live = _cache_registry().get(registry_key)
+            adk_cache_name = live.cache_name if live else await _run_blocking(lambda: _db_adk_cache_name(file_id))
 
         rec_doc_parts: list[Any] = []
         if recovery and not adk_cache_name:
@@ -741,12 +1063,13 @@ async def ask_with_context_cache(
                     gt.Content(role="user", parts=[gt.Part(text=build_recovery_prompt(full))]),
                 ]
                 _direct = _get_client()
-                sync_iter = await _run_blocking(
+                pump = StreamPump(
                     lambda: _direct.models.generate_content_stream(
                         model=model, contents=rec_contents, config=rec_cfg
-                    )
+                    ),
+                    label=f"cache-recovery {model} file={file_id}",
                 )
-                async for ev in _stream_round(iter(sync_iter), state, prior_text=full):
+                async for ev in _stream_round(pump, state, prior_text=full):
                     yield ev
                 direct_ok = True
             except Exception as exc:
@@ -948,26 +1271,36 @@ async def ask_with_context_cache(
         # Accumulate round output into session total
         output += curr_round_output
         curr_round_output = 0
+    _count_cache_read(registry_key, session_key, cached)
+    # A prompt answered from another session's cache gets no ADK cache
+    # metadata: that cache is slid and re-registered by name, while this
+    # session's gemini_cache_sessions row (cache_name is unique) keeps ADK's.
+    used_cache_name, used_expire_time = adk_cache_name, adk_expire_time
+    if not used_cache_name and shared_entry is not None and cached > 0:
+        used_cache_name, used_expire_time = shared_entry.cache_name, shared_entry.expires_at
     # Every answered prompt resets the cache lifetime to a fresh TTL, so the
-    # cache is deleted only after 5 minutes WITHOUT a prompt. If the user was
-    # idle past expiry, the slide is skipped and the next prompt rebuilds the
-    # cache automatically.
-    if adk_cache_name:
-        _ttl = _ttl_seconds()
+    # cache is deleted only after the TTL passes WITHOUT a prompt. Caches with
+    # a hit rate that pays for their storage slide further (up to the max
+    # TTL). If the user was idle past expiry, the slide is skipped and the
+    # next prompt rebuilds the cache automatically.
+    if used_cache_name:
+        _ttl = _cache_registry().ttl_for(registry_key, _ttl_seconds(), _max_ttl_seconds())
         slid = await _run_blocking(
             lambda: _slide_cache_expiry(
                 svc,
                 user_id=user_id,
                 adk_session_id=adk_session_id,
-                cache_name=adk_cache_name,
+                cache_name=used_cache_name,
                 ttl_seconds=_ttl,
             )
         )
         if slid:
-            adk_expire_time = slid
+            used_expire_time = slid
+            if adk_cache_name:
+                adk_expire_time = slid
             logger.info(
                 "Cache window reset: %s expires %ds from now (prompt received)",
-                adk_cache_name,
+                used_cache_name,
                 _ttl,
             )
 
@@ -983,6 +1316,17 @@ async def ask_with_context_cache(
         document_tokens=db_document_tokens,
         chat_session_id=session_key,
     )
+    if used_cache_name:
+        await _record_cache_use(
+            registry_key,
+            session_key=session_key,
+            cache_name=used_cache_name,
+            model_name=model,
+            system_instruction=system_instruction,
+            file_ids=file_ids or [file_id],
+            document_tokens=db_document_tokens,
+            expires_at=used_expire_time,
+        )
 
     costs = compute_usage_cost(
         model=model,
@@ -1427,13 +1771,30 @@ async def get_status(session_id: str, user_id: str | None = None) -> dict[str, A
     return payload
 
 
-async def has_active_cache(file_id: str) -> bool:
+async def has_active_cache(
+    file_id: str,
+    *,
+    model_name: str | None = None,
+    system_instruction: str | None = None,
+    file_ids: list[str] | None = None,
+) -> bool:
     """True when a valid Gemini named cache exists for this file.
-    
+
     Mirrors the primed-recovery check in ``ask_with_context_cache``: when this
     returns True, the ADK path answers question-only against the named cache and
     never needs the document bytes — so callers can skip downloading them.
+    Pass ``model_name`` and ``system_instruction`` (and ``file_ids`` for
+    multi-file chats) to check the cache registry for that exact content.
     """
+    if model_name and system_instruction is not None:
+        key = _registry_key(model_name, system_instruction, file_ids or [file_id])
+        if _cache_registry().get(key) is not None:
+            return True
+        try:
+            return await _run_blocking(lambda: _db_registry_entry(key)) is not None
+        except Exception:
+            return False
+
     def _check() -> bool:
         with doc_conn() as conn:
             with conn.cursor() as cur:
@@ -1535,17 +1896,71 @@ async def get_status_for_file(file_id: str, session_id: str | None = None) -> di
 
 
 async def delete_cache(session_id: str, user_id: str | None = None, reason: str = "manual") -> dict[str, Any]:
+    """Retire a chat session's cache.
+
+    The session's registry reference is released (in this process and in
+    gemini_cache_refs); the Gemini cache itself is only deleted when no other
+    session, on any instance, still references it.
+    """
     row = await get_session_row(session_id)
     if not row:
         return {"success": True, "sessionId": session_id, "deleted": False}
 
+    cache_name = row["cache_name"]
+    registry = _cache_registry()
+    registry.release(session_id, cache_name)
+    shared_here = registry.is_shared(cache_name, session_id)
+
+    def _release_in_db() -> bool:
+        """Drop this session's reference; True when this call may delete the cache."""
+        with doc_conn() as conn:
+            with conn.cursor() as cur:
+                _lapse_stale_refs(cur)
+                cur.execute(
+                    """
+                    WITH gone AS (
+                      DELETE FROM gemini_cache_refs WHERE cache_name=%s AND session_key=%s
+                      RETURNING cache_name
+                    )
+                    UPDATE gemini_cache_registry SET ref_count = GREATEST(0, ref_count - 1)
+                     WHERE cache_name IN (SELECT cache_name FROM gone)
+                    """,
+                    (cache_name, session_id),
+                )
+                if shared_here:
+                    deletable = False
+                elif _claim_unreferenced(cur, cache_name):
+                    deletable = True
+                else:
+                    # Not claimable: either still referenced, or never
+                    # registered (a cache from before the registry) — then
+                    # fall back to other active sessions on the same cache.
+                    cur.execute("SELECT 1 FROM gemini_cache_registry WHERE cache_name=%s", (cache_name,))
+                    registered = cur.fetchone() is not None
+                    cur.execute(
+                        """
+                        SELECT 1 FROM gemini_cache_sessions
+                        WHERE cache_name=%s AND session_id <> %s::uuid
+                          AND status='active' AND expires_at > NOW()
+                        LIMIT 1
+                        """,
+                        (cache_name, session_id),
+                    )
+                    deletable = not registered and cur.fetchone() is None
+            conn.commit()
+        return deletable
+
+    shared = not await _run_blocking(_release_in_db)
+
     def _delete():
         try:
-            _get_client().caches.delete(name=row["cache_name"])
+            _get_client().caches.delete(name=cache_name)
         except Exception:
             pass
 
-    await _run_blocking(_delete)
+    if not shared:
+        registry.discard(cache_name)
+        await _run_blocking(_delete)
 
     def _mark_deleted():
         with doc_conn() as conn:
@@ -1563,4 +1978,33 @@ async def delete_cache(session_id: str, user_id: str | None = None, reason: str
             conn.commit()
 
     await _run_blocking(_mark_deleted)
-    return {"success": True, "sessionId": session_id, "deleted": True}
+    return {"success": True, "sessionId": session_id, "deleted": True, "sharedCacheKept": shared}
+
+
+async def get_cache_savings(days: int = 7) -> dict[str, Any]:
+    """Per-day cache registry savings (hits, shared setups avoided, storage)."""
+    registry = _cache_registry()
+    pending = registry.take_pending()
+
+    def _load() -> list[dict[str, Any]]:
+        _ensure_schema()
+        _flush_cache_savings(pending)
+        with doc_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"""
+                    SELECT day, {", ".join(_SAVINGS_COLUMNS)}
+                    FROM gemini_cache_savings_daily
+                    ORDER BY day DESC LIMIT %s
+                    """,
+                    (days,),
+                )
+                return [dict(r) for r in cur.fetchall()]
+
+    rows = await _run_blocking(_load)
+    daily = [savings_row(r["day"].isoformat(), r) for r in rows]
+    return {
+        "days": daily,
+        "totalNetSaved": sum(d["netSaved"] for d in daily),
+        "totalSetupTokensSaved": sum(d["setupTokensSaved"] for d in daily),
+    }
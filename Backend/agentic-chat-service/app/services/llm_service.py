@@ -9,14 +9,16 @@ import os
 import re
 import tempfile
 import time
-import uuid
+from collections import deque
 from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import Any
 
 from app.core.config import get_settings
 from app.services.gcs_service import mime_from_path
 from app.services.llm_config_service import resolve_vertex_model_id
 from app.services.llm_usage_service import log_llm_usage
+from app.services.stream_pump import StreamPump
 
 logger = logging.getLogger(__name__)
 
@@ -274,20 +276,13 @@ _PDF_CHUNK_TARGET_BYTES = 48 * 1024 * 1024
 
 def _split_oversized_pdfs(gcs_uris: list[str], session_id: str | None) -> tuple[list[str], str]:
     """ChatModel's large-file strategy: any PDF over Vertex's 50MB limit is
-    page-split into <48MB part-PDFs uploaded under tmp/{session}/, and a
-    'unified document' notice is returned to prepend to the question so the
-    model treats the segments as one source. Non-oversized URIs pass through.
+    page-split into <48MB part-PDFs, and a 'unified document' notice is
+    returned to prepend to the question so the model treats the segments as
+    one source. Non-oversized URIs pass through. Splits are cached per object
+    version (see pdf_split_cache), so repeat chats reuse the parts.
     """
-    import io
-
-    from pypdf import PdfReader, PdfWriter
-
-    from app.services.gcs_service import (
-        download_object_buffer,
-        get_object_metadata,
-        parse_gcs_uri,
-        upload_file_to_gcs,
-    )
+    from app.services.gcs_service import get_object_metadata, parse_gcs_uri
+    from app.services.pdf_split_cache import split_pdf_parts
 
     out_uris: list[str] = []
     notices: list[str] = []
@@ -297,9 +292,10 @@ def _split_oversized_pdfs(gcs_uris: list[str], session_id: str | None) -> tuple[
             continue
         bucket, path = parsed
         try:
-            size = int(get_object_metadata(bucket, path).get("size") or 0)
+            meta = get_object_metadata(bucket, path)
         except Exception:
-            size = 0
+            meta = {}
+        size = int(meta.get("size") or 0)
         if size <= _VERTEX_FILE_SIZE_LIMIT_BYTES:
             out_uris.append(uri)
             continue
@@ -308,40 +304,19 @@ def _split_oversized_pdfs(gcs_uris: list[str], session_id: str | None) -> tuple[
                 f"{path.rsplit('/', 1)[-1]} exceeds 50 MB and is not a PDF, so it cannot be page-split for Vertex AI."
             )
         logger.info("Splitting oversized PDF for Vertex: %s (%d bytes)", uri, size)
-        reader = PdfReader(io.BytesIO(download_object_buffer(bucket, path)))
-        total_pages = len(reader.pages)
-        if not total_pages:
-            raise RuntimeError(f"PDF {path} contains no pages.")
-        chunk_count = max(2, -(-size // _PDF_CHUNK_TARGET_BYTES))
-        pages_per_chunk = max(1, -(-total_pages // chunk_count))
-        base = path.rsplit("/", 1)[-1].rsplit(".", 1)[0][:80] or "document"
-        safe_session = re.sub(r"[^a-zA-Z0-9-_]", "_", str(session_id or f"adhoc-{uuid.uuid4().hex[:8]}"))
-        part_uris: list[str] = []
-        start = 0
-        part_i = 1
-        while start < total_pages:
-            end = min(total_pages, start + pages_per_chunk)
-            while end > start:
-                writer = PdfWriter()
-                for p in range(start, end):
-                    writer.add_page(reader.pages[p])
-                buf = io.BytesIO()
-                writer.write(buf)
-                chunk = buf.getvalue()
-                if len(chunk) <= _PDF_CHUNK_TARGET_BYTES or end - start == 1:
-                    if end - start == 1 and len(chunk) > _VERTEX_FILE_SIZE_LIMIT_BYTES:
-                        raise RuntimeError(
-                            f"Page {start + 1} of {path} exceeds the Vertex file limit by itself — cannot split safely."
-                        )
-                    part_path = f"tmp/{safe_session}/{base}.part{part_i:02d}.pdf"
-                    part_uris.append(upload_file_to_gcs(bucket, part_path, chunk, "application/pdf"))
-                    break
-                end -= max(1, (end - start) // 4)  # shrink the range and retry
-            part_i += 1
-            start = end
+        manifest = split_pdf_parts(
+            bucket,
+            path,
+            metadata=meta,
+            session_id=session_id,
+            target_bytes=_PDF_CHUNK_TARGET_BYTES,
+            limit_bytes=_VERTEX_FILE_SIZE_LIMIT_BYTES,
+        )
+        part_uris = [part["uri"] for part in manifest["parts"]]
         out_uris.extend(part_uris)
         notices.append(
-            f'Source "{path.rsplit("/", 1)[-1]}" is split into {len(part_uris)} sequential parts covering pages 1-{total_pages}.'
+            f'Source "{path.rsplit("/", 1)[-1]}" is split into {len(part_uris)} sequential parts '
+            f'covering pages 1-{manifest["totalPages"]}.'
         )
     notice = ""
     if notices:
@@ -431,6 +406,13 @@ def _aggregate_candidate_text(chunk: Any) -> str:
     return thought
 
 
+# Stream dedupe: a piece of at least this many chars already present at the end
+# of the most recent tail is a duplicate; pure padding never is.
+_SUFFIX_DEDUPE_MIN = 50
+_SUFFIX_DEDUPE_TAIL = 1000
+_STREAM_PADDING_CHARS = " \t\n|-:.=_~*#"
+
+
 def _append_stream_piece(current: str, piece: str) -> tuple[str, str]:
     """Append a stream piece; return (new_full, delta_to_emit). Handles cumulative chunks."""
     if not piece:
@@ -452,8 +434,8 @@ def _append_stream_piece(current: str, piece: str) -> tuple[str, str]:
     # Pieces that are pure padding (spaces/pipes/dashes — column-aligned tables emit
     # long identical runs of them) are REAL content, not duplicates: swallowing them
     # made the stall counter kill rounds that would have completed fine.
-    if len(piece) >= 50 and piece.strip(" \t\n|-:.=_~*#"):
-        tail_len = min(len(current), 1000)
+    if len(piece) >= _SUFFIX_DEDUPE_MIN and piece.strip(_STREAM_PADDING_CHARS):
+        tail_len = min(len(current), _SUFFIX_DEDUPE_TAIL)
         tail = current[-tail_len:]
         if tail.endswith(piece):
             return current, ""
@@ -462,6 +444,76 @@ def _append_stream_piece(current: str, piece: str) -> tuple[str, str]:
     return current + piece, piece
 
 
+class _StreamText:
+    """Text of one stream round, assembled from pieces in amortised O(piece).
+
+    ``append`` has exactly the semantics of ``_append_stream_piece`` (equality,
+    cumulative snapshot, recent-tail duplicate, else delta), but the text is a
+    list of parts joined only on demand. The string version copied the whole
+    answer on every chunk, so a 30-60K-char answer (chronologies, summary
+    tables) cost more CPU per chunk the longer it got.
+    """
+
+    __slots__ = ("_parts", "_len", "_joined", "visible")
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._len = 0
+        self._joined: str | None = ""
+        self.visible = False  # == bool(text().strip()), kept incrementally
+
+    def __len__(self) -> int:
+        return self._len
+
+    def text(self) -> str:
+        if self._joined is None:
+            self._joined = "".join(self._parts)
+            self._parts = [self._joined]
+        return self._joined
+
+    def _endswith_recent(self, piece: str) -> bool:
+        """``text()[-_SUFFIX_DEDUPE_TAIL:].endswith(piece)`` without joining."""
+        need = len(piece)
+        if need > min(self._len, _SUFFIX_DEDUPE_TAIL):
+            return False
+        tail: list[str] = []
+        for part in reversed(self._parts):
+            tail.append(part)
+            need -= len(part)
+            if need <= 0:
+                break
+        return "".join(reversed(tail)).endswith(piece)
+
+    def append(self, piece: str) -> str:
+        """Add a stream piece; return the delta to emit ("" when deduped)."""
+        if not piece:
+            return ""
+        if len(piece) >= self._len and self._len:
+            # Only a piece at least as long as the text can equal or extend it.
+            current = self.text()
+            if piece == current:
+                return ""
+            if piece.startswith(current):
+                delta = piece[self._len :]
+                self._parts = [piece]
+                self._joined = piece
+                self._len = len(piece)
+                self.visible = self.visible or not delta.isspace()
+                return delta
+        elif (
+            self._len
+            and len(piece) >= _SUFFIX_DEDUPE_MIN
+            and piece.strip(_STREAM_PADDING_CHARS)
+            and self._endswith_recent(piece)
+        ):
+            return ""
+        self._parts.append(piece)
+        self._len += len(piece)
+        self._joined = None
+        self.visible = self.visible or not piece.isspace()
+        return piece
+
+
 def _stream_tail_delta(streamed: str, last_chunk: Any) -> tuple[str, str]:
     """Return (full_text, delta) when the final chunk holds text the stream skipped.
 
@@ -683,29 +735,36 @@ def _trim_symbol_flood(text: str) -> str:
     return re.sub(r"[ \t|\-:=+_~*#.]{16,}\s*$", "", (text or "").rstrip()).rstrip()
 
 
-def _looks_like_restart(prior: str, round_head: str) -> bool:
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+
+
+def _normalize_for_match(text: str) -> str:
+    """Lowercase alphanumerics only — the form restart/overlap checks compare.
+
+    Concatenative (``f(a + b) == f(a) + f(b)``), so a caller that keeps the
+    normalized answer can extend it per round instead of re-normalizing.
+    """
+    return _NON_ALNUM_RE.sub("", text.lower())
+
+
+def _looks_like_restart(prior: str, round_head: str, *, prior_norm: str | None = None) -> bool:
     """True when a continuation round's (overlap-trimmed) head already exists
     verbatim in the delivered answer — i.e. the model restarted from scratch.
 
     Now uses normalized comparison to catch minor variations in punctuation/case.
+    ``prior_norm`` is ``_normalize_for_match(prior)`` when the caller keeps it.
     """
     if not prior or not round_head:
         return False
 
-    def _normalize(t: str) -> str:
-        # Lowercase and remove all non-alphanumeric chars
-        return re.sub(r"[^a-z0-9]", "", t.lower())
-
     # Take a larger probe but require a reasonable minimum length
-    probe_raw = round_head[:_RESTART_PROBE_CHARS]
-    probe = _normalize(probe_raw)
-
+    probe = _normalize_for_match(round_head[:_RESTART_PROBE_CHARS])
     if len(probe) < _RESTART_PROBE_MIN:
         return False
 
     # Check if the normalized probe exists anywhere in the normalized prior text.
-    # We normalize the whole prior (expensive but only happens once per round).
-    prior_norm = _normalize(prior)
+    if prior_norm is None:
+        prior_norm = _normalize_for_match(prior)
     return probe in prior_norm
 
 
@@ -715,6 +774,13 @@ def _looks_like_restart(prior: str, round_head: str) -> bool:
 _STALL_LIMIT = 50
 
 
+# _RepetitionGuard tables: punctuation that counts toward a whitespace flood,
+# and the bytes a line key drops (keys keep [a-z0-9] for table rows, else [a-z]).
+_FLOOD_PUNCT_DELETE = str.maketrans("", "", "|-:=+_~*#.")
+_KEY_DELETE_NON_ALNUM = bytes(b for b in range(256) if not (48 <= b <= 57 or 97 <= b <= 122))
+_KEY_DELETE_NON_ALPHA = bytes(b for b in range(256) if not 97 <= b <= 122)
+
+
 class _RepetitionGuard:
     """Detects degenerate generation: the same line emitted over and over.
 
@@ -735,9 +801,11 @@ class _RepetitionGuard:
 
     def __init__(self, threshold: int = 15, window: int = 250, ws_limit: int = 1500):
         self.threshold = threshold
-        self._recent: list[str] = []
+        # Sliding window of line keys plus their counts: O(1) per line.
+        self._recent: deque[bytes] = deque()
+        self._counts: dict[bytes, int] = {}
         self._window = window
-        self._buf = ""
+        self._partial: list[str] = []  # text of the current, unterminated line
         self._ws_run = 0
         self._ws_limit = ws_limit
         self.tripped = False
@@ -748,16 +816,21 @@ class _RepetitionGuard:
         # Whitespace floods: a degenerate model can emit megabytes of pure
         # spaces/newlines, which pass every line-based check.
         # We also count non-printable punctuation as whitespace for this limit.
-        if re.sub(r"[\s|\-:=+_~*# .]", "", piece):
+        if piece.translate(_FLOOD_PUNCT_DELETE).strip():
             self._ws_run = 0
         else:
             self._ws_run += len(piece)
             if self._ws_run >= self._ws_limit:
                 self.tripped = True
                 return True
-        self._buf += piece
-        while "\n" in self._buf:
-            line, self._buf = self._buf.split("\n", 1)
+        if "\n" not in piece:
+            self._partial.append(piece)
+            return False
+        first, *lines = piece.split("\n")
+        rest = lines.pop()
+        lines.insert(0, "".join(self._partial) + first if self._partial else first)
+        self._partial = [rest] if rest else []
+        for line in lines:
             clean = line.strip()
             # Ignore short lines (bullets, table borders, etc.)
             if len(clean) < 30:
@@ -772,50 +845,96 @@ class _RepetitionGuard:
             # per receipt). Stripping digits collapses those to one key and
             # trips the guard on a perfectly healthy table. A genuine loop
             # repeats rows verbatim, so it still trips with digits kept.
+            # (Non-ASCII never survives the key, so it is dropped up front.)
+            ascii_line = clean.lower().encode("ascii", "ignore")
             if clean.startswith("|"):
-                key = re.sub(r"[^a-z0-9]", "", clean.lower())
+                key = ascii_line.translate(None, _KEY_DELETE_NON_ALNUM)
             else:
-                key = re.sub(r"[^a-z]", "", clean.lower())
+                key = ascii_line.translate(None, _KEY_DELETE_NON_ALPHA)
             if len(key) < 20:
                 continue
 
             self._recent.append(key)
+            count = self._counts.get(key, 0) + 1
+            self._counts[key] = count
             if len(self._recent) > self._window:
-                self._recent.pop(0)
-
-            if self._recent.count(key) >= self.threshold:
+                old = self._recent.popleft()
+                left = self._counts[old] - 1
+                if left:
+                    self._counts[old] = left
+                else:
+                    del self._counts[old]
+                if old == key:
+                    count -= 1
+
+            if count >= self.threshold:
                 self.tripped = True
                 return True
         return False
 
 
+def _longest_suffix_prefix(tail: str, head: str, min_len: int, allowed=None) -> int:
+    """Largest ``k >= min_len`` with ``tail.endswith(head[:k])``, else 0.
+
+    Every such overlap starts at an occurrence of ``head[:min_len]`` in
+    ``tail``, so only those offsets are tried, left to right (longest first),
+    each confirmed by one C-level comparison. ``allowed`` restricts ``k``.
+    """
+    if min_len > min(len(tail), len(head)):
+        return 0
+    seed = head[:min_len]
+    n = len(tail)
+    i = tail.find(seed, max(0, n - len(head)))
+    while i != -1:
+        k = n - i
+        if (allowed is None or k in allowed) and head.startswith(tail[i:]):
+            return k
+        i = tail.find(seed, i + 1)
+    return 0
+
+
+@lru_cache(maxsize=4096)
+def _normalized_char_len(ch: str) -> int:
+    return len(_normalize_for_match(ch))
+
+
 def _trim_overlap(prior: str, new: str, *, window: int = _CONTINUATION_TRIM_WINDOW, min_overlap: int = 15) -> str:
     """Drop the longest prefix of ``new`` that duplicates the tail of ``prior``.
 
     Now uses normalized matching to catch repeats with different spacing/newlines.
+    Both passes normalize once and only try the offsets where an overlap can
+    start, instead of a fresh slice (and regex normalize) per candidate length.
     """
     if not prior or not new:
         return new
 
-    def _normalize(t: str) -> str:
-        return re.sub(r"[^a-z0-9]", "", t.lower())
-
     tail = prior[-window:]
     limit = min(len(tail), len(new))
+    if limit < min_overlap:
+        return new
+    head = new[:limit]
 
     # 1. Try verbatim match first (fastest and most accurate)
-    for k in range(limit, min_overlap - 1, -1):
-        if tail.endswith(new[:k]):
-            return new[k:]
-
-    # 2. Try normalized match (catches spacing/case variations)
-    # We take chunks of the new head and see if they exist in the tail
-    norm_tail = _normalize(tail)
-    for k in range(limit, min_overlap - 1, -1):
-        probe = _normalize(new[:k])
-        if len(probe) >= min_overlap and norm_tail.endswith(probe):
-            return new[k:]
-
+    k = _longest_suffix_prefix(tail, head, max(min_overlap, 1))
+    if k or min_overlap <= 0:  # an empty overlap always "matches" verbatim
+        return new[k:]
+
+    # 2. Try normalized match (catches spacing/case variations): the probe for
+    # a raw length k is the first P(k) chars of the normalized head.
+    prefix_len = [0] * (limit + 1)
+    for i, ch in enumerate(head, 1):
+        prefix_len[i] = prefix_len[i - 1] + _normalized_char_len(ch)
+    matched = _longest_suffix_prefix(
+        _normalize_for_match(tail),
+        _normalize_for_match(head),
+        max(min_overlap, 1),
+        allowed=set(prefix_len[min_overlap:]),
+    )
+    if matched:
+        # Longest raw k whose normalized probe is exactly the matched length.
+        for k in range(limit, min_overlap - 1, -1):
+            if prefix_len[k] == matched:
+                return new[k:]
     return new
 
 
@@ -884,102 +1003,104 @@ def _normalize_usage(chunk: Any, streamed_len: int = 0) -> dict[str, Any]:
     }
 
 
-async def _stream_round(sync_iter, state: dict[str, Any], *, prior_text: str = "") -> AsyncIterator[dict[str, Any]]:
+async def _stream_round(
+    stream, state: dict[str, Any], *, prior_text: str = "", prior_norm: str | None = None
+) -> AsyncIterator[dict[str, Any]]:
     """Stream one generation round, yielding thought/chunk events.
 
-    Fills ``state`` with ``streamed`` (visible text emitted this round) and
-    ``last_chunk`` (final SDK chunk, for usage/finish-reason extraction).
+    ``stream`` is a ``StreamPump`` (or a plain SDK iterator, pumped here).
+    Fills ``state`` with ``streamed`` (visible text emitted this round),
+    ``last_chunk`` (final SDK chunk, for usage/finish-reason extraction) and
+    ``ttft_ms`` (time to the round's first chunk).
 
     For continuation rounds (``prior_text`` set), the head of the round is
     buffered and overlap-trimmed against the already-delivered text, so a model
     that restarts slightly before the cut point does not duplicate output.
+    ``prior_norm`` (``_normalize_for_match(prior_text)``) spares the restart
+    check a full re-normalization of the answer when the caller keeps it.
     """
-    loop = asyncio.get_event_loop()
+    pump = stream if isinstance(stream, StreamPump) else StreamPump.over(stream, label="round")
     last_chunk = None
-    raw = ""  # deduped text of this round, before overlap trimming
+    buf = _StreamText()  # deduped text of this round, before overlap trimming
     head_emitted = not prior_text  # continuation rounds buffer the head first
     trim_offset = 0
     guard = _RepetitionGuard()
     aborted = False
     stalls = 0  # consecutive non-empty pieces fully eaten by the dedupe
 
-    def _next():
-        try:
-            return next(sync_iter)
-        except StopIteration:
-            return None
-
-    while True:
-        chunk = await loop.run_in_executor(None, _next)
-        if chunk is None:
-            break
-        last_chunk = chunk
-        answer, thought = _extract_stream_payload(chunk)
-        if thought:
-            yield {"type": "thought", "text": thought}
-        piece = answer
-        thought_as_answer = False
-        if not piece and thought and not raw.strip():
-            piece = thought
-            thought_as_answer = True
-        if not piece:
-            continue
-        raw, delta = _append_stream_piece(raw, piece)
-        if not delta:
-            # `_append_stream_piece` drops pieces that already exist in the
-            # text. A looping model repeats the same fragment forever — every
-            # piece gets dropped, the answer stops growing, and the stream
-            # silently burns the whole output budget. Abort on a long run of
-            # swallowed pieces instead of stalling for minutes.
-            if len(piece) >= 15:
-                stalls += 1
-                if stalls >= _STALL_LIMIT:
+    try:
+        async for chunk in pump:
+            last_chunk = chunk
+            answer, thought = _extract_stream_payload(chunk)
+            if thought:
+                yield {"type": "thought", "text": thought}
+            piece = answer
+            thought_as_answer = False
+            if not piece and thought and not buf.visible:
+                piece = thought
+                thought_as_answer = True
+            if not piece:
+                continue
+            delta = buf.append(piece)
+            if not delta:
+                # `_StreamText.append` drops pieces that already exist in the
+                # text. A looping model repeats the same fragment forever — every
+                # piece gets dropped, the answer stops growing, and the stream
+                # silently burns the whole output budget. Abort on a long run of
+                # swallowed pieces instead of stalling for minutes.
+                if len(piece) >= 15:
+                    stalls += 1
+                    if stalls >= _STALL_LIMIT:
+                        state["degenerate"] = True
+                        aborted = True
+                        logger.warning(
+                            "Stream stalled: %s consecutive duplicate pieces — aborting round.", stalls
+                        )
+                        break
+                continue
+            stalls = 0
+            if thought_as_answer:
+                logger.warning("Stream chunk had only thought text; using as visible answer.")
+            if not head_emitted:
+                if guard.feed(delta):
                     state["degenerate"] = True
                     aborted = True
-                    logger.warning(
-                        "Stream stalled: %s consecutive duplicate pieces — aborting round.", stalls
-                    )
+                    logger.warning("Degenerate repetition while buffering continuation head — aborting round.")
                     break
-            continue
-        stalls = 0
-        if thought_as_answer:
-            logger.warning("Stream chunk had only thought text; using as visible answer.")
-        if not head_emitted:
+                if len(buf) < _CONTINUATION_TRIM_WINDOW:
+                    continue  # keep buffering until the overlap window is full
+                # Strip courteous lead-ins BEFORE the overlap/restart checks — a novel
+                # preamble at the head otherwise masks a full restart behind it.
+                head = _trim_overlap(prior_text, _strip_continuation_preamble(buf.text()))
+                if _looks_like_restart(prior_text, head, prior_norm=prior_norm):
+                    state["restarted"] = True
+                    aborted = True
+                    logger.warning("Continuation restarted from the beginning — discarding round.")
+                    break
+                trim_offset = len(buf) - len(head)
+                head_emitted = True
+                if head:
+                    yield {"type": "chunk", "text": head}
+                continue
+            yield {"type": "chunk", "text": delta}
             if guard.feed(delta):
+                # Same significant line repeated many times — the model is stuck in
+                # a loop that would burn the whole output budget for minutes. Stop
+                # pulling the stream now; the caller will not continue this answer.
                 state["degenerate"] = True
                 aborted = True
-                logger.warning("Degenerate repetition while buffering continuation head — aborting round.")
-                break
-            if len(raw) < _CONTINUATION_TRIM_WINDOW:
-                continue  # keep buffering until the overlap window is full
-            # Strip courteous lead-ins BEFORE the overlap/restart checks — a novel
-            # preamble at the head otherwise masks a full restart behind it.
-            head = _trim_overlap(prior_text, _strip_continuation_preamble(raw))
-            if _looks_like_restart(prior_text, head):
-                state["restarted"] = True
-                aborted = True
-                logger.warning("Continuation restarted from the beginning — discarding round.")
+                logger.warning("Degenerate repetition detected — aborting stream round early.")
                 break
-            trim_offset = len(raw) - len(head)
-            head_emitted = True
-            if head:
-                yield {"type": "chunk", "text": head}
-            continue
-        yield {"type": "chunk", "text": delta}
-        if guard.feed(delta):
-            # Same significant line repeated many times — the model is stuck in
-            # a loop that would burn the whole output budget for minutes. Stop
-            # pulling the stream now; the caller will not continue this answer.
-            state["degenerate"] = True
-            aborted = True
-            logger.warning("Degenerate repetition detected — aborting stream round early.")
-            break
+    finally:
+        await pump.aclose()
+        state["ttft_ms"] = pump.metrics["ttftMs"]
 
+    raw = buf.text()
     if not aborted:
         raw, tail = _stream_tail_delta(raw, last_chunk)
         if not head_emitted:
             head = _trim_overlap(prior_text, _strip_continuation_preamble(raw))
-            if _looks_like_restart(prior_text, head):
+            if _looks_like_restart(prior_text, head, prior_norm=prior_norm):
                 state["restarted"] = True
                 head = ""
                 raw = ""
@@ -1021,13 +1142,13 @@ async def _stream_with_continuation(
     """
     from google.genai import types as gt
 
-    loop = asyncio.get_event_loop()
     attempts = continuation_attempts()
     if config.max_output_tokens and config.max_output_tokens < 1000:
         attempts = 0
 
     t0 = time.monotonic()
     full = ""
+    full_norm = ""  # _normalize_for_match(full), extended per round
     agg_in = agg_out = agg_total = 0
     finish: str | None = None
     truncated = False
@@ -1036,6 +1157,7 @@ async def _stream_with_continuation(
 
     use_recovery = False
     consec_degen = 0
+    ttft_ms: int | None = None
     for round_i in range(attempts + 1):
         convo = list(contents)
         round_config = config
@@ -1082,9 +1204,9 @@ async def _stream_with_continuation(
             return client.models.generate_content_stream(model=model, contents=c, config=config)
 
         state: dict[str, Any] = {"streamed": "", "last_chunk": None}
+        pump = StreamPump(_open, label=f"{endpoint} {model} round={round_i}")
         try:
-            sync_iter = await loop.run_in_executor(None, _open)
-            async for ev in _stream_round(iter(sync_iter), state, prior_text=full):
+            async for ev in _stream_round(pump, state, prior_text=full, prior_norm=full_norm):
                 yield ev
         except Exception:
             if round_i == 0:
@@ -1093,6 +1215,8 @@ async def _stream_with_continuation(
             break
 
         rounds_run += 1
+        if round_i == 0:
+            ttft_ms = state.get("ttft_ms")
         round_text = state.get("streamed", "")
         restarted = bool(state.get("restarted"))
         degenerate = bool(state.get("degenerate"))
@@ -1105,6 +1229,9 @@ async def _stream_with_continuation(
                 full += "\n\n" + round_text
             else:
                 full += round_text
+            # `_trim_symbol_flood` only ever drops non-alphanumerics, so the
+            # normalized form stays valid across the trims between rounds.
+            full_norm += _normalize_for_match(round_text)
         
         if state.get("last_chunk") is not None:
             had_chunk = True
@@ -1179,6 +1306,8 @@ async def _stream_with_continuation(
     }
     if rounds_run > 1:
         usage_ev["continuationRounds"] = rounds_run - 1
+    if ttft_ms is not None:
+        usage_ev["ttftMs"] = ttft_ms
     if metadata.get("userId"):
         await log_llm_usage(
             user_id=int(metadata["userId"]),
@@ -0,0 +1,307 @@
+"""
+pdf_split_cache.py — reusable page splits of PDFs over Vertex's per-file limit.
+
+Document chat page-splits any PDF over 50MB into part-PDFs that Vertex can
+fetch as gs:// URIs. Splitting used to happen on every chat request with a
+new session: the whole PDF was downloaded into memory, re-split, and the
+parts uploaded again under ``tmp/{session}/``.
+
+Splits are now content-addressed by (bucket, path, generation/etag). The
+parts and a ``manifest.json`` describing them live under
+``split-cache/{key}/``; any later request for the same object version reuses
+them (an in-process memo skips even the manifest read). A new upload gets a
+new generation, hence a new key, so stale parts are never served; a pointer
+per source (``split-cache/sources/``) names its current key, and the
+superseded key's prefix is deleted once the new split is stored.
+
+Splitting streams the source through a spooled temp file and writes each
+candidate part to one as well, so memory stays bounded by the spool size
+rather than the PDF plus every writer buffer. Part boundaries come from a
+size-aware search (first probe estimated from bytes per page, then grown or
+shrunk by measured size and bisected only inside the fit/miss bracket)
+instead of a linear shrink loop.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+logger = logging.getLogger(__name__)
+
+_MANIFEST_PREFIX = "split-cache"
+# Source PDFs and part candidates spill to disk beyond this many bytes.
+_SPOOL_MAX_BYTES = int(os.environ.get("PDF_SPLIT_SPOOL_BYTES", str(8 * 1024 * 1024)))
+# First probe aims slightly under the target so it usually fits outright.
+_GUESS_FILL = 0.95
+_MEMO_SIZE = 256
+
+_memo: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_memo_lock = threading.Lock()
+# key -> [lock, holders]; an entry lives only while a split of it is in flight.
+_key_locks: dict[str, list[Any]] = {}
+
+
+class PdfSplitError(RuntimeError):
+    """The PDF cannot be split into parts under the Vertex file limit."""
+
+
+def split_key(bucket: str, path: str, version: Any) -> str:
+    return hashlib.sha256(f"{bucket}/{path}#{version}".encode("utf-8")).hexdigest()[:24]
+
+
+def _remember(key: str, manifest: dict[str, Any]) -> None:
+    with _memo_lock:
+        _memo[key] = manifest
+        _memo.move_to_end(key)
+        while len(_memo) > _MEMO_SIZE:
+            _memo.popitem(last=False)
+
+
+def _recall(key: str) -> dict[str, Any] | None:
+    with _memo_lock:
+        manifest = _memo.get(key)
+        if manifest is not None:
+            _memo.move_to_end(key)
+        return manifest
+
+
+@contextmanager
+def _key_lock(key: str) -> Iterator[None]:
+    with _memo_lock:
+        entry = _key_locks.setdefault(key, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _memo_lock:
+            entry[1] -= 1
+            if not entry[1]:
+                del _key_locks[key]
+
+
+def _source_pointer(bucket: str, path: str) -> str:
+    digest = hashlib.sha256(f"{bucket}/{path}".encode("utf-8")).hexdigest()[:24]
+    return f"{_MANIFEST_PREFIX}/sources/{digest}.json"
+
+
+def _retire_superseded(bucket: str, path: str, key: str) -> None:
+    """Point the source at ``key`` and delete the split it replaces."""
+    from app.services import gcs_service
+
+    pointer = _source_pointer(bucket, path)
+    try:
+        previous = json.loads(gcs_service.download_object_buffer(bucket, pointer)).get("key")
+    except Exception:
+        previous = None
+    try:
+        gcs_service.upload_file_to_gcs(bucket, pointer, json.dumps({"key": key}).encode("utf-8"), "application/json")
+        if previous and previous != key:
+            with _memo_lock:
+                _memo.pop(previous, None)
+            deleted = gcs_service.delete_prefix(bucket, f"{_MANIFEST_PREFIX}/{previous}/")
+            logger.info("Deleted superseded split %s of %s (%d objects)", previous, path, deleted)
+    except Exception:
+        logger.exception("Failed to retire the superseded split of %s", path)
+
+
+def _load_manifest(bucket: str, key: str) -> dict[str, Any] | None:
+    """Stored manifest for ``key`` when every part it lists still exists."""
+    from app.services import gcs_service
+
+    try:
+        manifest = json.loads(gcs_service.download_object_buffer(bucket, f"{_MANIFEST_PREFIX}/{key}/manifest.json"))
+    except Exception:
+        return None
+    for part in manifest.get("parts") or []:
+        parsed = gcs_service.parse_gcs_uri(part.get("uri") or "")
+        if not parsed or not gcs_service.object_exists(*parsed):
+            logger.info("Split manifest %s is missing part %s — re-splitting", key, part.get("uri"))
+            return None
+    return manifest if manifest.get("parts") else None
+
+
+def _render(reader: Any, start: int, end: int) -> tuple[Any, int]:
+    """Write pages [start, end) to a spooled temp file; return (file, size)."""
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for p in range(start, end):
+        writer.add_page(reader.pages[p])
+    out = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES)
+    writer.write(out)
+    return out, out.tell()
+
+
+def _next_part(
+    reader: Any,
+    start: int,
+    total_pages: int,
+    *,
+    page_bytes: float,
+    target_bytes: int,
+    limit_bytes: int,
+    path: str,
+) -> tuple[int, Any, int]:
+    """Largest end page such that pages [start, end) render under the target.
+
+    The first probe is estimated from bytes per page. From a fit the search
+    grows by the pages the remaining headroom should hold (at least one);
+    from a miss it shrinks by the measured overshoot. Once a fit and a miss
+    bracket the answer it bisects between them, so no render goes far past
+    the part actually being built. A single page over the target is accepted
+    on its own (as before) unless it is over the hard Vertex limit. Returns
+    (end, spooled part, size).
+    """
+    first = start + 1
+    probe = min(total_pages, max(first, start + int(target_bytes * _GUESS_FILL // max(1.0, page_bytes))))
+    best: tuple[int, Any, int] | None = None
+    miss, miss_size = total_pages + 1, 0  # smallest end known not to fit
+    while True:
+        out, size = _render(reader, start, probe)
+        if size <= target_bytes or probe == first:
+            if size > limit_bytes:
+                out.close()
+                raise PdfSplitError(
+                    f"Page {start + 1} of {path} exceeds the Vertex file limit by itself — cannot split safely."
+                )
+            if best is not None:
+                best[1].close()
+            best = (probe, out, size)
+        else:
+            out.close()
+            miss, miss_size = probe, size
+        if best is not None and best[0] + 1 >= miss:
+            return best
+        if best is None:
+            # Only misses so far: scale down by the measured overshoot.
+            guess = int((miss - start) * target_bytes * _GUESS_FILL / miss_size)
+            probe = max(first, min(miss - 1, start + guess))
+        elif miss <= total_pages:
+            probe = (best[0] + miss) // 2
+        else:
+            end, _, fit_size = best
+            headroom = int((target_bytes - fit_size) * (end - start) / max(1, fit_size))
+            probe = min(total_pages, end + max(1, headroom))
+
+
+def _split(
+    bucket: str,
+    path: str,
+    *,
+    size: int,
+    generation: int | None,
+    part_prefix: str,
+    target_bytes: int,
+    limit_bytes: int,
+) -> dict[str, Any]:
+    from pypdf import PdfReader
+
+    from app.services import gcs_service
+
+    base = path.rsplit("/", 1)[-1].rsplit(".", 1)[0][:80] or "document"
+    parts: list[dict[str, Any]] = []
+    with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES) as source:
+        gcs_service.download_object_to_file(bucket, path, source, generation=generation)
+        source.seek(0)
+        reader = PdfReader(source)
+        total_pages = len(reader.pages)
+        if not total_pages:
+            raise PdfSplitError(f"PDF {path} contains no pages.")
+        page_bytes = max(1.0, (size or source.tell()) / total_pages)
+        start = 0
+        while start < total_pages:
+            end, out, part_size = _next_part(
+                reader,
+                start,
+                total_pages,
+                page_bytes=page_bytes,
+                target_bytes=target_bytes,
+                limit_bytes=limit_bytes,
+                path=path,
+            )
+            with out:
+                part_path = f"{part_prefix}/{base}.part{len(parts) + 1:02d}.pdf"
+                uri = gcs_service.upload_fileobj_to_gcs(bucket, part_path, out, "application/pdf")
+            parts.append({"uri": uri, "firstPage": start + 1, "lastPage": end, "bytes": part_size})
+            page_bytes = max(1.0, part_size / (end - start))
+            start = end
+    return {
+        "source": f"gs://{bucket}/{path}",
+        "generation": generation,
+        "size": size,
+        "totalPages": total_pages,
+        "parts": parts,
+    }
+
+
+def split_pdf_parts(
+    bucket: str,
+    path: str,
+    *,
+    metadata: dict[str, Any],
+    session_id: str | None,
+    target_bytes: int,
+    limit_bytes: int,
+) -> dict[str, Any]:
+    """Manifest of part-PDFs (each under ``target_bytes``) for one GCS PDF.
+
+    ``metadata`` is the object's ``get_object_metadata``. With a generation
+    or etag the split is cached and shared; without one (nothing to key a
+    cache on) the parts go to ``tmp/{session}/`` as before.
+    """
+    from app.services import gcs_service
+
+    size = int(metadata.get("size") or 0)
+    generation = metadata.get("generation")
+    version = generation or metadata.get("etag")
+    if not version:
+        safe_session = re.sub(r"[^a-zA-Z0-9-_]", "_", str(session_id or f"adhoc-{uuid.uuid4().hex[:8]}"))
+        return _split(
+            bucket,
+            path,
+            size=size,
+            generation=None,
+            part_prefix=f"tmp/{safe_session}",
+            target_bytes=target_bytes,
+            limit_bytes=limit_bytes,
+        )
+
+    key = split_key(bucket, path, version)
+    manifest = _recall(key)
+    if manifest is not None:
+        return manifest
+    with _key_lock(key):  # one split per object version, even across concurrent chats
+        manifest = _recall(key) or _load_manifest(bucket, key)
+        if manifest is not None:
+            logger.info("Reusing split of %s (%d parts)", path, len(manifest["parts"]))
+        else:
+            manifest = _split(
+                bucket,
+                path,
+                size=size,
+                generation=generation,
+                part_prefix=f"{_MANIFEST_PREFIX}/{key}",
+                target_bytes=target_bytes,
+                limit_bytes=limit_bytes,
+            )
+            manifest["etag"] = metadata.get("etag")
+            gcs_service.upload_file_to_gcs(
+                bucket,
+                f"{_MANIFEST_PREFIX}/{key}/manifest.json",
+                json.dumps(manifest).encode("utf-8"),
+                "application/json",
+            )
+            _retire_superseded(bucket, path, key)
+        _remember(key, manifest)
+    return manifest
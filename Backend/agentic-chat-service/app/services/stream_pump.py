@@ -0,0 +1,195 @@
+"""
+stream_pump.py — async bridge for the synchronous Gemini SDK stream iterators.
+
+``generate_content_stream`` returns a blocking iterator. Advancing it with
+``loop.run_in_executor(None, next)`` once per chunk put thousands of tiny
+hops per minute on the default executor, where they queued behind DB work
+and inflated token-to-client latency under concurrent chats.
+
+A ``StreamPump`` drains one iterator (opening it too) on a worker of a
+dedicated, bounded pool and hands chunks to the event loop through a queue.
+The pump thread stops pulling once ``LLM_STREAM_PUMP_QUEUE`` chunks are
+waiting (backpressure), and stops for good when the consumer closes the
+pump. Each stream records time-to-first-chunk for latency tracking.
+
+The idle timeout and time-to-first-chunk start when a pump worker picks the
+stream up, not when it is queued: a stream waiting for a free worker is not
+a stalled Gemini stream. That wait is recorded and logged separately.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.environ.get(name, "").strip() or default))
+    except ValueError:
+        return default
+
+
+# One worker per in-flight stream (the worker is held for the whole stream),
+# so this caps concurrent LLM streams; extra streams wait for a free pump.
+_PUMP_THREADS = _env_int("LLM_STREAM_PUMP_THREADS", 64)
+# A stream that waited longer than this for a pump worker is logged as a
+# warning (the pool is saturated; raise LLM_STREAM_PUMP_THREADS).
+_QUEUE_WAIT_WARN_S = 1.0
+# Chunks buffered ahead of a slow consumer before the pump stops pulling.
+_QUEUE_SIZE = _env_int("LLM_STREAM_PUMP_QUEUE", 32)
+
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+_STARTED, _ITEM, _ERROR, _END = "started", "item", "error", "end"
+
+
+def _pump_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=_PUMP_THREADS, thread_name_prefix="llm-stream-pump")
+        return _pool
+
+
+class StreamPump:
+    """Async iterator over a blocking stream, drained on a dedicated pump thread.
+
+    ``open_stream`` is called on the pump thread and must return the SDK
+    iterator (so opening the stream costs no executor hop either). Errors
+    raised while opening or iterating surface from ``__anext__``.
+    ``idle_timeout`` raises ``asyncio.TimeoutError`` when no chunk arrives
+    for that many seconds once a pump worker runs the stream. ``metrics``
+    holds ``queueWaitMs`` (waiting for a pump worker), ``ttftMs`` (worker
+    start to first chunk), ``chunks`` and ``durationMs``.
+    """
+
+    def __init__(
+        self,
+        open_stream: Callable[[], Iterable[Any]],
+        *,
+        label: str = "",
+        maxsize: int = _QUEUE_SIZE,
+        idle_timeout: float | None = None,
+    ) -> None:
+        self._open = open_stream
+        self.label = label
+        self._idle_timeout = idle_timeout
+        self._credits = threading.Semaphore(maxsize)
+        self._closed = threading.Event()
+        self._queue: asyncio.Queue | None = None
+        self._done = False
+        self._t0 = 0.0
+        self._t_started: float | None = None
+        self.metrics: dict[str, Any] = {"queueWaitMs": None, "ttftMs": None, "chunks": 0, "durationMs": None}
+
+    @classmethod
+    def over(cls, iterator: Iterable[Any], **kwargs: Any) -> "StreamPump":
+        """Pump an iterator that is already open."""
+        return cls(lambda: iterator, **kwargs)
+
+    def _start(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._t0 = time.monotonic()
+        _pump_pool().submit(self._drain, loop, self._queue)
+
+    def _drain(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue) -> None:
+        def post(kind: str, payload: Any = None) -> bool:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, (kind, payload))
+                return True
+            except RuntimeError:  # event loop closed under us
+                return False
+
+        iterator = None
+        try:
+            if self._closed.is_set():  # consumer left while we waited for a pump worker
+                return
+            if not post(_STARTED, time.monotonic()):
+                return
+            iterator = iter(self._open())
+            if self._closed.is_set():  # ... or while the stream was opening: close it unread
+                return
+            for item in iterator:
+                while not self._credits.acquire(timeout=0.5):
+                    if self._closed.is_set():
+                        return
+                if self._closed.is_set() or not post(_ITEM, item):
+                    return
+            post(_END)
+        except BaseException as exc:  # noqa: BLE001 — re-raised on the loop side
+            post(_ERROR, exc)
+        finally:
+            close = getattr(iterator, "close", None)
+            if self._closed.is_set() and callable(close):
+                try:
+                    close()
+                except Exception:
+                    pass
+
+    def __aiter__(self) -> "StreamPump":
+        return self
+
+    async def __anext__(self) -> Any:
+        if self._done:
+            raise StopAsyncIteration
+        if self._queue is None:
+            self._start()
+        while True:
+            # No idle timeout until a worker runs the stream: waiting for a
+            # free pump is not a stalled stream.
+            if self._idle_timeout and self._t_started is not None:
+                kind, payload = await asyncio.wait_for(self._queue.get(), timeout=self._idle_timeout)
+            else:
+                kind, payload = await self._queue.get()
+            if kind != _STARTED:
+                break
+            self._on_started(payload)
+        if kind == _ITEM:
+            self._credits.release()
+            if self.metrics["ttftMs"] is None:
+                self.metrics["ttftMs"] = round((time.monotonic() - self._t_started) * 1000)
+            self.metrics["chunks"] += 1
+            return payload
+        self._finish()
+        if kind == _ERROR:
+            raise payload
+        raise StopAsyncIteration
+
+    def _on_started(self, started: float) -> None:
+        self._t_started = started
+        wait = started - self._t0
+        self.metrics["queueWaitMs"] = round(wait * 1000)
+        if wait >= _QUEUE_WAIT_WARN_S:
+            logger.warning("LLM stream %s waited %sms for a pump worker (pool of %s busy)",
+                           self.label or "-", self.metrics["queueWaitMs"], _PUMP_THREADS)
+
+    def _finish(self) -> None:
+        if self._done:
+            return
+        self._done = True
+        self._closed.set()
+        self._credits.release()  # unblock a pump waiting for queue space
+        if self._queue is not None:
+            self.metrics["durationMs"] = round((time.monotonic() - self._t0) * 1000)
+            logger.info(
+                "LLM stream %s: queue_wait=%sms ttft=%sms chunks=%s duration=%sms",
+                self.label or "-",
+                self.metrics["queueWaitMs"],
+                self.metrics["ttftMs"],
+                self.metrics["chunks"],
+                self.metrics["durationMs"],
+            )
+
+    async def aclose(self) -> None:
+        """Stop the pump; the thread exits after the chunk it is pulling."""
+        self._finish()
@@ -0,0 +1,101 @@
+"""Benchmark: draft invariants + structural lint, per-check parsing vs one DraftIndex.
+
+Runs every check in ``draft_invariants.ALL_CHECKS`` plus
+``drafting_service._structural_lint`` over each draft twice: once handing
+every check the raw section list (each parses the draft itself, as before),
+once through a single shared ``DraftIndex`` (``run_all``). Checks both give
+the same findings and prints wall time for each.
+
+Drafts: synthetic 40-section / 80–100 page sectioned drafts, plus any
+recorded drafts passed as arguments — JSON files shaped like
+tests/golden/*.json: {"sections": [...], "digest": "..."}.
+
+Run:  venv/Scripts/python.exe scripts/bench_draft_index.py [draft.json ...]
+"""
+from __future__ import annotations
+
+import json
+import pathlib
+import random
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from app.services.draft_index import DraftIndex  # noqa: E402
+from app.services.draft_invariants import ALL_CHECKS, run_all  # noqa: E402
+from app.services.drafting_service import _structural_lint  # noqa: E402
+
+WORDS = (
+    "plaintiff defendant invoice agreement payment delivery notice demand interest principal "
+    "amount goods supply contract breach damages hereby submitted respectfully court"
+).split()
+HEADINGS = ["FACTS", "BREACH", "INVOICES", "DEMAND", "LIMITATION AND CAUSE OF ACTION", "JURISDICTION",
+            "VALUATION", "INTEREST"]
+
+
+def _sectioned(paras: int, sections: int = 40, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    out = [{"section_id": "caption", "index": 0, "heading": "CAUSE TITLE",
+            "content": "IN THE COMMERCIAL COURT AT PUNE\nALPHA LTD\n…PLAINTIFF\nVERSUS\nBETA LTD\n…DEFENDANT"}]
+    chrono = "| S.No | Date | Particulars |\n|---|---|---|\n" + "\n".join(
+        f"| {k} | {k % 28 + 1:02d}-Mar-2024 | Event {k} between the parties |" for k in range(1, 80))
+    out.append({"section_id": "dates", "index": 1, "heading": "LIST OF DATES AND EVENTS", "content": chrono})
+    per = paras // sections
+    n = 0
+    for s in range(sections):
+        lines = []
+        for _ in range(per):
+            n += 1
+            line = f"{n}. That the {' '.join(rng.choice(WORDS) for _ in range(rng.randint(40, 90)))}."
+            if n % 25 == 0:
+                line += f" The invoice is annexed hereto and marked as ANNEXURE P-{n // 25}."
+            lines.append(line)
+        out.append({"section_id": f"s{s}", "index": s + 2, "heading": rng.choice(HEADINGS),
+                    "content": "\n\n".join(lines)})
+    out += [
+        {"section_id": "prayer", "index": 900, "heading": "PRAYER",
+         "content": "(a) decree for Rs. 20,06,000;\n(b) interest;\n(c) costs."},
+        {"section_id": "ver", "index": 901, "heading": "VERIFICATION",
+         "content": f"Verified on this 20th day of January, 2026. paragraphs 1 to {n} are true."},
+        {"section_id": "sot", "index": 902, "heading": "STATEMENT OF TRUTH",
+         "content": f"1. I state that paragraphs 1 to {n} are true.\n2. Signed."},
+        {"section_id": "lod", "index": 903, "heading": "LIST OF DOCUMENTS",
+         "content": "| S.No | Particulars | Annexure |\n|---|---|---|\n| 1 | Agreement | ANNEXURE P-1 |"},
+    ]
+    digest = "| 1. | 15-Jan-2026 | Certificate issued |\n| 2 | 01-Mar-2024 | Event 1 between the parties |"
+    return {"sections": out, "digest": digest}
+
+
+def _bench(label: str, sections: list[dict], digest: str) -> None:
+    t0 = time.perf_counter()
+    unshared = {name: fn(sections, digest) for name, fn in ALL_CHECKS.items()}
+    lint_before = [v.model_dump() for v in _structural_lint(sections)]
+    old_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    idx = DraftIndex(sections)
+    card = run_all(idx, digest)
+    lint_after = [v.model_dump() for v in _structural_lint(idx)]
+    new_s = time.perf_counter() - t0
+
+    chars = sum(len(s.get("content") or "") for s in sections)
+    same = card["issues"] == {k: v for k, v in unshared.items() if v} and lint_before == lint_after
+    print(
+        f"{label:<30} {len(sections):>3} sections {chars:>8} chars  per-check {old_s * 1000:8.1f} ms  "
+        f"shared index {new_s * 1000:8.1f} ms  x{old_s / max(new_s, 1e-9):4.1f}  "
+        f"{'identical' if same else 'DIFFERENT'}"
+    )
+    if not same:
+        raise SystemExit(f"{label}: findings differ between per-check and shared-index runs")
+
+
+def main(paths: list[str]) -> None:
+    drafts = [("sectioned 80pp", _sectioned(480)), ("sectioned 100pp", _sectioned(600, seed=1))]
+    drafts += [(pathlib.Path(p).name, json.loads(pathlib.Path(p).read_text(encoding="utf-8"))) for p in paths]
+    for label, data in drafts:
+        _bench(label, data.get("sections", []), data.get("digest", ""))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
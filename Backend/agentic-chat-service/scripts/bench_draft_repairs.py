@@ -0,0 +1,139 @@
+"""Benchmark: `_monolithic_deterministic_repairs` with and without shared scans.
+
+Runs each draft through the repair engine twice — once as shipped, once with
+the shared text index, the prefix-shingle corpus and the regex gates
+switched off (every helper rescanning the draft, as before the engine) —
+checks both produce the same text and info, and prints wall time plus the
+slowest passes from ``info["repair_timings_ms"]``.
+
+Drafts: synthetic 80–100 page plaints (with and without an appended restart
+copy), plus any recorded drafts passed as arguments — plain-text files, one
+draft per file. ``--digest FILE`` supplies a facts digest for them.
+
+Run:  venv/Scripts/python.exe scripts/bench_draft_repairs.py [--digest digest.txt] [draft.txt ...]
+"""
+from __future__ import annotations
+
+import contextlib
+import pathlib
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from app.services import draft_repairs as dr  # noqa: E402
+
+DIGEST = (
+    "PARTIES —\n- Full Name: Nexora Infotech Private Limited\n- CIN: U72900PN2020PTC191234\n"
+    "- Incorporated under Companies Act, 2013\nDOCUMENT REFERENCES —\n"
+    "- Master Service Agreement dated 01-Jan-2024\n- Invoice INV-101\n"
+    "AMOUNTS — Invoice unpaid Rs. 20,06,000\n"
+)
+WORDS = (
+    "plaintiff defendant invoice agreement payment delivery notice demand interest principal "
+    "amount goods supply contract breach damages hereby submitted respectfully court "
+    "jurisdiction limitation cause action arose"
+).split()
+
+
+def _plaint(paras: int, seed: int = 0, restart: bool = False) -> str:
+    rng = random.Random(seed)
+    caption = (
+        "IN THE COMMERCIAL COURT AT PUNE\nCOMMERCIAL SUIT NO. ____ OF 2026\n\n"
+        "Nexora Infotech Private Limited, a company incorporated under the Companies Act, 2013\n"
+        "…PLAINTIFF\n\nVERSUS\n\nBeta Traders Ltd\n…DEFENDANT\n\nPLAINT\n\n"
+    )
+    body = []
+    for i in range(1, paras + 1):
+        line = f"{i}. That the {' '.join(rng.choice(WORDS) for _ in range(rng.randint(40, 90)))}."
+        if i % 40 == 0:
+            line += f" The invoice is annexed hereto and marked as ANNEXURE P-{rng.randint(1, 3)}."
+        if i % 97 == 0:
+            line += " [DATA NOT PROVIDED: date of notice]"
+        body.append(line)
+    chrono = "LIST OF DATES AND EVENTS\n\n| S.No | Date | Particulars |\n|---|---|---|\n" + "\n".join(
+        f"| {k} | {k:02d}.03.2024 | Event {k} occurred between the parties |" for k in range(1, 60)
+    )
+    tail = (
+        "PRAYER\n\n(a) decree for Rs. 20,06,000;\n(b) costs.\n\nVERIFICATION\n"
+        "I say that paragraphs 1 to 20 are true to my personal knowledge.\n\n"
+        "LIST OF DOCUMENTS\n\n| S.No | Particulars | Annexure | Status |\n"
+        "|:-----|:------------|:---------|:-------|\n| 1 | Agreement | ANNEXURE P-1 | Filed herewith |\n"
+    )
+    doc = caption + chrono + "\n\n" + "\n\n".join(body) + "\n\n" + tail
+    return doc + "\n\n" + doc[: len(doc) // 2] if restart else doc
+
+
+class _DirectPrefixes:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    def containment(self, sample: str, pos: int, size: int = 8, step: int = 4) -> float:
+        return dr._shingle_containment(sample, self.text[:pos], size, step)
+
+
+@contextlib.contextmanager
+def _rescanning():
+    always = re.compile("")
+    patches = {
+        "_text_index": lambda text: dr._TextIndex(text),
+        "_NormalizedPrefixes": _DirectPrefixes,
+        "_CASEFOLD_ODD_CHARS": ("",),
+        "_DNP_GATE_RE": always,
+        "_AGED_DNP_GATE_RE": always,
+        "_AGED_COMMA_GATE_RE": always,
+        "_DESIGNATION_GATE_RE": always,
+        "_SWORN_LINE_GATE_RE": always,
+    }
+    saved = {name: getattr(dr, name) for name in patches}
+    for name, value in patches.items():
+        setattr(dr, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(dr, name, value)
+
+
+def _run(text: str, digest: str) -> tuple[float, str, dict]:
+    t0 = time.perf_counter()
+    out, info = dr._monolithic_deterministic_repairs(text, digest)
+    return time.perf_counter() - t0, out, info
+
+
+def _bench(label: str, text: str, digest: str) -> None:
+    with _rescanning():
+        old_s, old_out, old_info = _run(text, digest)
+    new_s, new_out, new_info = _run(text, digest)
+    timings = new_info.pop("repair_timings_ms")
+    old_info.pop("repair_timings_ms")
+    same = old_out == new_out and old_info == new_info
+    print(
+        f"{label:<34} {len(text):>8} chars  rescanning {old_s * 1000:8.1f} ms  "
+        f"shared {new_s * 1000:8.1f} ms  x{old_s / max(new_s, 1e-9):4.1f}  {'identical' if same else 'DIFFERENT'}"
+    )
+    slowest = sorted(timings.items(), key=lambda kv: -kv[1])[:5]
+    print("    " + "  ".join(f"{name} {ms:.1f}ms" for name, ms in slowest))
+    if not same:
+        raise SystemExit(f"{label}: repair output differs from the rescanning run")
+
+
+def main(argv: list[str]) -> None:
+    digest = DIGEST
+    if argv[:1] == ["--digest"]:
+        digest = pathlib.Path(argv[1]).read_text(encoding="utf-8")
+        argv = argv[2:]
+    drafts = [
+        ("plaint 80pp", _plaint(480), DIGEST),
+        ("plaint 100pp", _plaint(600, seed=1), DIGEST),
+        ("plaint 100pp + restart copy", _plaint(600, seed=2, restart=True), DIGEST),
+    ]
+    drafts += [(pathlib.Path(p).name, pathlib.Path(p).read_text(encoding="utf-8"), digest) for p in argv]
+    for label, text, dg in drafts:
+        _bench(label, text, dg)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
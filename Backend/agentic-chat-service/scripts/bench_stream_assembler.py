@@ -0,0 +1,141 @@
+"""Benchmark: stream round assembly, string concat vs `_StreamText`.
+
+Replays long answer streams through the old per-chunk path (one growing
+string via `_append_stream_piece`) and the list-backed assembler, checks the
+two produce identical deltas, and reports CPU per chunk at the start vs the
+end of the stream (the old path grows with answer length). Also times the
+continuation overlap trim against the quadratic version it replaced.
+
+Streams: synthetic 60K-char chronology tables in delta and cumulative (ADK
+snapshot) chunking, plus any recorded streams passed as arguments — JSONL,
+one chunk per line, either a JSON string or an object with a "text" field.
+
+Run:  venv/Scripts/python.exe scripts/bench_stream_assembler.py [recorded.jsonl ...]
+"""
+from __future__ import annotations
+
+import json
+import pathlib
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from app.services.llm_service import _append_stream_piece, _StreamText, _trim_overlap  # noqa: E402
+
+
+def _old_trim_overlap(prior: str, new: str, *, window: int = 1200, min_overlap: int = 15) -> str:
+    def _normalize(t: str) -> str:
+        return re.sub(r"[^a-z0-9]", "", t.lower())
+
+    tail = prior[-window:]
+    limit = min(len(tail), len(new))
+    for k in range(limit, min_overlap - 1, -1):
+        if tail.endswith(new[:k]):
+            return new[k:]
+    norm_tail = _normalize(tail)
+    for k in range(limit, min_overlap - 1, -1):
+        probe = _normalize(new[:k])
+        if len(probe) >= min_overlap and norm_tail.endswith(probe):
+            return new[k:]
+    return new
+
+
+def _chronology(chars: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    events = ["Plaint filed", "Written statement", "Interim order", "Notice issued", "Matter adjourned"]
+    rows = ["| Date | Event | Remarks |", "|---|---|---|"]
+    day = 0
+    while sum(len(r) + 1 for r in rows) < chars:
+        day += 1
+        rows.append(f"| {day:02d}.{rng.randint(1, 12):02d}.20{rng.randint(10, 25)} | "
+                    f"{rng.choice(events)} | Para {rng.randint(1, 400)} of the record |")
+    return "\n".join(rows)[:chars]
+
+
+def _delta_stream(text: str, size: int = 120) -> list[str]:
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def _cumulative_stream(text: str, size: int = 120) -> list[str]:
+    return [text[:i + size] for i in range(0, len(text), size)]
+
+
+def _load(path: str) -> list[str]:
+    out = []
+    for line in pathlib.Path(path).read_text(encoding="utf-8").splitlines():
+        if line.strip():
+            item = json.loads(line)
+            out.append(item if isinstance(item, str) else item.get("text") or "")
+    return out
+
+
+def _replay_old(pieces: list[str]) -> tuple[list[str], list[float]]:
+    current, deltas, cost = "", [], []
+    for piece in pieces:
+        t = time.perf_counter()
+        current, delta = _append_stream_piece(current, piece)
+        cost.append(time.perf_counter() - t)
+        deltas.append(delta)
+    return deltas, cost
+
+
+def _replay_new(pieces: list[str]) -> tuple[list[str], list[float]]:
+    buf, deltas, cost = _StreamText(), [], []
+    for piece in pieces:
+        t = time.perf_counter()
+        deltas.append(buf.append(piece))
+        cost.append(time.perf_counter() - t)
+    buf.text()
+    return deltas, cost
+
+
+def _us(cost: list[float], part: slice) -> float:
+    window = cost[part]
+    return sum(window) / max(1, len(window)) * 1e6
+
+
+def bench_stream(name: str, pieces: list[str]) -> None:
+    old_deltas, old_cost = _replay_old(pieces)
+    new_deltas, new_cost = _replay_new(pieces)
+    assert old_deltas == new_deltas, f"{name}: deltas differ"
+    tenth = max(1, len(pieces) // 10)
+    first, last = slice(0, tenth), slice(-tenth, None)
+    print(f"{name:<28} chunks={len(pieces):>5}  "
+          f"old {_us(old_cost, first):7.1f} -> {_us(old_cost, last):7.1f} us/chunk  "
+          f"new {_us(new_cost, first):7.1f} -> {_us(new_cost, last):7.1f} us/chunk  "
+          f"total {sum(old_cost) * 1e3:7.2f} -> {sum(new_cost) * 1e3:6.2f} ms")
+
+
+def bench_trim(prior: str, rounds: int = 20) -> None:
+    heads = [
+        prior[-700:] + "Further proceedings were recorded.\n" * 20,     # verbatim overlap
+        prior[-700:].upper().replace(" ", "  ") + "New rows follow.\n" * 20,  # reformatted
+        "Completely fresh content with no overlap at all.\n" * 30,       # miss: worst case
+    ]
+    for label, head in zip(("verbatim", "normalized", "no overlap"), heads):
+        assert _trim_overlap(prior, head) == _old_trim_overlap(prior, head)
+        t = time.perf_counter()
+        for _ in range(rounds):
+            _old_trim_overlap(prior, head)
+        old = (time.perf_counter() - t) / rounds
+        t = time.perf_counter()
+        for _ in range(rounds):
+            _trim_overlap(prior, head)
+        new = (time.perf_counter() - t) / rounds
+        print(f"trim_overlap {label:<15} old {old * 1e3:7.2f} ms  new {new * 1e3:6.2f} ms  ({old / new:5.1f}x)")
+
+
+def main() -> None:
+    answer = _chronology(60_000)
+    bench_stream("synthetic 60K delta", _delta_stream(answer))
+    bench_stream("synthetic 60K cumulative", _cumulative_stream(answer))
+    for path in sys.argv[1:]:
+        bench_stream(pathlib.Path(path).name, _load(path))
+    bench_trim(answer)
+
+
+if __name__ == "__main__":
+    main()
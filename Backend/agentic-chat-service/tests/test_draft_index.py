@@ -0,0 +1,89 @@
+"""DraftIndex: one parse of the sections shared by the invariants and the lint.
+
+    cd Backend/agentic-chat-service && python -m pytest tests/test_draft_index.py -q
+"""
+from __future__ import annotations
+
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from app.services import draft_index, draft_invariants  # noqa: E402
+from app.services.draft_index import DraftIndex  # noqa: E402
+from app.services.draft_invariants import ALL_CHECKS, run_all  # noqa: E402
+from app.services.drafting_service import _structural_lint  # noqa: E402
+
+
+def sec(sid, idx, heading, content):
+    return {"section_id": sid, "index": idx, "heading": heading, "content": content}
+
+
+SECTIONS = [
+    sec("v", 3, "VERIFICATION", "Verified on this 5th day of January, 2026.\nparagraphs 1 to 5"),
+    sec("f", 1, "FACTS", "1. The agreement (ANNEXURE P-1).\n2. The invoice (Exhibit P-2).\n2. Again."),
+    sec("c", 0, "CAUSE TITLE", "ALPHA LTD\nVERSUS\nBETA LTD"),
+    sec("t", 2, "LIST OF DATES AND EVENTS", "| Date | Event |\n|---|---|\n| 01-Jan-2025 | Invoice |\n\n"
+                                            "| A | B |\n|---|---|\n| x |  |"),
+    sec("s", 4, "STATEMENT OF TRUTH", "1. I state.\n2. paragraphs 1 to 8"),
+    sec("n", 5, "NOTES", None),
+]
+
+
+def test_lookups_and_per_section_scans():
+    idx = DraftIndex(SECTIONS)
+    assert idx.ordered == [2, 1, 3, 0, 4, 5]
+    assert idx.find("statement of truth") == 4
+    assert idx.find("prayer", "relief") is None
+    assert [idx.body_scope(i) for i in range(len(idx))] == [True, True, True, True, False, True]
+    assert [m.group(1) for m in idx.paragraphs(1)] == ["1", "2", "2"]
+    assert idx.dates(0) == [(2026, 1, 5)]
+    assert len(idx.table_rows(3)) == 6
+    assert [len(b) for b in idx.table_blocks(3)] == [3, 3]
+    assert idx.contents[5] == "" and idx.text("\n").endswith("paragraphs 1 to 8\n")
+
+
+def test_scans_are_memoized_on_the_snapshot():
+    sections = [dict(s) for s in SECTIONS]
+    idx = DraftIndex(sections)
+    first = idx.paragraphs(1)
+    sections[1]["content"] = "9. Edited."  # edits after indexing need a new index
+    assert idx.paragraphs(1) is first
+    assert [m.group(1) for m in DraftIndex(sections).paragraphs(1)] == ["9"]
+    assert DraftIndex.of(idx) is idx
+
+
+def test_run_all_builds_one_index_and_matches_unshared_checks(monkeypatch):
+    digest = "| 1. | 15-Jan-2026 | Certificate issued |"
+    builds = []
+    original = DraftIndex.__init__
+
+    def counting_init(self, sections):
+        builds.append(1)
+        original(self, sections)
+
+    monkeypatch.setattr(draft_index.DraftIndex, "__init__", counting_init)
+    card = run_all(SECTIONS, digest)
+    assert len(builds) == 1
+    expected = {name: fn(SECTIONS, digest) for name, fn in ALL_CHECKS.items()}
+    assert card["issues"] == {name: issues for name, issues in expected.items() if issues}
+    assert len(builds) > 10  # unshared: every check that reads the draft parses it again
+    assert {"single_exhibit_terminology", "attestation_dates_order",
+            "verification_matches_sot", "no_empty_cells"} <= set(card["issues"])
+
+
+def test_checks_accept_an_index():
+    idx = DraftIndex(SECTIONS)
+    assert draft_invariants.check_caption_duplication(idx) == []
+    assert draft_invariants.check_attestation_restarts(idx) == []
+    assert draft_invariants.check_no_empty_cells(idx) == draft_invariants.check_no_empty_cells(SECTIONS)
+
+
+def test_structural_lint_reads_the_same_index():
+    idx = DraftIndex(SECTIONS)
+    from_list = [v.model_dump() for v in _structural_lint(SECTIONS)]
+    assert [v.model_dump() for v in _structural_lint(idx)] == from_list
+    problems = " ".join(v["problem"] for v in from_list)
+    assert "Duplicate paragraph number: '1.' already used earlier (sections f, s)" in problems
+    assert "ANNEXURE P-1 is referenced but never formally annexed" in problems
+    assert "Mixed exhibit terminology" in problems
@@ -0,0 +1,391 @@
+"""Content-addressed Gemini cache registry: sharing, refcounts, TTL, eviction.
+
+    cd Backend/agentic-chat-service && python -m pytest tests/test_gemini_cache_registry.py -q
+"""
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import sys
+import threading
+import types
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from agents.adk_callbacks import SHARED_CACHE_STATE_KEY, attach_shared_cache  # noqa: E402
+from app.core.auth import require_admin  # noqa: E402
+from app.services import gemini_cache_service  # noqa: E402
+from app.services.gemini_cache_registry import CacheRegistry, content_key  # noqa: E402
+from app.services.gemini_pricing import compute_setup_cost  # noqa: E402
+
+MODEL = "gemini-2.5-flash"
+TOKENS = 200_000
+
+
+class _Clock:
+    def __init__(self, now: float = 1_760_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _registry(clock: _Clock, **kwargs) -> CacheRegistry:
+    return CacheRegistry(clock=clock, **kwargs)
+
+
+def _register(reg: CacheRegistry, clock: _Clock, key: str, session: str, name: str = "cachedContents/a", tokens: int = TOKENS):
+    return reg.register(
+        key,
+        cache_name=name,
+        model_name=MODEL,
+        system_hash="s",
+        file_ids=["f1"],
+        document_tokens=tokens,
+        expires_at=clock.now + 300,
+        session=session,
+    )
+
+
+def test_key_is_content_addressed():
+    assert content_key(MODEL, "s", ["a", "b"]) == content_key(MODEL, "s", ["a", "b"])
+    assert content_key(MODEL, "s", ["a", "b"]) != content_key("gemini-2.5-pro", "s", ["a", "b"])
+    assert content_key(MODEL, "s", ["a", "b"]) != content_key(MODEL, "t", ["a", "b"])
+    assert content_key(MODEL, "s", ["a"]) != content_key(MODEL, "s", ["a", "b"])
+
+
+def test_second_session_reuses_the_cache_and_counts_the_setup_saved():
+    clock = _Clock()
+    reg = _registry(clock)
+    key = content_key(MODEL, "s", ["f1"])
+    assert reg.acquire(key, "chat-1") is None  # nothing cached yet
+    _register(reg, clock, key, "chat-1")
+
+    clock.now += 30
+    assert reg.acquire(key, "chat-1").cache_name == "cachedContents/a"
+    assert reg.acquire(key, "chat-2").cache_name == "cachedContents/a"
+    assert reg.acquire(key, "chat-2") is not None
+
+    (day,) = reg.daily_savings()
+    assert day["setups"] == 1 and day["hits"] == 3 and day["sharedReuses"] == 1
+    assert day["setupTokensSaved"] == TOKENS
+    assert abs(day["setupCostSaved"] - compute_setup_cost(MODEL, TOKENS)) < 1e-12
+    assert day["hitCostSaved"] > 0
+    assert reg.take_pending() and not reg.take_pending()
+
+
+def test_release_keeps_a_cache_other_sessions_still_use():
+    clock = _Clock()
+    reg = _registry(clock)
+    key = content_key(MODEL, "s", ["f1"])
+    _register(reg, clock, key, "chat-1")
+    reg.acquire(key, "chat-2")
+
+    assert reg.release("chat-1", "cachedContents/a") == []
+    assert reg.is_shared("cachedContents/a", "chat-1")
+    orphaned = reg.release("chat-2", "cachedContents/a")
+    assert [e.key for e in orphaned] == [key]
+    assert not reg.is_shared("cachedContents/a", "chat-2")
+
+
+def test_refreshed_cache_name_is_a_new_setup_and_keeps_its_sessions():
+    clock = _Clock()
+    reg = _registry(clock)
+    key = content_key(MODEL, "s", ["f1"])
+    _register(reg, clock, key, "chat-1")
+    reg.acquire(key, "chat-2")
+    clock.now += 60
+    entry = _register(reg, clock, key, "chat-1", name="cachedContents/b")
+    assert entry.cache_name == "cachedContents/b" and set(entry.refs) == {"chat-1", "chat-2"}
+    assert reg.daily_savings()[0]["setups"] == 2
+    assert not reg.is_shared("cachedContents/a", "x")
+
+
+def test_ttl_slides_further_for_busy_caches():
+    clock = _Clock()
+    reg = _registry(clock)
+    busy, idle = content_key(MODEL, "s", ["busy"]), content_key(MODEL, "s", ["idle"])
+    _register(reg, clock, busy, "chat-1", name="cachedContents/busy")
+    _register(reg, clock, idle, "chat-1", name="cachedContents/idle")
+    for _ in range(30):
+        clock.now += 20
+        reg.acquire(busy, "chat-1")
+
+    assert reg.ttl_for(idle, 300, 3600) == 300
+    busy_ttl = reg.ttl_for(busy, 300, 3600)
+    assert 300 < busy_ttl <= 3600 and busy_ttl % 300 == 0
+    assert reg.ttl_for(busy, 300, 300) == 300
+
+
+def test_sweep_evicts_idle_unreferenced_caches_and_accrues_storage():
+    clock = _Clock()
+    reg = _registry(clock)
+    key = content_key(MODEL, "s", ["f1"])
+    _register(reg, clock, key, "chat-1")
+
+    clock.now += 100
+    assert reg.sweep(ref_ttl=300) == []  # still referenced
+    clock.now += 150  # chat-1's reference lapses; no hits → not worth storing
+    evicted = reg.sweep(ref_ttl=200)
+    assert [e.key for e in evicted] == [key]
+    assert reg.get(key) is None
+    assert reg.daily_savings()[0]["storageCost"] > 0
+
+
+def test_sweep_drops_expired_entries_without_deleting_them():
+    clock = _Clock()
+    reg = _registry(clock)
+    key = content_key(MODEL, "s", ["f1"])
+    _register(reg, clock, key, "chat-1")
+    clock.now += 301
+    assert reg.get(key) is None
+    assert reg.sweep(ref_ttl=300) == []  # Gemini already expired it
+
+
+def test_sweep_evicts_lowest_value_caches_over_the_token_budget():
+    clock = _Clock()
+    reg = _registry(clock, max_tokens=TOKENS)
+    keys = [content_key(MODEL, "s", [f"f{i}"]) for i in range(3)]
+    for i, key in enumerate(keys):
+        _register(reg, clock, key, f"chat-{i}", name=f"cachedContents/{i}")
+    for _ in range(5):  # the first cache is the busiest
+        clock.now += 10
+        reg.acquire(keys[0], "chat-0")
+    clock.now += 10
+    reg.acquire(keys[1], "chat-1")
+    for i in range(3):
+        reg.release(f"chat-{i}")
+
+    evicted = reg.sweep(ref_ttl=300)
+    assert [e.key for e in evicted] == [keys[2], keys[1]]  # no hits (cost), then the budget
+    assert reg.get(keys[0]) is not None
+
+
+def test_finding_a_shared_cache_counts_nothing_until_it_is_read(monkeypatch):
+    clock = _Clock()
+    reg = _registry(clock)
+    key = content_key(MODEL, "s", ["f1"])
+    _register(reg, clock, key, "chat-1")
+    monkeypatch.setattr(gemini_cache_service, "_registry", reg)
+    reg.take_pending()
+
+    entry = asyncio.run(gemini_cache_service._find_shared_cache(key))
+    assert entry.cache_name == "cachedContents/a"
+    gemini_cache_service._count_cache_read(key, "chat-2", cached_tokens=0)  # model ignored the cache
+    assert reg.take_pending() == {} and "chat-2" not in entry.refs
+
+    gemini_cache_service._count_cache_read(key, "chat-2", cached_tokens=TOKENS)
+    (day,) = reg.take_pending().values()
+    assert day["hits"] == 1 and day["shared_reuses"] == 1
+
+
+class _FakeDB:
+    """doc_conn stand-in: records SQL; ``referenced`` caches hold DB refs."""
+
+    def __init__(self, referenced: set[str], registered: set[str]):
+        self.referenced, self.registered = referenced, registered
+        self.sql: list[str] = []
+        self._row = None
+
+    def __call__(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def cursor(self):
+        return self
+
+    def commit(self):
+        pass
+
+    def execute(self, sql, params=()):
+        self.sql.append(" ".join(sql.split()))
+        name = params[0] if params else None
+        self._row = None
+        if sql.lstrip().startswith("DELETE FROM gemini_cache_registry"):
+            if name in self.registered and name not in self.referenced:
+                self.registered.discard(name)
+                self._row = {"content_key": "k"}
+        elif "SELECT 1 FROM gemini_cache_registry" in sql and name in self.registered:
+            self._row = {"?column?": 1}
+
+    def fetchone(self):
+        return self._row
+
+    def fetchall(self):
+        return []
+
+
+class _FakeCaches:
+    def __init__(self):
+        self.deleted: list[str] = []
+
+    def delete(self, name):
+        self.deleted.append(name)
+
+
+def _entry(reg: CacheRegistry, clock: _Clock, name: str):
+    return _register(reg, clock, content_key(MODEL, "s", [name]), "chat-x", name=name)
+
+
+def test_eviction_only_deletes_caches_no_instance_references(monkeypatch):
+    clock = _Clock()
+    reg = _registry(clock)
+    idle, elsewhere = _entry(reg, clock, "cachedContents/idle"), _entry(reg, clock, "cachedContents/busy")
+    db = _FakeDB(referenced={"cachedContents/busy"}, registered={"cachedContents/idle", "cachedContents/busy"})
+    caches = _FakeCaches()
+    monkeypatch.setattr(gemini_cache_service, "doc_conn", db)
+    monkeypatch.setattr(gemini_cache_service, "_get_client", lambda: type("C", (), {"caches": caches})())
+
+    gemini_cache_service._evict_cached_contents([idle, elsewhere])
+    assert caches.deleted == ["cachedContents/idle"]
+    assert any("ref_count <= 0" in q for q in db.sql)
+    assert db.sql[0].startswith("WITH gone AS ( DELETE FROM gemini_cache_refs")  # lapse stale refs first
+
+
+def test_delete_cache_keeps_a_cache_another_instance_references(monkeypatch):
+    caches = _FakeCaches()
+    monkeypatch.setattr(gemini_cache_service, "_registry", _registry(_Clock()))
+    monkeypatch.setattr(gemini_cache_service, "_get_client", lambda: type("C", (), {"caches": caches})())
+
+    async def _row(session_id):
+        return {"cache_name": f"cachedContents/{session_id}"}
+
+    monkeypatch.setattr(gemini_cache_service, "get_session_row", _row)
+    db = _FakeDB(referenced={"cachedContents/shared"}, registered={"cachedContents/shared", "cachedContents/solo"})
+    monkeypatch.setattr(gemini_cache_service, "doc_conn", db)
+
+    kept = asyncio.run(gemini_cache_service.delete_cache("shared"))
+    gone = asyncio.run(gemini_cache_service.delete_cache("solo"))
+    assert kept["sharedCacheKept"] and not gone["sharedCacheKept"]
+    assert caches.deleted == ["cachedContents/solo"]
+
+
+def _llm_request(cache_name=None):
+    return SimpleNamespace(
+        config=SimpleNamespace(cached_content=None, system_instruction="sys"),
+        cache_metadata=SimpleNamespace(cache_name=cache_name) if cache_name else None,
+        cache_config=object(),
+    )
+
+
+def test_attach_callback_names_the_shared_cache_unless_adk_has_its_own():
+    ctx = SimpleNamespace(state={SHARED_CACHE_STATE_KEY: "cachedContents/shared"})
+    req = _llm_request()
+    attach_shared_cache(ctx, req)
+    assert req.config.cached_content == "cachedContents/shared"
+    assert req.config.system_instruction is None and req.cache_config is None
+
+    own = _llm_request(cache_name="cachedContents/own")
+    attach_shared_cache(ctx, own)
+    assert own.config.cached_content is None and own.config.system_instruction == "sys"
+
+    bare = _llm_request()
+    attach_shared_cache(SimpleNamespace(state={}), bare)
+    assert bare.config.cached_content is None and bare.cache_config is not None
+
+
+class _FakeRunner:
+    """ADK Runner stand-in: records each prompt, answers from the cache."""
+
+    def __init__(self):
+        self.calls: list[dict] = []
+
+    async def run_async(self, **kw):
+        self.calls.append(kw)
+        yield SimpleNamespace(
+            author="document_cache_agent",
+            cache_metadata=None,
+            usage_metadata=SimpleNamespace(prompt_token_count=TOKENS + 10, cached_content_token_count=TOKENS, candidates_token_count=5),
+            content=SimpleNamespace(parts=[SimpleNamespace(text="The answer.", thought=False)]),
+            turn_complete=True,
+            output=None,
+            finish_reason="STOP",
+        )
+
+
+def test_attaching_to_a_shared_cache_does_not_prime_the_session(monkeypatch):
+    runner, primed = _FakeRunner(), set()
+    adk_app = types.ModuleType("agents.adk_app")
+    adk_app.get_or_build_document_runner = lambda **kw: (runner, object(), "rk")
+
+    async def _session(**kw):
+        return "adk-1"
+
+    adk_app.get_or_create_adk_session = _session
+    adk_app.is_session_primed = lambda rk, sk: (rk, sk) in primed
+    adk_app.mark_session_primed = lambda rk, sk: primed.add((rk, sk))
+    adk_app.DEFAULT_TTL_SECONDS = 300
+    monkeypatch.setitem(sys.modules, "agents.adk_app", adk_app)
+
+    clock = _Clock()
+    reg = _registry(clock)
+    shared = _register(reg, clock, "k", "chat-1", name="cachedContents/shared")
+    lookups = iter([shared, None])  # live for prompt 1, expired by prompt 2
+
+    async def _find(key):
+        return next(lookups)
+
+    async def _none(*a, **kw):
+        return None
+
+    async def _status(file_id, session_id=None):
+        return {}
+
+    monkeypatch.setattr(gemini_cache_service, "_registry", reg)
+    monkeypatch.setattr(gemini_cache_service, "_find_shared_cache", _find)
+    monkeypatch.setattr(gemini_cache_service, "_upsert_adk_cache_session", _none)
+    monkeypatch.setattr(gemini_cache_service, "_record_cache_use", _none)
+    monkeypatch.setattr(gemini_cache_service, "_slide_cache_expiry", lambda *a, **kw: None)
+    monkeypatch.setattr(gemini_cache_service, "get_status_for_file", _status)
+
+    async def _ask(question):
+        events = [
+            ev
+            async for ev in gemini_cache_service.ask_with_context_cache(
+                file_id="f1",
+                question=question,
+                user_id="u1",
+                file_specs=[{"buffer": b"%PDF-doc", "mimetype": "application/pdf"}],
+                system_instruction="s",
+                model_name=MODEL,
+                chat_session_id="chat-2",
+            )
+        ]
+        assert events[-1] == {"type": "done", "answer": "The answer."}
+
+    asyncio.run(_ask("first?"))
+    first = runner.calls[0]
+    assert [p.text for p in first["new_message"].parts] == ["first?"]  # no document bytes
+    assert first["state_delta"] == {SHARED_CACHE_STATE_KEY: "cachedContents/shared"}
+    assert not primed  # attaching is for this prompt only
+
+    asyncio.run(_ask("second?"))
+    second = runner.calls[1]
+    assert len(second["new_message"].parts) == 2  # shared cache gone: document re-sent
+    assert second["new_message"].parts[0].inline_data.data == b"%PDF-doc"
+    assert second["state_delta"] == {SHARED_CACHE_STATE_KEY: None}
+    assert primed == {("rk", "chat-2")}
+
+
+def test_savings_are_admin_only_and_read_off_the_event_loop(monkeypatch):
+    with pytest.raises(HTTPException) as denied:
+        require_admin({"id": "u1", "role": "user"})
+    assert denied.value.status_code == 403
+    assert require_admin({"id": "a1", "role": "admin"})["id"] == "a1"
+
+    loop_thread, schema_threads = threading.get_ident(), []
+    monkeypatch.setattr(gemini_cache_service, "_registry", _registry(_Clock()))
+    monkeypatch.setattr(gemini_cache_service, "_ensure_schema", lambda: schema_threads.append(threading.get_ident()))
+    monkeypatch.setattr(gemini_cache_service, "doc_conn", _FakeDB(referenced=set(), registered=set()))
+
+    savings = asyncio.run(gemini_cache_service.get_cache_savings(7))
+    assert savings["days"] == [] and schema_threads and loop_thread not in schema_threads
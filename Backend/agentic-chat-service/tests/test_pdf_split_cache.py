@@ -0,0 +1,198 @@
+"""Oversized-PDF page splits: size-bounded parts, cached per object version.
+
+    cd Backend/agentic-chat-service && python -m pytest tests/test_pdf_split_cache.py -q
+
+GCS is an in-memory dict here; pypdf does the real splitting.
+"""
+from __future__ import annotations
+
+import io
+import pathlib
+import random
+import sys
+
+import pytest
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import NameObject, StreamObject
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from app.services import gcs_service, llm_service, pdf_split_cache  # noqa: E402
+from app.services.pdf_split_cache import PdfSplitError, split_pdf_parts  # noqa: E402
+
+BUCKET = "docs"
+PATH = "uploads/u1/bundle.pdf"
+TARGET = 20_000
+LIMIT = 40_000
+
+
+def _pdf(page_sizes: list[int], seed: int = 0) -> bytes:
+    rng = random.Random(seed)
+    writer = PdfWriter()
+    for n in page_sizes:
+        page = writer.add_blank_page(612, 792)
+        stream = StreamObject()
+        stream.set_data(b"% " + rng.randbytes(n // 2).hex().encode() + b"\n")
+        page[NameObject("/Contents")] = writer._add_object(stream)
+    out = io.BytesIO()
+    writer.write(out)
+    return out.getvalue()
+
+
+class _FakeGcs:
+    def __init__(self, monkeypatch):
+        self.objects: dict[str, bytes] = {}
+        self.generation = {PATH: 1}
+        self.downloads = 0
+        monkeypatch.setattr(gcs_service, "download_object_to_file", self.download_to_file)
+        monkeypatch.setattr(gcs_service, "download_object_buffer", self.download)
+        monkeypatch.setattr(gcs_service, "upload_fileobj_to_gcs", self.upload_fileobj)
+        monkeypatch.setattr(gcs_service, "upload_file_to_gcs", self.upload)
+        monkeypatch.setattr(gcs_service, "object_exists", lambda b, p: p in self.objects)
+        monkeypatch.setattr(gcs_service, "get_object_metadata", self.metadata)
+        monkeypatch.setattr(gcs_service, "delete_prefix", self.delete_prefix)
+        monkeypatch.setattr(pdf_split_cache, "_memo", type(pdf_split_cache._memo)())
+
+    def metadata(self, bucket, path):
+        return {"size": len(self.objects[path]), "generation": self.generation.get(path), "etag": None}
+
+    def download_to_file(self, bucket, path, fileobj, generation=None):
+        self.downloads += 1
+        fileobj.write(self.objects[path])
+
+    def download(self, bucket, path):
+        if path not in self.objects:
+            raise FileNotFoundError(path)
+        return self.objects[path]
+
+    def upload(self, bucket, path, data, mime):
+        self.objects[path] = bytes(data)
+        return f"gs://{bucket}/{path}"
+
+    def upload_fileobj(self, bucket, path, fileobj, mime):
+        fileobj.seek(0)
+        return self.upload(bucket, path, fileobj.read(), mime)
+
+    def delete_prefix(self, bucket, prefix):
+        gone = [k for k in self.objects if k.startswith(prefix)]
+        for k in gone:
+            del self.objects[k]
+        return len(gone)
+
+    def object_exists_uri(self, uri: str) -> bool:
+        return gcs_service.parse_gcs_uri(uri)[1] in self.objects
+
+    def pages(self, uri: str) -> int:
+        return len(PdfReader(io.BytesIO(self.objects[gcs_service.parse_gcs_uri(uri)[1]])).pages)
+
+
+def _split(gcs: _FakeGcs, session: str = "s1") -> dict:
+    return split_pdf_parts(
+        BUCKET, PATH, metadata=gcs.metadata(BUCKET, PATH), session_id=session, target_bytes=TARGET, limit_bytes=LIMIT
+    )
+
+
+def test_parts_stay_under_target_and_cover_every_page(monkeypatch):
+    gcs = _FakeGcs(monkeypatch)
+    sizes = [random.Random(i).choice([1_000, 3_000, 6_000, 12_000]) for i in range(40)]
+    sizes[17] = 30_000  # one page over the target alone: accepted by itself
+    gcs.objects[PATH] = _pdf(sizes)
+
+    manifest = _split(gcs)
+    parts = manifest["parts"]
+    assert manifest["totalPages"] == 40
+    assert parts[0]["firstPage"] == 1 and parts[-1]["lastPage"] == 40
+    for prev, part in zip(parts, parts[1:]):
+        assert part["firstPage"] == prev["lastPage"] + 1
+    for part in parts:
+        pages = gcs.pages(part["uri"])
+        assert pages == part["lastPage"] - part["firstPage"] + 1
+        assert part["bytes"] <= TARGET or pages == 1
+    # Greedy: no part could have taken the next page and stayed under target.
+    for prev, part in zip(parts, parts[1:]):
+        if prev["bytes"] <= TARGET:
+            extra = _pdf(sizes[prev["firstPage"] - 1:prev["lastPage"] + 1])
+            assert len(extra) > TARGET or len(PdfReader(io.BytesIO(extra)).pages) == 1
+
+
+def test_split_is_reused_per_object_version(monkeypatch):
+    gcs = _FakeGcs(monkeypatch)
+    gcs.objects[PATH] = _pdf([5_000] * 12)
+
+    first = _split(gcs, "s1")
+    assert gcs.downloads == 1
+    assert all("/split-cache/" in p["uri"] for p in first["parts"])
+    assert _split(gcs, "s2") == first  # in-process memo
+    pdf_split_cache._memo.clear()
+    assert _split(gcs, "s3") == first  # stored manifest
+    assert gcs.downloads == 1
+
+    gcs.objects[PATH] = _pdf([5_000] * 6, seed=1)  # re-upload → new generation
+    gcs.generation[PATH] = 2
+    second = _split(gcs)
+    assert gcs.downloads == 2 and second["totalPages"] == 6
+    assert {p["uri"] for p in second["parts"]}.isdisjoint(p["uri"] for p in first["parts"])
+    # The superseded generation's parts and manifest are deleted; the new ones stay.
+    old_key = pdf_split_cache.split_key(BUCKET, PATH, 1)
+    assert not any(k.startswith(f"split-cache/{old_key}/") for k in gcs.objects)
+    assert all(gcs.object_exists_uri(p["uri"]) for p in second["parts"])
+    assert pdf_split_cache._key_locks == {}  # per-key locks are dropped after the split
+
+
+def test_missing_part_forces_a_fresh_split(monkeypatch):
+    gcs = _FakeGcs(monkeypatch)
+    gcs.objects[PATH] = _pdf([5_000] * 12)
+    first = _split(gcs)
+    del gcs.objects[gcs_service.parse_gcs_uri(first["parts"][-1]["uri"])[1]]
+    pdf_split_cache._memo.clear()
+    assert _split(gcs) == first
+    assert gcs.downloads == 2
+
+
+def test_unversioned_objects_split_per_session(monkeypatch):
+    gcs = _FakeGcs(monkeypatch)
+    gcs.objects[PATH] = _pdf([5_000] * 8)
+    gcs.generation[PATH] = None
+    manifest = _split(gcs, "chat 1")
+    assert all("/tmp/chat_1/" in p["uri"] for p in manifest["parts"])
+    assert not any(k.endswith("manifest.json") for k in gcs.objects)
+
+
+def test_page_over_the_hard_limit_raises(monkeypatch):
+    gcs = _FakeGcs(monkeypatch)
+    gcs.objects[PATH] = _pdf([2_000, 50_000, 2_000])
+    with pytest.raises(PdfSplitError, match="Page 2"):
+        _split(gcs)
+
+
+def test_split_oversized_pdfs_builds_the_unified_notice(monkeypatch):
+    gcs = _FakeGcs(monkeypatch)
+    gcs.objects[PATH] = _pdf([5_000] * 12)
+    gcs.objects["uploads/u1/small.pdf"] = _pdf([1_000])
+    monkeypatch.setattr(llm_service, "_VERTEX_FILE_SIZE_LIMIT_BYTES", LIMIT)
+    monkeypatch.setattr(llm_service, "_PDF_CHUNK_TARGET_BYTES", TARGET)
+
+    uris, notice = llm_service._split_oversized_pdfs(
+        [f"gs://{BUCKET}/uploads/u1/small.pdf", f"gs://{BUCKET}/{PATH}"], "s1"
+    )
+    assert uris[0] == f"gs://{BUCKET}/uploads/u1/small.pdf"
+    assert len(uris) > 2 and all(".part" in u for u in uris[1:])
+    assert f"split into {len(uris) - 1} sequential parts covering pages 1-12" in notice
+
+
+def test_search_renders_stay_near_the_part_being_built(monkeypatch):
+    gcs = _FakeGcs(monkeypatch)
+    sizes = [random.Random(i).choice([400, 500, 600]) for i in range(400)]
+    gcs.objects[PATH] = _pdf(sizes)
+    renders: list[int] = []
+    real_render = pdf_split_cache._render
+
+    def counting_render(reader, start, end):
+        renders.append(end - start)
+        return real_render(reader, start, end)
+
+    monkeypatch.setattr(pdf_split_cache, "_render", counting_render)
+    parts = _split(gcs)["parts"]
+    widest = max(p["lastPage"] - p["firstPage"] + 1 for p in parts)
+    assert len(renders) <= 4 * len(parts)
+    assert max(renders) <= 2 * widest  # never bisects out towards the end of the PDF
@@ -0,0 +1,237 @@
+"""Repair engine (`_REPAIR_PASSES`) vs the original hand-chained repairs.
+
+    cd Backend/agentic-chat-service && python -m pytest tests/test_repair_engine.py -q
+
+`_legacy_chain` is the pre-engine `_monolithic_deterministic_repairs` body,
+run with the shared text index, the `_NormalizedPrefixes` corpus and the
+regex gates switched off — i.e. every helper rescans the draft as before.
+Output text and info must be byte-identical on every draft in the corpus.
+"""
+from __future__ import annotations
+
+import pathlib
+import random
+import re
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from app.services import draft_repairs as dr  # noqa: E402
+from app.services.draft_repairs import _REPAIR_PASSES, _monolithic_deterministic_repairs  # noqa: E402
+
+DIGEST = (
+    "PARTIES —\n- Full Name: Nexora Infotech Private Limited\n- CIN: U72900PN2020PTC191234\n"
+    "- Incorporated under Companies Act, 2013\nDOCUMENT REFERENCES —\n"
+    "- Master Service Agreement dated 01-Jan-2024\n- Invoice INV-101\n"
+    "AMOUNTS — Invoice unpaid Rs. 20,06,000\n"
+)
+
+CAPTION = (
+    "IN THE COMMERCIAL COURT AT PUNE\nCOMMERCIAL SUIT NO. ____ OF 2026\n\n"
+    "Nexora Infotech Private Limited, a company incorporated under the Companies Act, 2013\n"
+    "…PLAINTIFF\n\nVERSUS\n\nBeta Traders Ltd\n…DEFENDANT\n\nPLAINT\n\n"
+)
+
+WORDS = (
+    "plaintiff defendant invoice agreement payment delivery notice demand interest principal "
+    "amount goods supply contract breach damages hereby submitted respectfully court "
+    "jurisdiction limitation cause action arose"
+).split()
+
+
+def _draft(
+    seed: int,
+    *,
+    paras: int = 60,
+    restart: bool = False,
+    annexed_captions: int = 0,
+    notes: bool = False,
+    odd: bool = False,
+) -> str:
+    rng = random.Random(seed)
+    body = []
+    for i in range(1, paras + 1):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(20, 60))]
+        line = f"{i}. That the {' '.join(words)}."
+        if i % 9 == 0:
+            line += f" The invoice is annexed hereto and marked as ANNEXURE P-{rng.randint(1, 3)}."
+        if i % 13 == 0:
+            line += " [DATA NOT PROVIDED: date of notice]"
+        if i % 17 == 0 and odd:
+            line += " İstanbul branch ſupplies; 5 K temperature."
+        body.append(line)
+        if notes and i == paras // 2:
+            body.append(f"{i}.1 Internal Note: confirm the invoice figures before filing.")
+    chrono = "LIST OF DATES AND EVENTS\n\n| S.No | Date | Particulars |\n|---|---|---|\n" + "\n".join(
+        f"| {k} | {k:02d}.03.2024 | Event {k} occurred between the parties |" for k in range(1, 12)
+    )
+    if notes:
+        chrono += "\n| 12 | ---------------- | ---------------- |\n| ---- | ---- |"
+    tail = (
+        "PRAYER\n\n(a) decree for Rs. 20,06,000;\n(b) [DATA NOT PROVIDED: interest rate];\n(c) costs.\n\n"
+        "VERIFICATION\n"
+        "I, the deponent, aged [DATA NOT PROVIDED: Deponent Age], designation of the deponent: , "
+        "say that paragraphs 1 to 20 are true to my personal knowledge.\n"
+        "Place:\nDated: [DATA NOT PROVIDED: Verification Date]\n\n"
+        "LIST OF DOCUMENTS\n\n| S.No | Particulars | Annexure | Status |\n"
+        "|:-----|:------------|:---------|:-------|\n| 1 | Agreement | ANNEXURE P-1 | Filed herewith |\n"
+    )
+    doc = "# " + CAPTION + chrono + "\n\n" + "\n\n".join(body) + "\n\n" + tail
+    for _ in range(annexed_captions):
+        doc += "\n\nAFFIDAVIT\n\n" + CAPTION + "I, the deponent above named, state on oath as follows.\n"
+    if restart:
+        doc += "\n\n" + doc[: len(doc) * 2 // 3]
+    return doc
+
+
+CORPUS = [
+    pytest.param(_draft(0), DIGEST, id="plain"),
+    pytest.param(_draft(1, restart=True), DIGEST, id="restart"),
+    pytest.param(_draft(2, annexed_captions=4), DIGEST, id="annexed-captions"),
+    pytest.param(_draft(3, annexed_captions=3, restart=True), DIGEST, id="annexed-and-restart"),
+    pytest.param(_draft(4, notes=True), DIGEST, id="notes-and-corrupt-table"),
+    pytest.param(_draft(5, odd=True, restart=True), DIGEST, id="casefold-odd-chars"),
+    pytest.param(_draft(6, paras=400, restart=True, notes=True), DIGEST, id="long"),
+    pytest.param(_draft(7), "", id="no-digest"),
+    pytest.param("", "", id="empty"),
+]
+
+
+def _legacy_chain(text, facts_digest="", exhibit_register=None, user_instructions=""):
+    info = {}
+    cleaned = dr._strip_markdown_artifacts(text)
+    if cleaned != text:
+        info["markdown_artifacts_stripped"] = True
+    text = cleaned
+    steps_a = [
+        ("restarted_copies_removed", lambda t: dr._strip_restarted_document(t), False),
+        ("internal_notes_removed", lambda t: dr._remove_internal_note_paragraphs(t), False),
+        ("corrupted_tables_removed", lambda t: dr._remove_corrupted_tables(t), False),
+        ("cause_title_deduped", lambda t: dr._dedupe_cause_title(t), True),
+        (
+            "option_menu_narrowed",
+            lambda t: dr._narrow_slash_option_menus(t, facts_digest, user_instructions),
+            True,
+        ),
+        ("admitted_dues_fixed", lambda t: dr._fix_admitted_dues_wording(t, facts_digest), True),
+        ("statute_year_fixed", lambda t: dr._sanitize_statute_years(t, facts_digest), True),
+    ]
+    for key, fn, flag in steps_a:
+        text, res = fn(text)
+        if res:
+            info[key] = True if flag else res
+    try:
+        from app.services.draft_provenance import fix_cross_field_act_years
+        new_txt, swaps = fix_cross_field_act_years(text, facts_digest)
+        if swaps:
+            info["field_swaps_fixed"] = swaps
+        text = new_txt
+    except Exception:
+        pass
+    reg = None
+    steps_b = [
+        ("proceedings_placeholder_fixed", lambda t: dr._fix_proceedings_placeholder(t), True),
+        ("deponent_age_fixed", lambda t: dr._fix_deponent_age_placeholder(t), True),
+        ("unauthorized_signatory_fixed", lambda t: dr._fix_unsupported_authorized_signatory(t, facts_digest), True),
+        ("company_registration_added", lambda t: dr._ensure_company_registration_in_body(t, facts_digest), True),
+        ("annexures", lambda t: dr._renumber_annexures(t), False),
+        ("interim_prayers_removed", lambda t: dr._reconcile_interim_relief_extended(t), False),
+        ("prayer_placeholders_removed", lambda t: dr._strip_prayer_placeholders(t), False),
+        ("chronology_rows_added", lambda t: dr._merge_chronology_from_digest(t, facts_digest), False),
+        ("body_renumbered", lambda t: dr._renumber_body_paragraphs_continuous(t), True),
+        ("lod_rebuilt", lambda t: dr._rebuild_list_of_documents(t, facts_digest), True),
+        ("exhibit_citations_added", lambda t: dr._polish_exhibit_citations(t, facts_digest, reg), False),
+        ("annexures", lambda t: dr._renumber_annexures(t), False),
+        ("lod_rebuilt", lambda t: dr._rebuild_list_of_documents(t, facts_digest), True),
+        ("placeholders_resolved", lambda t: dr._resolve_remaining_placeholders(t, facts_digest), False),
+        ("sworn_placeholders_neutralized", lambda t: dr._strip_all_sworn_placeholders(t), False),
+        ("deponent_age_fixed", lambda t: dr._fix_deponent_age_placeholder(t), True),
+        ("body_renumbered", lambda t: dr._renumber_body_paragraphs_continuous(t), True),
+        ("attestation_rebuilt", lambda t: dr._rebuild_verification_and_sot(t), True),
+        ("attestation_renumbered", lambda t: dr._restart_inline_attestation_numbering(t), True),
+        ("source_mentions_stripped", lambda t: dr._strip_inventory_source_mentions(t), False),
+    ]
+    for key, fn, flag in steps_b:
+        if key == "exhibit_citations_added":
+            reg = exhibit_register or (dr._plan_exhibits(facts_digest) if facts_digest else [])
+        text, res = fn(text)
+        if res:
+            info[key] = True if flag else res
+    return text, info
+
+
+class _DirectPrefixes:
+    def __init__(self, text):
+        self.text = text
+
+    def containment(self, sample, pos, size=8, step=4):
+        return dr._shingle_containment(sample, self.text[:pos], size, step)
+
+
+@pytest.fixture
+def legacy(monkeypatch):
+    """Run `_legacy_chain` with every shared scan and gate disabled."""
+
+    def run(*args, **kwargs):
+        always = re.compile("")
+        with monkeypatch.context() as m:
+            m.setattr(dr, "_text_index", lambda text: dr._TextIndex(text))
+            m.setattr(dr, "_NormalizedPrefixes", _DirectPrefixes)
+            m.setattr(dr, "_CASEFOLD_ODD_CHARS", ("",))  # "" in text → gate off
+            for gate in ("_DNP_GATE_RE", "_AGED_DNP_GATE_RE", "_AGED_COMMA_GATE_RE", "_DESIGNATION_GATE_RE", "_SWORN_LINE_GATE_RE"):
+                m.setattr(dr, gate, always)
+            return _legacy_chain(*args, **kwargs)
+
+    return run
+
+
+@pytest.mark.parametrize("text,digest", CORPUS)
+def test_engine_is_byte_identical_to_the_legacy_chain(legacy, text, digest):
+    expected_text, expected_info = legacy(text, digest)
+    out, info = _monolithic_deterministic_repairs(text, digest)
+    timings = info.pop("repair_timings_ms")
+    assert out == expected_text
+    assert info == expected_info
+    assert list(info) == list(expected_info)  # same key order for the status message
+    assert list(timings) == [p.name for p in _REPAIR_PASSES]
+
+
+def test_engine_matches_with_explicit_register_and_instructions(legacy):
+    text = _draft(8, restart=True)
+    register = dr._plan_exhibits(DIGEST)
+    kwargs = {"exhibit_register": register, "user_instructions": "Plaintiff / Defendant only"}
+    out, info = _monolithic_deterministic_repairs(text, DIGEST, **kwargs)
+    info.pop("repair_timings_ms")
+    assert (out, info) == legacy(text, DIGEST, **kwargs)
+
+
+def test_pass_names_are_unique_and_timings_are_non_negative():
+    names = [p.name for p in _REPAIR_PASSES]
+    assert len(names) == len(set(names))
+    _, info = _monolithic_deterministic_repairs(_draft(9), DIGEST)
+    assert all(ms >= 0 for ms in info["repair_timings_ms"].values())
+
+
+def test_normalized_prefixes_match_direct_containment():
+    rng = random.Random(3)
+    alphabet = "ab cd\nE1-2,.İſ"
+    for _ in range(2000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 80)))
+        prefixes = dr._NormalizedPrefixes(text)
+        for _ in range(4):
+            pos = rng.randint(0, len(text))
+            sample = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+            size, step = rng.randint(1, 4), rng.randint(1, 3)
+            assert prefixes.containment(sample, pos, size, step) == dr._shingle_containment(
+                sample, text[:pos], size, step
+            )
+
+
+def test_text_index_is_dropped_when_the_draft_changes():
+    a = "1. First para.\n\n2. Second para.\n"
+    assert [m.group(2) for m in dr._para_line_matches(a)] == ["1", "2"]
+    b = a + "\n3. Third para.\n"
+    assert [m.group(2) for m in dr._para_line_matches(b)] == ["1", "2", "3"]
+    assert dr._body_region_bounds(b) == (0, len(b))
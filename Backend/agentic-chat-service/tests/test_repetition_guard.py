@@ -0,0 +1,112 @@
+"""`_RepetitionGuard` runs on every streamed delta — it must stay O(1) per line
+and trip exactly where the list/regex implementation it replaced tripped.
+
+    cd Backend/agentic-chat-service && python -m pytest tests/test_repetition_guard.py -q
+"""
+from __future__ import annotations
+
+import pathlib
+import random
+import re
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from app.services.llm_service import _RepetitionGuard  # noqa: E402
+
+
+class _OldGuard:
+    """The list + re.sub implementation (the oracle)."""
+
+    def __init__(self, threshold: int = 15, window: int = 250, ws_limit: int = 1500):
+        self.threshold = threshold
+        self._recent: list[str] = []
+        self._window = window
+        self._buf = ""
+        self._ws_run = 0
+        self._ws_limit = ws_limit
+        self.tripped = False
+
+    def feed(self, piece: str) -> bool:
+        if self.tripped:
+            return True
+        if re.sub(r"[\s|\-:=+_~*# .]", "", piece):
+            self._ws_run = 0
+        else:
+            self._ws_run += len(piece)
+            if self._ws_run >= self._ws_limit:
+                self.tripped = True
+                return True
+        self._buf += piece
+        while "\n" in self._buf:
+            line, self._buf = self._buf.split("\n", 1)
+            clean = line.strip()
+            if len(clean) < 30:
+                continue
+            if clean.startswith("|"):
+                key = re.sub(r"[^a-z0-9]", "", clean.lower())
+            else:
+                key = re.sub(r"[^a-z]", "", clean.lower())
+            if len(key) < 20:
+                continue
+            self._recent.append(key)
+            if len(self._recent) > self._window:
+                self._recent.pop(0)
+            if self._recent.count(key) >= self.threshold:
+                self.tripped = True
+                return True
+        return False
+
+
+LINES = [
+    "The tribunal considered the submission on limitation at length.",
+    "The TRIBUNAL considered the submission on limitation at length!!",
+    "| 01-09-2005 | receipt for rent/advance | Page 72 |",
+    "| 02-09-2005 | receipt for rent/advance | Page 73 |",
+    "Clause 4 of the agreement requires notice within 30 days.",
+    "Clause 5 of the agreement requires notice within 31 days.",
+    "Über die Kündigung wurde KΣİ entschieden, siehe Anlage.",
+    "|---|---|---|---|---|---|---|---|---|---|",
+    "short line",
+    " \t ",
+    "=" * 40,
+]
+
+
+def _stream(rng: random.Random) -> list[str]:
+    text_parts = []
+    for _ in range(rng.randint(5, 400)):
+        roll = rng.random()
+        if roll < 0.05:
+            text_parts.append(rng.choice("  \t|-") * rng.randint(1, 700))
+        else:
+            text_parts.append(rng.choice(LINES[: rng.randint(2, len(LINES))]))
+        text_parts.append("\n" if rng.random() < 0.9 else "\r\n\n")
+    text = "".join(text_parts)
+    pieces, i = [], 0
+    while i < len(text):            # SDK-like chunking, boundaries anywhere
+        n = rng.randint(1, 160)
+        pieces.append(text[i:i + n])
+        i += n
+    return pieces
+
+
+def test_fuzz_matches_the_list_implementation():
+    rng = random.Random(21)
+    for _ in range(300):
+        kwargs = rng.choice([{}, {"threshold": 3, "window": 7}, {"threshold": 2, "window": 1}, {"ws_limit": 200}])
+        new, old = _RepetitionGuard(**kwargs), _OldGuard(**kwargs)
+        for piece in _stream(rng):
+            assert new.feed(piece) == old.feed(piece)
+        assert new.tripped == old.tripped
+
+
+def test_window_counts_slide_with_the_stream():
+    guard = _RepetitionGuard(threshold=3, window=4)
+    row = "The same repeated row of text, over and over again\n"
+    for i in range(10):             # at most 2 copies of `row` in any 4-line window
+        fillers = [f"Filler line {c * 6} keeps the window moving\n" for c in "abcdefghijklmnopqrstu"[2 * i:2 * i + 2]]
+        assert guard.feed(row + "".join(fillers)) is False
+    assert sum(guard._counts.values()) == len(guard._recent) == 4
+    assert guard.feed(row + row) is False      # [filler, filler, row, row]
+    assert guard.feed(row) is True
@@ -0,0 +1,152 @@
+"""Linear-time stream assembly (`_StreamText`, `_trim_overlap`) must not change
+what the user sees.
+
+    cd Backend/agentic-chat-service && python -m pytest tests/test_stream_assembler.py -q
+
+The round text used to be one growing string (copied on every chunk) and the
+continuation overlap trim re-normalized the head once per candidate length.
+The replacements are fuzzed against the string implementations they replace:
+same deltas, same dedupe decisions, same trimmed heads, same restart verdicts.
+"""
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import random
+import re
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from app.services.llm_service import (  # noqa: E402
+    _append_stream_piece,
+    _looks_like_restart,
+    _normalize_for_match,
+    _stream_round,
+    _StreamText,
+    _trim_overlap,
+)
+
+ALPHABET = "ab c|-\n.AB1İKßΣ"
+
+
+def _old_trim_overlap(prior: str, new: str, *, window: int = 1200, min_overlap: int = 15) -> str:
+    """The quadratic implementation `_trim_overlap` replaced (the oracle)."""
+    if not prior or not new:
+        return new
+
+    def _normalize(t: str) -> str:
+        return re.sub(r"[^a-z0-9]", "", t.lower())
+
+    tail = prior[-window:]
+    limit = min(len(tail), len(new))
+    for k in range(limit, min_overlap - 1, -1):
+        if tail.endswith(new[:k]):
+            return new[k:]
+    norm_tail = _normalize(tail)
+    for k in range(limit, min_overlap - 1, -1):
+        probe = _normalize(new[:k])
+        if len(probe) >= min_overlap and norm_tail.endswith(probe):
+            return new[k:]
+    return new
+
+
+def _text(rng: random.Random, n: int) -> str:
+    return "".join(rng.choice(ALPHABET) for _ in range(n))
+
+
+def _pieces(rng: random.Random, count: int) -> list[str]:
+    """A hostile stream: deltas, cumulative snapshots, re-sent tails, padding."""
+    current, out = "", []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.2 and current:
+            piece = current + _text(rng, rng.randint(0, 40))      # cumulative
+        elif roll < 0.35 and current:
+            piece = current[-rng.randint(1, min(len(current), 1100)):]  # re-sent tail
+        elif roll < 0.45:
+            piece = rng.choice(" |-") * rng.randint(50, 120)      # padding run
+        elif roll < 0.5:
+            piece = current                                       # exact repeat
+        else:
+            piece = _text(rng, rng.randint(1, 90))
+        current, _ = _append_stream_piece(current, piece)
+        out.append(piece)
+    return out
+
+
+def test_stream_text_matches_append_stream_piece():
+    rng = random.Random(19)
+    for _ in range(200):
+        current, buf = "", _StreamText()
+        for piece in _pieces(rng, 60):
+            current, expected = _append_stream_piece(current, piece)
+            assert buf.append(piece) == expected
+            assert len(buf) == len(current)
+            assert buf.visible == bool(current.strip())
+        assert buf.text() == current
+
+
+def test_trim_overlap_matches_the_quadratic_version():
+    rng = random.Random(7)
+    for _ in range(400):
+        prior = _text(rng, rng.randint(0, 1500))
+        cut = rng.randint(0, min(len(prior), 1300))
+        head = prior[len(prior) - cut:]
+        if rng.random() < 0.5:      # same words, different spacing / case
+            head = head.upper().replace(" ", "\n")
+        new = head + _text(rng, rng.randint(0, 300))
+        kw = {"min_overlap": rng.choice([15, 15, 1, 40])}
+        assert _trim_overlap(prior, new, **kw) == _old_trim_overlap(prior, new, **kw)
+
+
+def test_trim_overlap_drops_reformatted_overlap():
+    prior = "The appellant filed a suit for recovery.\n| Date | Event |"
+    assert _trim_overlap(prior, "for RECOVERY. | date | event | next row") == "next row"
+    assert _trim_overlap(prior, "entirely new text here") == "entirely new text here"
+
+
+def test_incremental_normalization_matches_the_whole_answer():
+    rng = random.Random(3)
+    rounds = [_text(rng, rng.randint(0, 400)) for _ in range(20)]
+    assert "".join(_normalize_for_match(r) for r in rounds) == _normalize_for_match("".join(rounds))
+    prior = "".join(rounds)
+    head = prior[500:900]
+    assert _looks_like_restart(prior, head, prior_norm=_normalize_for_match(prior)) == _looks_like_restart(
+        prior, head
+    )
+
+
+def _chunks(text: str, size: int = 37):
+    return iter([SimpleNamespace(text=text[i:i + size], candidates=None) for i in range(0, len(text), size)])
+
+
+def _run(prior: str, round_text: str) -> tuple[str, dict]:
+    state: dict = {}
+
+    async def _go():
+        out = []
+        async for ev in _stream_round(
+            _chunks(round_text), state, prior_text=prior, prior_norm=_normalize_for_match(prior)
+        ):
+            if ev["type"] == "chunk":
+                out.append(ev["text"])
+        return "".join(out)
+
+    return asyncio.run(_go()), state
+
+
+def _lines(rng: random.Random, count: int) -> str:
+    words = "hearing order notice adjourned reserved appeal stay granted filed reply".split()
+    return "".join(" ".join(rng.choice(words) for _ in range(8)) + ".\n" for _ in range(count))
+
+
+def test_continuation_round_trims_overlap_and_discards_restarts():
+    rng = random.Random(11)
+    prior, fresh = _lines(rng, 300), _lines(rng, 100)
+    emitted, state = _run(prior, prior[-200:] + fresh)
+    assert emitted == fresh and state["streamed"] == fresh
+
+    emitted, state = _run(prior, prior[:3000])
+    assert emitted == "" and state["restarted"] and state["streamed"] == ""
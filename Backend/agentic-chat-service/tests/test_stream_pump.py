@@ -0,0 +1,166 @@
+"""StreamPump: SDK stream iterators drained off the default executor.
+
+    cd Backend/agentic-chat-service && python -m pytest tests/test_stream_pump.py -q
+
+Every chunk used to cost one ``run_in_executor`` hop on the executor shared
+with DB work. The pump drains the whole stream on a dedicated bounded pool,
+with backpressure, errors surfaced in order, a prompt stop on close (even
+before or while the stream opens), and a time-to-first-chunk metric per
+stream.
+"""
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from app.services.stream_pump import StreamPump  # noqa: E402
+
+
+def _collect(pump: StreamPump) -> list:
+    async def _go():
+        return [item async for item in pump]
+
+    return asyncio.run(_go())
+
+
+def test_items_arrive_in_order_on_a_pump_thread():
+    threads: list[str] = []
+
+    def _stream():
+        threads.append(threading.current_thread().name)
+        time.sleep(0.02)
+        yield from range(50)
+
+    pump = StreamPump(_stream, label="t")
+    assert _collect(pump) == list(range(50))
+    assert threads[0].startswith("llm-stream-pump")
+    assert pump.metrics["chunks"] == 50
+    assert pump.metrics["ttftMs"] >= 20 and pump.metrics["durationMs"] >= pump.metrics["ttftMs"]
+
+
+def test_open_and_midstream_errors_surface_to_the_consumer():
+    def _broken_open():
+        raise ConnectionError("503 unavailable")
+
+    with pytest.raises(ConnectionError):
+        _collect(StreamPump(_broken_open))
+
+    got: list[int] = []
+
+    def _dies():
+        yield 1
+        raise ValueError("stream reset")
+
+    async def _go():
+        async for item in StreamPump(_dies):
+            got.append(item)
+
+    with pytest.raises(ValueError):
+        asyncio.run(_go())
+    assert got == [1]
+
+
+def test_backpressure_and_close_stop_the_pump():
+    pulled: list[int] = []
+    closed = threading.Event()
+
+    def _endless():
+        try:
+            for i in range(10_000):
+                pulled.append(i)
+                yield i
+        finally:
+            closed.set()
+
+    async def _go():
+        pump = StreamPump(_endless, maxsize=4)
+        first = await pump.__anext__()
+        await asyncio.sleep(0.05)              # slow consumer
+        assert len(pulled) <= 1 + 4 + 1        # consumed + queued + the one in hand
+        await pump.aclose()
+        return first
+
+    assert asyncio.run(_go()) == 0
+    assert closed.wait(2.0)                    # iterator closed on the pump thread
+    assert len(pulled) < 10
+
+
+def test_close_before_or_during_open_never_pulls_the_stream():
+    opened = threading.Event()
+    release = threading.Event()
+    closed = threading.Event()
+    pulled: list[int] = []
+
+    class _Stream:
+        def __iter__(self):
+            return self
+
+        def __next__(self):
+            pulled.append(1)
+            return 1
+
+        def close(self):
+            closed.set()
+
+    def _slow_open():
+        opened.set()
+        release.wait(2.0)
+        return _Stream()
+
+    async def _go():
+        pump = StreamPump(_slow_open)
+        pump._start()
+        assert await asyncio.to_thread(opened.wait, 2.0)
+        await pump.aclose()                    # consumer gives up mid-open
+        release.set()
+
+    asyncio.run(_go())
+    assert closed.wait(2.0)                    # the stream that did open is closed ...
+    assert pulled == []                        # ... without a chunk being pulled
+
+    never_opened: list[bool] = []
+    pump = StreamPump(lambda: never_opened.append(True) or iter(()))
+    pump._closed.set()                         # closed while queued for a pump worker
+    pump._drain(None, None)
+    assert never_opened == []
+
+
+def test_idle_timeout_raises():
+    def _hangs():
+        time.sleep(0.3)
+        yield "late"
+
+    async def _go():
+        pump = StreamPump(_hangs, idle_timeout=0.05)
+        try:
+            await pump.__anext__()
+        finally:
+            await pump.aclose()
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(_go())
+
+
+def test_waiting_for_a_pump_worker_is_not_an_idle_stream(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from app.services import stream_pump
+
+    busy = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(stream_pump, "_pool", busy)
+    busy.submit(time.sleep, 0.3)               # the only worker is held by another stream
+
+    pump = StreamPump(lambda: iter(["a", "b"]), idle_timeout=0.1)
+    try:
+        assert _collect(pump) == ["a", "b"]    # no TimeoutError while queued
+    finally:
+        busy.shutdown(wait=True)
+    assert pump.metrics["queueWaitMs"] >= 200
+    assert pump.metrics["ttftMs"] < 200        # measured from the worker picking it up
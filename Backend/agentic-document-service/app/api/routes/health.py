@@ -21,3 +21,11 @@ def health_check() -> HealthResponse:
         adk_runtime_enabled=settings.enable_adk_runtime,
         timestamp=datetime.now(timezone.utc),
     )
+
+
+@router.get("/health/embedding-cache")
+def embedding_cache_metrics() -> dict[str, int]:
+    """Hit / miss / eviction counters of the two-tier embedding cache (this worker)."""
+    from app.services.adapters.embedding_cache import embedding_cache_stats
+
+    return embedding_cache_stats()
@@ -548,6 +548,24 @@ class Settings(BaseSettings):
         default=8,
         validation_alias=AliasChoices("OCR_PARALLEL_WORKERS"),
     )
+    # Streaming ingestion for large PDFs: each OCR page batch is chunked, embedded
+    # and persisted as soon as it (and every batch before it) is done, instead of
+    # after the whole document is OCR'd. Applies to PDFs with at least
+    # ocr_streaming_min_pages pages.
+    ocr_streaming_enabled: bool = Field(
+        default=True,
+        validation_alias=AliasChoices("OCR_STREAMING_ENABLED"),
+    )
+    ocr_streaming_min_pages: int = Field(
+        default=60,
+        validation_alias=AliasChoices("OCR_STREAMING_MIN_PAGES"),
+    )
+    # Page batches allowed to be in OCR or waiting for the consumer at once
+    # (bounds memory held by batch PDFs / Document AI responses). 0 = 2× OCR workers.
+    ocr_streaming_max_pending_batches: int = Field(
+        default=0,
+        validation_alias=AliasChoices("OCR_STREAMING_MAX_PENDING_BATCHES"),
+    )
     # GLOBAL cap on in-flight Document AI requests across ALL documents/batches.
     # With every document processing concurrently, doc_workers × ocr_workers
     # could stampede the processor into 429s — which silently degrade OCR to the
@@ -591,6 +609,32 @@ class Settings(BaseSettings):
         default=1500,
         validation_alias=AliasChoices("EMBEDDING_RPM_LIMIT"),
     )
+    # Persist chunks + vectors with COPY into a staging table (binary pgvector
+    # encoding when the pgvector package is installed). False = multi-row INSERTs.
+    chunk_persist_use_copy: bool = Field(
+        default=True,
+        validation_alias=AliasChoices("CHUNK_PERSIST_USE_COPY"),
+    )
+    # Two-tier embedding cache (see adapters/embedding_cache.py).
+    # In-process LRU budget in MB of packed float32 vectors (~3 KB per 768-dim vector).
+    embedding_cache_memory_mb: int = Field(
+        default=64,
+        validation_alias=AliasChoices("EMBEDDING_CACHE_MEMORY_MB"),
+    )
+    # Shared SQLite file every uvicorn worker on the host reads/fills. Empty = <tmpdir>/agentic-document-service/.
+    embedding_cache_disk_enabled: bool = Field(
+        default=True,
+        validation_alias=AliasChoices("EMBEDDING_CACHE_DISK_ENABLED"),
+    )
+    embedding_cache_path: str = Field(
+        default="",
+        validation_alias=AliasChoices("EMBEDDING_CACHE_PATH"),
+    )
+    # Oldest entries are pruned past this count (50k × 768 dims ≈ 150 MB on disk).
+    embedding_cache_disk_max_entries: int = Field(
+        default=50000,
+        validation_alias=AliasChoices("EMBEDDING_CACHE_DISK_MAX_ENTRIES"),
+    )
     legacy_document_service_url: str = Field(
         default="",
         validation_alias=AliasChoices("LEGACY_DOCUMENT_SERVICE_URL"),
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from typing import Iterable, Iterator
 
 
 HEADING_RE = re.compile(
@@ -31,17 +32,81 @@ class LegalSemanticChunker:
         if not normalized:
             return []
 
-        sections = self._split_sections(normalized)
+        return self._merge_small_chunks(self._split_oversized(self._split_sections(normalized)))
+
+    def chunk_stream(self, pieces: Iterable[str]) -> Iterator[list[ChunkSection]]:
+        """Incremental ``chunk``: yield the chunks that became final after each piece.
+
+        Pieces are joined with a blank line, as a merged OCR text would be, and
+        concatenating the yielded groups gives exactly ``chunk`` on the joined
+        text. The heading scan runs line by line across pieces, so the section
+        open at the end of a piece simply continues into the next one. Once an
+        open section outgrows ``max_tokens`` — so ``chunk`` would split it too —
+        its paragraphs go through the same greedy packer ``chunk`` uses, one
+        piece at a time, and only the packer's unfinished chunk is kept. A piece
+        always ends a paragraph (the joining blank line), so no paragraph is
+        ever cut at a piece boundary.
+        """
+        heading: str | None = None
+        lines: list[str] = []  # open-section lines not yet handed to the packer
+        words = 0  # words in the whole open section
+        packer: _ParagraphPacker | None = None  # set once the open section outgrows max_tokens
+        ready: list[ChunkSection] = []
+        held: list[ChunkSection] = []
+
+        def pack_lines() -> None:
+            nonlocal lines
+            ready.extend(packer.feed_all(self._paragraphs("\n".join(lines))))
+            lines = []
+
+        def close_section() -> None:
+            nonlocal lines, words, packer
+            if packer is None:
+                ready.extend(self._split_oversized([ChunkSection(heading=heading, text="\n".join(lines).strip())]))
+            else:
+                pack_lines()
+                ready.extend(packer.finish())
+            lines, words, packer = [], 0, None
+
+        for index, piece in enumerate(pieces):
+            # A trailing CR would pair with the joining newline in the merged text.
+            piece = piece[:-1] if piece.endswith("\r") else piece
+            piece_lines = piece.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+            for raw_line in ([""] if index else []) + piece_lines:
+                line = raw_line.strip()
+                if not line:
+                    lines.append("")
+                elif self._is_heading(line):
+                    if words:
+                        close_section()
+                    heading = line
+                else:
+                    lines.append(line)
+                    words += len(line.split())
+            if packer is None and words and max(1, int(words * 1.3)) > self.max_tokens:
+                packer = _ParagraphPacker(self, heading)
+            if packer is not None:
+                pack_lines()
+            # The last merged chunk may still absorb a small successor, so it is
+            # held back until the next group (greedy merging is prefix-stable).
+            merged = self._merge_small_chunks(held + ready)
+            ready, held = [], merged[-1:]
+            if len(merged) > 1:
+                yield merged[:-1]
+        if words:
+            close_section()
+        merged = self._merge_small_chunks(held + ready)
+        if merged:
+            yield merged
+
+    def _split_oversized(self, sections: list[ChunkSection]) -> list[ChunkSection]:
         chunks: list[ChunkSection] = []
-
         for section in sections:
-            section_tokens = self._estimate_tokens(section.text)
-            if section_tokens <= self.max_tokens:
+            if self._estimate_tokens(section.text) <= self.max_tokens:
                 chunks.append(section)
-                continue
-            chunks.extend(self._split_large_section(section))
-
-        return self._merge_small_chunks(chunks)
+            else:
+                chunks.extend(self._split_large_section(section))
+        return chunks
 
     def _split_sections(self, text: str) -> list[ChunkSection]:
         lines = [line.rstrip() for line in text.split("\n")]
@@ -80,30 +145,16 @@ class LegalSemanticChunker:
         return [section for section in sections if section.text.strip()]
 
     def _split_large_section(self, section: ChunkSection) -> list[ChunkSection]:
-        paragraphs = [part.strip() for part in re.split(r"\n\s*\n", section.text) if part.strip()]
+        paragraphs = self._paragraphs(section.text)
         if not paragraphs:
             return [section]
 
-        chunks: list[ChunkSection] = []
-        current_parts: list[str] = []
-        current_tokens = 0
-
-        for paragraph in paragraphs:
-            paragraph_tokens = self._estimate_tokens(paragraph)
-            if current_parts and current_tokens + paragraph_tokens > self.target_tokens:
-                chunk_text = "\n\n".join(current_parts).strip()
-                chunks.append(ChunkSection(heading=section.heading, text=chunk_text))
-                overlap_text = self._tail_words(chunk_text, self.overlap_tokens)
-                current_parts = [overlap_text, paragraph] if overlap_text else [paragraph]
-                current_tokens = self._estimate_tokens("\n\n".join(current_parts))
-            else:
-                current_parts.append(paragraph)
-                current_tokens += paragraph_tokens
-
-        if current_parts:
-            chunks.append(ChunkSection(heading=section.heading, text="\n\n".join(current_parts).strip()))
+        packer = _ParagraphPacker(self, section.heading)
+        return packer.feed_all(paragraphs) + packer.finish()
 
-        return chunks
+    @staticmethod
+    def _paragraphs(text: str) -> list[str]:
+        return [part.strip() for part in re.split(r"\n\s*\n", text) if part.strip()]
 
     def _merge_small_chunks(self, chunks: list[ChunkSection]) -> list[ChunkSection]:
         if not chunks:
@@ -145,3 +196,42 @@ class LegalSemanticChunker:
         if len(line) > 160:
             return False
         return bool(HEADING_RE.match(line.strip()))
+
+
+class _ParagraphPacker:
+    """Greedy paragraph packing of one oversized section, fed in order.
+
+    Each chunk fills up to ``target_tokens`` and the next one starts with the
+    last ``overlap_tokens`` words of it. Feeding a section's paragraphs in
+    several calls gives the same chunks as one call, which lets
+    ``chunk_stream`` pack a section that spans pieces.
+    """
+
+    def __init__(self, chunker: LegalSemanticChunker, heading: str | None) -> None:
+        self._chunker = chunker
+        self._heading = heading
+        self._parts: list[str] = []
+        self._tokens = 0
+
+    def feed_all(self, paragraphs: Iterable[str]) -> list[ChunkSection]:
+        """Add paragraphs; return the chunks they completed."""
+        chunker = self._chunker
+        chunks: list[ChunkSection] = []
+        for paragraph in paragraphs:
+            paragraph_tokens = chunker._estimate_tokens(paragraph)
+            if self._parts and self._tokens + paragraph_tokens > chunker.target_tokens:
+                chunk_text = "\n\n".join(self._parts).strip()
+                chunks.append(ChunkSection(heading=self._heading, text=chunk_text))
+                overlap_text = chunker._tail_words(chunk_text, chunker.overlap_tokens)
+                self._parts = [overlap_text, paragraph] if overlap_text else [paragraph]
+                self._tokens = chunker._estimate_tokens("\n\n".join(self._parts))
+            else:
+                self._parts.append(paragraph)
+                self._tokens += paragraph_tokens
+        return chunks
+
+    def finish(self) -> list[ChunkSection]:
+        """The unfinished last chunk, if any."""
+        if not self._parts:
+            return []
+        return [ChunkSection(heading=self._heading, text="\n\n".join(self._parts).strip())]
@@ -0,0 +1,321 @@
+"""
+Two-tier embedding cache shared by every embed_text / embed_batch call.
+
+Key design:
+- Entries are keyed by (model, dims, task, sha256(text)), so changing the
+  embedding model or output dimensionality can never serve a stale vector.
+- Vectors are stored as packed little-endian float32 bytes (3 KB for 768 dims)
+  instead of Python float lists (~25 KB each).
+- Front tier: in-process LRU capped by total payload bytes.
+- Back tier: a SQLite file in WAL mode, so every uvicorn worker on the same
+  host/container reads and fills the same cache. Bounded by entry count,
+  oldest-first eviction.
+- Both tiers implement ``EmbeddingCacheTier``; ``set_embedding_cache`` swaps in
+  a different backend (tests, Redis, ...) without touching embeddings.py.
+- Every failure in the disk tier degrades to a miss — caching must never break
+  embedding.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
+from typing import Iterable, Protocol
+
+logger = logging.getLogger("agentic_document_service.embedding_cache")
+
+DEFAULT_MEMORY_BYTES = 64 * 1024 * 1024
+DEFAULT_DISK_MAX_ENTRIES = 50_000
+
+
+def cache_key(model: str, dims: int, task: str, text: str) -> str:
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{model}|{dims}|{task}|{digest}"
+
+
+def pack_vector(values: list[float]) -> bytes:
+    packed = array("f", values)
+    if packed.itemsize != 4:  # pragma: no cover - every supported platform has 4-byte C floats
+        raise RuntimeError("float32 array support required")
+    return packed.tobytes()
+
+
+def unpack_vector(blob: bytes) -> list[float]:
+    values = array("f")
+    values.frombytes(blob)
+    return values.tolist()
+
+
+@dataclass
+class EmbeddingCacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    memory_evictions: int = 0
+    disk_evictions: int = 0
+    disk_errors: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        if amount:
+            with self._lock:
+                setattr(self, name, getattr(self, name) + amount)
+
+    def as_dict(self) -> dict[str, int]:
+        with self._lock:
+            return {f.name: getattr(self, f.name) for f in fields(self) if not f.name.startswith("_")}
+
+
+class EmbeddingCacheTier(Protocol):
+    def get_many(self, keys: list[str]) -> dict[str, bytes]: ...
+
+    def put_many(self, items: Iterable[tuple[str, bytes]]) -> None: ...
+
+
+class MemoryLRUTier:
+    """Thread-safe LRU of packed vectors, bounded by total payload bytes."""
+
+    def __init__(self, max_bytes: int, stats: EmbeddingCacheStats) -> None:
+        self._max_bytes = max(0, int(max_bytes))
+        self._stats = stats
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(self, keys: list[str]) -> dict[str, bytes]:
+        found: dict[str, bytes] = {}
+        with self._lock:
+            for key in keys:
+                blob = self._entries.get(key)
+                if blob is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = blob
+        return found
+
+    def put_many(self, items: Iterable[tuple[str, bytes]]) -> None:
+        with self._lock:
+            for key, blob in items:
+                if len(blob) > self._max_bytes:
+                    continue
+                previous = self._entries.pop(key, None)
+                if previous is not None:
+                    self._bytes -= len(previous)
+                self._entries[key] = blob
+                self._bytes += len(blob)
+            while self._bytes > self._max_bytes and self._entries:
+                _key, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self._stats.incr("memory_evictions")
+
+
+class SQLiteTier:
+    """Cross-process vector store in one SQLite file (WAL, one connection per thread)."""
+
+    def __init__(self, path: str, max_entries: int, stats: EmbeddingCacheStats) -> None:
+        self._path = path
+        self._max_entries = max(1, int(max_entries))
+        self._stats = stats
+        self._local = threading.local()
+        self._writes_since_prune = 0
+        self._prune_lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embedding_cache ("
+                " key TEXT PRIMARY KEY, vec BLOB NOT NULL, created_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS embedding_cache_created_idx"
+                " ON embedding_cache (created_at)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get_many(self, keys: list[str]) -> dict[str, bytes]:
+        found: dict[str, bytes] = {}
+        try:
+            conn = self._connect()
+            # SQLite's default host-parameter limit is 999 on older builds.
+            for start in range(0, len(keys), 500):
+                batch = keys[start: start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    f"SELECT key, vec FROM embedding_cache WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                found.update({key: bytes(vec) for key, vec in rows})
+        except sqlite3.Error as exc:
+            self._stats.incr("disk_errors")
+            logger.warning("[EmbeddingCache] disk read failed: %s", exc)
+        return found
+
+    def put_many(self, items: Iterable[tuple[str, bytes]]) -> None:
+        now = time.time()
+        rows = [(key, blob, now) for key, blob in items]
+        if not rows:
+            return
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embedding_cache (key, vec, created_at) VALUES (?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error as exc:
+            self._stats.incr("disk_errors")
+            logger.warning("[EmbeddingCache] disk write failed: %s", exc)
+            return
+        self._writes_since_prune += len(rows)
+        # Counting rows is a full index scan; only do it every ~1% of capacity.
+        if self._writes_since_prune >= max(100, self._max_entries // 100):
+            self._prune()
+
+    def _prune(self) -> None:
+        if not self._prune_lock.acquire(blocking=False):
+            return
+        try:
+            self._writes_since_prune = 0
+            conn = self._connect()
+            (count,) = conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()
+            excess = int(count) - self._max_entries
+            if excess <= 0:
+                return
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute(
+                    "DELETE FROM embedding_cache WHERE key IN ("
+                    " SELECT key FROM embedding_cache ORDER BY created_at LIMIT ?)",
+                    (excess,),
+                )
+            self._stats.incr("disk_evictions", excess)
+        except sqlite3.Error as exc:
+            self._stats.incr("disk_errors")
+            logger.warning("[EmbeddingCache] disk prune failed: %s", exc)
+        finally:
+            self._prune_lock.release()
+
+
+class EmbeddingCache:
+    """Memory LRU in front of an optional shared back tier."""
+
+    def __init__(
+        self,
+        memory: MemoryLRUTier,
+        disk: EmbeddingCacheTier | None,
+        stats: EmbeddingCacheStats,
+    ) -> None:
+        self.memory = memory
+        self.disk = disk
+        self.stats = stats
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """Return {key: vector} for every key found in either tier."""
+        if not keys:
+            return {}
+        blobs = self.memory.get_many(keys)
+        self.stats.incr("memory_hits", len(blobs))
+        missing = [k for k in keys if k not in blobs]
+        if missing and self.disk is not None:
+            promoted = self.disk.get_many(missing)
+            if promoted:
+                self.stats.incr("disk_hits", len(promoted))
+                self.memory.put_many(promoted.items())
+                blobs.update(promoted)
+        self.stats.incr("misses", sum(1 for k in keys if k not in blobs))
+        return {key: unpack_vector(blob) for key, blob in blobs.items()}
+
+    def put_many(self, items: dict[str, list[float]]) -> None:
+        packed = [(key, pack_vector(vec)) for key, vec in items.items() if vec]
+        if not packed:
+            return
+        self.memory.put_many(packed)
+        if self.disk is not None:
+            self.disk.put_many(packed)
+
+    def snapshot(self) -> dict[str, int]:
+        """Counters plus current memory-tier occupancy, for metrics endpoints."""
+        data = self.stats.as_dict()
+        data["memory_entries"] = len(self.memory)
+        data["memory_bytes"] = self.memory.size_bytes
+        return data
+
+
+def _default_disk_path() -> str:
+    return os.path.join(tempfile.gettempdir(), "agentic-document-service", "embedding-cache.sqlite3")
+
+
+def build_embedding_cache(
+    *,
+    memory_bytes: int = DEFAULT_MEMORY_BYTES,
+    disk_path: str | None = None,
+    disk_max_entries: int = DEFAULT_DISK_MAX_ENTRIES,
+) -> EmbeddingCache:
+    """Build the two-tier cache. ``disk_path=""`` disables the disk tier."""
+    stats = EmbeddingCacheStats()
+    disk: EmbeddingCacheTier | None = None
+    if disk_path != "":
+        path = disk_path or _default_disk_path()
+        try:
+            disk = SQLiteTier(path, disk_max_entries, stats)
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("[EmbeddingCache] disk tier disabled (%s): %s", path, exc)
+    return EmbeddingCache(MemoryLRUTier(memory_bytes, stats), disk, stats)
+
+
+_cache: EmbeddingCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    global _cache
+    if _cache is not None:
+        return _cache
+    with _cache_lock:
+        if _cache is None:
+            try:
+                from app.core.config import get_settings
+
+                settings = get_settings()
+                disk_path = (settings.embedding_cache_path or None) if settings.embedding_cache_disk_enabled else ""
+                _cache = build_embedding_cache(
+                    memory_bytes=int(settings.embedding_cache_memory_mb) * 1024 * 1024,
+                    disk_path=disk_path,
+                    disk_max_entries=int(settings.embedding_cache_disk_max_entries),
+                )
+            except Exception as exc:
+                logger.warning("[EmbeddingCache] settings unavailable, using defaults: %s", exc)
+                _cache = build_embedding_cache()
+    return _cache
+
+
+def set_embedding_cache(cache: EmbeddingCache | None) -> None:
+    """Replace the process-wide cache (``None`` rebuilds from settings on next use)."""
+    global _cache
+    with _cache_lock:
+        _cache = cache
+
+
+def embedding_cache_stats() -> dict[str, int]:
+    return get_embedding_cache().snapshot()
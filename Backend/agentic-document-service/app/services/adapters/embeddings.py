@@ -7,29 +7,35 @@ Key design:
 - A token-bucket rate limiter ensures we never exceed EMBEDDING_RPM_LIMIT
 - On 429 / ResourceExhausted errors, exponential backoff + retry up to
   EMBEDDING_MAX_RETRIES times before falling back to deterministic hash vectors
-- In-process MD5 cache avoids re-embedding identical texts within a session
+- Two-tier cache (byte-bounded in-process LRU + shared SQLite file, see
+  embedding_cache.py) keyed by (model, dims, task, sha256) avoids re-embedding
+  identical texts across requests and uvicorn workers
 - Falls back to a deterministic hash-based vector if Gemini is unavailable,
   so the pipeline never breaks during development or quota exhaustion
+- Vector math is NumPy batch-native: cosine_matrix() scores every query row
+  against every doc row in one product, and hash fallback / dimension fitting
+  run once per sub-batch instead of once per text
 """
 from __future__ import annotations
 
 import hashlib
 import logging
-import math
 import random
 import threading
 import time
+
+import numpy as np
+
+from app.services.adapters.embedding_cache import cache_key, get_embedding_cache
 from app.services.llm_chat_config import get_llm_chat_config
 
 logger = logging.getLogger("agentic_document_service.embeddings")
 
-# ---------------------------------------------------------------------------
-# In-process embedding cache (md5 key → vector)
-# ---------------------------------------------------------------------------
-_embedding_cache: dict[str, list[float]] = {}
 _gemini_unavailable_logged = False
 
 EMBEDDING_DIMS = 768
+# Gemini task type sent with every ingestion / query embedding; part of the cache key.
+EMBEDDING_TASK = "RETRIEVAL_DOCUMENT"
 # Gemini 001 is the preferred embedding model for ingestion.
 EMBEDDING_MODELS = ("gemini-embedding-001",)
 
@@ -197,19 +203,41 @@ def _is_model_not_found_error(msg: str) -> bool:
 # Public API
 # ---------------------------------------------------------------------------
 
+def _active_embedding_model() -> str:
+    """The model a fresh embed call would try first (skipping blacklisted ones)."""
+    models = _embedding_models()
+    return next((m for m in models if m not in _bad_models), models[0])
+
+
+def _cache_key_for(text: str, dims: int, model: str | None = None) -> str:
+    """Cache key under ``model`` — the model that answered, or for lookups the active one.
+
+    Vectors are written under the model that actually produced them, so a
+    fallback model's vector is never served as the primary model's.
+    """
+    return cache_key(model or _active_embedding_model(), dims, EMBEDDING_TASK, text)
+
+
 def embed_text(text: str) -> list[float]:
     """
     Embed a single text string. Returns a 768-dim float list.
-    Results are cached in-process to avoid redundant API calls.
+    Results are cached (memory + shared disk tier) to avoid redundant API calls.
+    Hash-fallback vectors are never cached, so a quota outage does not pin
+    degraded vectors once Gemini recovers.
     """
-    cache_key = hashlib.md5(text.encode("utf-8")).hexdigest()
-    if cache_key in _embedding_cache:
-        return _embedding_cache[cache_key]
-
     dims = _embedding_dims()
-    vec = _gemini_embed(text, dims=dims) or _hash_embed(text, dims)
-    _embedding_cache[cache_key] = vec
-    return vec
+    key = _cache_key_for(text, dims)
+    cache = get_embedding_cache()
+    cached = cache.get_many([key])
+    if key in cached:
+        return cached[key]
+
+    answered = _gemini_embed(text, dims=dims)
+    if answered:
+        vec, model_name = answered
+        cache.put_many({_cache_key_for(text, dims, model_name): vec})
+        return vec
+    return _hash_embed(text, dims)
 
 
 def embed_batch(
@@ -240,11 +268,14 @@ def embed_batch(
     results: list[list[float]] = [[] for _ in range(len(texts))]
 
     # ── Cache pass ───────────────────────────────────────────────────────────
+    cache = get_embedding_cache()
+    active_model = _active_embedding_model()
+    keys = [_cache_key_for(text, dims, active_model) for text in texts]
+    cached = cache.get_many(list(dict.fromkeys(keys)))
     uncached_indices: list[int] = []
-    for i, text in enumerate(texts):
-        key = hashlib.md5(text.encode("utf-8")).hexdigest()
-        if key in _embedding_cache:
-            results[i] = _embedding_cache[key]
+    for i, key in enumerate(keys):
+        if key in cached:
+            results[i] = cached[key]
         else:
             uncached_indices.append(i)
 
@@ -259,20 +290,29 @@ def embed_batch(
     # ── Parallel batch embedding ─────────────────────────────────────────────
     uncached_texts = [texts[i] for i in uncached_indices]
     batch_size = _get_batch_size()
+    fallback_slots: set[int] = set()
+    slot_models: dict[int, str] = {}
     embedded = _embed_texts_in_batches_parallel(
         uncached_texts, dims, batch_size,
         max_workers=max_concurrent,
         progress_callback=progress_callback,
         progress_start=progress_start,
         progress_end=progress_end,
+        fallback_indices=fallback_slots,
+        model_by_index=slot_models,
     )
 
     # ── Write back to cache and result list ──────────────────────────────────
-    for slot, (orig_idx, text) in enumerate(zip(uncached_indices, uncached_texts)):
+    # Each vector is cached under the model that produced it; slots with no
+    # recorded model (hash fallback) are not cached.
+    fresh: dict[str, list[float]] = {}
+    for slot, orig_idx in enumerate(uncached_indices):
         vec = embedded[slot]
-        key = hashlib.md5(text.encode("utf-8")).hexdigest()
-        _embedding_cache[key] = vec
         results[orig_idx] = vec
+        model_name = slot_models.get(slot)
+        if slot not in fallback_slots and model_name:
+            fresh[_cache_key_for(texts[orig_idx], dims, model_name)] = vec
+    cache.put_many(fresh)
 
     return results
 
@@ -280,30 +320,87 @@ def embed_batch(
 def cosine_similarity(left: list[float], right: list[float]) -> float:
     if not left or not right or len(left) != len(right):
         return 0.0
-    dot = sum(a * b for a, b in zip(left, right))
-    norm_l = math.sqrt(sum(a * a for a in left)) or 1.0
-    norm_r = math.sqrt(sum(b * b for b in right)) or 1.0
-    return dot / (norm_l * norm_r)
+    return float(cosine_matrix([left], [right])[0, 0])
+
+
+def l2_normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Return ``matrix`` with every row scaled to unit length (zero rows stay zero)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return matrix / norms
+
+
+def cosine_matrix(queries, docs) -> np.ndarray:
+    """Cosine similarity of every query row against every doc row, shape ``(q, d)``.
+
+    Accepts 2-D arrays or lists of vectors. Rows whose length differs from the
+    common dimension (including empty rows) score 0.0 against everything, the
+    same as ``cosine_similarity`` on a mismatched pair.
+    """
+    left, left_ok = _as_matrix(queries)
+    right, right_ok = _as_matrix(docs)
+    scores = np.zeros((len(left_ok), len(right_ok)), dtype=np.float64)
+    if not left_ok.any() or not right_ok.any() or left.shape[1] != right.shape[1]:
+        return scores
+    scores[np.ix_(left_ok, right_ok)] = l2_normalize_rows(left[left_ok]) @ l2_normalize_rows(right[right_ok]).T
+    return scores
+
+
+def _as_matrix(rows) -> tuple[np.ndarray, np.ndarray]:
+    """(float64 matrix, valid-row mask); ragged input keeps only rows of the most common length."""
+    if isinstance(rows, np.ndarray) and rows.ndim == 2:
+        matrix = rows.astype(np.float64, copy=False)
+        return matrix, np.full(matrix.shape[0], matrix.shape[1] > 0)
+    rows = list(rows)
+    lengths = [len(row) for row in rows]
+    nonempty = [n for n in lengths if n]
+    if not nonempty:
+        return np.zeros((len(rows), 0)), np.zeros(len(rows), dtype=bool)
+    dims = max(set(nonempty), key=nonempty.count)
+    ok = np.array([n == dims for n in lengths], dtype=bool)
+    matrix = np.zeros((len(rows), dims), dtype=np.float64)
+    if ok.all():
+        matrix[:] = rows
+    else:
+        matrix[ok] = [row for row, keep in zip(rows, ok) if keep]
+    return matrix, ok
 
 
 # ---------------------------------------------------------------------------
 # Internal batch helpers
 # ---------------------------------------------------------------------------
 
-def _embed_texts_in_batches(texts: list[str], dims: int, batch_size: int) -> list[list[float]]:
-    """Serial fallback: split texts into sub-batches, embed sequentially."""
+def _embed_texts_in_batches(
+    texts: list[str],
+    dims: int,
+    batch_size: int,
+    *,
+    fallback_indices: set[int] | None = None,
+    model_by_index: dict[int, str] | None = None,
+) -> list[list[float]]:
+    """Serial fallback: split texts into sub-batches, embed sequentially.
+
+    Positions that received hash-fallback vectors are added to ``fallback_indices``;
+    the others are mapped to the model that embedded them in ``model_by_index``.
+    """
     results: list[list[float]] = []
     total = len(texts)
     for batch_start in range(0, total, batch_size):
         batch = texts[batch_start: batch_start + batch_size]
         logger.debug("[Embeddings] Batch %d-%d / %d", batch_start + 1, min(batch_start + batch_size, total), total)
-        batch_vecs = _gemini_embed_batch_with_retry(batch, dims)
-        if batch_vecs is None or len(batch_vecs) != len(batch):
+        answered = _gemini_embed_batch_with_retry(batch, dims)
+        if answered is None or len(answered[0]) != len(batch):
             logger.warning(
                 "[Embeddings] Sub-batch %d-%d failed — using hash fallback for %d texts",
                 batch_start + 1, min(batch_start + batch_size, total), len(batch),
             )
-            batch_vecs = [_hash_embed(t, dims) for t in batch]
+            batch_vecs = _hash_embed_batch(batch, dims)
+            if fallback_indices is not None:
+                fallback_indices.update(range(batch_start, batch_start + len(batch)))
+        else:
+            batch_vecs, model_name = answered
+            if model_by_index is not None:
+                model_by_index.update(dict.fromkeys(range(batch_start, batch_start + len(batch)), model_name))
         results.extend(batch_vecs)
     return results
 
@@ -317,6 +414,8 @@ def _embed_texts_in_batches_parallel(
     progress_callback=None,
     progress_start: float = 65.0,
     progress_end: float = 78.0,
+    fallback_indices: set[int] | None = None,
+    model_by_index: dict[int, str] | None = None,
 ) -> list[list[float]]:
     """
     Parallel batch embedding using ThreadPoolExecutor.
@@ -324,7 +423,9 @@ def _embed_texts_in_batches_parallel(
     Splits texts into sub-batches of batch_size and submits all concurrently.
     The token-bucket rate limiter (already thread-safe) throttles each batch
     to stay within Gemini RPM limits. Results are reassembled in original order.
-    Falls back to hash embeddings for any sub-batch that fails after retries.
+    Falls back to hash embeddings for any sub-batch that fails after retries;
+    those positions are added to ``fallback_indices``. Every other position is
+    mapped to the model that embedded it in ``model_by_index``.
     """
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -337,7 +438,9 @@ def _embed_texts_in_batches_parallel(
     n_batches = len(batches)
     if n_batches <= 1:
         # Single sub-batch: skip ThreadPoolExecutor overhead
-        result = _embed_texts_in_batches(texts, dims, batch_size)
+        result = _embed_texts_in_batches(
+            texts, dims, batch_size, fallback_indices=fallback_indices, model_by_index=model_by_index,
+        )
         if progress_callback:
             try:
                 progress_callback(round(progress_end, 1))
@@ -356,13 +459,21 @@ def _embed_texts_in_batches_parallel(
     completed_lock = threading.Lock()
 
     def _embed_one(start: int, batch: list[str]) -> tuple[int, list[list[float]]]:
-        vecs = _gemini_embed_batch_with_retry(batch, dims)
-        if vecs is None or len(vecs) != len(batch):
+        answered = _gemini_embed_batch_with_retry(batch, dims)
+        if answered is None or len(answered[0]) != len(batch):
             logger.warning(
                 "[Embeddings] parallel sub-batch start=%d size=%d failed — hash fallback",
                 start, len(batch),
             )
-            vecs = [_hash_embed(t, dims) for t in batch]
+            vecs = _hash_embed_batch(batch, dims)
+            if fallback_indices is not None:
+                with completed_lock:
+                    fallback_indices.update(range(start, start + len(batch)))
+            return start, vecs
+        vecs, model_name = answered
+        if model_by_index is not None:
+            with completed_lock:
+                model_by_index.update(dict.fromkeys(range(start, start + len(batch)), model_name))
         return start, vecs
 
     effective_workers = min(max_workers, n_batches)
@@ -390,12 +501,13 @@ def _embed_texts_in_batches_parallel(
     return combined
 
 
-def _gemini_embed_batch_with_retry(texts: list[str], dims: int) -> list[list[float]] | None:
+def _gemini_embed_batch_with_retry(texts: list[str], dims: int) -> tuple[list[list[float]], str] | None:
     """
     Send a single sub-batch to Gemini with exponential-backoff retry on
     rate-limit errors (429 / ResourceExhausted).
 
-    Returns the list of vectors on success, None if all retries are exhausted
+    Returns ``(vectors, model_name)`` on success — the model that actually
+    answered, which may be a fallback — or None if all retries are exhausted
     or a non-recoverable error occurs.
     """
     max_retries = _get_max_retries()
@@ -435,19 +547,18 @@ def _gemini_embed_batch_with_retry(texts: list[str], dims: int) -> list[list[flo
                         model=model_name,
                         contents=texts,
                         config={
-                            "task_type": "RETRIEVAL_DOCUMENT",
+                            "task_type": EMBEDDING_TASK,
                             "output_dimensionality": dims,
                         },
                     )
                     _record_embedding_tokens(result, model_name, texts)
                     payload = getattr(result, "embeddings", None) or []
-                    parsed: list[list[float]] = []
-                    for item in payload:
-                        values = list(getattr(item, "values", []) or [])
-                        if values:
-                            parsed.append(_fit_embedding_dims(values, dims))
+                    parsed = _fit_embedding_dims_batch(
+                        [v for v in (list(getattr(item, "values", []) or []) for item in payload) if v],
+                        dims,
+                    )
                     if len(parsed) == len(texts):
-                        return parsed
+                        return parsed, model_name
                     # Partial result — try next model
                     continue
                 except Exception as model_exc:
@@ -492,7 +603,8 @@ def _gemini_embed_batch_with_retry(texts: list[str], dims: int) -> list[list[flo
 # Single-text Gemini call (used by embed_text)
 # ---------------------------------------------------------------------------
 
-def _gemini_embed(text: str, *, dims: int | None = None) -> list[float] | None:
+def _gemini_embed(text: str, *, dims: int | None = None) -> tuple[list[float], str] | None:
+    """``(vector, model_name)`` from the first model that answers, else None."""
     global _gemini_unavailable_logged
     target_dims = dims or _embedding_dims()
     try:
@@ -513,7 +625,7 @@ def _gemini_embed(text: str, *, dims: int | None = None) -> list[float] | None:
                     model=model_name,
                     contents=text,
                     config={
-                        "task_type": "RETRIEVAL_DOCUMENT",
+                        "task_type": EMBEDDING_TASK,
                         "output_dimensionality": target_dims,
                     },
                 )
@@ -530,7 +642,7 @@ def _gemini_embed(text: str, *, dims: int | None = None) -> list[float] | None:
                             len(vec),
                             target_dims,
                         )
-                    return _fit_embedding_dims(vec, target_dims)
+                    return _fit_embedding_dims(vec, target_dims), model_name
             except Exception as exc:
                 if _is_model_not_found_error(str(exc)) and model_name not in _bad_models:
                     _bad_models.add(model_name)
@@ -558,30 +670,50 @@ def _fit_embedding_dims(values: list[float], dims: int = EMBEDDING_DIMS) -> list
         return []
     if len(values) == dims:
         return values
-    if len(values) > dims:
-        bucket = len(values) / float(dims)
-        reduced: list[float] = []
-        for i in range(dims):
-            start = int(i * bucket)
-            end = int((i + 1) * bucket)
-            if end <= start:
-                end = start + 1
-            segment = values[start:end]
-            reduced.append(sum(segment) / max(len(segment), 1))
-        values = reduced
-    else:
-        values = values + ([0.0] * (dims - len(values)))
-    norm = math.sqrt(sum(v * v for v in values)) or 1.0
-    return [v / norm for v in values]
+    return _fit_embedding_dims_batch([values], dims)[0]
+
+
+def _fit_embedding_dims_batch(rows: list[list[float]], dims: int = EMBEDDING_DIMS) -> list[list[float]]:
+    """``_fit_embedding_dims`` for many vectors; same-length rows are pooled/padded as one matrix."""
+    out: list[list[float]] = [[] for _ in rows]
+    by_length: dict[int, list[int]] = {}
+    for i, row in enumerate(rows):
+        if len(row) == dims:
+            out[i] = row  # already the right size: passed through un-normalized
+        elif row:
+            by_length.setdefault(len(row), []).append(i)
+    for length, indices in by_length.items():
+        matrix = np.asarray([rows[i] for i in indices], dtype=np.float64)
+        if length > dims:
+            # Mean-pool contiguous buckets: bucket i covers [int(i*b), int((i+1)*b)).
+            bucket = length / float(dims)
+            starts = (np.arange(dims) * bucket).astype(np.int64)
+            ends = np.maximum((np.arange(1, dims + 1) * bucket).astype(np.int64), starts + 1)
+            prefix = np.zeros((matrix.shape[0], length + 1), dtype=np.float64)
+            np.cumsum(matrix, axis=1, out=prefix[:, 1:])
+            matrix = (prefix[:, ends] - prefix[:, starts]) / (ends - starts)
+        else:
+            matrix = np.pad(matrix, ((0, 0), (0, dims - length)))
+        for i, vec in zip(indices, l2_normalize_rows(matrix).tolist()):
+            out[i] = vec
+    return out
 
 
 def _hash_embed(text: str, dims: int) -> list[float]:
     """Deterministic fallback embedding derived from SHA-256 hash."""
-    digest = hashlib.sha256(text.encode("utf-8")).digest()
-    values: list[float] = []
-    for i in range(dims):
-        start = (i * 2) % len(digest)
-        raw = int.from_bytes(digest[start: start + 2], "big", signed=False)
-        values.append((raw / 65535.0) * 2 - 1)
-    norm = math.sqrt(sum(v * v for v in values)) or 1.0
-    return [v / norm for v in values]
+    return _hash_embed_batch([text], dims)[0]
+
+
+def _hash_embed_batch(texts: list[str], dims: int) -> list[list[float]]:
+    """Hash-fallback vectors for many texts at once.
+
+    Component ``i`` is the big-endian uint16 at byte ``(2 * i) % 32`` of the
+    text's SHA-256 digest, mapped to [-1, 1]; the pattern repeats every 16
+    components, so the whole batch is one gather from an ``(n, 16)`` array.
+    """
+    if not texts:
+        return []
+    digests = b"".join(hashlib.sha256(text.encode("utf-8")).digest() for text in texts)
+    words = np.frombuffer(digests, dtype=">u2").reshape(len(texts), 16).astype(np.float64)
+    values = (words[:, np.arange(dims) % 16] / 65535.0) * 2 - 1
+    return l2_normalize_rows(values).tolist()
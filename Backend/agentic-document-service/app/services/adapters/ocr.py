@@ -8,6 +8,9 @@ in parallel via a ThreadPoolExecutor, and the results are merged in page order.
 Progress is reported to the caller via an optional progress_callback(pct: float)
 callable where pct is the document-level processing percentage (0-100).
 
+open_ocr_page_stream() is the streaming variant for large PDFs: it yields each
+page batch in page order as soon as it is OCR'd, with a bounded look-ahead window.
+
 Falls back to pypdf for PDFs and raw UTF-8 decode when Document AI is unavailable.
 """
 from __future__ import annotations
@@ -17,9 +20,10 @@ import logging
 import os
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
 logger = logging.getLogger("agentic_document_service.document_ai_ocr")
 
@@ -176,22 +180,26 @@ def _split_pdf_into_page_batches(data: bytes, max_pages: int) -> list[bytes]:
     Split PDF bytes into sequential batches of at most max_pages pages.
     Returns a list of PDF bytes (one entry per batch), in page order.
     """
-    from pypdf import PdfReader, PdfWriter  # type: ignore
+    from pypdf import PdfReader  # type: ignore
 
     reader = PdfReader(io.BytesIO(data))
     total = len(reader.pages)
-    batches: list[bytes] = []
+    return [
+        _pdf_page_range_bytes(reader, start, min(start + max_pages, total))
+        for start in range(0, total, max_pages)
+    ]
+
 
-    for start in range(0, total, max_pages):
-        end = min(start + max_pages, total)
-        writer = PdfWriter()
-        for i in range(start, end):
-            writer.add_page(reader.pages[i])
-        buf = io.BytesIO()
-        writer.write(buf)
-        batches.append(buf.getvalue())
+def _pdf_page_range_bytes(reader, start: int, end: int) -> bytes:
+    """Write pages [start, end) of an open PdfReader as a standalone PDF."""
+    from pypdf import PdfWriter  # type: ignore
 
-    return batches
+    writer = PdfWriter()
+    for i in range(start, end):
+        writer.add_page(reader.pages[i])
+    buf = io.BytesIO()
+    writer.write(buf)
+    return buf.getvalue()
 
 
 def _merge_structured_json(results: list[OcrResult], merged_text: str) -> dict[str, Any] | None:
@@ -819,6 +827,134 @@ def _parallel_ocr_bytes(
     return merged
 
 
+# ── Streaming page-batch OCR ───────────────────────────────────────────────────
+
+@dataclass
+class OcrPageStream:
+    """Page batches of one large PDF, yielded in page order as OCR completes."""
+    page_count: int
+    batch_count: int
+    batches: Iterator[OcrResult]
+
+
+def open_ocr_page_stream(
+    data: bytes,
+    mime_type: str,
+    *,
+    min_pages: int = 0,
+    max_pending: int = 0,
+) -> OcrPageStream | None:
+    """
+    Start streaming Document AI OCR for a large PDF.
+
+    Unlike _parallel_ocr_bytes, batch PDFs are cut lazily and at most
+    ``max_pending`` batches (default 2× OCR workers) are in OCR or waiting for
+    the consumer at any time, so the caller can chunk/embed batch N while
+    batches N+1.. are still being OCR'd and memory stays bounded.
+
+    Returns None when streaming does not apply — non-PDF, fewer than
+    ``min_pages`` pages or a single page batch, Document AI not configured, or
+    its client cannot be built — and the caller should use extract_text_from_bytes.
+    A batch that fails OCR is yielded as an empty OcrResult, as in _parallel_ocr_bytes.
+    """
+    if not (mime_type == "application/pdf" or mime_type.endswith("/pdf")):
+        return None
+    page_limit = _get_page_limit()
+    try:
+        from pypdf import PdfReader  # type: ignore
+        reader = PdfReader(io.BytesIO(data))
+        page_count = len(reader.pages)
+    except Exception:
+        return None
+    if page_count <= page_limit or page_count < min_pages:
+        return None
+
+    from app.core.config import get_settings
+    settings = get_settings()
+    project_id = settings.google_cloud_project
+    location = settings.google_cloud_location or "us"
+    processor_id = (getattr(settings, "document_ai_processor_id", "") or "").strip()
+    if not project_id or not processor_id:
+        return None
+    try:
+        client, processor_name = _build_document_ai_client(location, project_id, processor_id)
+        process_options = _build_ocr_process_options()
+    except Exception as exc:
+        logger.warning("[DocumentAI OCR] streaming unavailable, client setup failed: %s", exc)
+        return None
+
+    workers = _get_ocr_workers()
+    window = max(workers, int(max_pending or 0) or 2 * workers)
+    batch_count = -(-page_count // page_limit)
+    logger.info(
+        "[DocumentAI OCR] streaming PDF pages=%d batches=%d (limit=%d/batch) workers=%d window=%d",
+        page_count, batch_count, page_limit, workers, window,
+    )
+    return OcrPageStream(
+        page_count=page_count,
+        batch_count=batch_count,
+        batches=_iter_ocr_page_batches(
+            reader, mime_type, client, processor_name,
+            process_options=process_options, page_limit=page_limit, workers=workers, window=window,
+        ),
+    )
+
+
+def _iter_ocr_page_batches(
+    reader,
+    mime_type: str,
+    client,
+    processor_name: str,
+    *,
+    process_options,
+    page_limit: int,
+    workers: int,
+    window: int,
+) -> Iterator[OcrResult]:
+    total = len(reader.pages)
+    starts = iter(range(0, total, page_limit))
+    pending: deque[tuple[int, Future]] = deque()
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr-stream")
+
+    def _submit_next() -> None:
+        start = next(starts, None)
+        if start is None:
+            return
+        batch = _pdf_page_range_bytes(reader, start, min(start + page_limit, total))
+        # page_offset = first page index of the batch; see _parallel_ocr_bytes.
+        pending.append((start, pool.submit(
+            _call_document_ai,
+            batch,
+            mime_type,
+            client,
+            processor_name,
+            page_offset=start,
+            process_options=process_options,
+        )))
+
+    try:
+        for _ in range(window):
+            _submit_next()
+        while pending:
+            start, future = pending.popleft()
+            try:
+                result = future.result()
+            except Exception as exc:
+                logger.warning(
+                    "[DocumentAI OCR] streamed batch pages %d-%d failed: %s — using empty result",
+                    start + 1, min(start + page_limit, total), exc,
+                )
+                result = OcrResult(text="", page_count=0, quality_score=0.0)
+            # Refill before handing the batch over so OCR keeps running while the
+            # consumer chunks/embeds it.
+            _submit_next()
+            yield result
+    finally:
+        for _, future in pending:
+            future.cancel()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 # ── Audio / Speech-to-Text extraction ─────────────────────────────────────────
 
 def extract_text_from_audio_gcs(
@@ -1,14 +1,37 @@
+"""
+In-memory hybrid (vector + keyword) index used when the DB path is unavailable.
+
+Key design:
+- One ``_CaseIndex`` per case holds a contiguous, pre-normalized float32 matrix
+  of chunk embeddings plus parallel metadata arrays (records, doc-type codes,
+  alive flags), so a semantic search is one matrix-vector product.
+- Top-k selection uses ``np.argpartition`` (O(n)) instead of a full sort; ties
+  are broken by insertion order, matching the stable sort the store used before.
+- Keyword scores come from a per-case inverted index (term → rows), so only
+  rows sharing a query term are touched.
+- ``upsert_chunks`` appends into capacity-doubled buffers (amortized O(1) per
+  chunk). Replacing a chunk_id or ``delete_document`` only tombstones rows;
+  the matrix is compacted once tombstones outnumber live rows.
+"""
 from __future__ import annotations
 
 import re
+import threading
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from app.schemas.contracts import DocumentType
-from app.services.adapters.embeddings import cosine_similarity
+from app.services.adapters.embeddings import l2_normalize_rows
 
 
 TOKEN_RE = re.compile(r"[a-zA-Z0-9_]+")
 
+RRF_RANK_CONSTANT = 60.0
+_INITIAL_CAPACITY = 64
+# Compact once tombstones exceed this many rows AND outnumber live rows.
+_COMPACT_MIN_DEAD = 256
+
 
 @dataclass(slots=True)
 class ChunkRecord:
@@ -22,23 +45,172 @@ class ChunkRecord:
     metadata: dict[str, str] = field(default_factory=dict)
 
 
+def _top_rows(scores: np.ndarray, rows: np.ndarray, n: int) -> np.ndarray:
+    """Return up to ``n`` of ``rows`` ordered by score desc, then row asc.
+
+    Equivalent to a stable descending sort truncated to ``n``, but O(len(rows))
+    via argpartition. Rows tied at the cut-off score are taken in row order so
+    the result is deterministic.
+    """
+    if n <= 0 or rows.size == 0:
+        return rows[:0]
+    if rows.size > n:
+        cut = scores[np.argpartition(-scores, n - 1)[n - 1]]
+        above = scores > cut
+        tied = np.flatnonzero(scores == cut)[: n - int(above.sum())]
+        keep = np.concatenate([np.flatnonzero(above), tied])
+        rows, scores = rows[keep], scores[keep]
+    order = np.lexsort((rows, -scores))
+    return rows[order]
+
+
+class _CaseIndex:
+    """Column-oriented chunk storage for a single case. Not thread-safe on its own."""
+
+    def __init__(self, dims: int) -> None:
+        self.dims = dims
+        self.size = 0
+        self.dead = 0
+        self.matrix = np.zeros((_INITIAL_CAPACITY, dims), dtype=np.float32)
+        self.alive = np.zeros(_INITIAL_CAPACITY, dtype=bool)
+        self.type_codes = np.zeros(_INITIAL_CAPACITY, dtype=np.int16)
+        self.records: list[ChunkRecord | None] = []
+        self.row_by_chunk: dict[str, int] = {}
+        self.rows_by_document: dict[str, list[int]] = {}
+        self.postings: dict[str, list[int]] = {}
+        self.type_code_by_value: dict[DocumentType, int] = {}
+
+    @property
+    def live_count(self) -> int:
+        return self.size - self.dead
+
+    def _grow(self) -> None:
+        capacity = self.matrix.shape[0] * 2
+        matrix = np.zeros((capacity, self.dims), dtype=np.float32)
+        matrix[: self.size] = self.matrix[: self.size]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[: self.size] = self.alive[: self.size]
+        codes = np.zeros(capacity, dtype=np.int16)
+        codes[: self.size] = self.type_codes[: self.size]
+        self.matrix, self.alive, self.type_codes = matrix, alive, codes
+
+    def _type_code(self, doc_type: DocumentType) -> int:
+        code = self.type_code_by_value.get(doc_type)
+        if code is None:
+            code = len(self.type_code_by_value)
+            self.type_code_by_value[doc_type] = code
+        return code
+
+    def append(self, chunk: ChunkRecord) -> None:
+        if not self.dims and chunk.embedding:
+            # Every row so far had no embedding (all zeros), so re-dimensioning loses nothing.
+            self.dims = len(chunk.embedding)
+            self.matrix = np.zeros((self.matrix.shape[0], self.dims), dtype=np.float32)
+        previous = self.row_by_chunk.get(chunk.chunk_id)
+        if previous is not None:
+            self.tombstone(previous)
+        if self.size == self.matrix.shape[0]:
+            self._grow()
+        row = self.size
+        vector = np.asarray(chunk.embedding, dtype=np.float32)
+        if vector.shape == (self.dims,):
+            self.matrix[row] = l2_normalize_rows(vector[None, :])[0]
+        else:
+            # Mismatched / empty embeddings score 0.0, as cosine_similarity did.
+            self.matrix[row] = 0.0
+        self.alive[row] = True
+        self.type_codes[row] = self._type_code(chunk.doc_type)
+        self.records.append(chunk)
+        self.row_by_chunk[chunk.chunk_id] = row
+        self.rows_by_document.setdefault(chunk.document_id, []).append(row)
+        for term in set(TOKEN_RE.findall(chunk.text.lower())):
+            self.postings.setdefault(term, []).append(row)
+        self.size += 1
+
+    def tombstone(self, row: int) -> None:
+        if not self.alive[row]:
+            return
+        record = self.records[row]
+        self.alive[row] = False
+        self.records[row] = None
+        self.dead += 1
+        if record is not None and self.row_by_chunk.get(record.chunk_id) == row:
+            del self.row_by_chunk[record.chunk_id]
+
+    def delete_document(self, document_id: str) -> int:
+        rows = self.rows_by_document.pop(document_id, [])
+        removed = 0
+        for row in rows:
+            if self.alive[row]:
+                self.tombstone(row)
+                removed += 1
+        return removed
+
+    def maybe_compact(self) -> None:
+        if self.dead < _COMPACT_MIN_DEAD or self.dead <= self.live_count:
+            return
+        records = [r for r in self.records if r is not None]
+        fresh = _CaseIndex(self.dims)
+        for record in records:
+            fresh.append(record)
+        self.__dict__.update(fresh.__dict__)
+
+    def semantic_scores(self, query_embedding: list[float], rows: np.ndarray) -> np.ndarray:
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if query.shape != (self.dims,):
+            return np.zeros(rows.size, dtype=np.float32)
+        query = l2_normalize_rows(query[None, :])[0]
+        if rows.size * 2 < self.size:
+            # Sparse filter: gather only the selected rows.
+            return self.matrix[rows] @ query
+        return (self.matrix[: self.size] @ query)[rows]
+
+    def keyword_scores(self, query_terms: set[str], rows: np.ndarray) -> np.ndarray:
+        hits = np.zeros(self.size, dtype=np.float32)
+        for term in query_terms:
+            posting = self.postings.get(term)
+            if posting:
+                hits[posting] += 1.0
+        return hits[rows] / max(len(query_terms), 1)
+
+    def candidate_rows(self, required_doc_types: list[DocumentType]) -> np.ndarray:
+        mask = self.alive[: self.size]
+        if required_doc_types:
+            codes = [self.type_code_by_value[t] for t in required_doc_types if t in self.type_code_by_value]
+            mask = mask & np.isin(self.type_codes[: self.size], codes)
+        return np.flatnonzero(mask)
+
+
 class InMemoryVectorStore:
     def __init__(self) -> None:
-        self._chunks: dict[str, list[ChunkRecord]] = {}
+        self._cases: dict[str, _CaseIndex] = {}
+        self._document_cases: dict[str, set[str]] = {}
+        self._lock = threading.RLock()
 
     def upsert_chunks(self, case_id: str, chunks: list[ChunkRecord]) -> None:
-        self._chunks.setdefault(case_id, [])
-        self._chunks[case_id].extend(chunks)
+        """Append chunks to the case index; a repeated chunk_id replaces the old row."""
+        if not chunks:
+            return
+        with self._lock:
+            index = self._cases.get(case_id)
+            if index is None:
+                dims = next((len(c.embedding) for c in chunks if c.embedding), 0)
+                index = self._cases[case_id] = _CaseIndex(dims)
+            for chunk in chunks:
+                index.append(chunk)
+                self._document_cases.setdefault(chunk.document_id, set()).add(case_id)
+            index.maybe_compact()
 
     def delete_document(self, document_id: str) -> int:
         """Remove all chunks for a document_id across all cases. Returns count removed."""
         removed = 0
-        for case_id in list(self._chunks.keys()):
-            before = len(self._chunks[case_id])
-            self._chunks[case_id] = [
-                c for c in self._chunks[case_id] if c.document_id != document_id
-            ]
-            removed += before - len(self._chunks[case_id])
+        with self._lock:
+            for case_id in self._document_cases.pop(document_id, set()):
+                index = self._cases.get(case_id)
+                if index is None:
+                    continue
+                removed += index.delete_document(document_id)
+                index.maybe_compact()
         return removed
 
     def search(
@@ -54,51 +226,45 @@ class InMemoryVectorStore:
         semantic_weight: float = 0.7,
         keyword_weight: float = 0.3,
     ) -> list[tuple[ChunkRecord, float]]:
-        query_terms = set(TOKEN_RE.findall(query.lower()))
-        semantic_matches: list[tuple[ChunkRecord, float]] = []
-        keyword_matches: list[tuple[ChunkRecord, float]] = []
-        for chunk in self._chunks.get(case_id, []):
-            if required_doc_types and chunk.doc_type not in required_doc_types:
-                continue
-            text_terms = set(TOKEN_RE.findall(chunk.text.lower()))
-            lexical_score = len(query_terms & text_terms) / max(len(query_terms), 1)
-            vector_score = cosine_similarity(query_embedding, chunk.embedding)
-            semantic_matches.append((chunk, vector_score))
-            if use_hybrid_search:
-                keyword_matches.append((chunk, lexical_score))
-
-        semantic_matches.sort(key=lambda item: item[1], reverse=True)
-        if not use_hybrid_search:
-            return semantic_matches[:top_k]
-
-        keyword_matches.sort(key=lambda item: item[1], reverse=True)
-        if use_rrf:
-            chunk_map: dict[str, tuple[ChunkRecord, float]] = {}
-            rank_constant = 60.0
-            for rank, (chunk, _score) in enumerate(semantic_matches[: max(top_k * 3, top_k)], start=1):
-                chunk_map[chunk.chunk_id] = (chunk, 1.0 / (rank_constant + rank))
-            for rank, (chunk, _score) in enumerate(keyword_matches[: max(top_k * 3, top_k)], start=1):
-                existing = chunk_map.get(chunk.chunk_id)
-                score = (existing[1] if existing else 0.0) + (1.0 / (rank_constant + rank))
-                chunk_map[chunk.chunk_id] = (chunk, score)
-            merged = list(chunk_map.values())
-            merged.sort(key=lambda item: item[1], reverse=True)
-            return merged[:top_k]
-
-        semantic_weight = max(0.0, float(semantic_weight))
-        keyword_weight = max(0.0, float(keyword_weight))
-        chunk_scores: dict[str, tuple[ChunkRecord, float, float]] = {}
-        for chunk, score in semantic_matches[: max(top_k * 3, top_k)]:
-            chunk_scores[chunk.chunk_id] = (chunk, score, 0.0)
-        for chunk, score in keyword_matches[: max(top_k * 3, top_k)]:
-            existing = chunk_scores.get(chunk.chunk_id)
-            if existing:
-                chunk_scores[chunk.chunk_id] = (chunk, existing[1], score)
-            else:
-                chunk_scores[chunk.chunk_id] = (chunk, 0.0, score)
-        merged = [
-            (chunk, round((semantic * semantic_weight) + (keyword * keyword_weight), 4))
-            for chunk, semantic, keyword in chunk_scores.values()
-        ]
-        merged.sort(key=lambda item: item[1], reverse=True)
-        return merged[:top_k]
+        with self._lock:
+            index = self._cases.get(case_id)
+            if index is None:
+                return []
+            rows = index.candidate_rows(required_doc_types)
+            if rows.size == 0:
+                return []
+            semantic = index.semantic_scores(query_embedding, rows)
+            records = index.records
+
+            if not use_hybrid_search:
+                order = _top_rows(semantic, np.arange(rows.size), top_k)
+                return [(records[rows[i]], float(semantic[i])) for i in order]
+
+            pool = max(top_k * 3, top_k)
+            keyword = index.keyword_scores(set(TOKEN_RE.findall(query.lower())), rows)
+            semantic_top = _top_rows(semantic, np.arange(rows.size), pool)
+            keyword_top = _top_rows(keyword, np.arange(rows.size), pool)
+
+            if use_rrf:
+                fused: dict[int, float] = {}
+                for ranked in (semantic_top, keyword_top):
+                    for rank, i in enumerate(ranked.tolist(), start=1):
+                        fused[i] = fused.get(i, 0.0) + 1.0 / (RRF_RANK_CONSTANT + rank)
+                merged = [(records[rows[i]], score) for i, score in fused.items()]
+                merged.sort(key=lambda item: item[1], reverse=True)
+                return merged[:top_k]
+
+            semantic_weight = max(0.0, float(semantic_weight))
+            keyword_weight = max(0.0, float(keyword_weight))
+            components: dict[int, tuple[float, float]] = {
+                i: (float(semantic[i]), 0.0) for i in semantic_top.tolist()
+            }
+            for i in keyword_top.tolist():
+                prior = components.get(i)
+                components[i] = (prior[0] if prior else 0.0, float(keyword[i]))
+            weighted = [
+                (records[rows[i]], round((sem * semantic_weight) + (kw * keyword_weight), 4))
+                for i, (sem, kw) in components.items()
+            ]
+            weighted.sort(key=lambda item: item[1], reverse=True)
+            return weighted[:top_k]
@@ -0,0 +1,141 @@
+"""
+COPY-based bulk load of file_chunks + chunk_vectors for one document.
+
+Key design:
+- All rows for the document are streamed with psycopg ``COPY ... FROM STDIN``
+  into a transaction-scoped TEMP staging table, then merged with two set-based
+  upserts (file_chunks, then chunk_vectors joined on (file_id, chunk_index)).
+- When the ``pgvector`` package is installed, COPY runs in BINARY format and
+  embeddings go over the wire as packed float32 (3 KB per 768-dim vector)
+  instead of a ~10 KB "[0.1,0.2,...]" literal the server must parse.
+  Without it, COPY TEXT is used — still one stream instead of VALUES lists.
+- Returns the {chunk_index: file_chunks.id} map the RETURNING-based insert
+  path produced, so callers stay agnostic of which path ran.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Callable
+
+import numpy as np
+
+from app.services.adapters.vector_store import ChunkRecord
+
+try:
+    from pgvector.psycopg import register_vector
+except Exception:  # pragma: no cover - optional dependency
+    register_vector = None
+
+logger = logging.getLogger("agentic_document_service.chunk_bulk_loader")
+
+_STAGE_TABLE = "_chunk_stage"
+# Rows between progress reports while streaming COPY data.
+_PROGRESS_EVERY = 500
+
+
+def token_estimate(text: str) -> int:
+    return max(1, int(len(text.split()) * 1.3))
+
+
+def _vector_text(values: list[float]) -> str:
+    # float32 round-trips exactly through 9 significant digits; pgvector stores float4.
+    return "[" + ",".join(f"{v:.9g}" for v in values) + "]"
+
+
+def copy_chunks(
+    conn: Any,
+    cur: Any,
+    file_id: str,
+    chunks: list[ChunkRecord],
+    *,
+    tsv_config: str | None = None,
+    on_rows: Callable[[int, float], None] | None = None,
+    start_index: int = 0,
+) -> dict[int, str]:
+    """Stage ``chunks`` via COPY and upsert them. Caller owns commit/rollback.
+
+    ``chunks[i]`` is stored as chunk_index ``start_index + i``.
+
+    ``on_rows(rows_done, elapsed_seconds)`` is called periodically while
+    streaming and once more after both upserts finish.
+    """
+    started = time.perf_counter()
+    binary = register_vector is not None
+    if binary:
+        register_vector(conn)
+    cur.execute(
+        f"""
+        CREATE TEMP TABLE {_STAGE_TABLE} (
+            chunk_index INTEGER NOT NULL,
+            content TEXT NOT NULL,
+            token_count INTEGER,
+            heading TEXT,
+            embedding vector NOT NULL
+        ) ON COMMIT DROP
+        """
+    )
+    columns = "chunk_index, content, token_count, heading, embedding"
+    copy_format = "(FORMAT BINARY)" if binary else ""
+    with cur.copy(f"COPY {_STAGE_TABLE} ({columns}) FROM STDIN {copy_format}") as copy:
+        if binary:
+            copy.set_types(["int4", "text", "int4", "text", "vector"])
+        for index, chunk in enumerate(chunks):
+            embedding = (
+                np.asarray(chunk.embedding, dtype=np.float32)
+                if binary
+                else _vector_text(chunk.embedding)
+            )
+            copy.write_row((
+                start_index + index,
+                chunk.text,
+                token_estimate(chunk.text),
+                chunk.metadata.get("heading") or None,
+                embedding,
+            ))
+            if on_rows and (index + 1) % _PROGRESS_EVERY == 0:
+                on_rows(index + 1, time.perf_counter() - started)
+
+    tsv_column = ", tsv_config" if tsv_config else ""
+    tsv_value = ", %(tsv_config)s::regconfig" if tsv_config else ""
+    tsv_update = ", tsv_config = EXCLUDED.tsv_config" if tsv_config else ""
+    cur.execute(
+        f"""
+        INSERT INTO file_chunks (file_id, chunk_index, content, token_count, page_start, page_end, heading{tsv_column})
+        SELECT %(file_id)s::uuid, s.chunk_index, s.content, s.token_count, NULL, NULL, s.heading{tsv_value}
+        FROM {_STAGE_TABLE} s
+        ON CONFLICT (file_id, chunk_index) DO UPDATE
+          SET content = EXCLUDED.content,
+              token_count = EXCLUDED.token_count,
+              page_start = EXCLUDED.page_start,
+              page_end = EXCLUDED.page_end,
+              heading = EXCLUDED.heading{tsv_update}
+        RETURNING id, chunk_index
+        """,
+        {"file_id": file_id, "tsv_config": tsv_config},
+    )
+    id_by_index = {int(row["chunk_index"]): str(row["id"]) for row in cur.fetchall()}
+    cur.execute(
+        f"""
+        INSERT INTO chunk_vectors (chunk_id, embedding, file_id)
+        SELECT fc.id, s.embedding, fc.file_id
+        FROM {_STAGE_TABLE} s
+        INNER JOIN file_chunks fc ON fc.file_id = %(file_id)s::uuid AND fc.chunk_index = s.chunk_index
+        ON CONFLICT (chunk_id) DO UPDATE
+          SET embedding = EXCLUDED.embedding,
+              file_id = EXCLUDED.file_id,
+              updated_at = NOW()
+        """,
+        {"file_id": file_id},
+    )
+    elapsed = time.perf_counter() - started
+    if on_rows:
+        on_rows(len(chunks), elapsed)
+    logger.info(
+        "[ChunkBulkLoader] COPY %s file_id=%s rows=%d %.0f rows/s",
+        "binary" if binary else "text",
+        file_id,
+        len(chunks),
+        len(chunks) / elapsed if elapsed > 0 else float(len(chunks)),
+    )
+    return id_by_index
@@ -2508,21 +2508,22 @@ class FolderWorkflowService:
 
                 # Build a real-time progress callback for audio STT polling.
                 # Captures db_file_id / document_id / job_id by closure.
+                # Later stages pass ``operation`` (e.g. chunk persistence reports rows/s).
                 def _make_progress_callback(_db_file_id=db_file_id, _doc_id=document_id, _job_id=job_id):
-                    def _cb(pct: float) -> None:
+                    def _cb(pct: float, operation: str = "transcribing_audio") -> None:
                         try:
                             self._update_db_file_processing_state(
                                 file_id=_db_file_id,
                                 status=ProcessingState.processing.value,
                                 processing_progress=round(pct, 1),
-                                current_operation="transcribing_audio",
+                                current_operation=operation,
                             )
                             self._update_document(
                                 _job_id,
                                 _doc_id,
                                 ProcessingState.processing,
                                 round(pct, 1),
-                                "transcribing_audio",
+                                operation,
                             )
                         except Exception:
                             pass  # progress update is best-effort
@@ -2651,7 +2652,10 @@ class FolderWorkflowService:
             current_operation="vector_indexing",
         )
         self._update_document(job_id, document_id, ProcessingState.embedding_pending, 80.0, "vector_indexing")
-        persisted_chunks = self._pipeline.persist_chunks_to_db(db_file_id, bundle.chunks)
+        # Streaming ingestion (large PDFs) already persisted each chunk group as it was embedded.
+        persisted_chunks = bundle.chunks if bundle.chunks_persisted else self._pipeline.persist_chunks_to_db(
+            db_file_id, bundle.chunks, progress_callback=progress_callback,
+        )
         self._pipeline._vector_store.upsert_chunks(case_id, persisted_chunks)
         logger.info(
             "[Upload] Step 4/4: Storing — in-memory vector index updated case_id=%s document=%s chunks=%d",
@@ -5,6 +5,8 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 import re
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 from app.core.config import Settings, get_settings
@@ -26,6 +28,7 @@ from app.schemas.contracts import (
     QueryRequest,
     QueryResponse,
 )
+from app.services import chunk_bulk_loader
 from app.services.adapters import chunking, embeddings, gcs, ocr
 from app.services.adapters.document_ai import DocumentAIAdapter, _call_gemini_for_qa
 from app.services.adapters.vector_store import ChunkRecord, InMemoryVectorStore
@@ -79,6 +82,131 @@ def _get_public_table_columns(cur: Any, table_name: str) -> set[str]:
     return {row["column_name"] for row in cur.fetchall()}
 
 
+# (ready, probed_at): ready once migration 164 (file_chunks.content_tsv /
+# tsv_config) is applied. True is kept for the process; False is re-probed
+# after _TSV_PROBE_TTL_S so a migration applied later is picked up without a restart.
+_TSV_PROBE_TTL_S = 300.0
+_file_chunks_tsv_probe: tuple[bool, float] | None = None
+
+
+def _file_chunks_has_tsv(cur: Any) -> bool:
+    global _file_chunks_tsv_probe
+    now = time.monotonic()
+    probe = _file_chunks_tsv_probe
+    if probe is None or (not probe[0] and now - probe[1] >= _TSV_PROBE_TTL_S):
+        ready = {"content_tsv", "tsv_config"} <= _get_public_table_columns(cur, "file_chunks")
+        probe = _file_chunks_tsv_probe = (ready, now)
+    return probe[0]
+
+
+def _uuid_strings(values: list[str]) -> list[str]:
+    """Keep only values that parse as UUIDs, so ``= ANY(%s::uuid[])`` can never raise on a bad id."""
+    valid: list[str] = []
+    for value in values:
+        try:
+            valid.append(str(uuid.UUID(str(value))))
+        except (ValueError, TypeError, AttributeError):
+            continue
+    return valid
+
+
+def _keyword_candidates_sql(stored_tsv: bool) -> str:
+    """Keyword branch of the hybrid query.
+
+    Rows whose stored ``content_tsv`` was built with the requested regconfig hit
+    the GIN index; any other row (legacy / language changed / column absent) is
+    matched with an on-the-fly ``to_tsvector`` restricted to the same file set.
+    """
+    on_the_fly = """
+        SELECT fc.id AS chunk_id,
+               ts_rank_cd(to_tsvector(%(lang)s::regconfig, COALESCE(fc.content, '')), tsq.q) AS keyword_score
+        FROM file_chunks fc, tsq
+        WHERE %(hybrid)s
+          AND fc.file_id = ANY(%(file_ids)s::uuid[])
+          {stale_only}
+          AND to_tsvector(%(lang)s::regconfig, COALESCE(fc.content, '')) @@ tsq.q
+    """
+    if not stored_tsv:
+        return on_the_fly.format(stale_only="")
+    indexed = """
+        SELECT fc.id AS chunk_id, ts_rank_cd(fc.content_tsv, tsq.q) AS keyword_score
+        FROM file_chunks fc, tsq
+        WHERE %(hybrid)s
+          AND fc.file_id = ANY(%(file_ids)s::uuid[])
+          AND fc.tsv_config = %(lang)s::regconfig
+          AND fc.content_tsv @@ tsq.q
+    """
+    stale = on_the_fly.format(stale_only="AND fc.tsv_config IS DISTINCT FROM %(lang)s::regconfig")
+    return f"{indexed}\n        UNION ALL\n{stale}"
+
+
+# Semantic + keyword candidates, RRF / weighted fusion and the final join in ONE
+# round trip. Every predicate compares native uuid columns (no ::text casts), so
+# the chunk_vectors(file_id) / file_chunks(file_id) btrees, the pgvector operator
+# and the content_tsv GIN index all stay usable.
+_HYBRID_CHUNK_SEARCH_SQL = """
+WITH semantic AS (
+    SELECT chunk_id, distance, ROW_NUMBER() OVER (ORDER BY distance) AS rank
+    FROM (
+        SELECT cv.chunk_id, cv.embedding <=> %(embedding)s::vector AS distance
+        FROM chunk_vectors cv
+        WHERE cv.file_id = ANY(%(file_ids)s::uuid[])
+        ORDER BY cv.embedding <=> %(embedding)s::vector
+        LIMIT %(pool)s
+    ) nearest
+),
+tsq AS (
+    SELECT websearch_to_tsquery(%(lang)s::regconfig, %(keywords)s) AS q
+),
+keyword AS (
+    SELECT chunk_id, keyword_score, ROW_NUMBER() OVER (ORDER BY keyword_score DESC) AS rank
+    FROM (
+        {keyword_candidates}
+        ORDER BY keyword_score DESC
+        LIMIT %(pool)s
+    ) matched
+),
+fused AS (
+    SELECT COALESCE(s.chunk_id, k.chunk_id) AS chunk_id,
+           s.distance,
+           k.keyword_score::float8 AS keyword_score,
+           s.rank AS semantic_rank,
+           k.rank AS keyword_rank
+    FROM semantic s
+    FULL OUTER JOIN keyword k ON k.chunk_id = s.chunk_id
+),
+scored AS (
+    SELECT f.*,
+           1 / (1 + f.distance) AS similarity,
+           CASE WHEN %(use_rrf)s
+                THEN COALESCE(1.0::float8 / (60 + f.semantic_rank), 0) + COALESCE(1.0::float8 / (60 + f.keyword_rank), 0)
+                ELSE COALESCE(1 / (1 + f.distance), 0) * %(semantic_weight)s::float8
+                     + COALESCE(f.keyword_score, 0) * %(keyword_weight)s::float8
+           END AS combined_score
+    FROM fused f
+)
+SELECT
+  sc.chunk_id,
+  fc.content,
+  fc.file_id,
+  COALESCE(uf.originalname, fc.file_id::text) AS document_name,
+  fc.page_start,
+  fc.page_end,
+  COALESCE(fc.heading, '') AS section_title,
+  fc.chunk_index,
+  sc.distance,
+  sc.similarity,
+  sc.similarity AS semantic_score,
+  sc.keyword_score,
+  sc.combined_score
+FROM scored sc
+INNER JOIN file_chunks fc ON fc.id = sc.chunk_id
+LEFT JOIN user_files uf ON uf.id = fc.file_id
+ORDER BY sc.combined_score DESC, COALESCE(sc.semantic_rank, %(pool)s + sc.keyword_rank) ASC
+LIMIT %(top_k)s
+"""
+
+
 def _json_for_db(value: Any) -> str:
     return json.dumps(value if value is not None else {}, ensure_ascii=False)
 
@@ -197,6 +325,9 @@ class ProcessedDocumentBundle:
     process_result: DocumentProcessResult
     stored_document: StoredDocument
     chunks: list[ChunkRecord]
+    # True when chunks were already written to file_chunks/chunk_vectors (streaming
+    # ingestion) and carry DB chunk ids; callers must not persist them again.
+    chunks_persisted: bool = False
 
 
 class LegalCasePipelineService:
@@ -443,12 +574,38 @@ class LegalCasePipelineService:
                     document.document_uri,
                     mime_type,
                 )
-                ocr_result = ocr.extract_text_from_gcs(
-                    document.document_uri,
-                    mime_type,
-                    filename=document.document_name,
-                    progress_callback=progress_callback,
+                raw_bytes = self._download_for_streaming(document, mime_type)
+                stream = (
+                    ocr.open_ocr_page_stream(
+                        raw_bytes,
+                        mime_type,
+                        min_pages=self._settings.ocr_streaming_min_pages,
+                        max_pending=self._settings.ocr_streaming_max_pending_batches,
+                    )
+                    if raw_bytes is not None
+                    else None
                 )
+                if stream is not None:
+                    bundle = self._process_streamed_document(
+                        case_id, document, document_id, stream, progress_callback=progress_callback,
+                    )
+                    if bundle is not None:
+                        return bundle
+                if raw_bytes is not None:
+                    # Already downloaded for the streaming check — don't fetch it twice.
+                    ocr_result = ocr.extract_text_from_bytes(
+                        raw_bytes,
+                        mime_type,
+                        document.document_name,
+                        progress_callback=progress_callback,
+                    )
+                else:
+                    ocr_result = ocr.extract_text_from_gcs(
+                        document.document_uri,
+                        mime_type,
+                        filename=document.document_name,
+                        progress_callback=progress_callback,
+                    )
             else:
                 logger.info("[Pipeline] Step 1/4: OCR / text extraction — no GCS URI, empty text")
                 ocr_result = ocr.OcrResult(text="", page_count=0, quality_score=0.0)
@@ -487,46 +644,15 @@ class LegalCasePipelineService:
         # Side-writes (extracted-text upload → OCR-structure DB persist) don't
         # feed chunking/embedding, so they run in the background OVERLAPPING
         # those stages instead of adding several seconds of remote I/O to the
-        # critical path. Joined below before the URI is needed for metadata.
-        def _side_writes() -> str:
-            uri = ""
-            if text and document.document_uri and document.document_uri.startswith("gs://"):
-                try:
-                    output_text_path = self._build_output_text_path(document)
-                    uri = gcs.upload_bytes(
-                        text.encode("utf-8"),
-                        output_text_path,
-                        content_type="text/plain; charset=utf-8",
-                        bucket_type="output",
-                    )
-                    logger.info(
-                        "[Pipeline] Step 1.5/4: Extracted text uploaded to output bucket uri=%s chars=%d",
-                        uri,
-                        len(text),
-                    )
-                except Exception as exc:
-                    logger.warning(
-                        "[Pipeline] Step 1.5/4: failed to upload extracted text to output bucket document=%s error=%s",
-                        document.document_name,
-                        exc,
-                    )
-            # _persist_ocr_extraction stores extracted_text_uri in its metadata,
-            # so it must run after the upload — chained here, off the hot path.
-            self._persist_ocr_extraction(
-                file_id=db_file_id,
-                document=document,
-                text=text,
-                structured_json=structured_ocr_json,
-                page_count=page_count,
-                quality_score=quality_score,
-                extracted_text_uri=uri,
-            )
-            return uri
-
-        from concurrent.futures import ThreadPoolExecutor as _SidePool
-        _side_pool = _SidePool(max_workers=1, thread_name_prefix="doc-side")
-        _side_future = _side_pool.submit(_side_writes)
-        _side_pool.shutdown(wait=False)
+        # critical path. Joined in _build_bundle before the URI is needed.
+        _side_future = self._start_side_writes(
+            document,
+            db_file_id,
+            text=text,
+            structured_ocr_json=structured_ocr_json,
+            page_count=page_count,
+            quality_score=quality_score,
+        )
 
         doc_type = self._document_ai.classify(document, text)
         logger.info("[Pipeline] Document classified as %s", doc_type.value)
@@ -624,11 +750,97 @@ class LegalCasePipelineService:
 
         logger.info("[Pipeline] Step 3/4: done — %d vectors stored in bundle", len(chunk_rows))
 
+        return self._build_bundle(
+            document,
+            document_id,
+            doc_type,
+            text,
+            mime_type=mime_type,
+            is_audio=is_audio,
+            structured_ocr_json=structured_ocr_json,
+            page_count=page_count,
+            quality_score=quality_score,
+            chunk_rows=chunk_rows,
+            heading_count=len([s for _, s in non_empty_sections if s.heading]),
+            side_future=_side_future,
+        )
+
+    def _start_side_writes(
+        self,
+        document: DocumentReference,
+        db_file_id: str,
+        *,
+        text: str,
+        structured_ocr_json: dict[str, Any] | None,
+        page_count: int,
+        quality_score: float,
+    ) -> Future:
+        """Upload the extracted text, then persist the OCR structure, on a background thread.
+
+        The future resolves to the extracted-text URI ("" when not uploaded).
+        """
+        def _side_writes() -> str:
+            uri = ""
+            if text and document.document_uri and document.document_uri.startswith("gs://"):
+                try:
+                    output_text_path = self._build_output_text_path(document)
+                    uri = gcs.upload_bytes(
+                        text.encode("utf-8"),
+                        output_text_path,
+                        content_type="text/plain; charset=utf-8",
+                        bucket_type="output",
+                    )
+                    logger.info(
+                        "[Pipeline] Step 1.5/4: Extracted text uploaded to output bucket uri=%s chars=%d",
+                        uri,
+                        len(text),
+                    )
+                except Exception as exc:
+                    logger.warning(
+                        "[Pipeline] Step 1.5/4: failed to upload extracted text to output bucket document=%s error=%s",
+                        document.document_name,
+                        exc,
+                    )
+            # _persist_ocr_extraction stores extracted_text_uri in its metadata,
+            # so it must run after the upload — chained here, off the hot path.
+            self._persist_ocr_extraction(
+                file_id=db_file_id,
+                document=document,
+                text=text,
+                structured_json=structured_ocr_json,
+                page_count=page_count,
+                quality_score=quality_score,
+                extracted_text_uri=uri,
+            )
+            return uri
+
+        side_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="doc-side")
+        future = side_pool.submit(_side_writes)
+        side_pool.shutdown(wait=False)
+        return future
+
+    def _build_bundle(
+        self,
+        document: DocumentReference,
+        document_id: str,
+        doc_type: DocumentType,
+        text: str,
+        *,
+        mime_type: str,
+        is_audio: bool,
+        structured_ocr_json: dict[str, Any] | None,
+        page_count: int,
+        quality_score: float,
+        chunk_rows: list[ChunkRecord],
+        heading_count: int,
+        side_future: Future,
+        chunks_persisted: bool = False,
+    ) -> ProcessedDocumentBundle:
         # Join the background side-writes; the extracted-text URI goes into the
         # stored-document metadata below. Chunking + embedding usually take
         # longer, so this normally returns immediately.
         try:
-            extracted_text_uri = _side_future.result(timeout=180)
+            extracted_text_uri = side_future.result(timeout=180)
         except Exception as exc:
             logger.warning(
                 "[Pipeline] side-writes failed/timed out document=%s error=%s",
@@ -656,7 +868,7 @@ class LegalCasePipelineService:
             **dict(document.metadata),
             "original_name": document.metadata.get("original_name") or document.document_name,
             "page_count": page_count,
-            "heading_count": len([s for _, s in non_empty_sections if s.heading]),
+            "heading_count": heading_count,
             **({"extracted_text_uri": extracted_text_uri} if extracted_text_uri else {}),
             **({"structured_ocr_available": True, "ocr_page_count": page_count} if structured_ocr_available else {}),
         }
@@ -674,7 +886,169 @@ class LegalCasePipelineService:
             quality_score=quality_score,
             metadata=pr_meta,
         )
-        return ProcessedDocumentBundle(process_result=process_result, stored_document=stored_document, chunks=chunk_rows)
+        return ProcessedDocumentBundle(
+            process_result=process_result,
+            stored_document=stored_document,
+            chunks=chunk_rows,
+            chunks_persisted=chunks_persisted,
+        )
+
+    def _download_for_streaming(self, document: DocumentReference, mime_type: str) -> bytes | None:
+        """PDF bytes when streaming ingestion may apply; None = use extract_text_from_gcs as before."""
+        from app.services.adapters.speech_to_text import is_audio_filename
+        from app.services.adapters.word import is_word_filename
+
+        name = document.document_name or ""
+        if (
+            not self._settings.ocr_streaming_enabled
+            or not (mime_type == "application/pdf" or mime_type.endswith("/pdf"))
+            or is_audio_filename(name)
+            or is_word_filename(name)
+        ):
+            return None
+        try:
+            return gcs.download_bytes(document.document_uri)
+        except Exception as exc:
+            logger.warning("[Pipeline] streaming pre-download failed uri=%s: %s", document.document_uri, exc)
+            return None
+
+    def _process_streamed_document(
+        self,
+        case_id: str,
+        document: DocumentReference,
+        document_id: str,
+        stream: ocr.OcrPageStream,
+        *,
+        progress_callback=None,
+    ) -> ProcessedDocumentBundle | None:
+        """Streaming variant of _process_single_document for large PDFs.
+
+        Each OCR page batch (in page order) is stamped with [PAGE n] markers,
+        fed to the chunker's chunk_stream (open sections carry across batch
+        boundaries), and every group of finished chunks is embedded and
+        persisted right away — so the first chunks are searchable while later
+        pages are still in OCR. Returns None when no batch yielded any text;
+        the caller then runs whole-document extraction.
+        """
+        from app.services.chronology.pages import text_with_page_markers
+
+        db_file_id = str(document.metadata.get("db_file_id") or "").strip()
+        started = time.perf_counter()
+        results: list[ocr.OcrResult] = []
+        chunk_rows: list[ChunkRecord] = []
+        heading_count = 0
+        first_text = ""
+        # Provisional type for the records; the final one comes from the full text.
+        doc_type: DocumentType | None = None
+        first_searchable_s: float | None = None
+
+        def _report(operation: str) -> None:
+            if not progress_callback:
+                return
+            pct = 22.0 + (len(results) / max(stream.batch_count, 1)) * (95.0 - 22.0)
+            try:
+                progress_callback(round(pct, 1), operation=operation)
+            except Exception:
+                pass  # progress update is best-effort
+
+        def _page_texts():
+            nonlocal first_text
+            for result in stream.batches:
+                results.append(result)
+                batch_text = text_with_page_markers(result.structured_json) or (result.text or "").strip()
+                if batch_text and not first_text:
+                    first_text = batch_text
+                _report(
+                    f"streaming_ocr: {len(results)}/{stream.batch_count} page batches, "
+                    f"{len(chunk_rows)} chunks searchable"
+                )
+                yield batch_text
+
+        def _index(sections: list[chunking.ChunkSection]) -> None:
+            nonlocal doc_type, heading_count, first_searchable_s
+            sections = [s for s in sections if (s.text or "").strip()]
+            if not sections:
+                return
+            if doc_type is None:
+                doc_type = self._document_ai.classify(document, first_text)
+            texts = [s.text.strip() for s in sections]
+            vectors = embeddings.embed_batch(texts)
+            start_index = len(chunk_rows)
+            group = [
+                ChunkRecord(
+                    chunk_id=str(uuid.uuid4()),
+                    case_id=case_id,
+                    document_id=document_id,
+                    document_name=document.document_name,
+                    doc_type=doc_type,
+                    text=chunk_text,
+                    embedding=vector,
+                    metadata={"heading": section.heading or "", "chunk_index": str(start_index + offset)},
+                )
+                for offset, (section, chunk_text, vector) in enumerate(zip(sections, texts, vectors))
+            ]
+            chunk_rows.extend(self.persist_chunks_to_db(db_file_id, group, start_index=start_index))
+            heading_count += sum(1 for s in sections if s.heading)
+            if first_searchable_s is None:
+                first_searchable_s = time.perf_counter() - started
+                logger.info(
+                    "[Pipeline] streaming: first %d chunks searchable after %.1fs document=%s",
+                    len(group), first_searchable_s, document.document_name,
+                )
+            _report(
+                f"streaming_index: {len(results)}/{stream.batch_count} page batches, "
+                f"{len(chunk_rows)} chunks searchable"
+            )
+
+        for sections in self._chunker.chunk_stream(_page_texts()):
+            _index(sections)
+
+        merged = ocr._merge_ocr_results(results)
+        structured_ocr_json = merged.structured_json if isinstance(merged.structured_json, dict) else None
+        text = text_with_page_markers(structured_ocr_json) or (merged.text or "").strip()
+        if not text:
+            logger.warning(
+                "[Pipeline] streaming OCR produced no text document=%s — falling back to whole-document extraction",
+                document.document_name,
+            )
+            return None
+        if not chunk_rows:
+            # Same short-text fallback as the batch path: the text never reached min_tokens.
+            _index([chunking.ChunkSection(text=text, heading="Full Text")])
+
+        final_type = self._document_ai.classify(document, text)
+        for chunk in chunk_rows:
+            chunk.doc_type = final_type
+        page_count = int(merged.page_count or stream.page_count)
+        quality_score = float(merged.quality_score or 0.0)
+        logger.info(
+            "[Pipeline] streaming: done — batches=%d pages=%d chars=%d chunks=%d first_searchable=%.1fs total=%.1fs",
+            len(results), page_count, len(text), len(chunk_rows),
+            first_searchable_s or 0.0, time.perf_counter() - started,
+        )
+        side_future = self._start_side_writes(
+            document,
+            db_file_id,
+            text=text,
+            structured_ocr_json=structured_ocr_json,
+            page_count=page_count,
+            quality_score=quality_score,
+        )
+        return self._build_bundle(
+            document,
+            document_id,
+            final_type,
+            text,
+            mime_type=document.mime_type or "application/pdf",
+            is_audio=False,
+            structured_ocr_json=structured_ocr_json,
+            page_count=page_count,
+            quality_score=quality_score,
+            chunk_rows=chunk_rows,
+            heading_count=heading_count,
+            side_future=side_future,
+            chunks_persisted=bool(db_file_id),
+        )
 
     def _persist_ocr_extraction(
         self,
@@ -776,7 +1150,24 @@ class LegalCasePipelineService:
             fallback_name = fallback_name.rsplit(".", 1)[0]
         return f"extracted-text/{uuid.uuid4().hex[:10]}_{fallback_name}.txt"
 
-    def persist_chunks_to_db(self, file_id: str | None, chunks: list[ChunkRecord]) -> list[ChunkRecord]:
+    def persist_chunks_to_db(
+        self,
+        file_id: str | None,
+        chunks: list[ChunkRecord],
+        *,
+        progress_callback=None,
+        progress_start: float = 80.0,
+        progress_end: float = 95.0,
+        start_index: int = 0,
+    ) -> list[ChunkRecord]:
+        """Upsert chunks into file_chunks + chunk_vectors; return records carrying DB chunk ids.
+
+        Uses the COPY bulk loader (chunk_bulk_loader) and falls back to multi-row
+        INSERTs if COPY fails. ``progress_callback(pct, operation=...)`` receives
+        the load rate, e.g. ``"vector_indexing: 1200/3000 rows @ 5400 rows/s"``.
+        ``start_index`` is the chunk_index of ``chunks[0]`` (streaming ingestion
+        persists a document in several calls).
+        """
         if not file_id or not chunks or not is_db_available():
             if file_id and chunks and not is_db_available():
                 logger.info(
@@ -790,82 +1181,65 @@ class LegalCasePipelineService:
             file_id,
             len(chunks),
         )
-        persisted: list[ChunkRecord] = []
-        # Multi-row statements in slices instead of 2 round-trips per chunk: the
-        # DB is remote, so per-chunk execute() was the dominant per-document cost
-        # (a 60-chunk doc = 120 sequential round-trips).
-        _BATCH_ROWS = 200
+
+        def _on_rows(done: int, elapsed: float) -> None:
+            if not progress_callback:
+                return
+            rate = done / elapsed if elapsed > 0 else float(done)
+            pct = progress_start + (done / len(chunks)) * (progress_end - progress_start)
+            try:
+                progress_callback(
+                    round(pct, 1),
+                    operation=f"vector_indexing: {done}/{len(chunks)} rows @ {rate:.0f} rows/s",
+                )
+            except Exception:
+                pass  # progress update is best-effort
+
         try:
             with get_db_connection() as conn, conn.cursor() as cur:
-                id_by_index: dict[int, str] = {}
-                for start in range(0, len(chunks), _BATCH_ROWS):
-                    batch = chunks[start:start + _BATCH_ROWS]
-                    row_placeholders: list[str] = []
-                    values: list[Any] = []
-                    for offset, chunk in enumerate(batch):
-                        row_placeholders.append("(%s::uuid, %s, %s, %s, %s, %s, %s)")
-                        values.extend([
+                # With migration 164 applied, stamp each row with the configured
+                # text-search language; the file_chunks trigger builds content_tsv
+                # from it (and rebuilds it whenever content is rewritten).
+                tsv_config = (
+                    str(get_llm_chat_config().get("text_search_language") or "english").strip() or "english"
+                    if _file_chunks_has_tsv(cur)
+                    else None
+                )
+                id_by_index: dict[int, str] | None = None
+                if self._settings.chunk_persist_use_copy:
+                    try:
+                        id_by_index = chunk_bulk_loader.copy_chunks(
+                            conn, cur, file_id, chunks,
+                            tsv_config=tsv_config, on_rows=_on_rows, start_index=start_index,
+                        )
+                    except Exception as exc:
+                        conn.rollback()
+                        logger.warning(
+                            "[Pipeline] COPY chunk load failed file_id=%s — falling back to INSERT: %s",
                             file_id,
-                            start + offset,
-                            chunk.text,
-                            max(1, int(len(chunk.text.split()) * 1.3)),
-                            None,
-                            None,
-                            chunk.metadata.get("heading") or None,
-                        ])
-                    cur.execute(
-                        f"""
-                        INSERT INTO file_chunks (file_id, chunk_index, content, token_count, page_start, page_end, heading)
-                        VALUES {", ".join(row_placeholders)}
-                        ON CONFLICT (file_id, chunk_index) DO UPDATE
-                          SET content = EXCLUDED.content,
-                              token_count = EXCLUDED.token_count,
-                              page_start = EXCLUDED.page_start,
-                              page_end = EXCLUDED.page_end,
-                              heading = EXCLUDED.heading
-                        RETURNING id, chunk_index
-                        """,
-                        values,
-                    )
-                    for row in cur.fetchall():
-                        id_by_index[int(row.get("chunk_index"))] = str(row.get("id"))
-
-                for start in range(0, len(chunks), _BATCH_ROWS):
-                    batch = chunks[start:start + _BATCH_ROWS]
-                    row_placeholders = []
-                    values = []
-                    for offset, chunk in enumerate(batch):
-                        db_chunk_id = id_by_index.get(start + offset) or chunk.chunk_id
-                        embedding_pg = f"[{','.join(str(float(v)) for v in chunk.embedding)}]"
-                        row_placeholders.append("(%s::uuid, %s::vector, %s::uuid)")
-                        values.extend([db_chunk_id, embedding_pg, file_id])
-                        persisted.append(
-                            ChunkRecord(
-                                chunk_id=db_chunk_id,
-                                case_id=chunk.case_id,
-                                document_id=file_id,
-                                document_name=chunk.document_name,
-                                doc_type=chunk.doc_type,
-                                text=chunk.text,
-                                embedding=chunk.embedding,
-                                metadata=chunk.metadata,
-                            )
+                            exc,
                         )
-                    cur.execute(
-                        f"""
-                        INSERT INTO chunk_vectors (chunk_id, embedding, file_id)
-                        VALUES {", ".join(row_placeholders)}
-                        ON CONFLICT (chunk_id) DO UPDATE
-                          SET embedding = EXCLUDED.embedding,
-                              file_id = EXCLUDED.file_id,
-                              updated_at = NOW()
-                        """,
-                        values,
-                    )
+                if id_by_index is None:
+                    started = time.perf_counter()
+                    id_by_index = self._insert_chunk_rows(cur, file_id, chunks, tsv_config, start_index)
+                    _on_rows(len(chunks), time.perf_counter() - started)
                 conn.commit()
         except Exception as exc:
             logger.exception("[Pipeline] DB chunk/vector persistence failed file_id=%s error=%s", file_id, exc)
             return chunks
+        persisted = [
+            ChunkRecord(
+                chunk_id=id_by_index.get(start_index + index) or chunk.chunk_id,
+                case_id=chunk.case_id,
+                document_id=file_id,
+                document_name=chunk.document_name,
+                doc_type=chunk.doc_type,
+                text=chunk.text,
+                embedding=chunk.embedding,
+                metadata=chunk.metadata,
+            )
+            for index, chunk in enumerate(chunks)
+        ]
         logger.info(
             "[Pipeline] Step 4/4: done — persisted %d chunk rows for file_id=%s",
             len(persisted),
@@ -873,6 +1247,79 @@ class LegalCasePipelineService:
         )
         return persisted
 
+    def _insert_chunk_rows(
+        self,
+        cur: Any,
+        file_id: str,
+        chunks: list[ChunkRecord],
+        tsv_config: str | None,
+        start_index: int = 0,
+    ) -> dict[int, str]:
+        """Multi-row INSERT fallback for persist_chunks_to_db. Returns {chunk_index: file_chunks.id}."""
+        # Multi-row statements in slices instead of 2 round-trips per chunk: the
+        # DB is remote, so per-chunk execute() was the dominant per-document cost
+        # (a 60-chunk doc = 120 sequential round-trips).
+        _BATCH_ROWS = 200
+        tsv_column = ", tsv_config" if tsv_config else ""
+        tsv_placeholder = ", %s::regconfig" if tsv_config else ""
+        tsv_update = ",\n                      tsv_config = EXCLUDED.tsv_config" if tsv_config else ""
+        id_by_index: dict[int, str] = {}
+        for start in range(0, len(chunks), _BATCH_ROWS):
+            batch = chunks[start:start + _BATCH_ROWS]
+            row_placeholders: list[str] = []
+            values: list[Any] = []
+            for offset, chunk in enumerate(batch):
+                row_placeholders.append(f"(%s::uuid, %s, %s, %s, %s, %s, %s{tsv_placeholder})")
+                values.extend([
+                    file_id,
+                    start_index + start + offset,
+                    chunk.text,
+                    chunk_bulk_loader.token_estimate(chunk.text),
+                    None,
+                    None,
+                    chunk.metadata.get("heading") or None,
+                ])
+                if tsv_config:
+                    values.append(tsv_config)
+            cur.execute(
+                f"""
+                INSERT INTO file_chunks (file_id, chunk_index, content, token_count, page_start, page_end, heading{tsv_column})
+                VALUES {", ".join(row_placeholders)}
+                ON CONFLICT (file_id, chunk_index) DO UPDATE
+                  SET content = EXCLUDED.content,
+                      token_count = EXCLUDED.token_count,
+                      page_start = EXCLUDED.page_start,
+                      page_end = EXCLUDED.page_end,
+                      heading = EXCLUDED.heading{tsv_update}
+                RETURNING id, chunk_index
+                """,
+                values,
+            )
+            for row in cur.fetchall():
+                id_by_index[int(row.get("chunk_index"))] = str(row.get("id"))
+
+        for start in range(0, len(chunks), _BATCH_ROWS):
+            batch = chunks[start:start + _BATCH_ROWS]
+            row_placeholders = []
+            values = []
+            for offset, chunk in enumerate(batch):
+                db_chunk_id = id_by_index.get(start_index + start + offset) or chunk.chunk_id
+                embedding_pg = f"[{','.join(str(float(v)) for v in chunk.embedding)}]"
+                row_placeholders.append("(%s::uuid, %s::vector, %s::uuid)")
+                values.extend([db_chunk_id, embedding_pg, file_id])
+            cur.execute(
+                f"""
+                INSERT INTO chunk_vectors (chunk_id, embedding, file_id)
+                VALUES {", ".join(row_placeholders)}
+                ON CONFLICT (chunk_id) DO UPDATE
+                  SET embedding = EXCLUDED.embedding,
+                      file_id = EXCLUDED.file_id,
+                      updated_at = NOW()
+                """,
+                values,
+            )
+        return id_by_index
+
     def _resolve_retrieval_params(self, request: QueryRequest, llm_config: dict[str, Any]) -> dict[str, Any]:
         return {
             "top_k": int(request.top_k or llm_config.get("retrieval_top_k") or self._settings.retrieval_top_k or 8),
@@ -916,6 +1363,73 @@ class LegalCasePipelineService:
         query_embedding: list[float],
         params: dict[str, Any],
     ) -> list[dict[str, Any]]:
+        """Hybrid chunk search: pgvector + stored tsvector, fused (RRF or weighted) in SQL."""
+        top_k = int(params["top_k"])
+        file_ids = _uuid_strings(valid_file_ids)
+        if not file_ids:
+            return []
+        lang = str(params.get("text_search_language") or "").strip()
+        keyword_query = self._build_keyword_query(request.query)
+        hybrid = bool(params["use_hybrid_search"] and keyword_query)
+        query_params: dict[str, Any] = {
+            "embedding": f"[{','.join(str(float(v)) for v in query_embedding)}]",
+            "file_ids": file_ids,
+            # Semantic-only runs never match keywords; the built-in 'simple'
+            # config keeps the tsq CTE valid whatever language is configured.
+            "lang": lang if hybrid else "simple",
+            "keywords": keyword_query,
+            "hybrid": hybrid,
+            "use_rrf": bool(params["use_rrf"]) or not params["use_hybrid_search"],
+            "semantic_weight": float(params["semantic_weight"]),
+            "keyword_weight": float(params["keyword_weight"]),
+            "pool": max(top_k * 3, top_k),
+            "top_k": top_k,
+        }
+        rows: list[dict[str, Any]] | None = None
+        with get_db_connection() as conn, conn.cursor() as cur:
+            # Without migration 164 or a configured language, the old two-query path below.
+            if _file_chunks_has_tsv(cur) and lang:
+                sql = _HYBRID_CHUNK_SEARCH_SQL.format(keyword_candidates=_keyword_candidates_sql(True))
+                try:
+                    cur.execute(sql, query_params)
+                except Exception as exc:
+                    if not query_params["hybrid"]:
+                        raise
+                    # e.g. an invalid text_search_language regconfig: keep semantic results.
+                    logger.warning(
+                        "[Pipeline] DB keyword search skipped case_id=%s error=%s keyword_query=%r",
+                        request.case_id,
+                        exc,
+                        keyword_query[:160],
+                    )
+                    conn.rollback()
+                    query_params.update(hybrid=False, lang="simple", use_rrf=True)
+                    cur.execute(sql, query_params)
+                rows = [dict(row) for row in cur.fetchall()]
+        if rows is None:
+            return self._search_db_chunks_legacy(
+                request=request, valid_file_ids=valid_file_ids, query_embedding=query_embedding, params=params
+            )
+
+        if not params["use_hybrid_search"]:
+            for row in rows:
+                row.pop("combined_score", None)
+                row.pop("keyword_score", None)
+        return self._autoheal_fragmented_rows(rows)
+
+    def _search_db_chunks_legacy(
+        self,
+        *,
+        request: QueryRequest,
+        valid_file_ids: list[str],
+        query_embedding: list[float],
+        params: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        """Two-query search (semantic, then on-the-fly keyword) fused in Python.
+
+        Used until migration 164 is applied or when no text-search language is
+        configured, so hybrid search keeps working on older schemas.
+        """
         top_k = int(params["top_k"])
         semantic_limit = max(top_k * 3, top_k)
         text_search_language = params["text_search_language"]
@@ -0,0 +1,33 @@
+-- Stored full-text vector for hybrid (keyword) retrieval over file_chunks.
+-- Previously every query ran to_tsvector(regconfig, content) twice per row, so
+-- keyword search was a full scan of every chunk in the requested files.
+--
+-- tsv_config records which text-search configuration built content_tsv. The
+-- ingestion path (persist_chunks_to_db) writes the configured
+-- summarization_chat_config.text_search_language; the trigger below builds
+-- content_tsv from it and rebuilds it whenever content is rewritten (OCR
+-- auto-heal, whitespace repair). Rows whose tsv_config differs from the query
+-- language are still matched, via an on-the-fly to_tsvector.
+ALTER TABLE file_chunks ADD COLUMN IF NOT EXISTS tsv_config regconfig;
+ALTER TABLE file_chunks ADD COLUMN IF NOT EXISTS content_tsv tsvector;
+
+CREATE OR REPLACE FUNCTION file_chunks_refresh_content_tsv() RETURNS trigger AS $$
+BEGIN
+    NEW.tsv_config := COALESCE(NEW.tsv_config, 'english'::regconfig);
+    NEW.content_tsv := to_tsvector(NEW.tsv_config, COALESCE(NEW.content, ''));
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_file_chunks_content_tsv ON file_chunks;
+CREATE TRIGGER trg_file_chunks_content_tsv
+    BEFORE INSERT OR UPDATE OF content, tsv_config ON file_chunks
+    FOR EACH ROW EXECUTE FUNCTION file_chunks_refresh_content_tsv();
+
+-- Backfill existing rows (the trigger fills content_tsv). On very large tables
+-- run this in id-range slices during a quiet window instead.
+UPDATE file_chunks SET tsv_config = 'english'::regconfig WHERE content_tsv IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_file_chunks_content_tsv ON file_chunks USING GIN (content_tsv);
+
+COMMENT ON COLUMN file_chunks.content_tsv IS 'to_tsvector(tsv_config, content), maintained by trg_file_chunks_content_tsv.';
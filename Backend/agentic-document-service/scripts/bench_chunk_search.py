@@ -0,0 +1,212 @@
+"""EXPLAIN-backed benchmark: legacy two-query chunk search vs the fused hybrid query.
+
+Builds a throw-away schema (default ``bench_chunk_search``) holding synthetic
+``user_files`` / ``file_chunks`` / ``chunk_vectors`` tables with the same
+columns, indexes and content_tsv trigger as production (migrations 030, 040,
+164), fills it with N chunks spread over ``--files`` files, then runs
+``EXPLAIN (ANALYZE, BUFFERS)`` for:
+
+    legacy   — the old semantic query + the old keyword query
+               (::text casts, to_tsvector twice per row; two round trips)
+    fused    — LegalCasePipelineService's _HYBRID_CHUNK_SEARCH_SQL
+               (uuid predicates, stored content_tsv, RRF in SQL; one round trip)
+
+and prints execution time, shared buffers touched and the scan nodes used.
+
+Usage (needs a Postgres with pgvector; never point it at production):
+
+    DATABASE_URL=postgresql://... python scripts/bench_chunk_search.py --rows 1000000
+    DATABASE_URL=postgresql://... python scripts/bench_chunk_search.py --reuse   # skip data load
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pathlib
+import random
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+import psycopg  # noqa: E402
+from psycopg.rows import dict_row  # noqa: E402
+
+from app.services.pipeline_service import _HYBRID_CHUNK_SEARCH_SQL, _keyword_candidates_sql  # noqa: E402
+
+DIMS = 768
+WORDS = (
+    "agreement notice demand suit court payment lease tenant order appeal decree plaintiff "
+    "defendant evidence affidavit hearing interim injunction arbitration limitation cheque "
+    "dishonour consideration possession eviction rent mesne profits specific performance"
+).split()
+
+LEGACY_SEMANTIC_SQL = """
+SELECT cv.chunk_id, fc.content, fc.file_id,
+       COALESCE(uf.originalname, fc.file_id::text) AS document_name,
+       (cv.embedding <=> %(embedding)s::vector) AS distance,
+       (1 / (1 + (cv.embedding <=> %(embedding)s::vector))) AS similarity
+FROM chunk_vectors cv
+INNER JOIN file_chunks fc ON cv.chunk_id::text = fc.id::text
+LEFT JOIN user_files uf ON uf.id::text = fc.file_id::text
+WHERE fc.file_id::text = ANY(%(file_ids)s::text[])
+ORDER BY distance ASC
+LIMIT %(pool)s
+"""
+
+LEGACY_KEYWORD_SQL = """
+SELECT fc.id::text AS chunk_id, fc.content, fc.file_id,
+       COALESCE(uf.originalname, fc.file_id::text) AS document_name,
+       ts_rank_cd(to_tsvector(%(lang)s::regconfig, COALESCE(fc.content, '')),
+                  websearch_to_tsquery(%(lang)s::regconfig, %(keywords)s)) AS keyword_score
+FROM file_chunks fc
+LEFT JOIN user_files uf ON uf.id::text = fc.file_id::text
+WHERE fc.file_id::text = ANY(%(file_ids)s::text[])
+  AND to_tsvector(%(lang)s::regconfig, COALESCE(fc.content, '')) @@ websearch_to_tsquery(%(lang)s::regconfig, %(keywords)s)
+ORDER BY keyword_score DESC
+LIMIT %(pool)s
+"""
+
+SCHEMA_SQL = """
+CREATE EXTENSION IF NOT EXISTS vector;
+CREATE EXTENSION IF NOT EXISTS pgcrypto;
+CREATE TABLE user_files (id UUID PRIMARY KEY DEFAULT gen_random_uuid(), originalname TEXT);
+CREATE TABLE file_chunks (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    file_id UUID NOT NULL REFERENCES user_files(id) ON DELETE CASCADE,
+    chunk_index INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    token_count INTEGER, page_start INTEGER, page_end INTEGER, heading TEXT,
+    tsv_config regconfig, content_tsv tsvector,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(), updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    UNIQUE (file_id, chunk_index)
+);
+CREATE TABLE chunk_vectors (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    chunk_id UUID NOT NULL UNIQUE REFERENCES file_chunks(id) ON DELETE CASCADE,
+    embedding vector(768) NOT NULL,
+    file_id UUID NOT NULL REFERENCES user_files(id) ON DELETE CASCADE
+);
+CREATE OR REPLACE FUNCTION file_chunks_refresh_content_tsv() RETURNS trigger AS $$
+BEGIN
+    NEW.tsv_config := COALESCE(NEW.tsv_config, 'english'::regconfig);
+    NEW.content_tsv := to_tsvector(NEW.tsv_config, COALESCE(NEW.content, ''));
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+CREATE TRIGGER trg_file_chunks_content_tsv BEFORE INSERT OR UPDATE OF content, tsv_config ON file_chunks
+    FOR EACH ROW EXECUTE FUNCTION file_chunks_refresh_content_tsv();
+"""
+
+INDEX_SQL = """
+CREATE INDEX idx_file_chunks_file_id ON file_chunks(file_id);
+CREATE INDEX idx_chunk_vectors_file_id ON chunk_vectors(file_id);
+CREATE INDEX idx_file_chunks_content_tsv ON file_chunks USING GIN (content_tsv);
+ANALYZE user_files; ANALYZE file_chunks; ANALYZE chunk_vectors;
+"""
+
+
+def _load(cur, rows: int, files: int) -> None:
+    # The per-row subqueries reference an outer column so Postgres re-evaluates
+    # them for every row (an uncorrelated subquery would yield one shared value).
+    words = "ARRAY[" + ",".join(f"'{w}'" for w in WORDS) + "]"
+    cur.execute("INSERT INTO user_files (originalname) SELECT 'file-' || g || '.pdf' FROM generate_series(1, %s) g", [files])
+    cur.execute(
+        f"""
+        INSERT INTO file_chunks (file_id, chunk_index, content, tsv_config)
+        SELECT f.id, g.n,
+               (SELECT string_agg(({words})[1 + floor(random() * {len(WORDS)})::int], ' ')
+                FROM generate_series(1, 80 + (g.n % 7))),
+               'english'::regconfig
+        FROM user_files f
+        CROSS JOIN LATERAL generate_series(1, %s) AS g(n)
+        """,
+        [max(1, rows // files)],
+    )
+    cur.execute(
+        f"""
+        INSERT INTO chunk_vectors (chunk_id, embedding, file_id)
+        SELECT fc.id, (SELECT array_agg(random() - 0.5) FROM generate_series(1, {DIMS} + (fc.chunk_index * 0)))::vector, fc.file_id
+        FROM file_chunks fc
+        """
+    )
+
+
+def _explain(cur, sql: str, params: dict) -> dict:
+    cur.execute("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + sql, params)
+    plan = cur.fetchone()["QUERY PLAN"]
+    plan = plan[0] if isinstance(plan, list) else json.loads(plan)[0]
+    nodes: set[str] = set()
+
+    def _walk(node: dict) -> None:
+        kind = node.get("Node Type", "")
+        if "Scan" in kind:
+            nodes.add(f"{kind}({node.get('Index Name') or node.get('Relation Name') or ''})")
+        for child in node.get("Plans", []) or []:
+            _walk(child)
+
+    _walk(plan["Plan"])
+    return {
+        "ms": float(plan.get("Execution Time") or 0.0),
+        "buffers": int(plan["Plan"].get("Shared Hit Blocks", 0)) + int(plan["Plan"].get("Shared Read Blocks", 0)),
+        "scans": sorted(nodes),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--files", type=int, default=2_000)
+    parser.add_argument("--query-files", type=int, default=20, help="files in the searched folder")
+    parser.add_argument("--schema", default="bench_chunk_search")
+    parser.add_argument("--reuse", action="store_true", help="reuse an already-loaded schema")
+    parser.add_argument("--top-k", type=int, default=8)
+    args = parser.parse_args()
+
+    url = os.environ.get("DATABASE_URL")
+    if not url:
+        raise SystemExit("Set DATABASE_URL to a scratch Postgres with pgvector.")
+    with psycopg.connect(url, row_factory=dict_row, autocommit=True) as conn, conn.cursor() as cur:
+        if not args.reuse:
+            cur.execute(f"DROP SCHEMA IF EXISTS {args.schema} CASCADE")
+            cur.execute(f"CREATE SCHEMA {args.schema}")
+        cur.execute(f"SET search_path TO {args.schema}, public")
+        if not args.reuse:
+            started = time.perf_counter()
+            cur.execute(SCHEMA_SQL)
+            _load(cur, args.rows, args.files)
+            cur.execute(INDEX_SQL)
+            print(f"loaded {args.rows} chunks in {time.perf_counter() - started:.0f}s")
+
+        cur.execute("SELECT id::text AS id FROM user_files ORDER BY random() LIMIT %s", [args.query_files])
+        file_ids = [row["id"] for row in cur.fetchall()]
+        rng = random.Random(1)
+        params = {
+            "embedding": "[" + ",".join(f"{rng.uniform(-0.5, 0.5):.6f}" for _ in range(DIMS)) + "]",
+            "file_ids": file_ids,
+            "lang": "english",
+            "keywords": "interim injunction eviction",
+            "hybrid": True,
+            "use_rrf": True,
+            "semantic_weight": 0.7,
+            "keyword_weight": 0.3,
+            "pool": args.top_k * 3,
+            "top_k": args.top_k,
+        }
+        fused_sql = _HYBRID_CHUNK_SEARCH_SQL.format(keyword_candidates=_keyword_candidates_sql(True))
+        for sql in (LEGACY_SEMANTIC_SQL, LEGACY_KEYWORD_SQL, fused_sql):  # warm the cache
+            cur.execute(sql, params)
+
+        legacy_sem = _explain(cur, LEGACY_SEMANTIC_SQL, params)
+        legacy_kw = _explain(cur, LEGACY_KEYWORD_SQL, params)
+        fused = _explain(cur, fused_sql, params)
+        print(f"folder of {len(file_ids)} files, top_k={args.top_k}")
+        print(f"legacy semantic : {legacy_sem['ms']:9.1f} ms  buffers={legacy_sem['buffers']:>8}  {legacy_sem['scans']}")
+        print(f"legacy keyword  : {legacy_kw['ms']:9.1f} ms  buffers={legacy_kw['buffers']:>8}  {legacy_kw['scans']}")
+        print(f"legacy total    : {legacy_sem['ms'] + legacy_kw['ms']:9.1f} ms  (2 round trips)")
+        print(f"fused hybrid    : {fused['ms']:9.1f} ms  buffers={fused['buffers']:>8}  {fused['scans']}")
+
+
+if __name__ == "__main__":
+    main()
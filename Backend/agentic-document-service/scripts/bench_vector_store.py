@@ -0,0 +1,118 @@
+"""Benchmark the in-memory vector index against the old per-chunk Python loop.
+
+Builds synthetic cases of 1k / 10k / 100k chunks (768-dim, random text from a
+small legal vocabulary) and times, per size:
+
+    legacy   — the pre-index loop: cosine_similarity() + token-set per chunk
+    indexed  — InMemoryVectorStore.search (float32 matrix + argpartition)
+
+for both semantic-only and hybrid RRF search, plus upsert and delete cost.
+
+Usage:
+
+    python scripts/bench_vector_store.py                 # 1k,10k,100k
+    python scripts/bench_vector_store.py --sizes 1000,5000 --queries 10
+
+Pure CPU — needs no DB, GCS or Gemini credentials.
+"""
+from __future__ import annotations
+
+import argparse
+import pathlib
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from app.schemas.contracts import DocumentType  # noqa: E402
+from app.services.adapters.embeddings import cosine_similarity  # noqa: E402
+from app.services.adapters.vector_store import TOKEN_RE, ChunkRecord, InMemoryVectorStore  # noqa: E402
+
+WORDS = (
+    "agreement notice demand suit court payment lease tenant order appeal decree "
+    "plaintiff defendant evidence affidavit hearing interim injunction arbitration"
+).split()
+DIMS = 768
+
+
+def _make_chunks(n: int, rng: random.Random) -> list[ChunkRecord]:
+    types = list(DocumentType)
+    return [
+        ChunkRecord(
+            chunk_id=f"chunk-{i}",
+            case_id="bench",
+            document_id=f"doc-{i // 200}",
+            document_name=f"doc-{i // 200}.pdf",
+            doc_type=types[i % len(types)],
+            text=" ".join(rng.choice(WORDS) for _ in range(120)),
+            embedding=[rng.uniform(-1, 1) for _ in range(DIMS)],
+        )
+        for i in range(n)
+    ]
+
+
+def _legacy_search(chunks: list[ChunkRecord], query: str, qvec: list[float], top_k: int, hybrid: bool) -> list:
+    query_terms = set(TOKEN_RE.findall(query.lower()))
+    semantic, keyword = [], []
+    for chunk in chunks:
+        text_terms = set(TOKEN_RE.findall(chunk.text.lower()))
+        semantic.append((chunk, cosine_similarity(qvec, chunk.embedding)))
+        if hybrid:
+            keyword.append((chunk, len(query_terms & text_terms) / max(len(query_terms), 1)))
+    semantic.sort(key=lambda item: item[1], reverse=True)
+    if not hybrid:
+        return semantic[:top_k]
+    keyword.sort(key=lambda item: item[1], reverse=True)
+    fused: dict[str, tuple[ChunkRecord, float]] = {}
+    for ranked in (semantic, keyword):
+        for rank, (chunk, _s) in enumerate(ranked[: top_k * 3], start=1):
+            prior = fused.get(chunk.chunk_id)
+            fused[chunk.chunk_id] = (chunk, (prior[1] if prior else 0.0) + 1.0 / (60.0 + rank))
+    return sorted(fused.values(), key=lambda item: item[1], reverse=True)[:top_k]
+
+
+def _time_ms(fn, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--queries", type=int, default=5, help="repeats per measurement (median reported)")
+    parser.add_argument("--top-k", type=int, default=8)
+    parser.add_argument("--skip-legacy-above", type=int, default=100000,
+                        help="skip the legacy loop for larger sizes (it is slow)")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    qvec = [rng.uniform(-1, 1) for _ in range(DIMS)]
+    query = "interim injunction against the tenant"
+    print(f"{'chunks':>8} {'mode':>8} {'legacy ms':>10} {'indexed ms':>11} {'speedup':>8}")
+    for size in (int(s) for s in args.sizes.split(",") if s.strip()):
+        chunks = _make_chunks(size, rng)
+        store = InMemoryVectorStore()
+        upsert_ms = _time_ms(lambda: store.upsert_chunks("bench", chunks), 1)
+        for mode, hybrid in (("semantic", False), ("rrf", True)):
+            indexed = _time_ms(
+                lambda: store.search("bench", query, qvec, args.top_k, [], use_hybrid_search=hybrid),
+                args.queries,
+            )
+            if size <= args.skip_legacy_above:
+                legacy = _time_ms(lambda: _legacy_search(chunks, query, qvec, args.top_k, hybrid), max(1, args.queries // 2))
+                print(f"{size:>8} {mode:>8} {legacy:>10.1f} {indexed:>11.2f} {legacy / max(indexed, 1e-6):>7.0f}x")
+            else:
+                print(f"{size:>8} {mode:>8} {'-':>10} {indexed:>11.2f} {'-':>8}")
+        delete_ms = _time_ms(lambda: store.delete_document("doc-0"), 1)
+        print(f"{size:>8} upsert {upsert_ms:.0f} ms total ({upsert_ms * 1000 / size:.1f} µs/chunk), "
+              f"delete_document {delete_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
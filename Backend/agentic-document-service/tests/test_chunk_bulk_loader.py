@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import contextlib
+import unittest
+from unittest import mock
+
+from app.schemas.contracts import DocumentType
+from app.services import chunk_bulk_loader, pipeline_service
+from app.services.adapters.vector_store import ChunkRecord
+
+FILE_ID = "0b7c6a1e-3f1d-4f7e-9d6a-2b8c1e5f4a90"
+
+
+class _FakeCopy:
+    def __init__(self, sink: list) -> None:
+        self.sink = sink
+        self.types: list[str] | None = None
+
+    def __enter__(self) -> "_FakeCopy":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def set_types(self, types: list[str]) -> None:
+        self.types = types
+
+    def write_row(self, row: tuple) -> None:
+        self.sink.append(row)
+
+
+class _FakeCursor:
+    def __init__(self, *, fail_copy: bool = False) -> None:
+        self.fail_copy = fail_copy
+        self.statements: list[str] = []
+        self.copied: list[tuple] = []
+        self._result: list[dict] = []
+
+    def copy(self, statement: str) -> _FakeCopy:
+        self.statements.append(statement)
+        if self.fail_copy:
+            raise RuntimeError("COPY not permitted")
+        return _FakeCopy(self.copied)
+
+    def execute(self, sql: str, params: object = None) -> None:
+        self.statements.append(sql)
+        if "RETURNING id, chunk_index" in sql:
+            indexes = (
+                [row[0] for row in self.copied]
+                if "FROM _chunk_stage" in sql
+                else [params[i] for i in range(1, len(params), 7)]
+            )
+            self._result = [{"id": f"db-{i}", "chunk_index": i} for i in indexes]
+        elif "information_schema.columns" in sql:
+            self._result = [{"column_name": "content"}]
+        else:
+            self._result = []
+
+    def fetchall(self) -> list[dict]:
+        return self._result
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+class _FakeConn:
+    def __init__(self, cur: _FakeCursor) -> None:
+        self.cur = cur
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self) -> _FakeCursor:
+        return self.cur
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+
+def _chunks(n: int) -> list[ChunkRecord]:
+    return [
+        ChunkRecord(
+            chunk_id=f"tmp-{i}", case_id="case", document_id="doc", document_name="doc.pdf",
+            doc_type=DocumentType.pleading, text=f"chunk {i} text", embedding=[0.1, 0.2, 0.3],
+            metadata={"heading": "FACTS"} if i == 0 else {},
+        )
+        for i in range(n)
+    ]
+
+
+class PersistChunksTests(unittest.TestCase):
+    def setUp(self) -> None:
+        pipeline_service._file_chunks_tsv_probe = None
+        self.addCleanup(setattr, pipeline_service, "_file_chunks_tsv_probe", None)
+        self.service = pipeline_service.LegalCasePipelineService()
+
+    def _persist(self, cur: _FakeCursor, chunks: list[ChunkRecord], **kwargs):
+        conn = _FakeConn(cur)
+        with mock.patch.object(pipeline_service, "is_db_available", return_value=True), \
+                mock.patch.object(pipeline_service, "get_db_connection", return_value=contextlib.nullcontext(conn)), \
+                mock.patch.object(chunk_bulk_loader, "register_vector", None):
+            return self.service.persist_chunks_to_db(FILE_ID, chunks, **kwargs), conn
+
+    def test_copy_path_streams_rows_and_maps_db_ids(self) -> None:
+        progress: list[tuple[float, str]] = []
+        cur = _FakeCursor()
+        persisted, conn = self._persist(
+            cur, _chunks(3), progress_callback=lambda pct, operation: progress.append((pct, operation)),
+        )
+
+        self.assertEqual([c.chunk_id for c in persisted], ["db-0", "db-1", "db-2"])
+        self.assertTrue(all(c.document_id == FILE_ID for c in persisted))
+        self.assertEqual(cur.copied[0][:4], (0, "chunk 0 text", 3, "FACTS"))
+        self.assertEqual(cur.copied[0][4], "[0.1,0.2,0.3]")
+        self.assertTrue(any("INSERT INTO chunk_vectors" in s and "_chunk_stage" in s for s in cur.statements))
+        self.assertEqual(conn.rollbacks, 0)
+        self.assertEqual(progress[-1][0], 95.0)
+        self.assertRegex(progress[-1][1], r"^vector_indexing: 3/3 rows @ \d+ rows/s$")
+
+    def test_copy_failure_falls_back_to_multirow_insert(self) -> None:
+        cur = _FakeCursor(fail_copy=True)
+        persisted, conn = self._persist(cur, _chunks(2))
+
+        self.assertEqual([c.chunk_id for c in persisted], ["db-0", "db-1"])
+        self.assertEqual(conn.rollbacks, 1)
+        self.assertTrue(any("VALUES (%s::uuid, %s::vector, %s::uuid)" in s for s in cur.statements))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import contextlib
+import unittest
+from unittest import mock
+
+from app.schemas.contracts import QueryRequest
+from app.services import pipeline_service
+from app.services.pipeline_service import (
+    _HYBRID_CHUNK_SEARCH_SQL,
+    _keyword_candidates_sql,
+    _uuid_strings,
+)
+
+FILE_ID = "0b7c6a1e-3f1d-4f7e-9d6a-2b8c1e5f4a90"
+
+
+class _FakeCursor:
+    def __init__(self, columns: set[str]) -> None:
+        self.columns = columns
+        self.statements: list[tuple[str, object]] = []
+        self._rows: list[dict] = []
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def execute(self, sql: str, params: object = None) -> None:
+        self.statements.append((sql, params))
+        if "information_schema.columns" in sql:
+            self._rows = [{"column_name": c} for c in self.columns]
+        else:
+            self._rows = []
+
+    def fetchall(self) -> list[dict]:
+        return self._rows
+
+
+class _FakeConn:
+    def __init__(self, cur: _FakeCursor) -> None:
+        self.cur = cur
+
+    def cursor(self) -> _FakeCursor:
+        return self.cur
+
+    def rollback(self) -> None:
+        pass
+
+
+class ChunkSearchSqlTests(unittest.TestCase):
+    def test_uuid_strings_drops_values_that_would_break_the_uuid_cast(self) -> None:
+        good = "0b7c6a1e-3f1d-4f7e-9d6a-2b8c1e5f4a90"
+        self.assertEqual(_uuid_strings([good.upper(), "legacy-17", "", None]), [good])
+
+    def test_fused_query_uses_typed_predicates_only(self) -> None:
+        for stored in (True, False):
+            sql = _HYBRID_CHUNK_SEARCH_SQL.format(keyword_candidates=_keyword_candidates_sql(stored))
+            self.assertNotIn("::text =", sql)
+            self.assertNotIn("::text[]", sql)
+            self.assertIn("ANY(%(file_ids)s::uuid[])", sql)
+
+    def test_stored_tsvector_branch_only_when_column_exists(self) -> None:
+        with_column = _keyword_candidates_sql(True)
+        self.assertIn("fc.content_tsv @@ tsq.q", with_column)
+        self.assertIn("IS DISTINCT FROM %(lang)s::regconfig", with_column)
+        self.assertEqual(with_column.count("UNION ALL"), 1)
+
+        without_column = _keyword_candidates_sql(False)
+        self.assertNotIn("content_tsv", without_column)
+        self.assertNotIn("tsv_config", without_column)
+
+
+class ChunkSearchRoutingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        pipeline_service._file_chunks_tsv_probe = None
+        self.addCleanup(setattr, pipeline_service, "_file_chunks_tsv_probe", None)
+        self.service = pipeline_service.LegalCasePipelineService()
+
+    def _search(self, cur: _FakeCursor, **params: object) -> None:
+        merged = {"top_k": 5, "use_hybrid_search": True, "use_rrf": True, "semantic_weight": 0.7,
+                  "keyword_weight": 0.3, "text_search_language": "english", **params}
+        request = QueryRequest(user_id="1", case_id="c", query="limitation period for appeal")
+        with mock.patch.object(pipeline_service, "get_db_connection",
+                               side_effect=lambda: contextlib.nullcontext(_FakeConn(cur))):
+            self.service._search_db_chunks(request=request, valid_file_ids=[FILE_ID],
+                                           query_embedding=[0.1, 0.2], params=merged)
+
+    def test_missing_probe_is_retried_after_the_ttl_and_ready_is_kept(self) -> None:
+        cur = _FakeCursor(columns=set())
+        self.assertFalse(pipeline_service._file_chunks_has_tsv(cur))
+        cur.columns = {"content_tsv", "tsv_config"}  # migration 164 applied meanwhile
+        self.assertFalse(pipeline_service._file_chunks_has_tsv(cur))
+        with mock.patch.object(pipeline_service.time, "monotonic",
+                               return_value=pipeline_service.time.monotonic() + pipeline_service._TSV_PROBE_TTL_S):
+            self.assertTrue(pipeline_service._file_chunks_has_tsv(cur))
+        probes = len(cur.statements)
+        cur.columns = set()
+        self.assertTrue(pipeline_service._file_chunks_has_tsv(cur))
+        self.assertEqual(len(cur.statements), probes)
+
+    def test_old_query_path_without_the_column_or_a_language(self) -> None:
+        for columns, language in ((set(), "english"), ({"content_tsv", "tsv_config"}, "")):
+            pipeline_service._file_chunks_tsv_probe = None
+            cur = _FakeCursor(columns=columns)
+            self._search(cur, text_search_language=language)
+            searches = [sql for sql, _ in cur.statements if "information_schema" not in sql]
+            self.assertTrue(searches)
+            self.assertFalse(any("WITH semantic AS" in sql for sql in searches))
+
+    def test_semantic_only_search_does_not_use_the_configured_language(self) -> None:
+        cur = _FakeCursor(columns={"content_tsv", "tsv_config"})
+        self._search(cur, use_hybrid_search=False, text_search_language="not_a_regconfig")
+        (sql, params), = [(q, p) for q, p in cur.statements if "WITH semantic AS" in q]
+        self.assertEqual(params["lang"], "simple")
+        self.assertFalse(params["hybrid"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from app.services.adapters import embeddings
+from app.services.adapters.embedding_cache import (
+    EmbeddingCache,
+    EmbeddingCacheStats,
+    MemoryLRUTier,
+    build_embedding_cache,
+    cache_key,
+    pack_vector,
+    set_embedding_cache,
+)
+
+
+class EmbeddingCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "cache.sqlite3")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_key_includes_model_dims_and_task(self) -> None:
+        base = cache_key("gemini-embedding-001", 768, "RETRIEVAL_DOCUMENT", "text")
+        self.assertNotEqual(base, cache_key("other-model", 768, "RETRIEVAL_DOCUMENT", "text"))
+        self.assertNotEqual(base, cache_key("gemini-embedding-001", 256, "RETRIEVAL_DOCUMENT", "text"))
+        self.assertNotEqual(base, cache_key("gemini-embedding-001", 768, "RETRIEVAL_QUERY", "text"))
+
+    def test_vectors_round_trip_as_float32(self) -> None:
+        cache = build_embedding_cache(disk_path="")
+        cache.put_many({"k": [0.5, -0.25, 0.1]})
+
+        got = cache.get_many(["k"])["k"]
+        self.assertEqual(got[:2], [0.5, -0.25])
+        self.assertAlmostEqual(got[2], 0.1, places=6)
+
+    def test_memory_tier_is_bounded_by_bytes(self) -> None:
+        stats = EmbeddingCacheStats()
+        tier = MemoryLRUTier(max_bytes=3 * 16, stats=stats)
+        tier.put_many((f"k{i}", pack_vector([1.0] * 4)) for i in range(3))
+        tier.get_many(["k0"])  # k0 becomes most recently used
+        tier.put_many([("k3", pack_vector([1.0] * 4))])
+
+        self.assertEqual(set(tier.get_many(["k0", "k1", "k2", "k3"])), {"k0", "k2", "k3"})
+        self.assertEqual(tier.size_bytes, 3 * 16)
+        self.assertEqual(stats.memory_evictions, 1)
+
+    def test_disk_tier_is_shared_and_promotes_into_memory(self) -> None:
+        writer = build_embedding_cache(disk_path=self.path)
+        writer.put_many({"shared": [1.0, 2.0]})
+
+        reader = build_embedding_cache(disk_path=self.path)  # e.g. another worker
+        self.assertEqual(reader.get_many(["shared", "absent"]), {"shared": [1.0, 2.0]})
+        self.assertEqual(reader.get_many(["shared"]), {"shared": [1.0, 2.0]})
+        snapshot = reader.snapshot()
+        self.assertEqual((snapshot["disk_hits"], snapshot["memory_hits"], snapshot["misses"]), (1, 1, 1))
+
+    def test_disk_tier_prunes_oldest_entries(self) -> None:
+        cache = build_embedding_cache(disk_path=self.path, disk_max_entries=100)
+        for i in range(250):
+            cache.put_many({f"k{i}": [float(i)]})
+
+        fresh = build_embedding_cache(disk_path=self.path, disk_max_entries=100)
+        self.assertEqual(fresh.get_many(["k0"]), {})
+        self.assertIn("k249", fresh.get_many(["k249"]))
+        self.assertGreater(cache.stats.disk_evictions, 0)
+
+
+class EmbedBatchCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        stats = EmbeddingCacheStats()
+        self.cache = EmbeddingCache(MemoryLRUTier(1 << 20, stats), None, stats)
+        set_embedding_cache(self.cache)
+        self.addCleanup(set_embedding_cache, None)
+        patches = [
+            mock.patch.object(embeddings, "_embedding_dims", return_value=4),
+            mock.patch.object(embeddings, "_embedding_models", return_value=("test-model",)),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_second_batch_is_served_from_cache(self) -> None:
+        def fake(texts, dims, batch_size, **kwargs):
+            kwargs["model_by_index"].update(dict.fromkeys(range(len(texts)), "test-model"))
+            return [[1.0, 0.0, 0.0, 0.0] for _ in texts]
+
+        with mock.patch.object(embeddings, "_embed_texts_in_batches_parallel", side_effect=fake) as embed:
+            embeddings.embed_batch(["a", "b"])
+            embeddings.embed_batch(["a", "b", "c"])
+
+        self.assertEqual(embed.call_args_list[1].args[0], ["c"])
+        self.assertEqual(self.cache.stats.memory_hits, 2)
+
+    def test_hash_fallback_vectors_are_not_cached(self) -> None:
+        def fake(texts, dims, batch_size, **kwargs):
+            kwargs["fallback_indices"].update(range(len(texts)))
+            return [embeddings._hash_embed(t, dims) for t in texts]
+
+        with mock.patch.object(embeddings, "_embed_texts_in_batches_parallel", side_effect=fake):
+            embeddings.embed_batch(["quota outage"])
+
+        self.assertEqual(len(self.cache.memory), 0)
+
+    def test_vectors_are_keyed_by_the_model_that_answered(self) -> None:
+        primary, fallback = [1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]
+        models = mock.patch.object(embeddings, "_embedding_models", return_value=("primary-model", "fallback-model"))
+
+        def answered_by(model, vec):
+            return mock.patch.object(
+                embeddings, "_gemini_embed_batch_with_retry", side_effect=lambda texts, dims: ([vec], model),
+            )
+
+        with models:
+            with answered_by("fallback-model", fallback):
+                embeddings.embed_batch(["a"])
+            stored = self.cache.get_many([cache_key(m, 4, embeddings.EMBEDDING_TASK, "a")
+                                          for m in ("primary-model", "fallback-model")])
+            self.assertEqual(list(stored.values()), [fallback])
+            self.assertTrue(next(iter(stored)).startswith("fallback-model|"))
+
+            # The primary model is healthy, so its lookup misses and it is asked again.
+            with answered_by("primary-model", primary) as embed:
+                self.assertEqual(embeddings.embed_batch(["a"]), [primary])
+            embed.assert_called_once()
+
+            # Once the primary is blacklisted, lookups go to the fallback model's own entry.
+            with mock.patch.object(embeddings, "_bad_models", {"primary-model"}):
+                self.assertEqual(embeddings.embed_batch(["a"]), [fallback])
+
+
+if __name__ == "__main__":
+    unittest.main()
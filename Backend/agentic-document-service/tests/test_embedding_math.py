@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import random
+import unittest
+
+import numpy as np
+
+from app.services.adapters import embeddings
+
+
+# Pure-Python implementations the vectorized helpers replaced; kept as references.
+def _legacy_cosine(left: list[float], right: list[float]) -> float:
+    if not left or not right or len(left) != len(right):
+        return 0.0
+    dot = sum(a * b for a, b in zip(left, right))
+    norm_l = math.sqrt(sum(a * a for a in left)) or 1.0
+    norm_r = math.sqrt(sum(b * b for b in right)) or 1.0
+    return dot / (norm_l * norm_r)
+
+
+def _legacy_fit(values: list[float], dims: int) -> list[float]:
+    if not values:
+        return []
+    if len(values) == dims:
+        return values
+    if len(values) > dims:
+        bucket = len(values) / float(dims)
+        reduced: list[float] = []
+        for i in range(dims):
+            start = int(i * bucket)
+            end = int((i + 1) * bucket)
+            if end <= start:
+                end = start + 1
+            segment = values[start:end]
+            reduced.append(sum(segment) / max(len(segment), 1))
+        values = reduced
+    else:
+        values = values + ([0.0] * (dims - len(values)))
+    norm = math.sqrt(sum(v * v for v in values)) or 1.0
+    return [v / norm for v in values]
+
+
+def _legacy_hash(text: str, dims: int) -> list[float]:
+    digest = hashlib.sha256(text.encode("utf-8")).digest()
+    values: list[float] = []
+    for i in range(dims):
+        start = (i * 2) % len(digest)
+        raw = int.from_bytes(digest[start: start + 2], "big", signed=False)
+        values.append((raw / 65535.0) * 2 - 1)
+    norm = math.sqrt(sum(v * v for v in values)) or 1.0
+    return [v / norm for v in values]
+
+
+class EmbeddingMathTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rng = random.Random(7)
+
+    def _vec(self, n: int) -> list[float]:
+        return [self.rng.uniform(-1, 1) for _ in range(n)]
+
+    def test_cosine_matrix_matches_pairwise_cosine(self) -> None:
+        queries = [self._vec(16) for _ in range(3)] + [[0.0] * 16, [], self._vec(5)]
+        docs = [self._vec(16) for _ in range(7)] + [[0.0] * 16, self._vec(4)]
+
+        got = embeddings.cosine_matrix(queries, docs)
+
+        self.assertEqual(got.shape, (len(queries), len(docs)))
+        expected = [[_legacy_cosine(q, d) for d in docs] for q in queries]
+        np.testing.assert_allclose(got, expected, atol=1e-12)
+        self.assertAlmostEqual(embeddings.cosine_similarity(queries[0], docs[0]), expected[0][0], places=12)
+
+    def test_cosine_matrix_accepts_arrays(self) -> None:
+        left = np.asarray([self._vec(8) for _ in range(2)], dtype=np.float32)
+        right = np.asarray([self._vec(8) for _ in range(4)])
+
+        got = embeddings.cosine_matrix(left, right)
+
+        expected = [[_legacy_cosine(q, d) for d in right.tolist()] for q in left.tolist()]
+        np.testing.assert_allclose(got, expected, atol=1e-6)
+        self.assertEqual(embeddings.cosine_matrix(left, np.zeros((3, 5))).tolist(), [[0.0] * 3] * 2)
+
+    def test_hash_embed_batch_matches_legacy(self) -> None:
+        texts = ["", "quota outage", "अनुबंध का उल्लंघन", "x" * 5000]
+        for dims in (1, 15, 16, 768):
+            got = embeddings._hash_embed_batch(texts, dims)
+            for text, vec in zip(texts, got):
+                np.testing.assert_allclose(vec, _legacy_hash(text, dims), atol=1e-12)
+        self.assertEqual(embeddings._hash_embed("a", 32), embeddings._hash_embed_batch(["a"], 32)[0])
+        self.assertEqual(embeddings._hash_embed_batch([], 768), [])
+
+    def test_fit_dims_batch_matches_legacy(self) -> None:
+        rows = [self._vec(3072), self._vec(3072), self._vec(1000), self._vec(10), self._vec(768), [], [0.0] * 800]
+
+        got = embeddings._fit_embedding_dims_batch(rows, 768)
+
+        for row, vec in zip(rows, got):
+            np.testing.assert_allclose(vec, _legacy_fit(row, 768), atol=1e-12)
+        self.assertIs(got[4], rows[4])
+        for n in (1536, 1000, 769, 5):
+            row = self._vec(n)
+            np.testing.assert_allclose(embeddings._fit_embedding_dims(row, 768), _legacy_fit(row, 768), atol=1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+import unittest
+from unittest import mock
+
+from app.schemas.contracts import DocumentReference
+from app.services import pipeline_service
+from app.services.adapters import chunking, ocr
+
+WORDS = "court order plaintiff defendant lease rent appeal notice decree tenant".split()
+
+
+def _pages(seed: int, count: int = 40, heading_rate: float = 0.2) -> list[str]:
+    rng = random.Random(seed)
+    pages: list[str] = []
+    heading = 0
+    for _ in range(count):
+        lines: list[str] = []
+        for _ in range(rng.randint(1, 4)):
+            if rng.random() < heading_rate:
+                heading += 1
+                lines.append(f"SECTION {heading}")
+            lines.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 300))))
+        pages.append("\n\n".join(lines))
+    return pages
+
+
+def _ocr_pages(seed: int, count: int = 40) -> list[str]:
+    """OCR-style pages: single-newline lines, the odd heading, CRLF, empty pages."""
+    rng = random.Random(seed)
+    pages: list[str] = []
+    for _ in range(count):
+        lines = [
+            f"SECTION {rng.randint(1, 9)}" if rng.random() < 0.1
+            else " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 60)))
+            for _ in range(rng.randint(0, 30))
+        ]
+        pages.append(rng.choice(["\n", "\r\n"]).join(lines) + rng.choice(["", "\n", "\r"]))
+    return pages
+
+
+def _batch(first_page: int, bodies: list[str]) -> ocr.OcrResult:
+    pages = [{"pageNumber": first_page + i, "text": body} for i, body in enumerate(bodies)]
+    return ocr.OcrResult(
+        text="\n".join(bodies),
+        page_count=len(bodies),
+        quality_score=0.9,
+        structured_json={"source": "document_ai_ocr", "pages": pages},
+    )
+
+
+class ChunkStreamTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.chunker = chunking.LegalSemanticChunker(
+            target_tokens=500, overlap_tokens=50, min_tokens=150, max_tokens=900,
+        )
+
+    def test_stream_matches_whole_text_chunking(self) -> None:
+        for seed, heading_rate in [(0, 0.2), (1, 0.0), (2, 0.02), (3, 0.9), (24, 0.2)]:
+            pages = _pages(seed, heading_rate=heading_rate)
+            streamed = [c for group in self.chunker.chunk_stream(pages) for c in group]
+            self.assertEqual(streamed, self.chunker.chunk("\n\n".join(pages)), f"seed={seed}")
+
+    def assertStreamMatchesChunk(self, pages: list[str], msg: str = "") -> None:
+        streamed = [c for group in self.chunker.chunk_stream(iter(pages)) for c in group]
+        self.assertEqual(streamed, self.chunker.chunk("\n\n".join(pages)), msg)
+
+    def test_single_newline_pages_match_whole_text_chunking(self) -> None:
+        # Each page is one paragraph, often longer than target_tokens; a
+        # section spanning many pages is split while it is still open.
+        for seed in range(20):
+            self.assertStreamMatchesChunk(_ocr_pages(seed), f"seed={seed}")
+
+    def test_paragraphs_over_max_tokens_match_whole_text_chunking(self) -> None:
+        rng = random.Random(7)
+        for seed in range(20):
+            pages = _pages(seed, count=12, heading_rate=0.1)
+            for i in rng.sample(range(len(pages)), 4):
+                pages[i] = " ".join(rng.choice(WORDS) for _ in range(rng.randint(700, 1500)))
+            self.assertStreamMatchesChunk(pages, f"seed={seed}")
+
+    def test_overlap_is_carried_once_across_pieces(self) -> None:
+        big = [" ".join(f"w{page}x{i}" for i in range(600)) for page in range(5)]
+        chunks = [c for group in self.chunker.chunk_stream(big) for c in group]
+
+        self.assertEqual(chunks, self.chunker.chunk("\n\n".join(big)))
+        self.assertEqual(len(chunks), 5)
+        for prev, chunk in zip(chunks, chunks[1:]):
+            overlap = " ".join(prev.text.split()[-50:])
+            self.assertTrue(chunk.text.startswith(overlap + "\n\n"))
+            self.assertEqual(chunk.text.count(overlap), 1)
+
+    def test_heading_at_end_of_piece_carries_into_next(self) -> None:
+        body = " ".join(["lease"] * 40)
+        groups = list(self.chunker.chunk_stream([f"{body}\n\nSECTION 2", body, "", f"SECTION 3\n\n{body}"]))
+
+        chunks = [c for group in groups for c in group]
+        self.assertEqual([c.heading for c in chunks], [None, "SECTION 2", "SECTION 3"])
+
+
+class _FakeReader:
+    def __init__(self, pages: int) -> None:
+        self.pages = list(range(pages))
+
+
+class OcrPageStreamTests(unittest.TestCase):
+    def test_batches_come_out_in_page_order_within_window(self) -> None:
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fake_call(batch, mime_type, client, processor_name, *, page_offset, process_options):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02 if page_offset % 30 == 0 else 0.001)  # later batches finish first
+            with lock:
+                in_flight -= 1
+            if page_offset == 45:
+                raise RuntimeError("quota")
+            return _batch(page_offset + 1, [f"page {page_offset + 1}"])
+
+        with mock.patch.object(ocr, "_call_document_ai", side_effect=fake_call), \
+                mock.patch.object(ocr, "_pdf_page_range_bytes", side_effect=lambda r, s, e: b"%PDF"):
+            batches = ocr._iter_ocr_page_batches(
+                _FakeReader(100), "application/pdf", None, "proc",
+                process_options=None, page_limit=15, workers=2, window=3,
+            )
+            got = [b.structured_json["pages"][0]["pageNumber"] if b.structured_json else None for b in batches]
+
+        self.assertEqual(got, [1, 16, 31, None, 61, 76, 91])
+        self.assertLessEqual(peak, 2)
+
+
+class StreamedDocumentTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.service = pipeline_service.LegalCasePipelineService()
+        self.service._chunker = chunking.LegalSemanticChunker(
+            target_tokens=500, overlap_tokens=50, min_tokens=150, max_tokens=900,
+        )
+
+    def _run(self, batches: list[ocr.OcrResult], progress):
+        stream = ocr.OcrPageStream(page_count=45, batch_count=len(batches), batches=iter(batches))
+        persisted_starts: list[int] = []
+
+        def fake_persist(file_id, chunks, *, start_index=0, **kwargs):
+            persisted_starts.append(start_index)
+            return chunks
+
+        document = DocumentReference(document_name="plaint.pdf", metadata={"db_file_id": "file-1"})
+        with mock.patch.object(pipeline_service.embeddings, "embed_batch", side_effect=lambda t: [[1.0, 0.0]] * len(t)), \
+                mock.patch.object(self.service, "persist_chunks_to_db", side_effect=fake_persist), \
+                mock.patch.object(self.service, "_persist_ocr_extraction"):
+            bundle = self.service._process_streamed_document(
+                "case-1", document, "file-1", stream, progress_callback=progress,
+            )
+        return bundle, persisted_starts
+
+    def test_batches_are_indexed_incrementally(self) -> None:
+        pages = _pages(5, count=45)
+        batches = [_batch(start + 1, pages[start:start + 15]) for start in range(0, 45, 15)]
+        progress: list[tuple[float, str]] = []
+
+        bundle, starts = self._run(batches, lambda pct, operation: progress.append((pct, operation)))
+
+        self.assertTrue(bundle.chunks_persisted)
+        indexes = [int(c.metadata["chunk_index"]) for c in bundle.chunks]
+        self.assertEqual(indexes, list(range(len(bundle.chunks))))
+        self.assertGreater(len(starts), 1)
+        self.assertEqual(starts[0], 0)
+        self.assertTrue(bundle.stored_document.text.startswith("[PAGE 1]\n"))
+        self.assertIn("[PAGE 45]", bundle.stored_document.text)
+        self.assertEqual(bundle.process_result.chunk_count, len(bundle.chunks))
+        self.assertEqual({c.doc_type for c in bundle.chunks}, {bundle.process_result.doc_type})
+        self.assertTrue(any(op.startswith("streaming_index: 1/3 page batches") for _, op in progress))
+        self.assertEqual(progress[-1][0], 95.0)
+
+    def test_no_text_returns_none_for_whole_document_fallback(self) -> None:
+        empty = ocr.OcrResult(text="", page_count=0, quality_score=0.0)
+
+        bundle, starts = self._run([empty, empty], None)
+
+        self.assertIsNone(bundle)
+        self.assertEqual(starts, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import random
+import unittest
+
+from app.schemas.contracts import DocumentType
+from app.services.adapters.embeddings import cosine_similarity
+from app.services.adapters.vector_store import TOKEN_RE, ChunkRecord, InMemoryVectorStore
+
+
+WORDS = ["agreement", "notice", "demand", "suit", "court", "payment", "lease", "tenant", "order", "appeal"]
+TYPES = [DocumentType.pleading, DocumentType.evidence, DocumentType.order]
+
+
+def _chunk(i: int, rng: random.Random, *, document_id: str | None = None, dims: int = 16) -> ChunkRecord:
+    return ChunkRecord(
+        chunk_id=f"c{i}",
+        case_id="case-1",
+        document_id=document_id or f"doc-{i % 5}",
+        document_name=f"doc-{i % 5}.pdf",
+        doc_type=TYPES[i % len(TYPES)],
+        text=" ".join(rng.choice(WORDS) for _ in range(8)),
+        embedding=[rng.uniform(-1, 1) for _ in range(dims)],
+    )
+
+
+def _reference_search(
+    chunks: list[ChunkRecord],
+    query: str,
+    query_embedding: list[float],
+    top_k: int,
+    required_doc_types: list[DocumentType],
+    use_hybrid_search: bool,
+) -> list[tuple[str, float]]:
+    """The pre-index loop: score every chunk, stable-sort, slice."""
+    query_terms = set(TOKEN_RE.findall(query.lower()))
+    semantic, keyword = [], []
+    for chunk in chunks:
+        if required_doc_types and chunk.doc_type not in required_doc_types:
+            continue
+        text_terms = set(TOKEN_RE.findall(chunk.text.lower()))
+        semantic.append((chunk, cosine_similarity(query_embedding, chunk.embedding)))
+        keyword.append((chunk, len(query_terms & text_terms) / max(len(query_terms), 1)))
+    semantic.sort(key=lambda item: item[1], reverse=True)
+    if not use_hybrid_search:
+        return [(c.chunk_id, s) for c, s in semantic[:top_k]]
+    keyword.sort(key=lambda item: item[1], reverse=True)
+    fused: dict[str, float] = {}
+    for ranked in (semantic, keyword):
+        for rank, (chunk, _score) in enumerate(ranked[: max(top_k * 3, top_k)], start=1):
+            fused[chunk.chunk_id] = fused.get(chunk.chunk_id, 0.0) + 1.0 / (60.0 + rank)
+    merged = sorted(fused.items(), key=lambda item: item[1], reverse=True)
+    return merged[:top_k]
+
+
+class InMemoryVectorStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rng = random.Random(7)
+        self.chunks = [_chunk(i, self.rng) for i in range(300)]
+        self.store = InMemoryVectorStore()
+        self.store.upsert_chunks("case-1", self.chunks)
+        self.query_embedding = [self.rng.uniform(-1, 1) for _ in range(16)]
+
+    def test_semantic_ranking_matches_reference_loop(self) -> None:
+        hits = self.store.search(
+            "case-1", "demand notice", self.query_embedding, 10, [], use_hybrid_search=False
+        )
+        expected = _reference_search(self.chunks, "demand notice", self.query_embedding, 10, [], False)
+        self.assertEqual([c.chunk_id for c, _ in hits], [cid for cid, _ in expected])
+        for (_, got), (_, want) in zip(hits, expected):
+            self.assertAlmostEqual(got, want, places=5)
+
+    def test_rrf_ranking_matches_reference_loop_with_doc_type_filter(self) -> None:
+        required = [DocumentType.evidence, DocumentType.order]
+        hits = self.store.search("case-1", "Lease tenant appeal", self.query_embedding, 8, required)
+        expected = _reference_search(self.chunks, "Lease tenant appeal", self.query_embedding, 8, required, True)
+        self.assertEqual([c.chunk_id for c, _ in hits], [cid for cid, _ in expected])
+        self.assertTrue(all(c.doc_type in required for c, _ in hits))
+
+    def test_weighted_hybrid_scores_are_rounded_blend(self) -> None:
+        hits = self.store.search(
+            "case-1", "court order", self.query_embedding, 5, [], use_rrf=False,
+            semantic_weight=0.5, keyword_weight=0.5,
+        )
+        self.assertEqual(len(hits), 5)
+        self.assertEqual([s for _, s in hits], sorted((s for _, s in hits), reverse=True))
+        self.assertTrue(all(round(s, 4) == s for _, s in hits))
+
+    def test_delete_document_removes_rows_and_reports_count(self) -> None:
+        removed = self.store.delete_document("doc-0")
+
+        self.assertEqual(removed, sum(1 for c in self.chunks if c.document_id == "doc-0"))
+        hits = self.store.search("case-1", "suit", self.query_embedding, 300, [], use_hybrid_search=False)
+        self.assertEqual(len(hits), 300 - removed)
+        self.assertNotIn("doc-0", {c.document_id for c, _ in hits})
+        self.assertEqual(self.store.delete_document("doc-0"), 0)
+
+    def test_upsert_replaces_existing_chunk_id(self) -> None:
+        replacement = ChunkRecord(
+            chunk_id="c3", case_id="case-1", document_id="doc-3", document_name="doc-3.pdf",
+            doc_type=DocumentType.pleading, text="replacement", embedding=list(self.query_embedding),
+        )
+        self.store.upsert_chunks("case-1", [replacement])
+
+        hits = self.store.search("case-1", "", self.query_embedding, 2, [], use_hybrid_search=False)
+        self.assertIs(hits[0][0], replacement)
+        self.assertAlmostEqual(hits[0][1], 1.0, places=5)
+        all_hits = self.store.search("case-1", "", self.query_embedding, 1000, [], use_hybrid_search=False)
+        self.assertEqual(len(all_hits), 300)
+
+    def test_compaction_preserves_results(self) -> None:
+        extra = [_chunk(i, self.rng, document_id="bulk") for i in range(1000, 1600)]
+        self.store.upsert_chunks("case-1", extra)
+        before = self.store.search("case-1", "payment", self.query_embedding, 10, [])
+
+        self.store.delete_document("bulk")
+        after = self.store.search("case-1", "payment", self.query_embedding, 10, [])
+        expected = _reference_search(self.chunks, "payment", self.query_embedding, 10, [], True)
+
+        self.assertEqual(self.store._cases["case-1"].dead, 0)
+        self.assertEqual([c.chunk_id for c, _ in after], [cid for cid, _ in expected])
+        self.assertEqual(len(before), 10)
+
+    def test_mismatched_or_empty_embeddings_score_zero(self) -> None:
+        store = InMemoryVectorStore()
+        store.upsert_chunks("case-2", [
+            ChunkRecord("a", "case-2", "d", "d.pdf", DocumentType.unknown, "alpha", []),
+            ChunkRecord("b", "case-2", "d", "d.pdf", DocumentType.unknown, "beta", [1.0, 0.0]),
+            ChunkRecord("c", "case-2", "d", "d.pdf", DocumentType.unknown, "gamma", [1.0, 0.0, 0.0]),
+        ])
+
+        hits = store.search("case-2", "", [1.0, 0.0], 3, [], use_hybrid_search=False)
+        self.assertEqual([(c.chunk_id, round(s, 5)) for c, s in hits], [("b", 1.0), ("a", 0.0), ("c", 0.0)])
+        self.assertEqual(store.search("missing", "x", [1.0], 3, []), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
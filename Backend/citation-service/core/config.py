@@ -74,6 +74,17 @@ class Settings:
     # Relevance floor for a promoted cite (slightly above the 0.25 scoring default — cites are
     # noisier than keyword hits, so a promoted case must clear a higher bar to reach the judge).
     cite_graph_min_relevance: float = _float("CITATION_V2_CITE_GRAPH_MIN_RELEVANCE", 0.30)
+    # Cross-run citation graph (services.citation_graph): every stored judgment's cites feed
+    # a CSR snapshot (.npz on disk, rebuilt from ik_citation_edges after the refresh
+    # interval). Neighbours are ranked by local seed support, then global co-citation and
+    # in-degree. Once the graph is warm (>= warm_nodes), a neighbour only ONE seed references,
+    # that no other stored judgment co-cites and fewer than min_global_citations cite, is not
+    # promoted — no /doc/ spend on obscure neighbours. min_global_citations=0 disables that.
+    cite_graph_store_enabled: bool = os.environ.get("CITATION_V2_CITE_GRAPH_STORE", "true").lower() == "true"
+    cite_graph_store_path: str = os.environ.get("CITATION_V2_CITE_GRAPH_STORE_PATH", "")
+    cite_graph_store_refresh_seconds: int = _int("CITATION_V2_CITE_GRAPH_STORE_REFRESH_SECONDS", 3600)
+    cite_graph_store_warm_nodes: int = _int("CITATION_V2_CITE_GRAPH_STORE_WARM_NODES", 5000)
+    cite_graph_min_global_citations: int = _int("CITATION_V2_CITE_GRAPH_MIN_GLOBAL_CITATIONS", 2)
     # How many cite/citedby rows to request per seed /doc/ fetch. Bumped 5 -> 20/10: it is the
     # SAME /doc/ call (free), just a wider neighbourhood to rank promotions from. doc_data rows
     # are {tid,title} only, so court/date are filled from the promoted doc's own /doc/ fetch.
@@ -101,6 +112,16 @@ class Settings:
     # waste. Cranking maxpages to its 1000 ceiling would only burn money (cap still truncates).
     ik_search_maxpages: int = _int("CITATION_V2_IK_SEARCH_MAXPAGES", 6)
     per_query_doc_cap: int = _int("CITATION_V2_PER_QUERY_DOC_CAP", 50)
+    # Cross-run cache for search / docfragment / docmeta responses (in-process LRU over the
+    # ik_response_cache table). A hit costs nothing and does not consume the paid IK budget;
+    # it is counted as "<op>_cache_hit" in budget.counts. TTL 0 disables one endpoint.
+    # Search results age as IK indexes new judgments (1 day); fragments and metadata of a
+    # decided judgment are effectively immutable (30 days).
+    ik_response_cache_enabled: bool = os.environ.get("CITATION_IK_RESPONSE_CACHE", "true").lower() == "true"
+    ik_response_cache_memory_entries: int = _int("CITATION_IK_RESPONSE_CACHE_MEMORY_ENTRIES", 2000)
+    ik_cache_search_ttl_seconds: int = _int("CITATION_IK_CACHE_SEARCH_TTL_SECONDS", 86400)
+    ik_cache_fragment_ttl_seconds: int = _int("CITATION_IK_CACHE_FRAGMENT_TTL_SECONDS", 30 * 86400)
+    ik_cache_meta_ttl_seconds: int = _int("CITATION_IK_CACHE_META_TTL_SECONDS", 30 * 86400)
     # Tier 1 (B / P3) — co-retrieve the named local High Court AND the Supreme Court in ONE
     # search via comma-separated IK doctypes (e.g. "bombay,supremecourt"), so binding apex
     # precedent and the controlling HC line land in the SAME ranked result set. Still one
@@ -139,6 +160,10 @@ class Settings:
     # 150+ candidates was the slowest stage (~87s) and blew the runtime budget; 100 keeps
     # the rerank fast while still ranking the best of the wider net.
     rerank_pool_cap: int = _int("CITATION_V2_RERANK_POOL_CAP", 100)
+    # Semantic scoring reuses vectors instead of re-embedding: candidate ratio slices are
+    # persisted per (doc_id, slice hash, model) in ik_doc_embeddings; issue/case query vectors
+    # come from db.client's in-process embedding cache.
+    semantic_doc_cache_enabled: bool = os.environ.get("CITATION_V2_SEMANTIC_DOC_CACHE", "true").lower() == "true"
     # Richer query builder caps (per legal issue). 9 leaves room for 2-3 precision +
     # 2 landmark + strict + SC + court + opponent queries to coexist (FAILURE 2). The
     # execution budget (max_ik_search_calls) is the real cost ceiling.
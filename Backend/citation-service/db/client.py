@@ -221,7 +221,9 @@ def _embed_strings_gemini(strings: List[str], task: str = "query") -> List[List[
     return out_full
 
 
-def _embeddings_batch(texts: List[str], task: str) -> List[List[float]]:
+def _embeddings_batch(texts: List[str], task: str, sent: Optional[List[str]] = None) -> List[List[float]]:
+    """Embed `texts` through the content-hash cache; `sent` (if given) collects the texts that
+    actually went to Gemini, so callers bill only cache misses."""
     if not texts:
         return []
     out: List[List[float]] = [[] for _ in texts]
@@ -255,6 +257,8 @@ def _embeddings_batch(texts: List[str], task: str) -> List[List[float]]:
                 uniq_keys.append(key)
                 uniq_texts.append(t)
         vectors = _embed_strings_gemini(uniq_texts, task=task)
+        if sent is not None:
+            sent.extend(uniq_texts)
         key_to_vec: Dict[str, List[float]] = {}
         for k, vec in zip(uniq_keys, vectors):
             key_to_vec[k] = vec
@@ -267,20 +271,20 @@ def _embeddings_batch(texts: List[str], task: str) -> List[List[float]]:
     return out
 
 
-def get_query_embeddings_batch(texts: List[str]) -> List[List[float]]:
+def get_query_embeddings_batch(texts: List[str], sent: Optional[List[str]] = None) -> List[List[float]]:
     """
     Embed search-side text with RETRIEVAL_QUERY (e.g. the case/issue query vectors).
     Preserves list length and index alignment; blank strings produce [].
     """
-    return _embeddings_batch(texts, task="query")
+    return _embeddings_batch(texts, task="query", sent=sent)
 
 
-def get_document_embeddings_batch(texts: List[str]) -> List[List[float]]:
+def get_document_embeddings_batch(texts: List[str], sent: Optional[List[str]] = None) -> List[List[float]]:
     """
     Embed corpus-side text (candidate judgments) with RETRIEVAL_DOCUMENT so cosine
     similarity against a RETRIEVAL_QUERY case/issue vector is correct.
     """
-    return _embeddings_batch(texts, task="document")
+    return _embeddings_batch(texts, task="document", sent=sent)
 
 
 def _get_qdrant_query_embedding(query: str) -> List[float]:
@@ -1621,6 +1625,97 @@ def init_db() -> None:
                 "CREATE INDEX IF NOT EXISTS idx_ik_assets_canonical ON ik_document_assets(canonical_id)"
             )
 
+            # ── ik_doc_embeddings: RETRIEVAL_DOCUMENT vectors of each asset's ratio slice ──
+            # Keyed by the slice's content hash, so a candidate whose text grows (headline ->
+            # full judgment) gets a new row instead of a stale vector.
+            cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ik_doc_embeddings (
+                    doc_id      VARCHAR(64) NOT NULL,
+                    slice_hash  VARCHAR(64) NOT NULL,
+                    model_key   VARCHAR(128) NOT NULL,
+                    dims        INTEGER NOT NULL,
+                    embedding   REAL[] NOT NULL,
+                    created_at  TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+                    PRIMARY KEY (doc_id, slice_hash, model_key)
+                )
+                """
+            )
+
+            # ── ik_citation_edges / ik_citation_nodes: cross-run citation graph (citing -> cited) ──
+            cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ik_citation_edges (
+                    src_tid     VARCHAR(64) NOT NULL,
+                    dst_tid     VARCHAR(64) NOT NULL,
+                    created_at  TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+                    PRIMARY KEY (src_tid, dst_tid)
+                )
+                """
+            )
+            cur.execute("CREATE INDEX IF NOT EXISTS idx_ik_citation_edges_dst ON ik_citation_edges(dst_tid)")
+            cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ik_citation_nodes (
+                    tid    VARCHAR(64) PRIMARY KEY,
+                    title  TEXT
+                )
+                """
+            )
+            # One-time backfill from the cite lists already cached in ik_document_assets.
+            cur.execute("SELECT 1 FROM ik_citation_edges LIMIT 1")
+            if cur.fetchone() is None:
+                cur.execute(
+                    """
+                    WITH lists AS (
+                        SELECT a.doc_id,
+                               COALESCE(a.raw_api_response->'doc_data'->'cites',
+                                        a.raw_api_response->'doc_data'->'citeList', a.cite_list) AS cites,
+                               COALESCE(a.raw_api_response->'doc_data'->'citedby',
+                                        a.raw_api_response->'doc_data'->'citedbyList', a.cited_by_list) AS citedby
+                          FROM ik_document_assets a
+                    ), rows AS (
+                        SELECT l.doc_id, TRUE AS outbound, r AS row FROM lists l,
+                               jsonb_array_elements(CASE WHEN jsonb_typeof(l.cites) = 'array' THEN l.cites ELSE '[]'::jsonb END) r
+                        UNION ALL
+                        SELECT l.doc_id, FALSE, r FROM lists l,
+                               jsonb_array_elements(CASE WHEN jsonb_typeof(l.citedby) = 'array' THEN l.citedby ELSE '[]'::jsonb END) r
+                    ), tids AS (
+                        SELECT doc_id, outbound, TRIM(COALESCE(row->>'tid', row->>'id')) AS tid, row->>'title' AS title
+                          FROM rows WHERE jsonb_typeof(row) = 'object'
+                    ), edges AS (
+                        INSERT INTO ik_citation_edges (src_tid, dst_tid)
+                        SELECT DISTINCT CASE WHEN outbound THEN doc_id ELSE tid END,
+                                        CASE WHEN outbound THEN tid ELSE doc_id END
+                          FROM tids WHERE tid <> '' AND tid <> doc_id
+                        ON CONFLICT DO NOTHING
+                    )
+                    INSERT INTO ik_citation_nodes (tid, title)
+                    SELECT DISTINCT ON (tid) tid, title FROM tids
+                     WHERE tid <> '' AND COALESCE(title, '') <> ''
+                    ON CONFLICT (tid) DO NOTHING
+                    """
+                )
+
+            # ── ik_response_cache: cross-run cache of IK search/docfragment/docmeta responses ──
+            cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ik_response_cache (
+                    cache_key   VARCHAR(128) PRIMARY KEY,
+                    endpoint    VARCHAR(16) NOT NULL,
+                    response    JSONB NOT NULL,
+                    hit_count   INTEGER NOT NULL DEFAULT 0,
+                    created_at  TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+                    expires_at  TIMESTAMPTZ NOT NULL
+                )
+                """
+            )
+            cur.execute(
+                "CREATE INDEX IF NOT EXISTS idx_ik_response_cache_expires ON ik_response_cache(expires_at)"
+            )
+            # Expired rows are never served; sweep them at startup so the table stays bounded.
+            cur.execute("DELETE FROM ik_response_cache WHERE expires_at < NOW()")
+
             # ── citation_service_usage: third-party API usage and cost tracking ──
             cur.execute(
                 """
@@ -4091,6 +4186,7 @@ def ik_asset_upsert(
                         canonical_id,
                     ),
                 )
+            edges, titles = _ik_citation_edges_write(cur, doc_id, title, cite_list, cited_by_list, raw_api_response)
         conn.commit()
     except Exception as exc:
         logger.warning("[DB] ik_asset_upsert failed for doc_id=%s: %s", doc_id, exc)
@@ -4098,6 +4194,70 @@ def ik_asset_upsert(
             conn.rollback()
         except Exception:
             pass
+        return
+    finally:
+        conn.close()
+    from services.citation_graph import record_edges
+    record_edges(edges, titles)
+
+
+def _ik_citation_edges_write(cur, doc_id: str, title: Optional[str], cite_list: Optional[List],
+                             cited_by_list: Optional[List], raw_api_response: Optional[Dict]):
+    """Mirror an asset's citeList/citedbyList into ik_citation_edges / ik_citation_nodes."""
+    from psycopg2.extras import execute_values
+    from services.citation_graph import asset_edges
+
+    edges, titles = asset_edges(doc_id, title or "", cite_list, cited_by_list, raw_api_response)
+    if not edges and not titles:
+        return edges, titles
+    # Savepoint: a graph-write failure must never roll back the asset upsert itself.
+    cur.execute("SAVEPOINT ik_citation_edges_write")
+    try:
+        if edges:
+            execute_values(
+                cur,
+                "INSERT INTO ik_citation_edges (src_tid, dst_tid) VALUES %s ON CONFLICT DO NOTHING",
+                edges,
+            )
+        if titles:
+            execute_values(
+                cur,
+                """
+                INSERT INTO ik_citation_nodes (tid, title) VALUES %s
+                ON CONFLICT (tid) DO UPDATE SET title = COALESCE(NULLIF(ik_citation_nodes.title, ''), EXCLUDED.title)
+                """,
+                list(titles.items()),
+            )
+        cur.execute("RELEASE SAVEPOINT ik_citation_edges_write")
+    except Exception as exc:
+        logger.warning("[DB] citation edge write failed for doc_id=%s: %s", doc_id, exc)
+        cur.execute("ROLLBACK TO SAVEPOINT ik_citation_edges_write")
+        return [], {}
+    return edges, titles
+
+
+def ik_citation_edges_load() -> Optional[Tuple[List[Tuple[str, str]], Dict[str, str]]]:
+    """All stored citation edges and node titles (for building the CSR graph snapshot)."""
+    conn = get_pg_conn()
+    if not conn:
+        return None
+    try:
+        with conn.cursor(name="ik_citation_edges_scan") as cur:
+            cur.itersize = 50_000
+            cur.execute("SELECT src_tid, dst_tid FROM ik_citation_edges")
+            edges = [(str(src), str(dst)) for src, dst in cur]
+        with conn.cursor() as cur:
+            cur.execute("SELECT tid, title FROM ik_citation_nodes WHERE title IS NOT NULL AND title <> ''")
+            titles = {str(tid): str(title) for tid, title in cur.fetchall()}
+        conn.commit()
+        return edges, titles
+    except Exception as exc:
+        logger.warning("[DB] ik_citation_edges_load failed: %s", exc)
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+        return None
     finally:
         conn.close()
 
@@ -4131,6 +4291,139 @@ def ik_asset_get(doc_id: str, increment_hit: bool = False) -> Optional[Dict]:
         conn.close()
 
 
+def ik_response_cache_get(cache_key: str) -> Optional[Any]:
+    """Return an unexpired cached IK search/docfragment/docmeta response, bumping hit_count."""
+    conn = get_pg_conn()
+    if not conn:
+        return None
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE ik_response_cache SET hit_count = hit_count + 1
+                 WHERE cache_key = %s AND expires_at > NOW()
+                RETURNING response
+                """,
+                (cache_key,),
+            )
+            row = cur.fetchone()
+        conn.commit()
+        return row[0] if row else None
+    except Exception as exc:
+        logger.warning("[DB] ik_response_cache_get failed for %s: %s", cache_key, exc)
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+        return None
+    finally:
+        conn.close()
+
+
+def ik_response_cache_put(cache_key: str, endpoint: str, response: Any, ttl_seconds: int) -> None:
+    """Store (or refresh) one IK response for ttl_seconds."""
+    conn = get_pg_conn()
+    if not conn:
+        return
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO ik_response_cache (cache_key, endpoint, response, created_at, expires_at)
+                VALUES (%s, %s, %s, NOW(), NOW() + make_interval(secs => %s))
+                ON CONFLICT (cache_key) DO UPDATE SET
+                    response   = EXCLUDED.response,
+                    created_at = EXCLUDED.created_at,
+                    expires_at = EXCLUDED.expires_at
+                """,
+                (cache_key, endpoint, Json(response), int(ttl_seconds)),
+            )
+        conn.commit()
+    except Exception as exc:
+        logger.warning("[DB] ik_response_cache_put failed for %s: %s", cache_key, exc)
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+    finally:
+        conn.close()
+
+
+def document_embedding_model_key() -> str:
+    """Identity of the candidate-side vector space: model + task type + dims.
+
+    Stored document vectors are only comparable with vectors from the same key.
+    """
+    model = _resolve_query_embed_model()
+    config = _document_embed_config(model)
+    return f"{model}|{config.get('task_type', '')}|{config.get('output_dimensionality', '')}"
+
+
+def ik_doc_embeddings_get(keys: List[Tuple[str, str]], model_key: str) -> Dict[Tuple[str, str], List[float]]:
+    """Stored document vectors for (doc_id, slice_hash) pairs under model_key (misses omitted)."""
+    if not keys:
+        return {}
+    conn = get_pg_conn()
+    if not conn:
+        return {}
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT e.doc_id, e.slice_hash, e.embedding
+                  FROM ik_doc_embeddings e
+                  JOIN unnest(%s::text[], %s::text[]) AS k(doc_id, slice_hash)
+                    ON e.doc_id = k.doc_id AND e.slice_hash = k.slice_hash
+                 WHERE e.model_key = %s
+                """,
+                ([k[0] for k in keys], [k[1] for k in keys], model_key),
+            )
+            rows = cur.fetchall()
+        conn.commit()
+        return {(str(doc_id), str(slice_hash)): list(vec or []) for doc_id, slice_hash, vec in rows}
+    except Exception as exc:
+        logger.warning("[DB] ik_doc_embeddings_get failed (%d keys): %s", len(keys), exc)
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+        return {}
+    finally:
+        conn.close()
+
+
+def ik_doc_embeddings_put(rows: List[Tuple[str, str, List[float]]], model_key: str) -> None:
+    """Persist (doc_id, slice_hash, vector) rows under model_key; existing rows are kept."""
+    rows = [r for r in rows if r[0] and r[2]]
+    if not rows:
+        return
+    conn = get_pg_conn()
+    if not conn:
+        return
+    try:
+        from psycopg2.extras import execute_values
+
+        with conn.cursor() as cur:
+            execute_values(
+                cur,
+                """
+                INSERT INTO ik_doc_embeddings (doc_id, slice_hash, model_key, dims, embedding)
+                VALUES %s ON CONFLICT (doc_id, slice_hash, model_key) DO NOTHING
+                """,
+                [(doc_id, slice_hash, model_key, len(vec), [float(v) for v in vec])
+                 for doc_id, slice_hash, vec in rows],
+            )
+        conn.commit()
+    except Exception as exc:
+        logger.warning("[DB] ik_doc_embeddings_put failed (%d rows): %s", len(rows), exc)
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+    finally:
+        conn.close()
+
+
 def ik_asset_list_recent(limit: int = 50) -> List[Dict]:
     """List recently stored IK assets for admin/debug view."""
     conn = get_pg_conn()
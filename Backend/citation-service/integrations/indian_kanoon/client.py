@@ -4,6 +4,7 @@ import logging
 
 from core.budgets import BudgetTracker
 from core.config import settings
+from integrations.indian_kanoon import response_cache
 from models.citation_models import Candidate
 from services.cost_service import record_ik_call
 from utils.text import strip_html
@@ -27,17 +28,32 @@ class IndianKanoonClient:
         self.user_id = user_id
         self.budget = budget
 
+    def _cache_hit(self, operation: str, endpoint: str, candidate_doc_id: str = "", issue_id: str = "") -> None:
+        # Free hit: counted beside the paid op (budget.counts["ik_search_cache_hit"], ...) so
+        # a run's savings are visible, without consuming the paid per-op budget.
+        self.budget.consume(f"ik_{operation}_cache_hit", estimated_cost=0.0)
+        record_ik_call(self.run_id, self.user_id, operation, endpoint=endpoint, candidate_doc_id=candidate_doc_id,
+                       issue_id=issue_id, cached=True)
+
     def search(self, query: str, doctypes: str, issue_id: str,
                is_case_name_search: bool = False) -> list[Candidate]:
         from services.indian_kanoon import ik_search
-        self.budget.consume("ik_search")
-        # is_case_name_search routes a bare landmark name through IK's title:"..." path
-        # (case_metadata stays None so the title is not narrowed with court terms) — R3.
-        # Phase 3 — page the search (free: one budget unit covers all pages) and lift the
-        # per-query doc cap so a recall query surfaces a wider candidate net.
-        result = ik_search(query=query, pagenum=0, maxpages=settings.ik_search_maxpages,
-                           doctypes=doctypes, is_case_name_search=is_case_name_search) or {}
-        record_ik_call(self.run_id, self.user_id, "search", endpoint="/search/", issue_id=issue_id, success=bool(result))
+        cache = response_cache.get_response_cache()
+        key = response_cache.search_key(query, doctypes, settings.ik_search_maxpages, is_case_name_search)
+        result = cache.get("search", key) if cache is not None else None
+        if result is not None:
+            self._cache_hit("search", "/search/", issue_id=issue_id)
+        else:
+            self.budget.consume("ik_search")
+            # is_case_name_search routes a bare landmark name through IK's title:"..." path
+            # (case_metadata stays None so the title is not narrowed with court terms) — R3.
+            # Phase 3 — page the search (free: one budget unit covers all pages) and lift the
+            # per-query doc cap so a recall query surfaces a wider candidate net.
+            result = ik_search(query=query, pagenum=0, maxpages=settings.ik_search_maxpages,
+                               doctypes=doctypes, is_case_name_search=is_case_name_search) or {}
+            record_ik_call(self.run_id, self.user_id, "search", endpoint="/search/", issue_id=issue_id, success=bool(result))
+            if cache is not None and result.get("docs"):
+                cache.put("search", key, result)
         logger.debug("IK search response", extra={"details": {"run_id": self.run_id, "issue_id": issue_id, "query": query, "found": result.get("found"), "raw_response": result}})
         candidates = []
         for row in (result.get("docs") or [])[:settings.per_query_doc_cap]:
@@ -57,12 +73,21 @@ class IndianKanoonClient:
 
     def fetch_fragment(self, candidate: Candidate) -> Candidate:
         from services.indian_kanoon import ik_fetch_docfragment
-        self.budget.consume("ik_fragment")
-        result = ik_fetch_docfragment(candidate.doc_id, candidate.matched_query) or {}
-        # ik_fetch_docfragment retries simplified queries when IK's boolean fragment evaluator
-        # errors; bill every real HTTP call it made (default 1) so cost tracking stays honest.
-        http_calls = result.pop("_ik_http_calls", 1) if isinstance(result, dict) else 1
-        record_ik_call(self.run_id, self.user_id, "fragment", endpoint=f"/docfragment/{candidate.doc_id}/", candidate_doc_id=candidate.doc_id, issue_id=candidate.matched_issue_id, success=bool(result), quantity=http_calls)
+        endpoint = f"/docfragment/{candidate.doc_id}/"
+        cache = response_cache.get_response_cache()
+        key = response_cache.fragment_key(candidate.doc_id, candidate.matched_query)
+        result = cache.get("fragment", key) if cache is not None else None
+        if result is not None:
+            self._cache_hit("fragment", endpoint, candidate.doc_id, candidate.matched_issue_id)
+        else:
+            self.budget.consume("ik_fragment")
+            result = ik_fetch_docfragment(candidate.doc_id, candidate.matched_query) or {}
+            # ik_fetch_docfragment retries simplified queries when IK's boolean fragment evaluator
+            # errors; bill every real HTTP call it made (default 1) so cost tracking stays honest.
+            http_calls = result.pop("_ik_http_calls", 1) if isinstance(result, dict) else 1
+            record_ik_call(self.run_id, self.user_id, "fragment", endpoint=endpoint, candidate_doc_id=candidate.doc_id, issue_id=candidate.matched_issue_id, success=bool(result), quantity=http_calls)
+            if cache is not None and result.get("headline"):
+                cache.put("fragment", key, result)
         logger.debug("IK fragment response", extra={"details": {"run_id": self.run_id, "doc_id": candidate.doc_id, "raw_response": result}})
         candidate.fragment = strip_html(_as_text(result.get("headline")))
         candidate.metadata["fragment_data"] = result
@@ -70,9 +95,18 @@ class IndianKanoonClient:
 
     def fetch_meta(self, candidate: Candidate) -> Candidate:
         from services.indian_kanoon import ik_fetch_docmeta
-        self.budget.consume("ik_meta")
-        result = ik_fetch_docmeta(candidate.doc_id) or {}
-        record_ik_call(self.run_id, self.user_id, "meta", endpoint=f"/docmeta/{candidate.doc_id}/", candidate_doc_id=candidate.doc_id, issue_id=candidate.matched_issue_id, success=bool(result))
+        endpoint = f"/docmeta/{candidate.doc_id}/"
+        cache = response_cache.get_response_cache()
+        key = response_cache.meta_key(candidate.doc_id)
+        result = cache.get("meta", key) if cache is not None else None
+        if result is not None:
+            self._cache_hit("meta", endpoint, candidate.doc_id, candidate.matched_issue_id)
+        else:
+            self.budget.consume("ik_meta")
+            result = ik_fetch_docmeta(candidate.doc_id) or {}
+            record_ik_call(self.run_id, self.user_id, "meta", endpoint=endpoint, candidate_doc_id=candidate.doc_id, issue_id=candidate.matched_issue_id, success=bool(result))
+            if cache is not None and result.get("title"):
+                cache.put("meta", key, result)
         logger.debug("IK metadata response", extra={"details": {"run_id": self.run_id, "doc_id": candidate.doc_id, "raw_response": result}})
         candidate.metadata["meta_data"] = result
         candidate.title = strip_html(str(result.get("title") or candidate.title))
@@ -0,0 +1,175 @@
+"""
+Cross-run cache for the paid Indian Kanoon search / docfragment / docmeta calls.
+
+The same queries and the same landmark judgments recur across runs (re-runs of a case,
+dual-perspective runs, common doctrines), and every repeat used to be billed again.
+
+Key design:
+- Two tiers: an in-process LRU (per worker) in front of the shared ``ik_response_cache``
+  Postgres table, so every worker and every restart reuses a response.
+- TTL per endpoint: search results go stale as IK indexes new judgments, while a
+  fragment for (doc, query) and a doc's metadata practically never change.
+- Keys are built from the endpoint plus the NORMALISED request: whitespace collapsed,
+  terms lowercased (IK's boolean operators ANDD/ORR/NOTT keep their case — lowercased
+  they become plain words), doctypes sorted, plus maxpages and the case-name flag.
+- Only successful (non-empty) responses are stored; every failure in the DB tier
+  degrades to a miss — caching must never break a run.
+- Entries are held as JSON text, so each hit hands the caller fresh dicts it may mutate.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_IK_OPERATORS = {"ANDD", "ORR", "NOTT"}
+_WS_RE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    tokens = _WS_RE.sub(" ", str(query or "")).strip().split(" ")
+    return " ".join(tok if tok in _IK_OPERATORS else tok.lower() for tok in tokens if tok)
+
+
+def normalize_doctypes(doctypes: str | None) -> str:
+    parts = {p.strip().lower() for p in str(doctypes or "").split(",")}
+    return ",".join(sorted(p for p in parts if p))
+
+
+def _digest(*parts: Any) -> str:
+    return hashlib.sha256("\x1f".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+
+
+def search_key(query: str, doctypes: str | None, maxpages: int, is_case_name_search: bool = False) -> str:
+    return "search:" + _digest(normalize_query(query), normalize_doctypes(doctypes), int(maxpages), bool(is_case_name_search))
+
+
+def fragment_key(doc_id: str, query: str) -> str:
+    return "fragment:" + _digest(str(doc_id).strip(), normalize_query(query))
+
+
+def meta_key(doc_id: str) -> str:
+    return "meta:" + str(doc_id).strip()
+
+
+def endpoint_ttls() -> dict[str, int]:
+    return {
+        "search": settings.ik_cache_search_ttl_seconds,
+        "fragment": settings.ik_cache_fragment_ttl_seconds,
+        "meta": settings.ik_cache_meta_ttl_seconds,
+    }
+
+
+def _db_get(cache_key: str) -> Any:
+    from db.client import ik_response_cache_get
+    return ik_response_cache_get(cache_key)
+
+
+def _db_put(cache_key: str, endpoint: str, response: Any, ttl_seconds: int) -> None:
+    from db.client import ik_response_cache_put
+    ik_response_cache_put(cache_key, endpoint, response, ttl_seconds)
+
+
+class IKResponseCache:
+    """In-process LRU (entry-count bounded, per-entry expiry) over an optional shared store."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttls: dict[str, int],
+        store_get: Callable[[str], Any] | None = _db_get,
+        store_put: Callable[[str, str, Any, int], None] | None = _db_put,
+    ) -> None:
+        self._max_entries = max(0, int(max_entries))
+        self._ttls = dict(ttls)
+        self._store_get = store_get
+        self._store_put = store_put
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, endpoint: str, key: str) -> Any:
+        """Return a fresh copy of the cached response, or None on a miss/expiry."""
+        if self._ttls.get(endpoint, 0) <= 0:
+            return None
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    return json.loads(entry[1])
+                del self._entries[key]
+        if self._store_get is None:
+            return None
+        try:
+            response = self._store_get(key)
+        except Exception as exc:
+            logger.warning("[IK_RESPONSE_CACHE] store read failed for %s: %s", key, exc)
+            return None
+        if not response:
+            return None
+        # The shared row's own expiry is authoritative; locally keep it at most one TTL.
+        self._remember(key, json.dumps(response), now + self._ttls[endpoint])
+        return response
+
+    def put(self, endpoint: str, key: str, response: Any) -> None:
+        ttl = self._ttls.get(endpoint, 0)
+        if ttl <= 0 or not response:
+            return
+        try:
+            payload = json.dumps(response)
+        except (TypeError, ValueError) as exc:
+            logger.debug("[IK_RESPONSE_CACHE] response for %s is not JSON-serialisable: %s", key, exc)
+            return
+        self._remember(key, payload, time.time() + ttl)
+        if self._store_put is None:
+            return
+        try:
+            self._store_put(key, endpoint, json.loads(payload), ttl)
+        except Exception as exc:
+            logger.warning("[IK_RESPONSE_CACHE] store write failed for %s: %s", key, exc)
+
+    def _remember(self, key: str, payload: str, expires_at: float) -> None:
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (expires_at, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+_cache: IKResponseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> IKResponseCache | None:
+    """Process-wide cache, or None when CITATION_IK_RESPONSE_CACHE is off."""
+    global _cache
+    if not settings.ik_response_cache_enabled:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = IKResponseCache(settings.ik_response_cache_memory_entries, endpoint_ttls())
+    return _cache
+
+
+def set_response_cache(cache: IKResponseCache | None) -> None:
+    """Replace the process-wide cache (``None`` rebuilds from settings on next use)."""
+    global _cache
+    with _cache_lock:
+        _cache = cache
@@ -199,6 +199,11 @@ def run_v2_pipeline(
             "full_docs_fetched_count": context.timings.get("_full_docs_count", 0),
             "cite_graph_harvested_count": context.timings.get("_cite_graph_harvested", 0),
             "cite_graph_promoted_count": context.timings.get("_cite_graph_promoted", 0),
+            "semantic_doc_cache_hits": context.timings.get("_semantic_doc_cache_hits", 0),
+            "semantic_doc_embedded": context.timings.get("_semantic_doc_embedded", 0),
+            "semantic_query_cache_hits": context.timings.get("_semantic_query_cache_hits", 0),
+            "semantic_embed_tokens": context.timings.get("_semantic_embed_tokens", 0),
+            "semantic_embed_tokens_saved": context.timings.get("_semantic_embed_tokens_saved", 0),
             "ai_judged_count": len(context.shortlisted),
             "recommended_count": len(supporting),
             "adverse_count": len(adverse),
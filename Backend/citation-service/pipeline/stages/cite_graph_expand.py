@@ -16,6 +16,11 @@ merge the survivors into the shortlist so the AI judge + disposition see them al
 seeds. The relevance floor + the existing disposition veto guard against tangential and
 overruled authorities.
 
+Global evidence: every judgment ever full-doc'd feeds the persistent citation graph
+(services.citation_graph). Neighbours with equal seed support are ranked by how many OTHER stored
+judgments co-cite them with the seeds, then by how often they are cited at all, and obscure
+single-seed neighbours are not promoted once that graph is warm.
+
 Cost: harvesting is free (rows already in doc_data); each PROMOTED cite costs one /doc/ fetch,
 bounded by cite_graph_max_promote and the remaining ik_full_doc budget. Gated by
 settings.enable_cite_graph_expansion for easy A/B against the keyword-only baseline.
@@ -34,6 +39,7 @@ from integrations.indian_kanoon.client import IndianKanoonClient
 from models.citation_models import Candidate
 from pipeline.pipeline_context import PipelineContext
 from pipeline.stages.shortlist_candidates import _collapse_common_orders
+from services.citation_graph import CitationGraph, get_citation_graph_store
 from services.scoring_service import score
 from services.semantic_service import case_similarity_scores
 
@@ -60,12 +66,24 @@ def _looks_like_statute(title: str) -> bool:
     return bool(_STATUTE_RX.search(t))
 
 
-def _harvest(seeds: list[Candidate], seen: set[str]) -> dict[str, dict[str, Any]]:
+def _global_graph() -> CitationGraph | None:
+    try:
+        store = get_citation_graph_store()
+        return store.graph() if store is not None else None
+    except Exception:
+        logger.warning("[CITE_GRAPH] citation graph store unavailable; ranking on seed evidence only", exc_info=True)
+        return None
+
+
+def _harvest(seeds: list[Candidate], seen: set[str],
+             graph: CitationGraph | None = None) -> dict[str, dict[str, Any]]:
     """Collect cite/citedby neighbours of the seeds, keyed by tid, with a co-citation count.
 
     `support` = how many distinct seeds reference this neighbour (the co-citation vote).
     `outbound` = at least one seed CITES it (a relied-upon authority — ranked above pure
     citedby neighbours, which are merely later cases citing a seed).
+    `cocited` / `in_degree` = global evidence from the persistent citation graph: stored
+    judgments citing a seed AND this neighbour / citing this neighbour at all (0 without a graph).
     """
     harvested: dict[str, dict[str, Any]] = {}
     for seed in seeds:
@@ -92,9 +110,18 @@ def _harvest(seeds: list[Candidate], seen: set[str]) -> dict[str, dict[str, Any]
                 entry["support"] += 1
                 entry["best_conf"] = max(entry["best_conf"], float(getattr(seed, "confidence", 0.0) or 0.0))
                 entry["outbound"] = entry["outbound"] or is_outbound
+    evidence = graph.evidence([seed.doc_id for seed in seeds], harvested) if graph is not None else {}
+    for tid, entry in harvested.items():
+        entry["cocited"], entry["in_degree"] = evidence.get(tid, (0, 0))
     return harvested
 
 
+def _low_value(entry: dict[str, Any]) -> bool:
+    """One seed's stray reference that the wider graph does not corroborate."""
+    return (entry["support"] < 2 and entry["cocited"] == 0
+            and entry["in_degree"] < settings.cite_graph_min_global_citations)
+
+
 def run(context: PipelineContext, client: IndianKanoonClient):
     if not settings.enable_cite_graph_expansion or not context.shortlisted:
         return context.shortlisted
@@ -106,18 +133,28 @@ def run(context: PipelineContext, client: IndianKanoonClient):
     seen |= {c.doc_id for c in context.rejected}
     seen |= set(context.excluded_doc_ids or set())
 
-    harvested = _harvest(seeds, seen)
+    graph = _global_graph()
+    harvested = _harvest(seeds, seen, graph)
     if not harvested:
         logger.info("[JURINEX][%s][CITE_GRAPH] no promotable neighbours in seed cite graph", context.run_id[:8])
         return context.shortlisted
 
-    # Rank: most co-cited first; relied-upon authorities (outbound) ahead of later citers;
-    # break ties by the strongest seed that referenced it.
+    # Rank: most co-cited by this run's seeds first, then by other stored judgments citing
+    # them alongside the seeds; relied-upon authorities (outbound) ahead of later citers;
+    # then global citation count, and finally the strongest seed that referenced it.
     ranked = sorted(
         harvested.values(),
-        key=lambda e: (e["support"], e["outbound"], e["best_conf"]),
+        key=lambda e: (e["support"], e["cocited"], e["outbound"], e["in_degree"], e["best_conf"]),
         reverse=True,
     )
+    if graph is not None and graph.node_count >= settings.cite_graph_store_warm_nodes:
+        kept_ranked = [e for e in ranked if not _low_value(e)]
+        context.timings["_cite_graph_low_value_skipped"] = len(ranked) - len(kept_ranked)
+        ranked = kept_ranked
+        if not ranked:
+            logger.info("[JURINEX][%s][CITE_GRAPH] %d neighbours, none corroborated by the citation graph",
+                        context.run_id[:8], len(harvested))
+            return context.shortlisted
 
     # Promotions share the ik_full_doc budget with the seed shortlist — only take what's left.
     used = context.budget.counts.get("ik_full_doc", 0)
@@ -172,7 +209,8 @@ def run(context: PipelineContext, client: IndianKanoonClient):
 
     # Score promoted cites (semantic uses the full_text ratio slice). The relevance floor
     # culls tangential/overruled neighbours before they reach the judge.
-    sims = case_similarity_scores(context.case_context, enriched, context.run_id, context.user_id, context.issues)
+    sims = case_similarity_scores(context.case_context, enriched, context.run_id, context.user_id, context.issues,
+                                  stats=context.timings)
     issues_by_id = {issue.issue_id: issue for issue in context.issues}
     fallback_issue = context.issues[0] if context.issues else None
     kept: list[Candidate] = []
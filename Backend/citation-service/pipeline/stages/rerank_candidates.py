@@ -84,6 +84,7 @@ def run(context: PipelineContext):
     # point candidates carry only title/headline, so this is a cheap pre-enrichment cull.
     sims = case_similarity_scores(
         context.case_context, candidates, context.run_id, context.user_id, context.issues,
+        stats=context.timings,
     )
 
     scores: dict = {}
@@ -9,6 +9,7 @@ def run(context: PipelineContext):
     # Empty dict means embeddings unavailable → scoring falls back to lexical.
     sims = case_similarity_scores(
         context.case_context, context.candidates, context.run_id, context.user_id, context.issues,
+        stats=context.timings,
     )
     scored = []
     for candidate in context.candidates:
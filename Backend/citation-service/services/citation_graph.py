@@ -0,0 +1,345 @@
+"""
+Persistent citation graph (tid -> cites / citedby) shared by every run's cite-graph expansion.
+
+Every full document fetched from Indian Kanoon carries its citeList / citedbyList. ik_asset_upsert
+persists those rows as directed edges (citing tid -> cited tid) in ik_citation_edges, so the
+graph keeps growing across runs instead of being rebuilt from the current seeds only.
+
+Key design:
+- CitationGraph is an immutable CSR snapshot: node tids, out-edge and in-edge index arrays
+  (int32) with int64 row pointers, and the precomputed in-degree of every node (how many
+  stored judgments cite it — global authority evidence).
+- Co-citation evidence for a seed set is computed from the CSR in one vectorised pass: the
+  stored judgments that cite any seed, then how many of them also cite each neighbour.
+- On disk the snapshot is one .npz (arrays + UTF-8 string blobs with offsets), written
+  atomically and shared by every worker on the host; Postgres stays the source of truth
+  and is re-read once the snapshot is older than the refresh interval.
+- Edges written in this process since the snapshot are kept as a delta and merged into the
+  CSR on the next read, so a run sees the cites of judgments fetched moments earlier. The
+  merge inserts only the new edges into the sorted rows; it never re-sorts the whole graph.
+- Every failure degrades to an empty graph — ranking then falls back to local evidence.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Iterable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Edge = tuple[str, str]
+EdgeLoader = Callable[[], "tuple[list[Edge], dict[str, str]] | None"]
+
+
+def _row_tid(row: Any) -> str:
+    row = row or {}
+    return str(row.get("tid") or row.get("id") or "").strip() if isinstance(row, dict) else ""
+
+
+def asset_edges(
+    doc_id: str,
+    title: str = "",
+    cite_list: list | None = None,
+    cited_by_list: list | None = None,
+    raw_api_response: dict | None = None,
+) -> tuple[list[Edge], dict[str, str]]:
+    """Directed (citing, cited) edges and {tid: title} for one IK asset."""
+    doc_id = str(doc_id or "").strip()
+    doc_data = (raw_api_response or {}).get("doc_data") or {}
+    cites = cite_list or doc_data.get("cites") or doc_data.get("citeList") or []
+    citedby = cited_by_list or doc_data.get("citedby") or doc_data.get("citedbyList") or []
+    edges: list[Edge] = []
+    titles: dict[str, str] = {}
+    if not doc_id:
+        return edges, titles
+    title = str(title or doc_data.get("title") or "").strip()
+    if title:
+        titles[doc_id] = title
+    for outbound, rows in ((True, cites), (False, citedby)):
+        for row in rows or []:
+            tid = _row_tid(row)
+            if not tid or tid == doc_id:
+                continue
+            edges.append((doc_id, tid) if outbound else (tid, doc_id))
+            row_title = str(row.get("title") or "").strip()
+            if row_title:
+                titles.setdefault(tid, row_title)
+    return edges, titles
+
+
+def _csr(rows: np.ndarray, cols: np.ndarray, n: int) -> tuple[np.ndarray, np.ndarray]:
+    order = np.lexsort((cols, rows))
+    ptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=ptr[1:])
+    return ptr, cols[order].astype(np.int32)
+
+
+def _csr_insert(ptr: np.ndarray, idx: np.ndarray, rows: np.ndarray, cols: np.ndarray,
+                n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Insert (rows, cols) into a CSR with sorted rows, growing it to `n` rows.
+
+    The pairs must be new and sorted by (row, col); every row stays sorted, so the result is
+    what _csr would build from scratch.
+    """
+    ptr = np.concatenate([ptr, np.full(n + 1 - ptr.size, ptr[-1], dtype=np.int64)])
+    if rows.size == 0:
+        return ptr, idx
+    at = np.fromiter(
+        (ptr[r] + np.searchsorted(idx[ptr[r]:ptr[r + 1]], c) for r, c in zip(rows.tolist(), cols.tolist())),
+        dtype=np.int64, count=rows.size,
+    )
+    grown = ptr.copy()
+    grown[1:] += np.cumsum(np.bincount(rows, minlength=n))
+    return grown, np.insert(idx, at, cols.astype(np.int32))
+
+
+def _gather(ptr: np.ndarray, idx: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+    """Concatenate the CSR rows of `nodes` without a Python loop."""
+    starts = ptr[nodes]
+    lens = ptr[nodes + 1] - starts
+    total = int(lens.sum())
+    if total == 0:
+        return np.empty(0, dtype=idx.dtype)
+    offsets = np.repeat(starts - (np.cumsum(lens) - lens), lens) + np.arange(total)
+    return idx[offsets]
+
+
+def _pack_strings(values: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    encoded = [v.encode("utf-8") for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _unpack_strings(blob: np.ndarray, offsets: np.ndarray) -> list[str]:
+    raw = blob.tobytes()
+    bounds = offsets.tolist()
+    return [raw[a:b].decode("utf-8") for a, b in zip(bounds, bounds[1:])]
+
+
+def _intern(tids: list[str], names: list[str], index: dict[str, int],
+            edges: Iterable[Edge], titles: dict[str, str]) -> np.ndarray:
+    """Give every tid in `edges`/`titles` a node id (appending to tids/names/index in place).
+
+    Returns the edges as an (m, 2) int64 array of node ids; self-loops and blanks are dropped.
+    """
+    def _node(tid: str) -> int:
+        i = index.get(tid)
+        if i is None:
+            i = index[tid] = len(tids)
+            tids.append(tid)
+            names.append("")
+        return i
+
+    pairs = [(_node(a), _node(b)) for a, b in edges if a and b and a != b]
+    for tid, title in titles.items():
+        i = _node(tid)
+        if not names[i]:
+            names[i] = title
+    return np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+
+
+class CitationGraph:
+    """Immutable CSR citation graph over IK tids."""
+
+    def __init__(self, tids: list[str], titles: list[str], src: np.ndarray, dst: np.ndarray) -> None:
+        n = len(tids)
+        self.tids = tids
+        self.titles = titles
+        self.index = {tid: i for i, tid in enumerate(tids)}
+        if src.size:
+            keys = np.unique(src.astype(np.int64) * max(n, 1) + dst.astype(np.int64))
+            src, dst = keys // max(n, 1), keys % max(n, 1)
+        self.out_ptr, self.out_idx = _csr(src, dst, n)
+        self.in_ptr, self.in_idx = _csr(dst, src, n)
+        self.in_degree = np.diff(self.in_ptr).astype(np.int32)
+
+    @property
+    def node_count(self) -> int:
+        return len(self.tids)
+
+    @property
+    def edge_count(self) -> int:
+        return int(self.out_idx.size)
+
+    @classmethod
+    def empty(cls) -> "CitationGraph":
+        return cls([], [], np.empty(0, np.int64), np.empty(0, np.int64))
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Edge], titles: dict[str, str] | None = None) -> "CitationGraph":
+        tids: list[str] = []
+        names: list[str] = []
+        pairs = _intern(tids, names, {}, edges, titles or {})
+        return cls(tids, names, pairs[:, 0], pairs[:, 1])
+
+    def merged(self, edges: Iterable[Edge], titles: dict[str, str]) -> "CitationGraph":
+        """A new graph with `edges` and `titles` added (existing titles win).
+
+        Only the edges the snapshot lacks are inserted into its rows, so a small delta costs
+        a copy of the arrays rather than a re-sort of every edge.
+        """
+        tids = list(self.tids)
+        names = list(self.titles)
+        index = dict(self.index)
+        new = np.unique(_intern(tids, names, index, edges, titles), axis=0)
+        known = self.node_count
+        new = new[np.fromiter(
+            (a >= known or b >= known or not self.has_edge(a, b) for a, b in new.tolist()),
+            dtype=bool, count=len(new),
+        )]
+        n = len(tids)
+        graph = CitationGraph.__new__(CitationGraph)
+        graph.tids, graph.titles, graph.index = tids, names, index
+        graph.out_ptr, graph.out_idx = _csr_insert(self.out_ptr, self.out_idx, new[:, 0], new[:, 1], n)
+        flipped = new[np.lexsort((new[:, 0], new[:, 1]))]
+        graph.in_ptr, graph.in_idx = _csr_insert(self.in_ptr, self.in_idx, flipped[:, 1], flipped[:, 0], n)
+        graph.in_degree = np.diff(graph.in_ptr).astype(np.int32)
+        return graph
+
+    def has_edge(self, src: int, dst: int) -> bool:
+        row = self.out_idx[self.out_ptr[src]:self.out_ptr[src + 1]]
+        i = int(np.searchsorted(row, dst))
+        return i < row.size and int(row[i]) == dst
+
+    def title(self, tid: str) -> str:
+        i = self.index.get(tid)
+        return self.titles[i] if i is not None else ""
+
+    def evidence(self, seed_tids: Iterable[str], tids: Iterable[str]) -> dict[str, tuple[int, int]]:
+        """{tid: (cocited, in_degree)} for each requested tid known to the graph.
+
+        cocited  = stored judgments (other than the seeds) citing a seed AND the tid.
+        in_degree = stored judgments citing the tid.
+        """
+        wanted = [(tid, self.index[tid]) for tid in tids if tid in self.index]
+        if not wanted:
+            return {}
+        seeds = np.fromiter((self.index[s] for s in set(seed_tids) if s in self.index), dtype=np.int64)
+        cocited = np.zeros(self.node_count, dtype=np.int64)
+        if seeds.size:
+            citing = np.setdiff1d(_gather(self.in_ptr, self.in_idx, seeds), seeds)
+            if citing.size:
+                cocited = np.bincount(_gather(self.out_ptr, self.out_idx, citing), minlength=self.node_count)
+        return {tid: (int(cocited[i]), int(self.in_degree[i])) for tid, i in wanted}
+
+    def save(self, path: str) -> None:
+        tid_blob, tid_off = _pack_strings(self.tids)
+        title_blob, title_off = _pack_strings(self.titles)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as fh:
+            np.savez(fh, tid_blob=tid_blob, tid_off=tid_off, title_blob=title_blob, title_off=title_off,
+                     out_ptr=self.out_ptr, out_idx=self.out_idx)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "CitationGraph":
+        with np.load(path) as data:
+            tids = _unpack_strings(data["tid_blob"], data["tid_off"])
+            titles = _unpack_strings(data["title_blob"], data["title_off"])
+            out_ptr, out_idx = data["out_ptr"], data["out_idx"]
+        src = np.repeat(np.arange(len(tids), dtype=np.int64), np.diff(out_ptr))
+        return cls(tids, titles, src, out_idx.astype(np.int64))
+
+
+def _load_from_db() -> tuple[list[Edge], dict[str, str]] | None:
+    from db.client import ik_citation_edges_load
+    return ik_citation_edges_load()
+
+
+class CitationGraphStore:
+    """Process-wide holder of the current snapshot plus edges recorded since."""
+
+    def __init__(self, path: str, loader: EdgeLoader = _load_from_db, refresh_seconds: int = 3600) -> None:
+        self.path = path
+        self._loader = loader
+        self._refresh_seconds = max(1, int(refresh_seconds))
+        self._graph: CitationGraph | None = None
+        self._loaded_at = 0.0
+        self._pending_edges: list[Edge] = []
+        self._pending_titles: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def record(self, edges: list[Edge], titles: dict[str, str]) -> None:
+        if not edges and not titles:
+            return
+        with self._lock:
+            self._pending_edges.extend(edges)
+            for tid, title in titles.items():
+                self._pending_titles.setdefault(tid, title)
+
+    def graph(self) -> CitationGraph:
+        with self._lock:
+            if self._graph is None or time.monotonic() - self._loaded_at > self._refresh_seconds:
+                self._graph = self._load()
+                self._loaded_at = time.monotonic()
+            if self._pending_edges or self._pending_titles:
+                self._graph = self._graph.merged(self._pending_edges, self._pending_titles)
+                self._pending_edges, self._pending_titles = [], {}
+            return self._graph
+
+    def _load(self) -> CitationGraph:
+        try:
+            if time.time() - os.path.getmtime(self.path) <= self._refresh_seconds:
+                return CitationGraph.load(self.path)
+        except OSError:
+            pass
+        except Exception as exc:
+            logger.warning("[CITE_GRAPH_STORE] unreadable snapshot %s: %s", self.path, exc)
+        started = time.monotonic()
+        try:
+            loaded = self._loader()
+        except Exception as exc:
+            logger.warning("[CITE_GRAPH_STORE] edge load failed: %s", exc)
+            loaded = None
+        if not loaded or not loaded[0]:
+            return CitationGraph.empty()
+        graph = CitationGraph.from_edges(*loaded)
+        try:
+            graph.save(self.path)
+        except OSError as exc:
+            logger.warning("[CITE_GRAPH_STORE] snapshot write failed (%s): %s", self.path, exc)
+        logger.info("[CITE_GRAPH_STORE] built snapshot nodes=%d edges=%d in %.2fs",
+                    graph.node_count, graph.edge_count, time.monotonic() - started)
+        return graph
+
+
+def _default_path() -> str:
+    return os.path.join(tempfile.gettempdir(), "citation-service", "citation_graph.npz")
+
+
+_store: CitationGraphStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_citation_graph_store() -> CitationGraphStore | None:
+    """Process-wide store, or None when CITATION_V2_CITE_GRAPH_STORE is off."""
+    global _store
+    from core.config import settings
+    if not settings.cite_graph_store_enabled:
+        return None
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = CitationGraphStore(settings.cite_graph_store_path or _default_path(),
+                                            refresh_seconds=settings.cite_graph_store_refresh_seconds)
+    return _store
+
+
+def set_citation_graph_store(store: CitationGraphStore | None) -> None:
+    global _store
+    with _store_lock:
+        _store = store
+
+
+def record_edges(edges: list[Edge], titles: dict[str, str]) -> None:
+    """Feed a freshly upserted asset's edges into the live graph (no-op until a store is in use)."""
+    if _store is not None:
+        _store.record(edges, titles)
@@ -75,6 +75,7 @@ def record_ik_call(
     issue_id: str = "",
     success: bool = True,
     quantity: int = 1,
+    cached: bool = False,
 ) -> None:
     from utils.pricing import IK_DOCUMENT_INR, IK_FRAGMENT_INR, IK_META_INR, IK_SEARCH_INR
     from utils.usage_tracker import record
@@ -89,6 +90,12 @@ def record_ik_call(
     # quantity > 1 when one logical enrichment made several real HTTP calls (e.g. docfragment
     # boolean-query retries) — bill every real call so cost stays 100% real.
     cost = unit_cost * quantity
+    # A response served from the IK response cache is free: record it as "<op>_cache_hit"
+    # at zero cost (so hit counts and paid call counts stay separate) with the INR it saved.
+    saved_cost = 0.0
+    if cached:
+        saved_cost, cost = cost, 0.0
+        operation = f"{operation}_cache_hit"
     metadata = {
         "run_id": run_id,
         "provider": "indian_kanoon",
@@ -103,6 +110,8 @@ def record_ik_call(
         "issue_id": issue_id,
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "success": success,
+        "cache_hit": cached,
+        "saved_cost_inr": saved_cost,
     }
     record(run_id, user_id, "indian_kanoon", operation, quantity=quantity, unit="calls", cost_inr=cost, metadata=metadata)
     logger.info("Provider cost recorded", extra={"details": metadata})
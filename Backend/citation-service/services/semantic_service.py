@@ -1,10 +1,28 @@
+"""
+Semantic (embedding) relevance of candidates against the case and its issues.
+
+Key design:
+- Query side (issue texts + whole-case text) is embedded with RETRIEVAL_QUERY through
+  db.client's content-hash cache, so rerank, scoring and cite-graph expansion embed each
+  query text once.
+- Candidate side (the ratio slice) is embedded with RETRIEVAL_DOCUMENT and persisted in
+  ik_doc_embeddings per (doc_id, slice hash, model), so a judgment recurring across runs is
+  never re-embedded. Only texts that actually reach Gemini (db.client reports them) are billed.
+- Similarity is one matrix product of L2-normalised candidate and query matrices, then each
+  candidate picks the column of its own issue (or the case vector).
+- Cache/embedding counters are accumulated into the caller's `stats` (context.timings).
+"""
+
 from __future__ import annotations
 
+import hashlib
 import logging
-import math
 import os
 import re
 
+import numpy as np
+
+from core.config import settings
 from models.citation_models import Candidate
 from models.issue_models import IssueCard
 
@@ -17,13 +35,73 @@ _ISSUE_QUERY_CHARS = int(os.environ.get("CITATION_V2_SEMANTIC_ISSUE_CHARS", "200
 _HELD_RX = re.compile(r"\b(held\s+that|it\s+is\s+held|we\s+hold|the\s+ratio|HELD)\b", re.IGNORECASE)
 
 
-def _cosine(a: list[float], b: list[float]) -> float:
-    if not a or not b:
-        return 0.0
-    dot = sum(x * y for x, y in zip(a, b))
-    na = math.sqrt(sum(x * x for x in a))
-    nb = math.sqrt(sum(y * y for y in b))
-    return (dot / (na * nb)) if na and nb else 0.0
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _est_tokens(texts: list[str]) -> int:
+    return sum(len(t) for t in texts) // 4  # ~4 chars/token
+
+
+def _bump(stats: dict | None, key: str, value: int) -> None:
+    if stats is not None and value:
+        stats[key] = stats.get(key, 0) + value
+
+
+def _unit_rows(vectors: list[list[float]], dims: int) -> np.ndarray:
+    """Stack vectors as L2-normalised rows; empty or wrong-sized vectors become zero rows."""
+    mat = np.zeros((len(vectors), dims), dtype=np.float32)
+    for i, vec in enumerate(vectors):
+        if len(vec) == dims:
+            mat[i] = vec
+    norms = np.linalg.norm(mat, axis=1, keepdims=True)
+    np.divide(mat, norms, out=mat, where=norms > 0)
+    return mat
+
+
+def _query_vectors(texts: list[str], embed, stats: dict | None) -> list[list[float]]:
+    """Query vectors for `texts`; the embedder's cache serves repeats, only misses are billed."""
+    sent: list[str] = []
+    out = embed(texts, sent=sent)
+    _bump(stats, "_semantic_query_cache_hits", len(texts) - len(sent))
+    _bump(stats, "_semantic_embed_tokens", _est_tokens(sent))
+    return [v or [] for v in out]
+
+
+def _document_vectors(items: list[Candidate], texts: list[str], embed, stats: dict | None) -> list[list[float]]:
+    """Document vectors for the candidates' ratio slices, via the persistent store when enabled."""
+    keys = [(c.doc_id or "", _text_hash(t)) for c, t in zip(items, texts)]
+    stored: dict[tuple[str, str], list[float]] = {}
+    model_key = ""
+    if settings.semantic_doc_cache_enabled:
+        try:
+            from db.client import document_embedding_model_key, ik_doc_embeddings_get
+            model_key = document_embedding_model_key()
+            stored = ik_doc_embeddings_get(sorted({k for k in keys if k[0]}), model_key)
+        except Exception:
+            logger.warning("[SEMANTIC] document embedding store unavailable", exc_info=True)
+            model_key = ""
+    out = [stored.get(k) or [] for k in keys]
+    todo: dict[tuple[str, str], str] = {}
+    for k, t, v in zip(keys, texts, out):
+        if not v:
+            todo.setdefault(k, t)
+    hits = len(items) - sum(1 for v in out if not v)
+    _bump(stats, "_semantic_doc_cache_hits", hits)
+    _bump(stats, "_semantic_embed_tokens_saved", _est_tokens([t for t, v in zip(texts, out) if v]))
+    if todo:
+        sent: list[str] = []
+        fresh = dict(zip(todo, embed(list(todo.values()), sent=sent)))
+        out = [v or fresh.get(k) or [] for k, v in zip(keys, out)]
+        _bump(stats, "_semantic_doc_embedded", len(sent))
+        _bump(stats, "_semantic_embed_tokens", _est_tokens(sent))
+        if model_key:
+            try:
+                from db.client import ik_doc_embeddings_put
+                ik_doc_embeddings_put([(k[0], k[1], v) for k, v in fresh.items() if k[0] and v], model_key)
+            except Exception:
+                logger.warning("[SEMANTIC] document embedding store write failed", exc_info=True)
+    return out
 
 
 def _ratio_slice(candidate: Candidate) -> str:
@@ -63,6 +141,7 @@ def case_similarity_scores(
     run_id: str,
     user_id: str,
     issues: list[IssueCard] | None = None,
+    stats: dict | None = None,
 ) -> dict[str, float]:
     """
     Per-issue semantic relevance. Each candidate is compared against the embedding of
@@ -83,47 +162,58 @@ def case_similarity_scores(
         logger.warning("[SEMANTIC] embedder import failed; using lexical scoring")
         return {}
 
+    local_stats: dict = {}
+
     # ── Query side: one vector per issue (+ a whole-case fallback vector) ─────────
     issue_list = list(issues or [])
     issue_ids = [iss.issue_id for iss in issue_list]
     query_texts = [_issue_query_text(iss) or case_text for iss in issue_list] + [case_text]
     try:
-        q_vecs = get_query_embeddings_batch(query_texts)
+        q_vecs = _query_vectors(query_texts, get_query_embeddings_batch, local_stats)
     except Exception:
         logger.exception("[SEMANTIC] query embedding failed; using lexical scoring")
         return {}
     if not q_vecs or not q_vecs[-1]:
         logger.info("[SEMANTIC] no case vector returned; using lexical scoring")
         return {}
-    case_vec = q_vecs[-1]
-    issue_vec = {iid: q_vecs[i] for i, iid in enumerate(issue_ids) if i < len(q_vecs) and q_vecs[i]}
+    dims = len(q_vecs[-1])
+    # Issues without a usable vector fall back to the whole-case column.
+    column = {iid: i for i, iid in enumerate(issue_ids) if len(q_vecs[i]) == dims}
 
     # ── Candidate side: ratio/holding slice embedded as a DOCUMENT ───────────────
     cand_texts = [_ratio_slice(c) for c in items]
     try:
-        c_vecs = get_document_embeddings_batch(cand_texts)
+        c_vecs = _document_vectors(items, cand_texts, get_document_embeddings_batch, local_stats)
     except Exception:
         logger.exception("[SEMANTIC] document embedding failed; using lexical scoring")
         return {}
 
-    sims: dict[str, float] = {}
-    for c, v in zip(items, c_vecs):
-        ref = issue_vec.get(c.matched_issue_id) or case_vec
-        sims[c.doc_id] = max(0.0, min(1.0, _cosine(ref, v)))
-
-    # Record embedding cost (~4 chars/token) across both batches.
-    try:
-        from utils.usage_tracker import record_gemini_embedding
-        est_tokens = max(1, (sum(len(t) for t in query_texts) + sum(len(t) for t in cand_texts)) // 4)
-        record_gemini_embedding(
-            run_id, user_id, est_tokens,
-            model=os.environ.get("GEMINI_QUERY_EMBEDDING_MODEL", "models/gemini-embedding-001"),
-        )
-    except Exception:
-        logger.debug("[SEMANTIC] embedding cost record skipped", exc_info=True)
+    # ── One matrix product: cosine of every candidate against every query vector ─
+    scores = _unit_rows(c_vecs, dims) @ _unit_rows(q_vecs, dims).T
+    ref = np.fromiter((column.get(c.matched_issue_id, len(q_vecs) - 1) for c in items),
+                      dtype=np.int64, count=len(items))
+    picked = np.clip(scores[np.arange(len(items)), ref], 0.0, 1.0)
+    sims = {c.doc_id: float(s) for c, s in zip(items, picked)}
+
+    for key, value in local_stats.items():
+        _bump(stats, key, value)
+
+    # Record embedding cost for what was actually sent to Gemini (cache hits are free).
+    spent = local_stats.get("_semantic_embed_tokens", 0)
+    if spent > 0:
+        try:
+            from utils.usage_tracker import record_gemini_embedding
+            record_gemini_embedding(
+                run_id, user_id, max(1, spent),
+                model=os.environ.get("GEMINI_QUERY_EMBEDDING_MODEL", "models/gemini-embedding-001"),
+            )
+        except Exception:
+            logger.debug("[SEMANTIC] embedding cost record skipped", exc_info=True)
 
     logger.info(
-        "[SEMANTIC] scored %d candidate(s) per-issue (%d issue vec, case_chars=%d); top=%.3f",
-        len(sims), len(issue_vec), len(case_text), max(sims.values()) if sims else 0.0,
+        "[SEMANTIC] scored %d candidate(s) per-issue (%d issue vec, case_chars=%d); top=%.3f "
+        "doc_cache_hits=%d embed_tokens=%d",
+        len(sims), len(column), len(case_text), max(sims.values()) if sims else 0.0,
+        local_stats.get("_semantic_doc_cache_hits", 0), spent,
     )
     return sims
@@ -0,0 +1,153 @@
+"""Persistent citation graph behind cite-graph expansion.
+
+Stored judgments' cite lists become a CSR graph (with an on-disk snapshot and an in-process
+delta) that gives cite_graph_expand global evidence: how many other judgments co-cite a
+neighbour with the seeds, and how often it is cited at all. These tests lock in edge
+direction, the CSR evidence maths, the snapshot round trip, the store's reload/delta
+behaviour, and the ranking + low-value skip inside cite_graph_expand.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from typing import Any
+from unittest.mock import patch
+
+import pipeline.stages.cite_graph_expand as cg
+from core.config import settings
+from models.citation_models import Candidate
+from services.citation_graph import CitationGraph, CitationGraphStore, asset_edges
+from tests.unit.test_cite_graph import _StubClient, _ctx, _fake_score, _fake_sims, _seed
+
+# D1 and D2 are earlier judgments: both cite seed S1 and neighbour A; D2 also cites B.
+_EDGES = [("D1", "S1"), ("D1", "A"), ("D2", "S1"), ("D2", "A"), ("D2", "B"),
+          ("S1", "A"), ("S1", "B"), ("X", "B"), ("Y", "B")]
+
+
+class AssetEdgeTests(unittest.TestCase):
+    def test_cites_point_out_and_citedby_point_in(self):
+        edges, titles = asset_edges(
+            "S1", "Seed v. State",
+            raw_api_response={"doc_data": {"cites": [{"tid": 7, "title": "A v. B"}, {"tid": "S1"}],
+                                           "citedbyList": [{"tid": "9", "title": "C v. D"}]}},
+        )
+        self.assertEqual(edges, [("S1", "7"), ("9", "S1")])  # self-cite dropped
+        self.assertEqual(titles, {"S1": "Seed v. State", "7": "A v. B", "9": "C v. D"})
+
+
+class CitationGraphTests(unittest.TestCase):
+    def setUp(self):
+        self.graph = CitationGraph.from_edges(_EDGES + [("D1", "A")], {"A": "A v. State"})
+
+    def test_duplicate_edges_collapse_and_in_degree_is_precomputed(self):
+        self.assertEqual(self.graph.edge_count, len(_EDGES))
+        evidence = self.graph.evidence(["S1"], ["A", "B", "unknown"])
+        # A: co-cited with S1 by D1 and D2; cited by D1, D2, S1.  B: co-cited by D2 only.
+        self.assertEqual(evidence, {"A": (2, 3), "B": (1, 4)})
+
+    def test_seeds_do_not_count_as_their_own_cociting_judgments(self):
+        self.assertEqual(self.graph.evidence(["S1", "D2"], ["B"])["B"][0], 0)
+
+    def test_snapshot_round_trip_preserves_graph_and_titles(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "graph.npz")
+            self.graph.save(path)
+            loaded = CitationGraph.load(path)
+        self.assertEqual(loaded.title("A"), "A v. State")
+        self.assertEqual(loaded.evidence(["S1"], ["A", "B"]), self.graph.evidence(["S1"], ["A", "B"]))
+
+    def test_merged_adds_edges_without_mutating_the_snapshot(self):
+        grown = self.graph.merged([("Z", "B"), ("Z", "S1")], {"Z": "Z v. Union"})
+        self.assertEqual(self.graph.evidence(["S1"], ["B"])["B"], (1, 4))
+        self.assertEqual(grown.evidence(["S1"], ["B"])["B"], (2, 5))
+
+    def test_incremental_merge_matches_a_full_rebuild(self):
+        delta = [("Z", "B"), ("D1", "A"), ("A", "D2"), ("Z", "B"), ("S1", "C"), ("C", "A")]
+        grown = self.graph.merged(delta, {})
+        rebuilt = CitationGraph.from_edges(_EDGES + delta)
+
+        def neighbours(graph, ptr, idx):
+            return {tid: {graph.tids[j] for j in idx[ptr[i]:ptr[i + 1]]} for i, tid in enumerate(graph.tids)}
+
+        self.assertEqual(grown.edge_count, rebuilt.edge_count)
+        self.assertEqual(neighbours(grown, grown.out_ptr, grown.out_idx),
+                         neighbours(rebuilt, rebuilt.out_ptr, rebuilt.out_idx))
+        self.assertEqual(neighbours(grown, grown.in_ptr, grown.in_idx),
+                         neighbours(rebuilt, rebuilt.in_ptr, rebuilt.in_idx))
+        for ptr, idx in ((grown.out_ptr, grown.out_idx), (grown.in_ptr, grown.in_idx)):
+            rows = [idx[ptr[i]:ptr[i + 1]].tolist() for i in range(grown.node_count)]
+            self.assertTrue(all(row == sorted(row) for row in rows))
+        self.assertEqual(grown.evidence(["S1"], grown.tids), rebuilt.evidence(["S1"], grown.tids))
+
+
+class CitationGraphStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "graph.npz")
+        self.loads = 0
+
+    def _loader(self):
+        self.loads += 1
+        return list(_EDGES), {}
+
+    def test_snapshot_is_shared_through_disk_and_delta_is_merged(self):
+        first = CitationGraphStore(self.path, loader=self._loader)
+        self.assertEqual(first.graph().edge_count, len(_EDGES))
+        second = CitationGraphStore(self.path, loader=self._loader)  # e.g. another worker
+        second.record([("NEW", "A")], {"NEW": "New v. Old"})
+        graph = second.graph()
+        self.assertEqual(self.loads, 1)
+        self.assertEqual(graph.evidence([], ["A"])["A"][1], 4)
+
+    def test_unavailable_database_gives_an_empty_graph(self):
+        store = CitationGraphStore(self.path, loader=lambda: None)
+        self.assertEqual(store.graph().node_count, 0)
+        self.assertFalse(os.path.exists(self.path))
+
+
+class CiteGraphRankingTests(unittest.TestCase):
+    def setUp(self):
+        for target, repl in ((cg, "case_similarity_scores"), (cg, "score")):
+            p = patch.object(target, repl, _fake_sims if repl == "case_similarity_scores" else _fake_score)
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _run(self, graph: CitationGraph, warm_nodes: int):
+        seeds = [_seed("S1", cites=[{"tid": "B", "title": "P vs Q"}, {"tid": "A", "title": "X vs Y"},
+                                    {"tid": "C", "title": "R vs S"}])]
+        ctx = _ctx(seeds)
+        client: Any = _StubClient()
+        saved = settings.cite_graph_store_warm_nodes
+        object.__setattr__(settings, "cite_graph_store_warm_nodes", warm_nodes)  # frozen dataclass
+        try:
+            with patch.object(cg, "_global_graph", return_value=graph):
+                cg.run(ctx, client)
+        finally:
+            object.__setattr__(settings, "cite_graph_store_warm_nodes", saved)
+        return ctx, client
+
+    def test_global_cocitation_breaks_ties_between_single_seed_neighbours(self):
+        harvested = cg._harvest(
+            [_seed("S1", cites=[{"tid": "B", "title": "P vs Q"}, {"tid": "A", "title": "X vs Y"}])],
+            seen={"S1"}, graph=CitationGraph.from_edges(_EDGES),
+        )
+        self.assertEqual((harvested["A"]["cocited"], harvested["B"]["cocited"]), (2, 1))
+        _ctx_, client = self._run(CitationGraph.from_edges(_EDGES), warm_nodes=10_000)
+        self.assertEqual(client.fetched[:2], ["A", "B"])
+
+    def test_warm_graph_skips_uncorroborated_neighbours(self):
+        ctx, client = self._run(CitationGraph.from_edges(_EDGES + [("S1", "C")]), warm_nodes=1)
+        self.assertNotIn("C", client.fetched)          # cited once, by the seed only
+        self.assertEqual(sorted(client.fetched), ["A", "B"])
+        self.assertEqual(ctx.timings["_cite_graph_low_value_skipped"], 1)
+
+    def test_without_a_graph_ranking_falls_back_to_seed_evidence(self):
+        _ctx_, client = self._run(CitationGraph.empty(), warm_nodes=1)
+        self.assertEqual(sorted(client.fetched), ["A", "B", "C"])
+
+
+if __name__ == "__main__":
+    unittest.main()
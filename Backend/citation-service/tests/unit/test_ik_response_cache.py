@@ -0,0 +1,160 @@
+"""Cross-run Indian Kanoon response cache.
+
+Repeat search / docfragment / docmeta calls must be served from the cache instead of being
+billed again. These tests lock in key normalisation, TTL expiry, the shared-store fallback, and
+the client wiring: a hit skips the paid budget, is counted as "<op>_cache_hit" in budget.counts
+and is recorded through record_ik_call as a zero-cost cached call.
+"""
+
+from __future__ import annotations
+
+import sys
+import types
+import unittest
+from unittest.mock import patch
+
+from core.budgets import BudgetTracker
+from integrations.indian_kanoon import response_cache
+from integrations.indian_kanoon.client import IndianKanoonClient
+from integrations.indian_kanoon.response_cache import IKResponseCache
+from models.citation_models import Candidate
+
+_TTLS = {"search": 60, "fragment": 60, "meta": 60}
+
+
+def _memory_cache(**kw) -> IKResponseCache:
+    return IKResponseCache(kw.pop("max_entries", 100), kw.pop("ttls", _TTLS), store_get=None, store_put=None, **kw)
+
+
+class _FakeIK:
+    """Stands in for services.indian_kanoon and counts real (paid) calls."""
+
+    def __init__(self):
+        self.calls: list[str] = []
+
+    def module(self) -> types.ModuleType:
+        mod = types.ModuleType("services.indian_kanoon")
+        mod.ik_search = self.ik_search
+        mod.ik_fetch_docfragment = self.ik_fetch_docfragment
+        mod.ik_fetch_docmeta = self.ik_fetch_docmeta
+        return mod
+
+    def ik_search(self, **kwargs):
+        self.calls.append("search")
+        return {"found": 1, "docs": [{"tid": 101, "title": "<b>A</b> v. B", "headline": "h"}]}
+
+    def ik_fetch_docfragment(self, doc_id, query):
+        self.calls.append("fragment")
+        return {"tid": doc_id, "headline": ["forfeiture <b>of</b> land"], "_ik_http_calls": 2}
+
+    def ik_fetch_docmeta(self, doc_id):
+        self.calls.append("meta")
+        return {"tid": doc_id, "title": "A v. B", "docsource": "Supreme Court of India", "publishdate": "2001-01-01"}
+
+
+class KeyTests(unittest.TestCase):
+    def test_search_key_normalises_whitespace_case_and_doctype_order(self):
+        base = response_cache.search_key('"forfeiture of land"  ANDD Lease', "supremecourt,bombay", 6)
+        self.assertEqual(base, response_cache.search_key('  "Forfeiture of LAND" ANDD lease ', "bombay, supremecourt", 6))
+        self.assertNotEqual(base, response_cache.search_key('"forfeiture of land" andd lease', "supremecourt,bombay", 6))
+        self.assertNotEqual(base, response_cache.search_key('"forfeiture of land" ANDD lease', "supremecourt", 6))
+        self.assertNotEqual(base, response_cache.search_key('"forfeiture of land" ANDD lease', "supremecourt,bombay", 3))
+        self.assertNotEqual(base, response_cache.search_key('"forfeiture of land" ANDD lease', "supremecourt,bombay", 6, True))
+
+
+class IKResponseCacheTests(unittest.TestCase):
+    def test_hit_returns_a_fresh_copy(self):
+        cache = _memory_cache()
+        cache.put("meta", "k", {"title": "A"})
+        first = cache.get("meta", "k")
+        first["title"] = "mutated"
+        self.assertEqual(cache.get("meta", "k"), {"title": "A"})
+
+    def test_entries_expire_after_their_endpoint_ttl(self):
+        cache = _memory_cache()
+        with patch.object(response_cache.time, "time", return_value=1000.0):
+            cache.put("search", "k", {"docs": [1]})
+        with patch.object(response_cache.time, "time", return_value=1059.0):
+            self.assertIsNotNone(cache.get("search", "k"))
+        with patch.object(response_cache.time, "time", return_value=1061.0):
+            self.assertIsNone(cache.get("search", "k"))
+
+    def test_zero_ttl_disables_an_endpoint(self):
+        cache = _memory_cache(ttls={"search": 0, "fragment": 60, "meta": 60})
+        cache.put("search", "k", {"docs": [1]})
+        self.assertIsNone(cache.get("search", "k"))
+
+    def test_lru_is_bounded(self):
+        cache = _memory_cache(max_entries=2)
+        cache.put("meta", "a", {"v": 1})
+        cache.put("meta", "b", {"v": 2})
+        cache.get("meta", "a")
+        cache.put("meta", "c", {"v": 3})
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("meta", "b"))
+
+    def test_shared_store_is_read_through_and_failures_are_misses(self):
+        store: dict = {}
+        writer = IKResponseCache(10, _TTLS, store_get=store.get,
+                                 store_put=lambda key, endpoint, response, ttl: store.__setitem__(key, response))
+        writer.put("fragment", "k", {"headline": "x"})
+        reader = IKResponseCache(10, _TTLS, store_get=store.get, store_put=None)  # another worker
+        self.assertEqual(reader.get("fragment", "k"), {"headline": "x"})
+
+        def boom(_key):
+            raise RuntimeError("db down")
+        self.assertIsNone(IKResponseCache(10, _TTLS, store_get=boom, store_put=None).get("fragment", "k"))
+
+
+class ClientCacheWiringTests(unittest.TestCase):
+    def setUp(self):
+        self.ik = _FakeIK()
+        self.recorded: list[dict] = []
+        patches = [
+            patch.dict(sys.modules, {"services.indian_kanoon": self.ik.module()}),
+            patch("integrations.indian_kanoon.client.record_ik_call",
+                  side_effect=lambda *a, **kw: self.recorded.append({"operation": a[2], **kw})),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        response_cache.set_response_cache(_memory_cache())
+        self.addCleanup(response_cache.set_response_cache, None)
+
+    def _client(self):
+        return IndianKanoonClient("run", "user", BudgetTracker())
+
+    def _candidate(self):
+        return Candidate(doc_id="101", title="A v. B", matched_issue_id="i1", matched_query="forfeiture of land")
+
+    def test_second_run_is_served_from_cache_at_zero_cost(self):
+        first, second = self._client(), self._client()
+        for client in (first, second):
+            hits = client.search("forfeiture of land", "supremecourt", "i1")
+            client.fetch_fragment(self._candidate())
+            client.fetch_meta(self._candidate())
+            self.assertEqual([c.doc_id for c in hits], ["101"])
+
+        self.assertEqual(self.ik.calls, ["search", "fragment", "meta"])
+        self.assertEqual(first.budget.counts, {"ik_search": 1, "ik_fragment": 1, "ik_meta": 1})
+        self.assertEqual(second.budget.counts,
+                         {"ik_search_cache_hit": 1, "ik_fragment_cache_hit": 1, "ik_meta_cache_hit": 1})
+        self.assertEqual(second.budget.estimated_cost_inr, 0.0)
+        self.assertEqual([r.get("cached", False) for r in self.recorded], [False] * 3 + [True] * 3)
+
+    def test_cached_fragment_matches_the_live_one(self):
+        live = self._client().fetch_fragment(self._candidate())
+        cached = self._client().fetch_fragment(self._candidate())
+        self.assertEqual(cached.fragment, live.fragment)
+        self.assertNotIn("_ik_http_calls", cached.metadata["fragment_data"])
+
+    def test_empty_search_is_not_cached(self):
+        self.ik.ik_search = lambda **kw: self.ik.calls.append("search") or {"found": 0, "docs": []}
+        with patch.dict(sys.modules, {"services.indian_kanoon": self.ik.module()}):
+            self._client().search("no such doctrine", "", "i1")
+            self._client().search("no such doctrine", "", "i1")
+        self.assertEqual(self.ik.calls, ["search", "search"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+"""Cached, matrix-scored semantic similarity.
+
+case_similarity_scores runs in rerank, scoring and cite-graph expansion of the same run, and the
+same judgments recur across runs. These tests lock in that query vectors are embedded once
+(db.client's embedding cache), candidate vectors come from the (doc_id, slice hash, model)
+store, only texts that actually reach Gemini are billed, and that the matrix product picks the
+candidate's own issue vector (case vector as fallback) with the same clamped cosine as before.
+"""
+
+from __future__ import annotations
+
+import math
+import unittest
+from unittest.mock import patch
+
+import db.client as db_client
+import utils.usage_tracker as usage_tracker
+from core.config import settings
+from models.citation_models import Candidate
+from models.issue_models import IssueCard
+from services import semantic_service
+
+_CASE = "The petitioner challenges forfeiture of an industrial plot for non-utilisation. " * 2
+
+# Deterministic 3-d vectors: queries and documents are looked up by their text.
+_VECTORS = {
+    "forfeiture": [1.0, 0.0, 0.0],
+    "change of user": [0.0, 1.0, 0.0],
+    _CASE.strip()[:8000]: [0.0, 0.0, 1.0],
+    "A v. State": [3.0, 4.0, 0.0],
+    "B v. State": [0.0, 1.0, 1.0],
+    "C v. State": [-1.0, 0.0, 0.0],
+}
+
+
+def _issue(issue_id: str, text: str) -> IssueCard:
+    return IssueCard(issue_id=issue_id, legal_issue=text, represented_side="petitioner",
+                     favorable_position_for_selected_side="", likely_opposite_position="")
+
+
+def _cand(doc_id: str, title: str, issue_id: str) -> Candidate:
+    return Candidate(doc_id=doc_id, title=title, matched_issue_id=issue_id)
+
+
+class _Embedder:
+    def __init__(self):
+        self.queries: list[str] = []
+        self.documents: list[str] = []
+        self.store: dict = {}
+        self.billed: list[int] = []
+
+    def embed(self, texts, task="query"):
+        (self.documents if task == "document" else self.queries).extend(texts)
+        return [list(_VECTORS.get(t, [])) for t in texts]
+
+    def store_get(self, keys, model_key):
+        return {k: self.store[(model_key,) + k] for k in keys if (model_key,) + k in self.store}
+
+    def store_put(self, rows, model_key):
+        for doc_id, slice_hash, vec in rows:
+            self.store[(model_key, doc_id, slice_hash)] = vec
+
+    def bill(self, run_id, user_id, tokens, model=None):
+        self.billed.append(tokens)
+
+
+class SemanticCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.fake = _Embedder()
+        patches = [
+            patch.object(db_client, "_embed_strings_gemini", self.fake.embed),
+            patch.object(db_client, "ik_doc_embeddings_get", self.fake.store_get),
+            patch.object(db_client, "ik_doc_embeddings_put", self.fake.store_put),
+            patch.object(db_client, "document_embedding_model_key", lambda: "test-model|RETRIEVAL_DOCUMENT|3"),
+            patch.object(usage_tracker, "record_gemini_embedding", self.fake.bill),
+            patch.dict(db_client._EMBED_CACHE, clear=True),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.issues = [_issue("I1", "forfeiture"), _issue("I2", "change of user")]
+        self.cands = [_cand("A", "A v. State", "I1"), _cand("B", "B v. State", "I2"),
+                      _cand("C", "C v. State", "missing-issue")]
+
+    def _score(self, run_id="run-1", stats=None):
+        return semantic_service.case_similarity_scores(_CASE, self.cands, run_id, "u", self.issues, stats=stats)
+
+    def test_matrix_scores_match_per_issue_cosine(self):
+        sims = self._score()
+        self.assertAlmostEqual(sims["A"], 0.6)               # vs I1: 3/5
+        self.assertAlmostEqual(sims["B"], 1 / math.sqrt(2))  # vs I2
+        self.assertEqual(sims["C"], 0.0)                     # unknown issue -> case vector, clamped
+
+    def test_repeat_call_in_a_run_embeds_nothing_and_bills_nothing(self):
+        stats: dict = {}
+        first = self._score(stats=stats)
+        queries, documents, billed = len(self.fake.queries), len(self.fake.documents), list(self.fake.billed)
+        second = self._score(stats=stats)
+        self.assertEqual(first, second)
+        self.assertEqual((len(self.fake.queries), len(self.fake.documents)), (queries, documents))
+        self.assertEqual(self.fake.billed, billed)
+        self.assertEqual(stats["_semantic_doc_embedded"], 3)
+        self.assertEqual(stats["_semantic_doc_cache_hits"], 3)
+        self.assertEqual(stats["_semantic_query_cache_hits"], 3)
+        self.assertGreater(stats["_semantic_embed_tokens_saved"], 0)
+
+    def test_new_run_reuses_cached_queries_and_stored_documents(self):
+        self._score(run_id="run-1")
+        self.fake.queries.clear()
+        self.fake.documents.clear()
+        self._score(run_id="run-2")
+        self.assertEqual((self.fake.queries, self.fake.documents), ([], []))
+
+    def test_only_texts_sent_to_gemini_are_billed(self):
+        db_client.get_query_embeddings_batch(["forfeiture"])    # already cached before the run
+        self.fake.queries.clear()
+        stats: dict = {}
+        self._score(stats=stats)
+        sent = self.fake.queries + self.fake.documents
+        self.assertNotIn("forfeiture", sent)
+        self.assertEqual(stats["_semantic_query_cache_hits"], 1)
+        self.assertEqual(stats["_semantic_embed_tokens"], semantic_service._est_tokens(sent))
+        self.assertEqual(self.fake.billed, [stats["_semantic_embed_tokens"]])
+
+    def test_changed_slice_is_re_embedded(self):
+        self._score()
+        self.cands[0].title = "A v. State of Gujarat"
+        self.fake.documents.clear()
+        self._score()
+        self.assertEqual(self.fake.documents, ["A v. State of Gujarat"])
+
+    def test_disabled_store_persists_nothing(self):
+        saved = settings.semantic_doc_cache_enabled
+        object.__setattr__(settings, "semantic_doc_cache_enabled", False)  # frozen dataclass
+        try:
+            self._score(run_id="run-1")
+            self._score(run_id="run-1")
+        finally:
+            object.__setattr__(settings, "semantic_doc_cache_enabled", saved)
+        self.assertEqual(len(self.fake.documents), 3)        # the in-process cache still serves
+        self.assertEqual(self.fake.store, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,7 +22,8 @@ import asyncio
 import logging
 import re
 import time
-from typing import Any
+from collections import Counter
+from typing import Any, Awaitable, Callable
 
 from google.adk.agents import LlmAgent, SequentialAgent
 from google.adk.runners import InMemoryRunner
@@ -68,7 +69,7 @@ from tools import (
     cache_storage_track,
     case_court_profile,
     citation_guardian,
-    composite_score,
+    composite_scores,
     cost_totals,
     enforce_verifier_rules,
     fact_match_signal,
@@ -80,12 +81,18 @@ from tools import (
     ik_cost_start,
     is_forum_high_court,
     judged_band,
-    keyword_signal,
+    keyword_signals,
     llm_track_usage,
+    memo_count,
+    memo_get,
+    memo_key,
+    memo_put,
     merge_cost_ledger,
     party_perspective,
     rerank,
     run_cost_log,
+    run_memo_export,
+    run_memo_start,
     shelf_present,
     statutory_shelf_patterns,
     to_ik_operators,
@@ -931,18 +938,52 @@ async def verify_judgments(issue: Issue, context: CaseContext,
             + f"JUDGMENT TEXT:\n{text}"
         )
         settings = get_settings()
+        use_claude = settings.verifier_use_claude and claude_available()
+        claude_model, gemini_model = settings.judgement_verifier_claude_model, settings.gemini_model
+
+        # Re-runs reuse the raw verdict an earlier run paid for (same issue
+        # block, same doc, same model — the model that actually produced it,
+        # so a Gemini-fallback verdict is never served as Claude's); the
+        # deterministic rules below still re-run against this run's text and
+        # shelf anchors.
+        # Counted once per candidate (reused / fresh), however many keys
+        # the lookup tried.
+        def _memoised(model: str) -> JudgmentVerification | None:
+            known = memo_get("verifications", memo_key(issue_block, cand.doc_id, model), count=False)
+            if known is None:
+                return None
+            try:
+                return JudgmentVerification.model_validate(known)
+            except ValueError:
+                logger.debug("[verifier] memoised %s verdict for %s no longer valid", model, cand.doc_id)
+                return None
+
+        def _enforced(verdict: JudgmentVerification, reused: bool) -> tuple[str, JudgmentVerification]:
+            memo_count("verifications", reused=reused)
+            return cand.doc_id, enforce_verifier_rules(verdict, cand.doc_text,
+                                                       issue.perspective, shelf_patterns)
+
+        known = _memoised(claude_model if use_claude else gemini_model)
+        if known is not None:
+            return _enforced(known, reused=True)
         verdict: JudgmentVerification | None = None
         async with semaphore:
             # Claude first (sharper on shelf/field-of-law distinctions than
             # flash); Gemini agent is the automatic fallback.
-            if settings.verifier_use_claude and claude_available():
+            if use_claude:
                 verdict = await claude_parse(
                     JUDGMENT_VERIFIER_SYSTEM, message, JudgmentVerification,
-                    max_tokens=3000, model=settings.judgement_verifier_claude_model)
-            if verdict is None:
-                # Fast path: direct Gemini call with the CACHED system
-                # prompt (billed once/hour, not per call). None → ADK path.
-                verdict = await _verify_direct_cached(message)
+                    max_tokens=3000, model=claude_model)
+                if verdict is not None:
+                    memo_put("verifications", memo_key(issue_block, cand.doc_id, claude_model),
+                             verdict.model_dump(mode="json"))
+                    return _enforced(verdict, reused=False)
+                known = _memoised(gemini_model)
+                if known is not None:
+                    return _enforced(known, reused=True)
+            # Fast path: direct Gemini call with the CACHED system
+            # prompt (billed once/hour, not per call). None → ADK path.
+            verdict = await _verify_direct_cached(message)
             if verdict is None:
                 try:
                     out = await run_agent_once(build_judgment_verifier_agent(), message,
@@ -952,9 +993,11 @@ async def verify_judgments(issue: Issue, context: CaseContext,
                 except Exception:
                     logger.exception("[verifier] doc %s failed for issue %s",
                                      cand.doc_id, issue.id)
+                    memo_count("verifications", reused=False)
                     return cand.doc_id, None
-        return cand.doc_id, enforce_verifier_rules(verdict, cand.doc_text,
-                                                   issue.perspective, shelf_patterns)
+        memo_put("verifications", memo_key(issue_block, cand.doc_id, gemini_model),
+                 verdict.model_dump(mode="json"))
+        return _enforced(verdict, reused=False)
 
     results = await asyncio.gather(*(_verify_one(c) for c in judged))
     if triage_skips["n"]:
@@ -1775,8 +1818,13 @@ async def _issue_round(issue: Issue, context: CaseContext, keywords: KeywordSet,
 
     weights = settings.phase_weights
     judge_w = settings.relevance_judge_weight
-    scored: list[ScoredResult] = []
-    for cand in pool:
+    # Columnar scoring: gather every candidate's signals first, then weight
+    # the whole pool in one composite_scores pass (per-result breakdowns
+    # ride along unchanged).
+    keyword_values = keyword_signals(pool, keywords)
+    rows: list[tuple[Candidate, float, float | None, str | None, bool]] = []
+    signal_sets: list[SignalSet] = []
+    for cand, keyword_value in zip(pool, keyword_values):
         sem = semantic.get(cand.doc_id, 0.0)
         verdict = verifications.get(cand.doc_id)
         ai, side, rejected = None, None, False
@@ -1785,7 +1833,7 @@ async def _issue_round(issue: Issue, context: CaseContext, keywords: KeywordSet,
             sem = min(1.0, (1 - judge_w) * sem + judge_w * ai)
             rejected = verdict.verdict == "reject"
             side = verdict.verdict if verdict.verdict in ("support", "contra", "interim") else None
-        auth_value, court_label = authority_signal(cand)
+        auth_value, _court_label = authority_signal(cand)
         party_value, party_label = party_perspective(cand, context)
         # The VERIFIED outcome overrides the regex party heuristic.
         if side == "support":
@@ -1795,9 +1843,9 @@ async def _issue_round(issue: Issue, context: CaseContext, keywords: KeywordSet,
         elif side == "interim":
             party_value, party_label = 0.5, "neutral"
         gl_value, gl_label = good_law_signal(cand)
-        signals = SignalSet(
+        signal_sets.append(SignalSet(
             semantic_match=round(sem, 4),
-            keyword_match=keyword_signal(cand, keywords),
+            keyword_match=keyword_value,
             ai_relevance=ai,
             authority=auth_value,
             good_law_status=gl_value,
@@ -1805,8 +1853,12 @@ async def _issue_round(issue: Issue, context: CaseContext, keywords: KeywordSet,
             party_fit=party_value,
             party_fit_label=party_label,
             fact_match=fact_match_signal(cand, context),
-        )
-        result = composite_score(signals, weights)
+        ))
+        rows.append((cand, sem, ai, side, rejected))
+
+    scored: list[ScoredResult] = composite_scores(signal_sets, weights)
+    for result, (cand, sem, ai, side, rejected) in zip(scored, rows):
+        verdict = verifications.get(cand.doc_id)
         result.doc_id = cand.doc_id
         # KILL checks (outcome unclear / wrong shelf) are a hard RED gate.
         result.band = "RED" if rejected else judged_band(band_for(sem), ai, bool(verifications))
@@ -1819,7 +1871,6 @@ async def _issue_round(issue: Issue, context: CaseContext, keywords: KeywordSet,
             result.counter_strategy = verdict.counter_strategy or None
         if cand.doc_text and result.band in ("GREEN", "YELLOW"):
             result.pinpoint, result.pinpoint_ref = find_pinpoint(cand, issue.issue, keywords)
-        scored.append(result)
 
     # Surface ONLY judgments verified relevant. When the judge ran, a result
     # must have been read and passed (ai_relevance present, band survived the
@@ -1891,6 +1942,7 @@ async def issue_fanout(issues: list[Issue], context: CaseContext,
                        curated_ids: set[str] | None = None,
                        query_style: str = "simple",
                        page_map: dict[str, dict[str, int]] | None = None,
+                       on_issue: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
                        ) -> list[dict[str, Any]]:
     """Dynamic-cardinality fan-out: one per-issue pipeline per issue, run
     concurrently. IK rate limiting is enforced inside the shared client
@@ -1901,7 +1953,10 @@ async def issue_fanout(issues: list[Issue], context: CaseContext,
     query → last page}). Each issue advances only the pages IT has used: an
     issue that never fetched a query starts at page one even when another
     issue already used that query (whose page-one fetch then serves it from
-    cache, free). Sub-maps are created here and mutated in place."""
+    cache, free). Sub-maps are created here and mutated in place.
+    on_issue: awaited with each issue's result the moment it finishes
+    (completion order) — the streaming endpoint's hook; the returned list
+    keeps issue order either way."""
     keywords_map = keywords_map or {}
     curated_ids = curated_ids or set()
 
@@ -1919,10 +1974,12 @@ async def issue_fanout(issues: list[Issue], context: CaseContext,
                         len(result.get("candidates") or {}),
                         len(result.get("scored") or []),
                         ", curated" if str(issue.id) in curated_ids else "")
-            return result
         except Exception:
             logger.exception("[pipeline] issue %s failed", issue.id)
-            return {"issue": issue, "keywords": None, "candidates": {}, "scored": []}
+            result = {"issue": issue, "keywords": None, "candidates": {}, "scored": []}
+        if on_issue is not None:
+            await on_issue(result)
+        return result
 
     return list(await asyncio.gather(*(_safe(i) for i in issues[:MAX_ISSUES])))
 
@@ -1987,13 +2044,83 @@ def _signals_payload(result: ScoredResult) -> dict[str, Any]:
     return payload
 
 
+def assemble_issue(entry: dict[str, Any], forum_profile: dict[str, Any] | None,
+                   ) -> tuple[IssueResults, dict[str, Any], int]:
+    """One issue's slice of the response: CitationGuardian (always — no
+    bypass), then the result cards. Returns (issue results, session entry,
+    guardian drop count) — streamed runs send the first part as soon as the
+    issue finishes."""
+    issue: Issue = entry["issue"]
+    candidates: dict[str, Candidate] = entry["candidates"]
+    scored: list[ScoredResult] = entry["scored"]
+
+    clean, drops = citation_guardian.verify(scored, candidates)
+
+    items: list[ResultItem] = []
+    # IK indexes many judgments under SEVERAL doc-ids (reported copy +
+    # order copy, '…'-truncated party lists). Collapse near-duplicates by
+    # normalized title — it embeds the decision date, and the list is
+    # already best-first, so the top-ranked copy is the one kept.
+    seen_titles: set[str] = set()
+    for result in clean:
+        cand = candidates[result.doc_id]
+        title_key = re.sub(r"[^a-z0-9]+", "", (cand.title or "").lower()) or result.doc_id
+        if title_key in seen_titles:
+            continue
+        seen_titles.add(title_key)
+        _, court_label = authority_signal(cand)
+        pin = None
+        if result.pinpoint:
+            pin = f"{result.pinpoint_ref}: {result.pinpoint}" if result.pinpoint_ref else result.pinpoint
+        items.append(ResultItem(
+            docId=result.doc_id,
+            title=cand.title,
+            court=cand.court,
+            year=cand.year,
+            band=result.band,
+            score=result.score,
+            redFlag=result.red_flag,
+            pinpoint=pin,
+            url=cand.source_url,
+            headline=cand.headline,
+            matchedTerms=list(cand.matched_terms),
+            side=result.side,
+            outcomeEvidence=result.outcome_evidence,
+            doctrineLink=result.doctrine_link,
+            distinguishRisk=result.distinguish_risk,
+            opponentArgument=result.opponent_argument,
+            counterStrategy=result.counter_strategy,
+            signals=_signals_payload(result),
+            chips=_chips(cand, result, court_label,
+                         own_court=is_forum_high_court(cand.court, forum_profile)),
+        ))
+    keywords = entry.get("keywords")
+    issue_out = IssueResults(id=issue.id, issue=issue.issue, title=issue.title,
+                             groundLabel=issue.ground_label, keywords=keywords, results=items)
+    session_entry = {
+        "id": issue.id,
+        "issue": issue.issue,
+        "title": issue.title,
+        "groundLabel": issue.ground_label,
+        "keywords": keywords.model_dump() if keywords else None,
+        "results": [item.model_dump() for item in items],
+        "candidateMeta": {
+            doc_id: {"title": c.title, "headline": c.headline,
+                     "court": c.court, "year": c.year, "numCitedby": c.num_citedby}
+            for doc_id, c in candidates.items()
+        },
+    }
+    return issue_out, session_entry, len(drops)
+
+
 def assemble_response(
     session_id: str,
     context: CaseContext,
     fanout_results: list[dict[str, Any]],
 ) -> SearchResponse:
     """Runs the CitationGuardian (always — no bypass), then builds the
-    Section 11 response and persists the session for /refine."""
+    Section 11 response and persists the session for /refine. Entries a
+    streamed run already assembled carry it under "assembled"."""
     issues_out: list[IssueResults] = []
     total_drops = 0
     session_issues: list[dict[str, Any]] = []
@@ -2001,69 +2128,11 @@ def assemble_response(
         context.forum, f"{context.procedural_history} {context.raw_case_summary}")
 
     for entry in fanout_results:
-        issue: Issue = entry["issue"]
-        candidates: dict[str, Candidate] = entry["candidates"]
-        scored: list[ScoredResult] = entry["scored"]
-
-        clean, drops = citation_guardian.verify(scored, candidates)
-        total_drops += len(drops)
-
-        items: list[ResultItem] = []
-        # IK indexes many judgments under SEVERAL doc-ids (reported copy +
-        # order copy, '…'-truncated party lists). Collapse near-duplicates by
-        # normalized title — it embeds the decision date, and the list is
-        # already best-first, so the top-ranked copy is the one kept.
-        seen_titles: set[str] = set()
-        for result in clean:
-            cand = candidates[result.doc_id]
-            title_key = re.sub(r"[^a-z0-9]+", "", (cand.title or "").lower()) or result.doc_id
-            if title_key in seen_titles:
-                continue
-            seen_titles.add(title_key)
-            _, court_label = authority_signal(cand)
-            pin = None
-            if result.pinpoint:
-                pin = f"{result.pinpoint_ref}: {result.pinpoint}" if result.pinpoint_ref else result.pinpoint
-            items.append(ResultItem(
-                docId=result.doc_id,
-                title=cand.title,
-                court=cand.court,
-                year=cand.year,
-                band=result.band,
-                score=result.score,
-                redFlag=result.red_flag,
-                pinpoint=pin,
-                url=cand.source_url,
-                headline=cand.headline,
-                matchedTerms=list(cand.matched_terms),
-                side=result.side,
-                outcomeEvidence=result.outcome_evidence,
-                doctrineLink=result.doctrine_link,
-                distinguishRisk=result.distinguish_risk,
-                opponentArgument=result.opponent_argument,
-                counterStrategy=result.counter_strategy,
-                signals=_signals_payload(result),
-                chips=_chips(cand, result, court_label,
-                             own_court=is_forum_high_court(cand.court, forum_profile)),
-            ))
-        keywords = entry.get("keywords")
-        issues_out.append(IssueResults(id=issue.id, issue=issue.issue,
-                                       title=issue.title,
-                                       groundLabel=issue.ground_label,
-                                       keywords=keywords, results=items))
-        session_issues.append({
-            "id": issue.id,
-            "issue": issue.issue,
-            "title": issue.title,
-            "groundLabel": issue.ground_label,
-            "keywords": keywords.model_dump() if keywords else None,
-            "results": [item.model_dump() for item in items],
-            "candidateMeta": {
-                doc_id: {"title": c.title, "headline": c.headline,
-                         "court": c.court, "year": c.year, "numCitedby": c.num_citedby}
-                for doc_id, c in candidates.items()
-            },
-        })
+        issue_out, session_entry, drops = (entry.get("assembled")
+                                           or assemble_issue(entry, forum_profile))
+        issues_out.append(issue_out)
+        session_issues.append(session_entry)
+        total_drops += drops
 
     response = SearchResponse(
         sessionId=session_id,
@@ -2086,6 +2155,36 @@ def assemble_response(
     return response
 
 
+def run_diff(previous_issues: list[dict[str, Any]], response: SearchResponse,
+             memo_stats: Counter) -> dict[str, Any]:
+    """What a re-run changed, per issue, against the session's previous
+    results: docIds newly surfaced, dropped, and kept with a different band
+    or score — plus how much of the previous run's work was reused."""
+    before = {str(entry.get("id")): {r["docId"]: r for r in entry.get("results") or []}
+              for entry in previous_issues}
+    issues: dict[str, Any] = {}
+    for issue in response.issues:
+        old = before.get(str(issue.id), {})
+        new = {r.docId: r for r in issue.results}
+        changed = [
+            {"docId": doc_id, "band": [old[doc_id].get("band"), r.band],
+             "score": [old[doc_id].get("score"), r.score]}
+            for doc_id, r in new.items()
+            if doc_id in old and (old[doc_id].get("band"), old[doc_id].get("score")) != (r.band, r.score)
+        ]
+        issues[str(issue.id)] = {
+            "added": [d for d in new if d not in old],
+            "removed": [d for d in old if d not in new],
+            "changed": changed,
+            "unchanged": sum(1 for d in new if d in old) - len(changed),
+        }
+    return {
+        "issues": issues,
+        "reused": {t: memo_stats[f"{t}_reused"] for t in ("semantic", "verifications")},
+        "fresh": {t: memo_stats[f"{t}_fresh"] for t in ("semantic", "verifications")},
+    }
+
+
 # ─── Root pipeline ────────────────────────────────────────────────────────────
 
 async def analyze_case(raw_text: str, source_text: str | None = None,
@@ -2233,12 +2332,15 @@ def apply_query_overrides(keywords_map: dict[str, KeywordSet],
 async def run_issue_search(session_id: str, context: CaseContext,
                            issues: list[Issue],
                            query_overrides: dict[str, list[str]] | None = None,
+                           on_issue: Callable[[IssueResults], Awaitable[None]] | None = None,
                            ) -> SearchResponse:
     """Phase 2: per-issue fan-out (Stage 2 → fetch → rerank → layers →
     score), then CitationGuardian + assembler — deterministic, always on,
     no bypass. Keywords generated at analyze time are reused here, after
     the user's per-issue query selection (checkboxes + own queries) is
-    applied on top."""
+    applied on top.
+    on_issue: streaming hook — awaited with each issue's guardian-verified
+    results as soon as that issue finishes, before the slowest one does."""
     # Per-run Indian Kanoon spend meter — the fan-out's child tasks inherit
     # this context; the tabular summary logs when the judgement completes.
     ik_tracker = ik_cost_start()
@@ -2251,6 +2353,10 @@ async def run_issue_search(session_id: str, context: CaseContext,
             logger.warning("[pipeline] stored keywords for issue %s invalid — regenerating", issue_id)
     keywords_map = apply_query_overrides(keywords_map, query_overrides)
     curated_ids = {str(issue_id) for issue_id in (query_overrides or {})}
+    # Re-run memo: rerank scores and verifier verdicts from earlier runs of
+    # this session — only new pages' new candidates are paid for again.
+    previous_issues = list(session.get("issues") or [])
+    memo = run_memo_start(sessions.load_run_memo(session_id) or session.get("runMemo"))
     # Page ledger, PER ISSUE per query: an issue advances only the pages it
     # has itself used (Run #1 → pagenum 0, Run #2 → pagenum 1 …); an issue
     # that never ran a query starts at page one even when another issue
@@ -2260,17 +2366,31 @@ async def run_issue_search(session_id: str, context: CaseContext,
     for issue_key, sub in (session.get("ikQueryPages") or {}).items():
         if isinstance(sub, dict):
             page_map[str(issue_key)] = {str(w): int(p) for w, p in sub.items()}
+    emit = None
+    if on_issue is not None:
+        forum_profile = case_court_profile(
+            context.forum, f"{context.procedural_history} {context.raw_case_summary}")
+
+        async def emit(entry: dict[str, Any]) -> None:
+            entry["assembled"] = assemble_issue(entry, forum_profile)
+            await on_issue(entry["assembled"][0])
     fanout_results = await issue_fanout(issues, context, keywords_map,
                                         curated_ids=curated_ids,
                                         query_style=session.get("queryStyle", "simple"),
-                                        page_map=page_map)
+                                        page_map=page_map, on_issue=emit)
     response = assemble_response(session_id, context, fanout_results)
+    if previous_issues:
+        response.runDiff = run_diff(previous_issues, response, memo["stats"])
+        logger.info("[rerun] session %s: reused %s, fresh %s", session_id[:8],
+                    response.runDiff["reused"], response.runDiff["fresh"])
     # Fold this run into the session's cumulative ledger, but print THIS
     # RUN's own bill as the table — the cumulative figures (analyze + every
     # earlier run) read as "wrong API counts" when shown as the main table.
     # The session lifetime total follows as one line.
     cost_session = sessions.load(session_id) or {}
     cost_session["ikQueryPages"] = page_map
+    cost_session.pop("runMemo", None)              # older sessions carried it inline
+    sessions.save_run_memo(session_id, run_memo_export(memo))
     cost_ledger = merge_cost_ledger(cost_session.get("costLedger"), ik_tracker)
     cost_session["costLedger"] = cost_ledger
     sessions.save(session_id, cost_session)
@@ -11,6 +11,7 @@ Run:  python -m uvicorn api:app --host 0.0.0.0 --port 8002
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import re
 from datetime import date
@@ -19,6 +20,7 @@ from typing import Any
 import httpx
 from fastapi import BackgroundTasks, FastAPI, File, Form, HTTPException, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 
 from agents import (
     analyze_case,
@@ -40,6 +42,7 @@ from schemas import (
     Candidate,
     CaseContext,
     Issue,
+    IssueResults,
     KeywordSet,
     RefinedItem,
     RefineRequest,
@@ -57,6 +60,7 @@ from tools import (
     case_court_profile,
     citation_guardian,
     composite_score,
+    cost_totals,
     flush_usage_events,
     set_court_scope,
     set_date_scope,
@@ -400,9 +404,11 @@ async def analyze_upload(http_request: Request,
     )
 
 
-@app.post("/api/v1/search/{session_id}/run", response_model=SearchResponse)
-async def search_run(session_id: str, request: RunSearchRequest,
-                     background: BackgroundTasks, http_request: Request) -> SearchResponse:
+async def _prepare_run(session_id: str, request: RunSearchRequest,
+                       http_request: Request) -> tuple[CaseContext, list[Issue]]:
+    """Everything /run and /run/stream share before the fan-out: session
+    lookup, issue selection (+ enriched custom issues), and the run's court
+    and date scopes. Returns (context, chosen issues)."""
     session = sessions.load(session_id)
     if session is None:
         raise HTTPException(status_code=404, detail="Unknown or expired sessionId — analyze first")
@@ -470,20 +476,97 @@ async def search_run(session_id: str, request: RunSearchRequest,
                 {k: len(v) for k, v in (request.queryOverrides or {}).items()} or "none",
                 ",".join(scope_tokens) or "default",
                 " ".join(date_parts) or "all")
+    return context, chosen
+
+
+_IK_AUTH_FAILED = (
+    "Indian Kanoon rejected the API token (HTTP 403) — the prepaid "
+    "account is out of balance or the token expired. Recharge at "
+    "api.indiankanoon.org (or set a new INDIAN_KANOON_TOKEN and "
+    "restart), then run the search again.")
+
+
+@app.post("/api/v1/search/{session_id}/run", response_model=SearchResponse)
+async def search_run(session_id: str, request: RunSearchRequest,
+                     background: BackgroundTasks, http_request: Request) -> SearchResponse:
+    context, chosen = await _prepare_run(session_id, request, http_request)
     response = await run_issue_search(session_id, context, chosen,
                                       query_overrides=request.queryOverrides or None)
     if ik_client.auth_failed and not any(i.results for i in response.issues):
         # An auth failure must never masquerade as an honest empty result.
-        raise HTTPException(status_code=502, detail=(
-            "Indian Kanoon rejected the API token (HTTP 403) — the prepaid "
-            "account is out of balance or the token expired. Recharge at "
-            "api.indiankanoon.org (or set a new INDIAN_KANOON_TOKEN and "
-            "restart), then run the search again."))
+        raise HTTPException(status_code=502, detail=_IK_AUTH_FAILED)
     _tag_session(session_id, resolve_user_id(http_request))
     background.add_task(_vault_write, response)
     return response
 
 
+def _sse(obj: Any) -> str:
+    if isinstance(obj, str):
+        return f"data: {obj}\n\n"
+    return f"data: {json.dumps(obj, ensure_ascii=False, default=str)}\n\n"
+
+
+@app.post("/api/v1/search/{session_id}/run/stream")
+async def search_run_stream(session_id: str, request: RunSearchRequest,
+                            http_request: Request) -> StreamingResponse:
+    """/run as Server-Sent Events: one {"type": "issue"} event per issue —
+    its guardian-verified results, sent the moment THAT issue's round
+    completes (completion order) — then one {"type": "summary"} event with
+    the run-level fields of SearchResponse and this run's cost, then
+    [DONE]. The session ends up exactly as /run leaves it."""
+    context, chosen = await _prepare_run(session_id, request, http_request)
+    user_id = resolve_user_id(http_request)
+    ledger_before = (sessions.load(session_id) or {}).get("costLedger") or {}
+    events: asyncio.Queue[IssueResults | None] = asyncio.Queue()
+    background = BackgroundTasks()  # runs once the stream has been sent
+
+    async def _run() -> SearchResponse:
+        try:
+            return await run_issue_search(session_id, context, chosen,
+                                          query_overrides=request.queryOverrides or None,
+                                          on_issue=events.put)
+        finally:
+            events.put_nowait(None)
+
+    async def gen():
+        task = asyncio.create_task(_run())
+        try:
+            while (issue := await events.get()) is not None:
+                yield _sse({"type": "issue", "issue": issue.model_dump(mode="json")})
+            response = await task
+            if ik_client.auth_failed and not any(i.results for i in response.issues):
+                yield _sse({"type": "error", "status": 502, "message": _IK_AUTH_FAILED})
+            else:
+                _tag_session(session_id, user_id)
+                background.add_task(_vault_write, response)
+                ai_before, ik_before = cost_totals(ledger_before)
+                ai_after, ik_after = cost_totals(
+                    (sessions.load(session_id) or {}).get("costLedger") or {})
+                summary = response.model_dump(mode="json", exclude={"issues"})
+                summary.update({
+                    "type": "summary",
+                    "issueOrder": [i.id for i in response.issues],
+                    "cost": {"aiInr": round(ai_after - ai_before, 2),
+                             "ikInr": round(ik_after - ik_before, 2),
+                             "sessionTotalInr": round(ai_after + ik_after, 2)},
+                })
+                yield _sse(summary)
+        except Exception as exc:  # never let the stream die silently
+            logger.exception("[run/stream] session %s failed", session_id)
+            yield _sse({"type": "error", "message": f"Search run failed: {exc}"})
+        finally:
+            # No yield here: on client disconnect the generator is being
+            # closed, and yielding from finally would raise RuntimeError.
+            if not task.done():
+                task.cancel()  # client went away mid-run
+        yield _sse("[DONE]")
+
+    headers = {"Cache-Control": "no-cache, no-transform", "X-Accel-Buffering": "no",
+               "Connection": "keep-alive"}
+    return StreamingResponse(gen(), media_type="text/event-stream", headers=headers,
+                             background=background)
+
+
 @app.post("/api/v1/search/{session_id}/issues")
 async def add_session_issue(session_id: str, request: AddIssueRequest,
                             http_request: Request) -> dict[str, Any]:
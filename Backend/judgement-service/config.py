@@ -63,6 +63,9 @@ class Settings(BaseSettings):
     gemini_keyword_fallback_model: str = "gemini-3.6-flash"
     gemini_embedding_model: str = "models/gemini-embedding-001"
     embedding_dim: int = 768
+    # Process-local LRU in front of the Qdrant segment-vector cache (entries,
+    # ~3KB each at 768 dims).
+    embed_local_cache_size: int = 20000
 
     # Case material budget for the analysis stages (chars). The old hardcoded
     # 28–30k fed the issue spotter barely a dozen pages — multi-hundred-page
@@ -155,6 +158,24 @@ class Settings(BaseSettings):
 
     # --- Stores (all optional; service degrades gracefully) ---
     redis_url: str | None = None
+    # Connection pool of the asyncio Redis client (per event loop). Sized
+    # above ik_max_concurrency so a 24-wide IK fan-out never queues on a
+    # cache round trip.
+    redis_max_connections: int = 64
+    # Judgment-text tier (stores.DocumentStore). Full judgments run
+    # 200KB–2MB, so they are stored compressed: zstd when installed (with an
+    # optional dictionary trained on judgments), else zlib. The local tier
+    # is an LRU bounded by BYTES, not keys; entries it evicts spill to a
+    # content-addressed directory on disk when one is configured.
+    doc_cache_codec: str = "auto"  # auto | zstd | zlib | none
+    doc_cache_level: int = 6
+    doc_cache_zstd_dict_path: str | None = None
+    doc_cache_local_max_bytes: int = 128 * 1024 * 1024
+    doc_cache_spill_dir: str | None = None
+    doc_cache_spill_max_bytes: int = 2 * 1024 * 1024 * 1024
+    # Per-judgment paragraph index + normalized text (tools.DocAnalysis),
+    # process-local LRU in entries; each is roughly 1-2x the judgment size.
+    doc_analysis_cache_size: int = 64
     qdrant_url: str | None = None
     qdrant_api_key: str | None = None
     judgement_qdrant_collection: str = "judgement_segments_768"
@@ -180,6 +201,10 @@ class Settings(BaseSettings):
 
     # --- Sessions ---
     session_ttl_seconds: int = 3600
+    # Re-run memo (tools.run_memo_*): rerank scores and raw verifier verdicts
+    # kept in the session per (issue, docId, model), newest N per table, so
+    # a re-run only pays for new pages and new candidates.
+    rerun_memo_max_entries: int = 1000
 
     @property
     def ik_token(self) -> str | None:
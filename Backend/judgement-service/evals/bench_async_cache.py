@@ -0,0 +1,131 @@
+"""
+Load benchmark for the asyncio cache API (stores.Cache.a*) — fully offline,
+no Redis, no IK. Runs a concurrent search fan-out two ways against a cache
+with a simulated round trip:
+
+- before: the old path — the sync client's get/set inside each coroutine,
+  so every round trip blocks the event loop;
+- after: aget_json / aset_json on redis.asyncio, awaiting the round trip.
+
+and reports the worst event-loop lag (a 1 ms ticker's overshoot) and the
+p99 search latency for each. Exits non-zero if the async path does not
+cut loop lag and p99 the way the fan-out relies on.
+
+Run:  venv\\Scripts\\python.exe -m evals.bench_async_cache
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import stores  # noqa: E402
+
+RTT = 0.005        # simulated Redis round trip
+IK_CALL = 0.02     # simulated Indian Kanoon search on a miss
+WIDTHS = (24, 48)  # the IK fan-out width, and twice it
+
+
+class AsyncRedis:
+    """Minimal redis.asyncio stand-in: the round trip yields to the loop."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def get(self, key):
+        await asyncio.sleep(RTT)
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        await asyncio.sleep(RTT)
+        self.data[key] = value
+
+
+class BlockingRedis:
+    """The old behaviour: a sync client whose round trip blocks the loop."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    def get(self, key):
+        time.sleep(RTT)
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        time.sleep(RTT)
+        self.data[key] = value
+
+
+def _cache(fake) -> stores.Cache:
+    cache = stores.Cache()
+
+    async def _aclient(binary: bool = False):
+        return fake
+
+    cache._aclient = _aclient
+    cache._client = lambda: fake
+    return cache
+
+
+async def _load(search_once, width: int) -> tuple[float, float]:
+    """Run `width` concurrent searches; returns (max loop lag, p99 latency)."""
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - start - 0.001)
+
+    async def timed(i):
+        start = time.perf_counter()
+        await search_once(i)
+        return time.perf_counter() - start
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0.002)
+    latencies = sorted(await asyncio.gather(*(timed(i) for i in range(width))))
+    done.set()
+    await tick
+    return max(lags), latencies[int(0.99 * (len(latencies) - 1))]
+
+
+async def run(width: int) -> tuple[float, float, float, float]:
+    blocking = _cache(BlockingRedis())
+    nonblocking = _cache(AsyncRedis())
+
+    async def before(i):
+        if blocking.get_json(f"q{i}") is None:
+            await asyncio.sleep(IK_CALL)
+            blocking.set_json(f"q{i}", [], ttl=60)
+
+    async def after(i):
+        if await nonblocking.aget_json(f"q{i}") is None:
+            await asyncio.sleep(IK_CALL)
+            await nonblocking.aset_json(f"q{i}", [], ttl=60)
+
+    lag_before, p99_before = await _load(before, width)
+    lag_after, p99_after = await _load(after, width)
+    return lag_before, lag_after, p99_before, p99_after
+
+
+def main() -> int:
+    failures = 0
+    print(f"cache RTT {RTT * 1000:.0f} ms, IK call {IK_CALL * 1000:.0f} ms")
+    print(f"{'width':>6} {'lag before':>11} {'lag after':>10} {'p99 before':>11} {'p99 after':>10}")
+    for width in WIDTHS:
+        lag_before, lag_after, p99_before, p99_after = asyncio.run(run(width))
+        # Blocking round trips serialise on the loop (~width x RTT of lag).
+        ok = lag_after < lag_before / 4 and p99_after < p99_before / 2
+        failures += not ok
+        print(f"{width:>6} {lag_before * 1000:>9.1f}ms {lag_after * 1000:>8.1f}ms "
+              f"{p99_before * 1000:>9.1f}ms {p99_after * 1000:>8.1f}ms{'' if ok else '  REGRESSION'}")
+    print("PASS" if not failures else "FAIL")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
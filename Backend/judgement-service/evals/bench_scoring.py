@@ -0,0 +1,107 @@
+"""
+Microbenchmark for _issue_round's scoring step — fully offline, no model,
+no network. Scores synthetic pools of 50 / 500 / 5000 candidates two ways:
+
+- per-row: the old loop — court-tier regexes, keyword sets and
+  composite_score once per candidate;
+- columnar: memoised court tiers, keyword_signals for the pool, and one
+  composite_scores pass over the signal columns.
+
+and checks both paths produce the same scores.
+
+Run:  venv\\Scripts\\python.exe -m evals.bench_scoring
+"""
+
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import PHASE_WEIGHT_PRESETS  # noqa: E402
+from schemas import Candidate, KeywordSet, SignalSet  # noqa: E402
+from tools import (  # noqa: E402
+    _COURT_TIERS,
+    _court_tier,
+    authority_signal,
+    composite_score,
+    composite_scores,
+    keyword_signal,
+    keyword_signals,
+)
+
+COURTS = ["Supreme Court of India", "Bombay High Court", "Delhi High Court",
+          "Madras High Court", "Income Tax Appellate Tribunal - Mumbai",
+          "National Company Law Appellate Tribunal", "Sessions Court, Pune",
+          "Consumer Disputes Redressal Commission", "Gram Nyayalaya, Wardha"]
+TERMS = ["natural justice", "section 482", "quashing", "forfeiture", "limitation",
+         "condonation of delay", "cognizable offence", "bail", "anticipatory bail"]
+KEYWORDS = KeywordSet(doctrinal=TERMS[:3], statutory=TERMS[3:5], factual=TERMS[5:7],
+                      outcome=TERMS[7:], anchor_queries=["section 482 quashing"])
+WEIGHTS = PHASE_WEIGHT_PRESETS[3]
+
+
+def _pool(n: int, rng: random.Random) -> list[Candidate]:
+    return [Candidate(doc_id=str(i), title=f"Case {i}", court=rng.choice(COURTS),
+                      num_citedby=rng.randint(0, 500),
+                      matched_terms=rng.sample(TERMS, rng.randint(0, 4)))
+            for i in range(n)]
+
+
+def _old_authority(cand: Candidate) -> float:
+    tier = 0.3
+    for pattern, value, _name in _COURT_TIERS:
+        if pattern.search(cand.court or ""):
+            tier = value
+            break
+    influence = min(1.0, math.log10(1 + max(0, cand.num_citedby)) / 3.0)
+    return round(0.7 * tier + 0.3 * influence, 4)
+
+
+def per_row(pool, semantic):
+    out = []
+    for cand in pool:
+        signals = SignalSet(semantic_match=semantic[cand.doc_id],
+                            keyword_match=keyword_signal(cand, KEYWORDS),
+                            authority=_old_authority(cand))
+        out.append(composite_score(signals, WEIGHTS).score)
+    return out
+
+
+def columnar(pool, semantic):
+    kw = keyword_signals(pool, KEYWORDS)
+    signal_sets = [SignalSet(semantic_match=semantic[c.doc_id], keyword_match=k,
+                             authority=authority_signal(c)[0]) for c, k in zip(pool, kw)]
+    return [r.score for r in composite_scores(signal_sets, WEIGHTS)]
+
+
+def _best_of(fn, *args, repeat: int = 5) -> tuple[float, list[float]]:
+    best, out = math.inf, []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, out
+
+
+def main() -> int:
+    rng = random.Random(0)
+    failures = 0
+    print(f"{'candidates':>10} {'per-row ms':>11} {'columnar ms':>12} {'speedup':>8}")
+    for n in (50, 500, 5000):
+        pool = _pool(n, rng)
+        semantic = {c.doc_id: round(rng.random(), 4) for c in pool}
+        _court_tier.cache_clear()
+        before, old_scores = _best_of(per_row, pool, semantic)
+        after, new_scores = _best_of(columnar, pool, semantic)
+        failures += old_scores != new_scores
+        print(f"{n:>10} {before * 1000:>11.2f} {after * 1000:>12.2f} {before / after:>7.1f}x"
+              f"{'' if old_scores == new_scores else '  SCORE MISMATCH'}")
+    print("PASS" if not failures else "FAIL")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
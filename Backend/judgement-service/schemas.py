@@ -416,6 +416,10 @@ class SearchResponse(BaseModel):
     # The client's own High Court inferred from the forum (e.g. "Bombay High
     # Court" for a Maharashtra matter) — its judgments are ranked first.
     forumCourt: str | None = None
+    # Re-runs only: per-issue added / removed / changed results against the
+    # session's previous run, plus how many rerank scores and verdicts were
+    # reused from it instead of paid for again.
+    runDiff: dict[str, Any] | None = None
 
 
 # ─── API request contracts ───────────────────────────────────────────────────
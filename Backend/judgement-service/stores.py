@@ -4,17 +4,24 @@ Data-store connections and helpers: Redis (cache/sessions), Qdrant
 
 Every store is optional and lazily connected. When a store is missing or
 down the service degrades gracefully: Redis falls back to an in-process
-TTL cache, Qdrant caching is skipped, Neo4j-based good-law stays "lite",
-and vault writes are no-ops. Nothing here may raise at import or boot.
+TTL cache (full judgment texts to the byte-bounded DocumentStore tier),
+Qdrant caching is skipped, Neo4j-based good-law stays "lite", and vault
+writes are no-ops. Nothing here may raise at import or boot.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
+import os
 import threading
 import time
 import uuid
+import weakref
+import zlib
+from collections import OrderedDict
 from typing import Any
 
 from config import get_settings
@@ -53,12 +60,25 @@ class _MemoryTTLCache:
 
 
 class Cache:
-    """Redis-backed string cache with transparent in-memory fallback."""
+    """Redis-backed string cache with transparent in-memory fallback.
+
+    Coroutines use the a* methods (aget/aset/amget/amset/...): they run on
+    redis.asyncio with a pooled connection per event loop, so a cache round
+    trip never blocks the loop while IK fan-outs are in flight. The sync
+    methods stay for threads and sync call sites; both share the memory
+    fallback and its semantics."""
 
     def __init__(self) -> None:
         self._memory = _MemoryTTLCache()
         self._redis = None
         self._redis_failed = False
+        # redis.asyncio connections are bound to the loop that opened them;
+        # one text client (decode_responses) and one binary client per loop.
+        self._aredis: dict[bool, weakref.WeakKeyDictionary] = {
+            False: weakref.WeakKeyDictionary(), True: weakref.WeakKeyDictionary()}
+        # Per-loop lock so a burst of first callers opens one pool, not one each.
+        self._aredis_locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._aredis_failed = False
 
     def _client(self):
         if self._redis is not None or self._redis_failed:
@@ -109,25 +129,560 @@ class Cache:
         self._memory.delete(key)
 
     def get_json(self, key: str) -> Any | None:
-        raw = self.get(key)
-        if raw is None:
+        return _loads(self.get(key))
+
+    def set_json(self, key: str, value: Any, ttl: int = 86400) -> None:
+        self.set(key, json.dumps(value, default=str), ttl)
+
+    # ── asyncio API ──────────────────────────────────────────────────────
+
+    async def _aclient(self, binary: bool = False):
+        if self._aredis_failed:
+            return None
+        loop = asyncio.get_running_loop()
+        client = self._aredis[binary].get(loop)
+        if client is not None:
+            return client
+        lock = self._aredis_locks.get(loop)
+        if lock is None:
+            lock = self._aredis_locks[loop] = asyncio.Lock()
+        async with lock:
+            # Callers that queued behind the first one reuse its pool (or its failure).
+            client = self._aredis[binary].get(loop)
+            if client is not None or self._aredis_failed:
+                return client
+            settings = get_settings()
+            if not settings.redis_url:
+                self._aredis_failed = True
+                return None
+            client = None
+            try:
+                import redis.asyncio as aioredis  # type: ignore
+                client = aioredis.Redis.from_url(
+                    settings.redis_url, decode_responses=not binary, socket_timeout=3,
+                    max_connections=settings.redis_max_connections)
+                await client.ping()
+                logger.info("[stores] async Redis connected")
+            except Exception as exc:
+                logger.warning("[stores] async Redis unavailable (%s) — using in-memory cache", exc)
+                self._aredis_failed = True
+                if client is not None:
+                    try:
+                        await client.aclose()
+                    except Exception:
+                        pass
+                return None
+            self._aredis[binary][loop] = client
+            return client
+
+    async def aget(self, key: str) -> str | None:
+        client = await self._aclient()
+        if client is not None:
+            try:
+                return await client.get(key)
+            except Exception as exc:
+                logger.warning("[stores] Redis get failed (%s)", exc)
+        return self._memory.get(key)
+
+    async def amget(self, keys: list[str]) -> list[str | None]:
+        """One MGET round trip for many keys; values in key order."""
+        if not keys:
+            return []
+        client = await self._aclient()
+        if client is not None:
+            try:
+                return list(await client.mget(keys))
+            except Exception as exc:
+                logger.warning("[stores] Redis mget failed (%s)", exc)
+        return [self._memory.get(key) for key in keys]
+
+    async def aset(self, key: str, value: str, ttl: int = 86400) -> None:
+        client = await self._aclient()
+        if client is not None:
+            try:
+                await client.setex(key, ttl, value)
+                return
+            except Exception as exc:
+                logger.warning("[stores] Redis set failed (%s)", exc)
+        self._memory.set(key, value, ttl)
+
+    async def amset(self, items: dict[str, str], ttl: int = 86400) -> None:
+        """SETEX every item in one pipelined round trip."""
+        if not items:
+            return
+        client = await self._aclient()
+        if client is not None:
+            try:
+                async with client.pipeline(transaction=False) as pipe:
+                    for key, value in items.items():
+                        pipe.setex(key, ttl, value)
+                    await pipe.execute()
+                return
+            except Exception as exc:
+                logger.warning("[stores] Redis pipelined set failed (%s)", exc)
+        for key, value in items.items():
+            self._memory.set(key, value, ttl)
+
+    async def aget_bytes(self, key: str) -> bytes | None:
+        """Binary get from Redis only — byte values have their own local
+        tier (DocumentStore), so there is no memory fallback here."""
+        client = await self._aclient(binary=True)
+        if client is None:
             return None
         try:
-            return json.loads(raw)
-        except ValueError:
+            return await client.get(key)
+        except Exception as exc:
+            logger.warning("[stores] Redis get failed (%s)", exc)
             return None
 
-    def set_json(self, key: str, value: Any, ttl: int = 86400) -> None:
-        self.set(key, json.dumps(value, default=str), ttl)
+    async def aset_bytes(self, key: str, value: bytes, ttl: int = 86400) -> bool:
+        """Binary SETEX; False when Redis is unavailable or the write failed."""
+        client = await self._aclient(binary=True)
+        if client is None:
+            return False
+        try:
+            await client.setex(key, ttl, value)
+            return True
+        except Exception as exc:
+            logger.warning("[stores] Redis set failed (%s)", exc)
+            return False
+
+    async def adelete(self, key: str) -> None:
+        client = await self._aclient()
+        if client is not None:
+            try:
+                await client.delete(key)
+            except Exception as exc:
+                logger.warning("[stores] Redis delete failed (%s)", exc)
+        self._memory.delete(key)
+
+    async def aget_json(self, key: str) -> Any | None:
+        return _loads(await self.aget(key))
+
+    async def amget_json(self, keys: list[str]) -> list[Any | None]:
+        return [_loads(raw) for raw in await self.amget(keys)]
+
+    async def aset_json(self, key: str, value: Any, ttl: int = 86400) -> None:
+        await self.aset(key, json.dumps(value, default=str), ttl)
+
+    async def amset_json(self, items: dict[str, Any], ttl: int = 86400) -> None:
+        await self.amset({k: json.dumps(v, default=str) for k, v in items.items()}, ttl)
 
     @property
     def backend(self) -> str:
         return "redis" if self._client() is not None else "memory"
 
 
+def _loads(raw: str | None) -> Any | None:
+    if raw is None:
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
 cache = Cache()
 
 
+# ─── Document store (compressed judgment text tier) ──────────────────────────
+
+# One-byte codec tag in front of every stored blob, so a reader always knows
+# how to decode — and a blob written under a dictionary this process does
+# not hold is treated as a miss, never as garbage text.
+_TAG_RAW, _TAG_ZLIB, _TAG_ZSTD, _TAG_ZSTD_DICT = b"R", b"L", b"Z", b"D"
+# Blobs above this size are (de)compressed off the event loop.
+_OFFLOAD_BYTES = 64 * 1024
+# Spilled blobs waiting for the spill writer thread; past this, new spills
+# are dropped (the disk tier is best-effort) rather than queued in memory.
+_SPILL_QUEUE_MAX_BYTES = 64 * 1024 * 1024
+# An object no ref points at is only removed once it is this old, so a put
+# in another process (object written, ref not yet) is never raced.
+_ORPHAN_GRACE_SECONDS = 300
+# A Redis hit promoted into the local tier lives this long there: Redis owns
+# the real expiry and reading it back would cost a second round trip.
+_PROMOTED_TTL_SECONDS = 300
+
+
+class _Codec:
+    def __init__(self, codec: str = "auto", level: int = 6,
+                 dict_path: str | None = None) -> None:
+        self._zstd = None
+        self._dict = None
+        self._level = level
+        self._lock = threading.Lock()
+        self.name = "none" if codec == "none" else "zlib"
+        if codec in ("auto", "zstd"):
+            try:
+                import zstandard  # type: ignore
+                self._zstd = zstandard
+                self.name = "zstd"
+            except ImportError:
+                if codec == "zstd":
+                    logger.warning("[stores] zstandard not installed — judgment cache uses zlib")
+        if self._zstd is not None and dict_path:
+            try:
+                with open(dict_path, "rb") as fh:
+                    self._dict = self._zstd.ZstdCompressionDict(fh.read())
+                self._cctx = self._zstd.ZstdCompressor(level=level, dict_data=self._dict)
+                self._dctx = self._zstd.ZstdDecompressor(dict_data=self._dict)
+                self.name = f"zstd+dict:{self._dict.dict_id()}"
+            except Exception as exc:
+                logger.warning("[stores] zstd dictionary %s unusable (%s) — plain zstd", dict_path, exc)
+                self._dict = None
+        if self._zstd is not None and self._dict is None:
+            self._cctx = self._zstd.ZstdCompressor(level=level)
+            self._dctx = self._zstd.ZstdDecompressor()
+
+    def compress(self, data: bytes) -> bytes:
+        if self.name == "none":
+            return _TAG_RAW + data
+        if self._zstd is None:
+            return _TAG_ZLIB + zlib.compress(data, self._level)
+        with self._lock:  # zstd contexts are not thread-safe
+            body = self._cctx.compress(data)
+        if self._dict is not None:
+            return _TAG_ZSTD_DICT + self._dict.dict_id().to_bytes(4, "big") + body
+        return _TAG_ZSTD + body
+
+    def decompress(self, blob: bytes) -> bytes | None:
+        tag, body = blob[:1], blob[1:]
+        try:
+            if tag == _TAG_RAW:
+                return body
+            if tag == _TAG_ZLIB:
+                return zlib.decompress(body)
+            if tag == _TAG_ZSTD and self._zstd is not None:
+                return self._zstd.ZstdDecompressor().decompress(body)
+            if (tag == _TAG_ZSTD_DICT and self._dict is not None
+                    and int.from_bytes(body[:4], "big") == self._dict.dict_id()):
+                with self._lock:
+                    return self._dctx.decompress(body[4:])
+        except Exception as exc:
+            logger.warning("[stores] judgment cache blob undecodable (%s)", exc)
+        return None
+
+
+def train_zstd_dictionary(samples: list[str], path: str, size: int = 112_640) -> int:
+    """Train a shared zstd dictionary on judgment texts and write it to
+    `path` (point DOC_CACHE_ZSTD_DICT_PATH at it). Returns the dict id.
+    Every process reading the cache must load the same dictionary."""
+    import zstandard  # type: ignore
+    trained = zstandard.train_dictionary(size, [s.encode("utf-8") for s in samples])
+    with open(path, "wb") as fh:
+        fh.write(trained.as_bytes())
+    return trained.dict_id()
+
+
+class _ByteLRU:
+    """LRU of compressed blobs bounded by total bytes; unexpired entries it
+    evicts are handed to `on_evict` (the disk spill)."""
+
+    def __init__(self, max_bytes: int, on_evict=None) -> None:
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._data: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._on_evict = on_evict
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            if item[0] < time.time():
+                self._drop(key)
+                return None
+            self._data.move_to_end(key)
+            return item[1]
+
+    def put(self, key: str, blob: bytes, expires: float) -> None:
+        evicted: list[tuple[str, float, bytes]] = []
+        with self._lock:
+            if key in self._data:
+                self._drop(key)
+            if len(blob) > self.max_bytes:
+                evicted.append((key, expires, blob))
+            else:
+                self._data[key] = (expires, blob)
+                self.bytes += len(blob)
+                while self.bytes > self.max_bytes:
+                    old_key, (old_expires, old_blob) = self._data.popitem(last=False)
+                    self.bytes -= len(old_blob)
+                    evicted.append((old_key, old_expires, old_blob))
+        if self._on_evict is not None:
+            now = time.time()
+            for old_key, old_expires, old_blob in evicted:
+                if old_expires > now:
+                    self._on_evict(old_key, old_blob, old_expires)
+
+    def _drop(self, key: str) -> None:
+        _expires, blob = self._data.pop(key)
+        self.bytes -= len(blob)
+
+
+class _SpillDir:
+    """Content-addressed blobs on local disk: objects/<sha256[:2]>/<sha256>
+    holds the blob (identical content is stored once), refs/<sha1(key)>
+    points a key at its object with an expiry. An object's mtime is its last
+    write, dedup hit or read; least recently used objects are pruned once the
+    directory exceeds max_bytes. Blocking file I/O — callers run it off the
+    event loop."""
+
+    def __init__(self, root: str, max_bytes: int) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self._writes = 0
+
+    def _ref_path(self, key: str) -> str:
+        return os.path.join(self.root, "refs", hashlib.sha1(key.encode()).hexdigest())
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.root, "objects", digest[:2], digest)
+
+    def put(self, key: str, blob: bytes, expires: float) -> None:
+        try:
+            digest = hashlib.sha256(blob).hexdigest()
+            obj = self._object_path(digest)
+            if os.path.exists(obj):
+                os.utime(obj)  # a dedup hit keeps shared content from aging out
+            else:
+                _atomic_write(obj, blob)
+            _atomic_write(self._ref_path(key), f"{expires:.0f} {digest}".encode())
+        except OSError as exc:
+            logger.warning("[stores] judgment spill write failed (%s)", exc)
+            return
+        self._writes += 1
+        if self._writes % 64 == 0:
+            self.prune()
+
+    def get(self, key: str) -> bytes | None:
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key: str) -> tuple[bytes, float] | None:
+        """(blob, expiry) for a live key, else None."""
+        try:
+            with open(self._ref_path(key), "rb") as fh:
+                expires, digest = fh.read().decode().split()
+            if float(expires) < time.time():
+                return None
+            obj = self._object_path(digest)
+            with open(obj, "rb") as fh:
+                blob = fh.read()
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(obj)
+        except OSError:
+            pass
+        return blob, float(expires)
+
+    def prune(self) -> None:
+        """Drop expired refs, unreferenced objects, then the least recently
+        used objects past max_bytes, and finally refs left dangling."""
+        now = time.time()
+        refs_dir = os.path.join(self.root, "refs")
+        refs: dict[str, str] = {}
+        try:
+            names = [n for n in os.listdir(refs_dir) if not n.endswith(".tmp")]
+        except OSError:
+            names = []
+        for name in names:
+            path = os.path.join(refs_dir, name)
+            try:
+                with open(path, "rb") as fh:
+                    expires, digest = fh.read().decode().split()
+                if float(expires) >= now:
+                    refs[path] = digest
+                    continue
+            except (OSError, ValueError):
+                pass
+            _remove_quietly(path)
+        live = set(refs.values())
+
+        objects = []
+        for dirpath, _dirs, files in os.walk(os.path.join(self.root, "objects")):
+            for name in files:
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                if name not in live and st.st_mtime < now - _ORPHAN_GRACE_SECONDS:
+                    _remove_quietly(path)
+                    continue
+                objects.append((st.st_mtime, st.st_size, name, path))
+        total = sum(size for _m, size, _n, _p in objects)
+        removed: set[str] = set()
+        for _mtime, size, name, path in sorted(objects):
+            if total <= self.max_bytes:
+                break
+            if _remove_quietly(path):
+                total -= size
+                removed.add(name)
+        for path, digest in refs.items():
+            if digest in removed:
+                _remove_quietly(path)
+
+
+def _remove_quietly(path: str) -> bool:
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(data)
+    os.replace(tmp, path)
+
+
+class DocumentStore:
+    """Compressed, size-aware tier for full judgment text / HTML.
+
+    Reads go local LRU → Redis (binary) → disk spill, promoting a hit into
+    the local tier. Writes compress once and go to the local tier and
+    Redis. Nothing here raises: a failed tier is simply a miss."""
+
+    def __init__(self, shared: Cache | None = None, *, codec: str | None = None,
+                 level: int | None = None, dict_path: str | None = None,
+                 local_max_bytes: int | None = None, spill_dir: str | None = None,
+                 spill_max_bytes: int | None = None) -> None:
+        settings = get_settings()
+        self._shared = shared
+        self._codec = _Codec(codec or settings.doc_cache_codec,
+                             settings.doc_cache_level if level is None else level,
+                             dict_path or settings.doc_cache_zstd_dict_path)
+        spill_root = spill_dir or settings.doc_cache_spill_dir
+        self._spill = _SpillDir(spill_root, spill_max_bytes or settings.doc_cache_spill_max_bytes) \
+            if spill_root else None
+        self._local = _ByteLRU(local_max_bytes or settings.doc_cache_local_max_bytes,
+                               on_evict=self._spilled)
+        # Evictions happen inside aset_text / aget_text on the event loop, so
+        # the spill (file writes up to 2 MB, a directory prune every 64 writes)
+        # runs on one writer thread. Until written, a blob is served from
+        # `_pending`.
+        from concurrent.futures import ThreadPoolExecutor
+        self._spill_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="doc-spill") \
+            if self._spill is not None else None
+        self._pending: dict[str, tuple[bytes, float]] = {}
+        self._pending_bytes = 0
+        self._pending_lock = threading.Lock()
+        self._metrics = {"writes": 0, "raw_bytes": 0, "stored_bytes": 0, "spilled": 0,
+                         "spill_dropped": 0, "local_hits": 0, "redis_hits": 0, "spill_hits": 0,
+                         "misses": 0}
+
+    def _spilled(self, key: str, blob: bytes, expires: float) -> None:
+        if self._spill_writer is None:
+            return
+        with self._pending_lock:
+            if self._pending_bytes + len(blob) > _SPILL_QUEUE_MAX_BYTES:
+                self._metrics["spill_dropped"] += 1
+                return
+            previous = self._pending.pop(key, None)
+            if previous is not None:
+                self._pending_bytes -= len(previous[0])
+            self._pending[key] = (blob, expires)
+            self._pending_bytes += len(blob)
+        self._metrics["spilled"] += 1
+        self._spill_writer.submit(self._write_spill, key, blob, expires)
+
+    def _write_spill(self, key: str, blob: bytes, expires: float) -> None:
+        try:
+            self._spill.put(key, blob, expires)
+        finally:
+            with self._pending_lock:
+                pending = self._pending.get(key)
+                if pending is not None and pending[0] is blob:  # not re-spilled since
+                    del self._pending[key]
+                    self._pending_bytes -= len(blob)
+
+    def _pending_spill(self, key: str) -> tuple[bytes, float] | None:
+        with self._pending_lock:
+            pending = self._pending.get(key)
+        if pending is None or pending[1] < time.time():
+            return None
+        return pending
+
+    async def aflush_spill(self) -> None:
+        """Wait until every spill queued so far is on disk."""
+        if self._spill_writer is not None:
+            await asyncio.wrap_future(self._spill_writer.submit(lambda: None))
+
+    async def _decode(self, blob: bytes) -> str | None:
+        if len(blob) > _OFFLOAD_BYTES:
+            data = await asyncio.to_thread(self._codec.decompress, blob)
+        else:
+            data = self._codec.decompress(blob)
+        return data.decode("utf-8") if data is not None else None
+
+    async def aget_text(self, key: str) -> str | None:
+        blob = self._local.get(key)
+        tier, expires = "local_hits", None
+        if blob is None and self._shared is not None:
+            blob, tier = await self._shared.aget_bytes(key), "redis_hits"
+            expires = time.time() + _PROMOTED_TTL_SECONDS
+        if blob is None and self._spill is not None:
+            tier = "spill_hits"
+            entry = self._pending_spill(key) or await asyncio.to_thread(self._spill.get_entry, key)
+            blob, expires = entry if entry is not None else (None, None)
+        text = await self._decode(blob) if blob is not None else None
+        if text is None:
+            self._metrics["misses"] += 1
+            return None
+        self._metrics[tier] += 1
+        if expires is not None:
+            # A spill entry carries its own expiry; a Redis hit is kept briefly.
+            self._local.put(key, blob, expires)
+        return text
+
+    async def aset_text(self, key: str, text: str, ttl: int = 86400) -> None:
+        data = text.encode("utf-8")
+        if len(data) > _OFFLOAD_BYTES:
+            blob = await asyncio.to_thread(self._codec.compress, data)
+        else:
+            blob = self._codec.compress(data)
+        self._metrics["writes"] += 1
+        self._metrics["raw_bytes"] += len(data)
+        self._metrics["stored_bytes"] += len(blob)
+        self._local.put(key, blob, time.time() + ttl)
+        if self._shared is not None:
+            await self._shared.aset_bytes(key, blob, ttl)
+
+    async def aget_json(self, key: str) -> Any | None:
+        return _loads(await self.aget_text(key))
+
+    async def aset_json(self, key: str, value: Any, ttl: int = 86400) -> None:
+        await self.aset_text(key, json.dumps(value, default=str), ttl)
+
+    def stats(self) -> dict[str, Any]:
+        m = self._metrics
+        return {
+            "codec": self._codec.name,
+            "localEntries": len(self._local),
+            "localBytes": self._local.bytes,
+            "localMaxBytes": self._local.max_bytes,
+            "compressionRatio": round(m["raw_bytes"] / m["stored_bytes"], 2) if m["stored_bytes"] else None,
+            "bytesSaved": m["raw_bytes"] - m["stored_bytes"],
+            "spillDir": self._spill.root if self._spill is not None else None,
+            **{k: m[k] for k in ("writes", "spilled", "spill_dropped", "local_hits", "redis_hits",
+                                 "spill_hits", "misses")},
+        }
+
+
+doc_store = DocumentStore(cache)
+
+
 # ─── Session store (for /refine) ─────────────────────────────────────────────
 
 class SessionStore:
@@ -175,11 +730,22 @@ class SessionStore:
                                  get_settings().session_ttl_seconds)
         return payload
 
+    def load_run_memo(self, session_id: str) -> dict[str, Any] | None:
+        """The session's re-run memo (tools.run_memo_export). Kept under its
+        own cache key, never in the session payload: it is a pure spend
+        optimisation, so losing it only re-pays calls — no need to bloat
+        every session write with it."""
+        return self._cache.get_json(f"jmemo:{session_id}")
+
+    def save_run_memo(self, session_id: str, memo: dict[str, Any]) -> None:
+        self._cache.set_json(f"jmemo:{session_id}", memo, get_settings().session_ttl_seconds)
+
     def delete(self, session_id: str) -> bool:
         """Remove a session everywhere — cache and durable copy. The DB
         delete runs synchronously (unlike saves) so the caller can report
         a real outcome; returns the durable layer's success."""
         self._cache.delete(f"jsession:{session_id}")
+        self._cache.delete(f"jmemo:{session_id}")
         return postgres.session_delete(session_id)
 
 
@@ -195,6 +761,10 @@ sessions = SessionStore()
 
 # ─── Qdrant (segment embeddings — the flywheel) ──────────────────────────────
 
+# Points per retrieve/upsert request: one call covers a whole candidate pool.
+_QDRANT_BATCH = 256
+
+
 class QdrantStore:
     def __init__(self) -> None:
         self._client = None
@@ -241,32 +811,51 @@ class QdrantStore:
         return str(uuid.uuid5(uuid.NAMESPACE_URL, f"ik-segment:{doc_id}"))
 
     def get_vector(self, doc_id: str) -> list[float] | None:
+        return self.get_vectors([doc_id]).get(doc_id)
+
+    def get_vectors(self, doc_ids: list[str]) -> dict[str, list[float]]:
+        """Cached vectors for many docIds — one multi-point retrieve per
+        _QDRANT_BATCH ids instead of a round trip each. Misses are absent."""
         client = self._get()
-        if client is None:
-            return None
+        if client is None or not doc_ids:
+            return {}
+        by_point = {self.point_id(d): d for d in dict.fromkeys(doc_ids)}
+        point_ids = list(by_point)
+        out: dict[str, list[float]] = {}
         try:
-            points = client.retrieve(
-                collection_name=get_settings().judgement_qdrant_collection,
-                ids=[self.point_id(doc_id)],
-                with_vectors=True,
-            )
-            if points and points[0].vector:
-                return list(points[0].vector)
+            for start in range(0, len(point_ids), _QDRANT_BATCH):
+                points = client.retrieve(
+                    collection_name=get_settings().judgement_qdrant_collection,
+                    ids=point_ids[start:start + _QDRANT_BATCH],
+                    with_vectors=True,
+                    with_payload=False,
+                )
+                for point in points or []:
+                    doc_id = by_point.get(str(point.id))
+                    if doc_id is not None and point.vector:
+                        out[doc_id] = list(point.vector)
         except Exception as exc:
             logger.warning("[stores] Qdrant retrieve failed (%s)", exc)
-        return None
+        return out
 
     def put_vector(self, doc_id: str, vector: list[float], payload: dict[str, Any]) -> None:
+        self.put_vectors([(doc_id, vector, payload)])
+
+    def put_vectors(self, points: list[tuple[str, list[float], dict[str, Any]]]) -> None:
+        """Upsert many (docId, vector, payload) points in batched calls."""
         client = self._get()
-        if client is None:
+        if client is None or not points:
             return
         try:
             from qdrant_client import models as qm
-            client.upsert(
-                collection_name=get_settings().judgement_qdrant_collection,
-                points=[qm.PointStruct(id=self.point_id(doc_id), vector=vector,
-                                       payload={"doc_id": doc_id, **payload})],
-            )
+            structs = [qm.PointStruct(id=self.point_id(doc_id), vector=vector,
+                                      payload={"doc_id": doc_id, **payload})
+                       for doc_id, vector, payload in points]
+            for start in range(0, len(structs), _QDRANT_BATCH):
+                client.upsert(
+                    collection_name=get_settings().judgement_qdrant_collection,
+                    points=structs[start:start + _QDRANT_BATCH],
+                )
         except Exception as exc:
             logger.warning("[stores] Qdrant upsert failed (%s)", exc)
 
@@ -666,6 +1255,7 @@ doc_db = DocDBStore()
 def store_health() -> dict[str, Any]:
     return {
         "cache": cache.backend,
+        "docStore": doc_store.stats(),
         "qdrant": qdrant.available,
         "neo4j": neo4j_store.available,
         "postgres": postgres.available,
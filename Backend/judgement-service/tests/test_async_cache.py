@@ -0,0 +1,212 @@
+"""Asyncio cache API (stores.Cache.a*) and its use by the IK client.
+
+The sync Redis client blocked the event loop for a full round trip on every
+cache get/set inside IK coroutines. The a* methods run on redis.asyncio;
+MGET / pipelined SETEX batch the fan-out. These tests lock in the memory
+fallback semantics, the batching, the client wiring, that the a* path never
+touches the blocking client, and that a 24-wide burst of first callers opens
+one connection pool per loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+import stores
+import tools
+from schemas import KeywordSet
+from tools import IndianKanoonClient, build_ik_query
+
+
+class FakeAsyncRedis:
+    """Minimal redis.asyncio stand-in that counts round trips."""
+
+    def __init__(self, rtt: float = 0.0) -> None:
+        self.data: dict[str, str] = {}
+        self.calls: list[str] = []
+        self._rtt = rtt
+
+    async def _trip(self, op: str) -> None:
+        self.calls.append(op)
+        await asyncio.sleep(self._rtt)
+
+    async def get(self, key):
+        await self._trip("get")
+        return self.data.get(key)
+
+    async def mget(self, keys):
+        await self._trip("mget")
+        return [self.data.get(k) for k in keys]
+
+    async def setex(self, key, ttl, value):
+        await self._trip("setex")
+        self.data[key] = value
+
+    async def delete(self, key):
+        await self._trip("delete")
+        self.data.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeAsyncRedis) -> None:
+        self._redis = redis
+        self._ops: list[tuple[str, str]] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def setex(self, key, ttl, value):
+        self._ops.append((key, value))
+
+    async def execute(self):
+        await self._redis._trip("pipeline")
+        self._redis.data.update(self._ops)
+        return [True] * len(self._ops)
+
+
+@pytest.fixture()
+def redis_cache(monkeypatch):
+    def _make(fake) -> stores.Cache:
+        c = stores.Cache()
+
+        async def _aclient(binary: bool = False):
+            return fake
+        monkeypatch.setattr(c, "_aclient", _aclient)
+        monkeypatch.setattr(c, "_client", lambda: fake)
+        return c
+    return _make
+
+
+async def test_memory_fallback_keeps_sync_semantics(monkeypatch):
+    c = stores.Cache()
+    monkeypatch.setattr(c, "_aredis_failed", True)
+    monkeypatch.setattr(c, "_redis_failed", True)
+    await c.aset("a", "1", ttl=60)
+    await c.amset_json({"b": {"x": 1}, "c": [1]}, ttl=60)
+    await c.aset("gone", "x", ttl=-1)                     # already expired
+    assert await c.aget("a") == "1" == c.get("a")
+    assert await c.amget(["a", "missing", "gone"]) == ["1", None, None]
+    assert await c.amget_json(["b", "c"]) == [{"x": 1}, [1]]
+    c.set("d", "not json")
+    assert await c.aget_json("d") is None
+    await c.adelete("a")
+    assert c.get("a") is None
+
+
+async def test_multi_key_calls_are_one_round_trip(redis_cache):
+    fake = FakeAsyncRedis()
+    c = redis_cache(fake)
+    await c.amset_json({f"k{i}": i for i in range(24)})
+    assert await c.amget_json([f"k{i}" for i in range(24)]) == list(range(24))
+    assert fake.calls == ["pipeline", "mget"]
+
+
+async def test_fanout_reads_every_query_with_one_mget(redis_cache, monkeypatch):
+    fake = FakeAsyncRedis()
+    monkeypatch.setattr(tools, "cache", redis_cache(fake))
+    client = IndianKanoonClient()
+    anchors = [f"quashing ground {i}" for i in range(4)]
+    fake.data[client._search_key(build_ik_query(anchors[0]), 0)] = json.dumps(
+        [{"tid": 1, "title": "A v. State", "docsource": "Supreme Court of India"}])
+    searched: list[str] = []
+
+    async def fake_search(query: str, pagenum: int = 0):
+        searched.append(query)
+        return []
+
+    monkeypatch.setattr(client, "_search_page", fake_search)
+    tracker = tools.ik_cost_start()
+    pool = await client.fanout_and_fetch(KeywordSet(anchor_queries=anchors))
+    assert [c.doc_id for c in pool] == ["1"]
+    assert fake.calls == ["mget", "pipeline"]         # misses written back in one batch
+    assert len(searched) == 3 and tracker["cached"] == 1
+    assert all(fake.data[client._search_key(wire, 0)] == "[]" for wire in searched)
+
+
+async def test_doc_bundle_hit_reads_text_and_info_without_blocking(redis_cache, monkeypatch):
+    fake = FakeAsyncRedis()
+    shared = redis_cache(fake)
+    docs = stores.DocumentStore(shared, codec="zlib")
+    monkeypatch.setattr(tools, "cache", shared)
+    monkeypatch.setattr(tools, "doc_store", docs)
+    await docs.aset_text("ik:docz:9", "judgment text")
+    await docs.aset_json("ik:docidx:9", tools.DocAnalysis.build("judgment text").to_json())
+    fake.data["ik:docinfo2:9"] = json.dumps({"title": "X"})
+    fake.calls.clear()
+    text, info = await IndianKanoonClient().fetch_doc_bundle("9")
+    assert (text, info) == ("judgment text", {"title": "X"})
+    assert fake.calls == ["get"]        # text + index came from the local document tier
+
+
+async def test_async_path_never_uses_the_blocking_client(redis_cache, monkeypatch):
+    c = redis_cache(FakeAsyncRedis())
+
+    def blocking_client():
+        raise AssertionError("sync Redis client used from a coroutine")
+
+    monkeypatch.setattr(c, "_client", blocking_client)
+    await c.aset_json("q", [1], ttl=60)
+    await c.amset({"r": "2"})
+    assert await c.aget_json("q") == [1]
+    assert await c.amget(["q", "r"]) == ['[1]', "2"]
+    await c.adelete("q")
+
+
+class _ConnectingRedis(FakeAsyncRedis):
+    opened: list["_ConnectingRedis"] = []
+
+    def __init__(self, fail: bool = False) -> None:
+        super().__init__()
+        self.fail = fail
+        self.closed = False
+        _ConnectingRedis.opened.append(self)
+
+    async def ping(self):
+        await asyncio.sleep(0.001)      # every first caller is parked here at once
+        if self.fail:
+            raise ConnectionError("refused")
+        return True
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.fixture()
+def connecting_redis(monkeypatch):
+    import redis.asyncio as aioredis
+
+    _ConnectingRedis.opened = []
+    monkeypatch.setattr(stores, "get_settings", lambda: type(
+        "S", (), {"redis_url": "redis://test", "redis_max_connections": 8})())
+
+    def _install(fail: bool = False):
+        monkeypatch.setattr(aioredis.Redis, "from_url", classmethod(lambda cls, url, **kw: _ConnectingRedis(fail)))
+        return _ConnectingRedis.opened
+    return _install
+
+
+async def test_concurrent_first_callers_share_one_pool(connecting_redis):
+    opened = connecting_redis()
+    c = stores.Cache()
+    clients = await asyncio.gather(*(c._aclient() for _ in range(24)), c._aclient(binary=True))
+    assert len(opened) == 2                               # one text pool + one binary pool
+    assert all(client is opened[0] for client in clients[:24]) and clients[24] is opened[1]
+    assert await c._aclient() is opened[0]
+
+
+async def test_failed_connect_is_closed_and_falls_back_once(connecting_redis):
+    opened = connecting_redis(fail=True)
+    c = stores.Cache()
+    assert await asyncio.gather(*(c._aclient() for _ in range(24))) == [None] * 24
+    assert len(opened) == 1 and opened[0].closed
+    await c.aset("k", "v")
+    assert await c.aget("k") == "v"                       # served by the memory fallback
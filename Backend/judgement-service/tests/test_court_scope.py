@@ -5,6 +5,8 @@ IK exactly ONCE per scoped run (no forum-restricted duplicate re-run)."""
 
 import asyncio
 
+import stores
+import tools
 from schemas import KeywordSet
 from tools import (build_ik_query, ik_client, scope_allows_court,
                    set_court_scope, set_date_scope)
@@ -94,7 +96,11 @@ def _fanout_wires(monkeypatch, page_map=None):
         sent.append((query, pagenum))
         return []
 
-    monkeypatch.setattr(ik_client, "search", fake_search)
+    # An empty memory cache per run: the fan-out writes its misses back.
+    fresh = stores.Cache()
+    fresh._redis_failed = fresh._aredis_failed = True
+    monkeypatch.setattr(tools, "cache", fresh)
+    monkeypatch.setattr(ik_client, "_search_page", fake_search)
     keywords = KeywordSet(anchor_queries=['"civil dispute" quash', '"Section 482" quash'])
     asyncio.run(ik_client.fanout_and_fetch(keywords, page_map=page_map))
     return sent
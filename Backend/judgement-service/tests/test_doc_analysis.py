@@ -0,0 +1,140 @@
+"""Per-document analysis artifact behind find_pinpoint and the guardian.
+
+find_pinpoint used to re-split and re-tokenize every judgment for every
+issue, and CitationGuardian.verify re-normalized the whole text for every
+result. Both now read one DocAnalysis per document. These tests lock in
+that pinpoints are unchanged (against the old per-call implementation),
+the guardian's normalized containment check, the offset map, and the
+persisted index that rides next to the judgment text.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import re
+
+import pytest
+
+import stores
+import tools
+from schemas import Candidate, KeywordSet, ScoredResult, SignalSet
+from tools import DocAnalysis, doc_analysis, find_pinpoint
+
+WORDS = ("appellant respondent forfeiture natural justice hearing notice order "
+         "section quashing fir cognizable offence limitation delay condonation "
+         "held court the of and in a to is").split()
+
+
+def _old_find_pinpoint(text: str, issue_text: str, keywords: KeywordSet):
+    """The pre-index implementation, kept verbatim as the oracle."""
+    paragraphs = [p.strip() for p in re.split(r"\n\s*\n|\n(?=\d{1,3}\.\s)", text) if len(p.strip()) > 120]
+    if not paragraphs:
+        return None, None
+    issue_tokens = set(tools._tokens(issue_text)) | {t.lower() for t in keywords.all_terms()}
+    issue_tokens -= {"the", "of", "and", "in", "a", "to", "is", "for", "under", "whether"}
+    best_idx, best_score = -1, 0.0
+    for idx, para in enumerate(paragraphs):
+        para_tokens = set(tools._tokens(para))
+        overlap = len(issue_tokens & para_tokens)
+        if overlap >= 3:
+            score = overlap / math.sqrt(len(para_tokens) + 1)
+            if score > best_score:
+                best_idx, best_score = idx, score
+    if best_idx < 0:
+        return None, None
+    para = paragraphs[best_idx]
+    if len(para) > 500:
+        cut = para[:500]
+        para = cut[:cut.rfind(" ")] if " " in cut else cut
+    ref_match = re.match(r"^(\d{1,3})\.\s", paragraphs[best_idx])
+    ref = f"para {ref_match.group(1)}" if ref_match else f"para {best_idx + 1}"
+    return para, ref
+
+
+def _judgment(rng: random.Random) -> str:
+    parts = []
+    for n in range(1, rng.randint(3, 25)):
+        body = " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 120)))
+        lead = f"{n}. " if rng.random() < 0.6 else rng.choice(["", "  ", "\t"])
+        parts.append(lead + body + rng.choice(["", "  ", " \t"]))
+        parts.append(rng.choice(["\n\n", "\n", "\n \n", "\n\n\n"]))
+    return "".join(parts)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_analyses():
+    tools._analyses.clear()
+    yield
+    tools._analyses.clear()
+
+
+def test_pinpoints_match_the_old_implementation():
+    rng = random.Random(7)
+    keywords = KeywordSet(primary=["natural justice"], statutory=["Section"])
+    for i in range(300):
+        text = _judgment(rng)
+        issue = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 12)))
+        cand = Candidate(doc_id=str(i), title="t", doc_text=text)
+        assert find_pinpoint(cand, issue, keywords) == _old_find_pinpoint(text, issue, keywords)
+
+
+def test_analysis_is_built_once_per_document(monkeypatch):
+    text = "1. " + "the appellant was denied a hearing before forfeiture " * 5
+    cand = Candidate(doc_id="42", title="t", doc_text=text)
+    builds = []
+    real = DocAnalysis.build
+    monkeypatch.setattr(DocAnalysis, "build", lambda t: builds.append(1) or real(t))
+    for issue in ("hearing before forfeiture", "appellant denied hearing", "forfeiture hearing denied"):
+        assert find_pinpoint(cand, issue, KeywordSet())[1] == "para 1"
+    guardian_result = ScoredResult(doc_id="42", score=0.9, band="GREEN", pinpoint=text[3:80],
+                                   breakdown=SignalSet(semantic_match=0.9, keyword_match=0.8))
+    assert tools.citation_guardian.verify([guardian_result], {"42": cand})[1] == []
+    assert builds == [1]
+    cand.doc_text = text + "\n\n2. a new paragraph"          # same docId, new text
+    find_pinpoint(cand, "hearing before forfeiture", KeywordSet())
+    assert builds == [1, 1]
+
+
+def test_contains_and_locate_use_the_normalized_offset_map():
+    text = "  Held:\tthe  FIR\n\ndiscloses   NO offence.\n"
+    analysis = DocAnalysis.build(text)
+    assert analysis.contains("the fir discloses no")
+    assert not analysis.contains("fir was quashed")
+    start, end = analysis.locate("fir   DISCLOSES no")
+    assert text[start:end] == "FIR\n\ndiscloses   NO"
+    assert analysis.locate("Held:") == (2, 7)
+    assert analysis.locate("absent") is None
+    assert not DocAnalysis.build("  \n ").contains("")
+
+
+def test_persisted_index_round_trips_and_rejects_other_text():
+    text = _judgment(random.Random(3))
+    analysis = DocAnalysis.build(text)
+    payload = analysis.to_json()
+    loaded = DocAnalysis.from_json(payload, text)
+    assert loaded.spans == analysis.spans and loaded.refs == analysis.refs
+    assert loaded.postings == analysis.postings and loaded.sizes == analysis.sizes
+    assert DocAnalysis.from_json(payload, text + " ") is None
+    assert DocAnalysis.from_json({"v": 0}, text) is None
+
+
+async def test_fetch_warms_and_persists_the_index(monkeypatch):
+    docs = stores.DocumentStore(None, codec="zlib")
+    monkeypatch.setattr(tools, "doc_store", docs)
+    text = "1. " + "limitation delay condonation sufficient cause shown " * 5
+
+    async def fake_request(path, params):
+        return {"doc": text, "title": "A v. B"}
+
+    client = tools.IndianKanoonClient()
+    monkeypatch.setattr(client, "_request", fake_request)
+    await client.fetch_doc_bundle("7")
+    assert "7" in tools._analyses
+    stored = await docs.aget_json("ik:docidx:7")
+    assert DocAnalysis.from_json(stored, text) is not None
+
+    tools._analyses.clear()                                  # another worker
+    monkeypatch.setattr(DocAnalysis, "build", None)          # must not rebuild
+    assert await client.fetch_doc_text("7") == text
+    assert doc_analysis("7", text).refs == ["para 1"]
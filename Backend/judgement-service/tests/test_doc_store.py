@@ -0,0 +1,142 @@
+"""Compressed, size-aware judgment text tier (stores.DocumentStore).
+
+Full judgments are 200KB–2MB, so Redis memory ran out before IK spend did
+and the in-process fallback capped keys, not bytes. These tests lock in the
+codec round trip and metrics, the byte-budgeted local LRU, the
+content-addressed disk spill (written off the event loop, pruned by last
+use, refs included), and that blobs this process cannot decode read as
+misses.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+import pytest
+
+import stores
+
+JUDGMENT = ("The appellant challenges the order of forfeiture. Held that the "
+            "principles of natural justice were not followed. ") * 400
+
+
+def _store(tmp_path=None, **kw) -> stores.DocumentStore:
+    kw.setdefault("codec", "zlib")
+    if tmp_path is not None:
+        kw.setdefault("spill_dir", str(tmp_path))
+    return stores.DocumentStore(None, **kw)
+
+
+async def test_round_trip_and_compression_metrics():
+    docs = _store()
+    await docs.aset_text("ik:docz:1", JUDGMENT)
+    await docs.aset_json("ik:docrawz:1", {"html": "<p>x</p>"})
+    assert await docs.aget_text("ik:docz:1") == JUDGMENT
+    assert await docs.aget_json("ik:docrawz:1") == {"html": "<p>x</p>"}
+    assert await docs.aget_text("ik:docz:missing") is None
+    stats = docs.stats()
+    assert stats["codec"] == "zlib"
+    assert stats["compressionRatio"] > 10           # repetitive legal prose
+    assert stats["bytesSaved"] > 0
+    assert (stats["local_hits"], stats["misses"]) == (2, 1)
+
+
+async def test_local_tier_is_bounded_by_bytes_and_spills_to_disk(tmp_path):
+    docs = _store(tmp_path, codec="none", local_max_bytes=2500)
+    for i in range(3):
+        await docs.aset_text(f"ik:docz:{i}", f"{i}" * 1000)
+    stats = docs.stats()
+    assert stats["localBytes"] <= 2500 and stats["localEntries"] == 2
+    assert stats["spilled"] == 1
+    assert await docs.aget_text("ik:docz:0") == "0" * 1000   # served from the spill
+    assert docs.stats()["spill_hits"] == 1
+
+
+async def test_promoted_hits_never_outlive_their_source(tmp_path):
+    docs = _store(tmp_path, codec="none", local_max_bytes=2500)
+    await docs.aset_text("ik:docz:short", "s" * 1000, ttl=60)
+    for i in range(2):
+        await docs.aset_text(f"ik:docz:{i}", f"{i}" * 1000)      # spills "short"
+    await docs.aflush_spill()
+    started = time.time()
+    assert await docs.aget_text("ik:docz:short") == "s" * 1000
+    assert docs._local._data["ik:docz:short"][0] <= started + 61   # the spill's expiry
+
+    class Shared:
+        async def aget_bytes(self, key):
+            return b"R" + b"from redis"
+
+    docs = stores.DocumentStore(Shared(), codec="none")
+    assert await docs.aget_text("ik:docz:r") == "from redis"
+    assert docs._local._data["ik:docz:r"][0] <= time.time() + stores._PROMOTED_TTL_SECONDS
+
+
+async def test_spill_is_content_addressed_and_expires(tmp_path):
+    docs = _store(tmp_path, codec="none", local_max_bytes=10)  # every blob spills
+    await docs.aset_text("ik:docz:a", "same judgment text")
+    await docs.aset_text("ik:docrawz:a", "same judgment text")
+    await docs.aflush_spill()
+    objects = [f for _d, _s, files in os.walk(tmp_path / "objects") for f in files]
+    assert len(objects) == 1
+    await docs.aset_text("ik:docz:old", "stale", ttl=-1)
+    assert await docs.aget_text("ik:docz:old") is None
+
+
+async def test_spill_writes_run_on_the_writer_thread(tmp_path, monkeypatch):
+    docs = _store(tmp_path, codec="none", local_max_bytes=1500)
+    writers: list[str] = []
+    release = threading.Event()
+    real_put = docs._spill.put
+
+    def slow_put(key, blob, expires):
+        writers.append(threading.current_thread().name)
+        release.wait(5)
+        real_put(key, blob, expires)
+
+    monkeypatch.setattr(docs._spill, "put", slow_put)
+    for i in range(3):
+        await docs.aset_text(f"ik:docz:{i}", f"{i}" * 1000)   # returns while the disk write is parked
+    assert await docs.aget_text("ik:docz:0") == "0" * 1000    # queued spill is readable
+    release.set()
+    await docs.aflush_spill()
+    assert writers and all(name.startswith("doc-spill") for name in writers)
+    assert docs._spill.get("ik:docz:0") is not None
+
+
+async def test_prune_keeps_recently_used_objects_and_drops_stale_refs(tmp_path):
+    spill = stores._SpillDir(str(tmp_path), max_bytes=7500)   # hot 3000 + cold 4000 + gone 4000 bytes
+    far = time.time() + 3600
+    for name in ("hot", "cold", "gone"):
+        spill.put(name, name.encode() * 1000, far if name != "gone" else time.time() - 1)
+    obj = lambda name: spill._object_path(stores.hashlib.sha256(name.encode() * 1000).hexdigest())  # noqa: E731
+    for name, age in (("hot", 300), ("cold", 200), ("gone", 100)):
+        os.utime(obj(name), (time.time() - age, time.time() - age))
+    spill.put("hot-again", b"hot" * 1000, far)          # dedup hit refreshes the shared object
+    spill.prune()
+    assert spill.get("hot") == spill.get("hot-again") == b"hot" * 1000
+    assert spill.get("cold") is None and spill.get("gone") is None
+    assert not os.path.exists(spill._ref_path("cold")) and not os.path.exists(spill._ref_path("gone"))
+    assert os.path.exists(obj("gone"))                   # unreferenced, but inside the grace period
+
+
+async def test_blob_from_an_unknown_codec_is_a_miss():
+    docs = _store(codec="zlib")
+    docs._local.put("ik:docz:x", b"D\x00\x00\x00\x01garbage", expires=2e9)
+    assert await docs.aget_text("ik:docz:x") is None
+
+
+async def test_zstd_dictionary_round_trip(tmp_path):
+    pytest.importorskip("zstandard")
+    samples = [f"Case {i}: the appellant challenges forfeiture; held natural justice "
+               f"applies to order {i * 7}." * 20 for i in range(300)]
+    path = str(tmp_path / "judgments.dict")
+    dict_id = stores.train_zstd_dictionary(samples, path, size=4096)
+    docs = _store(codec="zstd", dict_path=path)
+    assert docs.stats()["codec"] == f"zstd+dict:{dict_id}"
+    await docs.aset_text("ik:docz:1", JUDGMENT)
+    assert await docs.aget_text("ik:docz:1") == JUDGMENT
+    plain = _store(codec="zstd")
+    plain._local.put("ik:docz:1", docs._local.get("ik:docz:1"), expires=2e9)
+    assert await plain.aget_text("ik:docz:1") is None    # needs the same dictionary
@@ -0,0 +1,87 @@
+"""Batched Qdrant access and the bounded local tier in EmbeddingTool.
+
+A 60-candidate pool used to cost 60 thread hops + Qdrant round trips for
+the lookup and one more per miss for the write-back. The pool now costs one
+multi-point retrieve and one upsert, and the process-local vector cache is
+an LRU that no longer grows without bound.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+import stores
+import tools
+from schemas import Candidate
+
+
+class FakeQdrantClient:
+    def __init__(self) -> None:
+        self.points: dict[str, list[float]] = {}
+        self.retrieves: list[int] = []
+        self.upserts: list[int] = []
+
+    def retrieve(self, collection_name, ids, with_vectors, with_payload):
+        self.retrieves.append(len(ids))
+        return [SimpleNamespace(id=i, vector=self.points[i]) for i in ids if i in self.points]
+
+    def upsert(self, collection_name, points):
+        self.upserts.append(len(points))
+        for p in points:
+            self.points[str(p.id)] = p.vector
+
+
+@pytest.fixture()
+def qdrant(monkeypatch):
+    fake = FakeQdrantClient()
+    store = stores.QdrantStore()
+    monkeypatch.setattr(store, "_get", lambda: fake)
+    monkeypatch.setattr(tools, "qdrant", store)
+    return fake
+
+
+def _cands(n: int, start: int = 0) -> list[Candidate]:
+    return [Candidate(doc_id=str(i), title=f"Case {i}", headline="held") for i in range(start, start + n)]
+
+
+def test_batch_get_and_put_round_trip(qdrant):
+    store = tools.qdrant
+    store.put_vectors([(str(i), [float(i), 1.0], {"title": "t"}) for i in range(300)])
+    assert qdrant.upserts == [256, 44]                 # chunked, not per point
+    got = store.get_vectors(["5", "299", "5", "missing"])
+    assert got == {"5": [5.0, 1.0], "299": [299.0, 1.0]}
+    assert qdrant.retrieves == [3]                     # duplicates collapsed
+
+
+async def test_pool_costs_one_retrieve_and_one_upsert(qdrant, monkeypatch):
+    tool = tools.EmbeddingTool()
+    embedded: list[int] = []
+
+    def fake_embed(texts, task_type):
+        embedded.append(len(texts))
+        return [[1.0, 0.0] for _ in texts]
+
+    monkeypatch.setattr(tool, "_embed_batch", fake_embed)
+    tools.qdrant.put_vectors([("0", [0.0, 1.0], {})])
+    qdrant.upserts.clear()
+
+    out = await tool.embed_candidates(_cands(60))
+    assert len(out) == 60 and out["0"] == [0.0, 1.0]
+    assert qdrant.retrieves == [60] and qdrant.upserts == [59] and embedded == [59]
+
+    await tool.embed_candidates(_cands(60))            # all local now
+    assert qdrant.retrieves == [60]
+    assert tool.stats["local_hits"] == 60 and tool.stats["qdrant_hits"] == 1
+    assert tool.stats["embedded"] == 59
+
+
+async def test_local_tier_is_a_bounded_lru(qdrant, monkeypatch):
+    monkeypatch.setattr(tools.get_settings(), "embed_local_cache_size", 3)
+    tool = tools.EmbeddingTool()
+    monkeypatch.setattr(tool, "_embed_batch", lambda texts, task: [[1.0] for _ in texts])
+    await tool.embed_candidates(_cands(3))
+    await tool.embed_candidates(_cands(1))             # touch "0" → most recent
+    await tool.embed_candidates(_cands(1, start=3))    # evicts "1"
+    assert list(tool._local) == ["2", "0", "3"]
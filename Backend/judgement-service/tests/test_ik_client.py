@@ -3,10 +3,20 @@ cap, and matched-term accumulation — with the network mocked out."""
 
 import pytest
 
+import stores
+import tools
 from schemas import KeywordSet
 from tools import IndianKanoonClient, build_ik_query
 
 
+@pytest.fixture(autouse=True)
+def _empty_cache(monkeypatch):
+    """The fan-out writes its misses back; keep each test's pages its own."""
+    fresh = stores.Cache()
+    fresh._redis_failed = fresh._aredis_failed = True
+    monkeypatch.setattr(tools, "cache", fresh)
+
+
 def _doc(tid: int, title: str = "Some Case v. State", citedby: int = 3):
     return {"tid": tid, "title": title, "headline": "…relevant snippet…",
             "docsource": "Supreme Court of India", "publishdate": "2019-04-05",
@@ -44,7 +54,7 @@ async def test_fanout_dedupes_unions_and_caps(monkeypatch):
             return [_doc(2), _doc(3)]          # doc 2 repeats → union, not dup
         return [_doc(100 + i) for i in range(30)]  # would blow past the cap
 
-    monkeypatch.setattr(client, "search", fake_search)
+    monkeypatch.setattr(client, "_search_page", fake_search)
 
     keywords = KeywordSet(
         statutory=["Section 482 CrPC"],
@@ -74,7 +84,7 @@ async def test_anchor_queries_search_first_with_extra_weight(monkeypatch):
             return [_doc(7)]
         return [_doc(8)]
 
-    monkeypatch.setattr(client, "search", fake_search)
+    monkeypatch.setattr(client, "_search_page", fake_search)
     keywords = KeywordSet(
         anchor_queries=['"Section 482" quashing matrimonial dispute'],
         statutory=["Section 482 CrPC"],
@@ -95,7 +105,7 @@ async def test_empty_keywords_fetch_nothing(monkeypatch):
     async def boom(query, pagenum=0):  # pragma: no cover
         raise AssertionError("must not hit IK with no terms")
 
-    monkeypatch.setattr(client, "search", boom)
+    monkeypatch.setattr(client, "_search_page", boom)
     assert await client.fanout_and_fetch(KeywordSet()) == []
 
 
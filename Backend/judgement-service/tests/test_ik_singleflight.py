@@ -0,0 +1,76 @@
+"""Single-flight coalescing of concurrent identical IK requests.
+
+Issues fan out concurrently and often send the same wire query or fetch the
+same /doc/ at the same moment. Only the first caller may bill IK; the rest
+await its in-flight request and are counted as "coalesced" in the run's
+cost tracker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import stores
+import tools
+from tools import IndianKanoonClient
+
+
+@pytest.fixture()
+def client(monkeypatch):
+    fresh = stores.Cache()
+    monkeypatch.setattr(fresh, "_aredis_failed", True)
+    monkeypatch.setattr(fresh, "_redis_failed", True)
+    monkeypatch.setattr(tools, "cache", fresh)
+    c = IndianKanoonClient()
+    c.sent: list[tuple[str, dict]] = []
+
+    async def fake_request_once(path, params=None):
+        c.sent.append((path, dict(params or {})))
+        tools._ik_count_billed(path)
+        await asyncio.sleep(0.01)
+        if path.startswith("/doc/"):
+            return {"doc": "<p>judgment</p>", "title": "A v. B"}
+        return {"docs": [{"tid": len(c.sent), "title": "A v. B"}]}
+
+    monkeypatch.setattr(c, "_request_once", fake_request_once)
+    return c
+
+
+async def test_identical_concurrent_searches_share_one_billed_call(client):
+    tracker = tools.ik_cost_start()
+    results = await asyncio.gather(*(client.search("forfeiture of plot") for _ in range(5)),
+                                   client.search("forfeiture of plot", pagenum=1))
+    assert len(client.sent) == 2                      # page 0 once, page 1 once
+    assert all(r == results[0] for r in results[:5])
+    assert tracker["billed"]["search"] == 2
+    assert tracker["coalesced"] == 4
+    assert client._inflight == {}
+
+
+async def test_doc_fetches_coalesce_and_later_calls_hit_the_cache(client):
+    tracker = tools.ik_cost_start()
+    first = await asyncio.gather(*(client.fetch_doc_bundle("77") for _ in range(3)))
+    assert len(client.sent) == 1 and tracker["coalesced"] == 2
+    assert await client.fetch_doc_bundle("77") == first[0]
+    assert len(client.sent) == 1 and tracker["cached"] == 1
+
+
+async def test_cancelled_caller_does_not_cancel_the_shared_request(client):
+    leader = asyncio.create_task(client.search("change of user"))
+    follower = asyncio.create_task(client.search("change of user"))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert (await follower)[0]["tid"] == 1
+    assert len(client.sent) == 1
+
+
+def test_coalesced_calls_are_folded_into_the_ledger_and_usage_rows():
+    tracker = tools.ik_cost_start()
+    tracker["coalesced"] = 3
+    ledger = tools.merge_cost_ledger({"coalesced": 2}, tracker)
+    assert ledger["coalesced"] == 5
+    rows = tools._usage_rows(tracker, "sid", "search")
+    row = next(r for r in rows if r["operation"] == "coalesced")
+    assert row["calls"] == 3 and row["producer_cost_inr"] == 0.0
@@ -68,6 +68,8 @@ def test_fanout_sends_only_the_display_queries(monkeypatch):
     issue never silently fetches nothing."""
     import asyncio
 
+    import stores
+    import tools
     from tools import ik_client
 
     sent: list[str] = []
@@ -76,7 +78,13 @@ def test_fanout_sends_only_the_display_queries(monkeypatch):
         sent.append(query)
         return []
 
-    monkeypatch.setattr(ik_client, "search", _fake_search)
+    def _empty_cache():  # the fan-out writes its misses back
+        fresh = stores.Cache()
+        fresh._redis_failed = fresh._aredis_failed = True
+        monkeypatch.setattr(tools, "cache", fresh)
+
+    monkeypatch.setattr(ik_client, "_search_page", _fake_search)
+    _empty_cache()
 
     kw = _kw()
     asyncio.run(ik_client.fanout_and_fetch(kw))
@@ -88,6 +96,7 @@ def test_fanout_sends_only_the_display_queries(monkeypatch):
         assert "abuse of process" not in wire  # axis terms not sent
 
     sent.clear()
+    _empty_cache()
     no_anchors = _kw().model_copy(update={"anchor_queries": [], "contra_queries": []})
     asyncio.run(ik_client.fanout_and_fetch(no_anchors))
     assert len(sent) == len(no_anchors.all_terms())  # degraded fallback
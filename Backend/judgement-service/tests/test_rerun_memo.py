@@ -0,0 +1,188 @@
+"""Session re-run memo (tools.run_memo_*) and the run diff.
+
+Re-running a session used to re-pay the rerank embeddings and one verifier
+call for every candidate it had already judged. These tests lock in that a
+re-run reuses memoised scores and raw verdicts keyed by (issue, docId,
+model), pays only for new candidates, never memoises degraded scores, and
+reports what changed against the previous run.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+
+import agents
+import tools
+from schemas import (
+    Candidate,
+    CaseContext,
+    Issue,
+    IssueResults,
+    JudgmentVerification,
+    KeywordSet,
+    ResultItem,
+    SearchResponse,
+)
+
+
+@pytest.fixture(autouse=True)
+def _no_memo_leak():
+    yield
+    tools._run_memo.set(None)
+
+
+def _cands(*ids: str) -> list[Candidate]:
+    return [Candidate(doc_id=i, title=f"Case {i}", headline="held",
+                      doc_text=f"Judgment {i}. The appeal is allowed.") for i in ids]
+
+
+def _fake_embedder(monkeypatch, calls: dict[str, list]):
+    async def embed_query(text):
+        calls["query"].append(text)
+        return [1.0, 0.0]
+
+    async def embed_candidates(cands):
+        calls["cands"].append([c.doc_id for c in cands])
+        return {c.doc_id: [1.0, float(c.doc_id)] for c in cands}
+
+    monkeypatch.setattr(tools.embedder, "embed_query", embed_query)
+    monkeypatch.setattr(tools.embedder, "embed_candidates", embed_candidates)
+
+
+async def test_rerank_reuses_memoised_scores(monkeypatch):
+    calls: dict[str, list] = {"query": [], "cands": []}
+    _fake_embedder(monkeypatch, calls)
+    memo = tools.run_memo_start()
+    first = await tools.rerank("issue", _cands("1", "2"))
+
+    memo = tools.run_memo_start(tools.run_memo_export(memo))   # next run of the session
+    second = await tools.rerank("issue", _cands("1", "2", "3"))
+    assert calls["cands"] == [["1", "2"], ["3"]]            # only the new candidate
+    assert second["1"] == first["1"] and second["2"] == first["2"]
+
+    calls["query"].clear()
+    memo = tools.run_memo_start(tools.run_memo_export(memo))
+    await tools.rerank("issue", _cands("3", "1"))
+    assert calls["query"] == []                             # nothing new → no embedding call
+    assert memo["stats"]["semantic_reused"] == 2
+    await tools.rerank("another issue", _cands("1"))        # different issue → not reused
+    assert memo["stats"]["semantic_fresh"] == 1
+
+
+async def test_degraded_scores_are_never_memoised(monkeypatch):
+    async def no_vector(text):
+        return None
+
+    monkeypatch.setattr(tools.embedder, "embed_query", no_vector)
+    memo = tools.run_memo_start()
+    await tools.rerank("appeal allowed", _cands("1"))
+    assert memo["semantic"] == {}
+
+
+async def test_rerun_reuses_verdicts_and_reruns_the_rules(monkeypatch):
+    settings = tools.get_settings()
+    monkeypatch.setattr(settings, "verifier_use_claude", False)
+    llm_calls: list[str] = []
+    enforced: list[str] = []
+
+    async def fake_direct(message):
+        llm_calls.append(message)
+        return JudgmentVerification(verdict="support", score=80)
+
+    def fake_rules(verdict, doc_text, perspective, shelf_patterns):
+        enforced.append(doc_text)
+        return verdict
+
+    monkeypatch.setattr(agents, "_verify_direct_cached", fake_direct)
+    monkeypatch.setattr(agents, "enforce_verifier_rules", fake_rules)
+    issue = Issue(id=1, issue="Whether the appeal lies?")
+    ctx = CaseContext(document_type="petition", relief_sought="setting aside")
+
+    memo = tools.run_memo_start()
+    first = await agents.verify_judgments(issue, ctx, _cands("1", "2"), KeywordSet())
+    assert len(llm_calls) == 2
+
+    memo = tools.run_memo_start(tools.run_memo_export(memo))
+    second = await agents.verify_judgments(issue, ctx, _cands("1", "2", "3"), KeywordSet())
+    assert len(llm_calls) == 3                              # only doc 3 is paid for
+    assert second["1"] == first["1"] and set(second) == {"1", "2", "3"}
+    assert len(enforced) == 5                               # rules re-run on reused verdicts
+
+    tools.run_memo_start(tools.run_memo_export(memo))
+    other_ctx = ctx.model_copy(update={"relief_sought": "bail"})
+    await agents.verify_judgments(issue, other_ctx, _cands("1"), KeywordSet())
+    assert len(llm_calls) == 4                              # client context is part of the key
+
+
+async def test_fallback_verdicts_are_keyed_on_the_model_that_produced_them(monkeypatch):
+    settings = tools.get_settings()
+    monkeypatch.setattr(settings, "verifier_use_claude", True)
+    claude_up = {"ok": False}
+    calls: list[str] = []
+
+    async def fake_claude(system, message, schema, **kwargs):
+        calls.append(kwargs["model"])
+        return JudgmentVerification(verdict="support", score=90) if claude_up["ok"] else None
+
+    async def fake_direct(message):
+        calls.append(settings.gemini_model)
+        return JudgmentVerification(verdict="interim", score=50)
+
+    monkeypatch.setattr(agents, "claude_available", lambda: True)
+    monkeypatch.setattr(agents, "claude_parse", fake_claude)
+    monkeypatch.setattr(agents, "_verify_direct_cached", fake_direct)
+    monkeypatch.setattr(agents, "enforce_verifier_rules", lambda verdict, *_: verdict)
+    issue = Issue(id=1, issue="Whether the appeal lies?")
+    ctx = CaseContext(document_type="petition", relief_sought="setting aside")
+    claude_model = settings.judgement_verifier_claude_model
+
+    memo = tools.run_memo_start()
+    await agents.verify_judgments(issue, ctx, _cands("1"), KeywordSet())
+    assert calls == [claude_model, settings.gemini_model]
+    assert memo["stats"] == {"verifications_fresh": 1}      # one lookup, however many keys
+
+    memo = tools.run_memo_start(tools.run_memo_export(memo))
+    calls.clear()
+    again = await agents.verify_judgments(issue, ctx, _cands("1"), KeywordSet())
+    assert calls == [claude_model]                          # Claude retried, Gemini verdict reused
+    assert again["1"].verdict == "interim"
+    assert memo["stats"] == {"verifications_reused": 1}
+
+    memo = tools.run_memo_start(tools.run_memo_export(memo))
+    claude_up["ok"] = True
+    calls.clear()
+    recovered = await agents.verify_judgments(issue, ctx, _cands("1"), KeywordSet())
+    assert calls == [claude_model]                          # fallback verdict is never served as Claude's
+    assert recovered["1"].verdict == "support"
+
+
+def test_export_keeps_the_newest_entries(monkeypatch):
+    monkeypatch.setattr(tools.get_settings(), "rerun_memo_max_entries", 2)
+    memo = tools.run_memo_start({"semantic": {"a": 0.1, "b": 0.2, "c": 0.3}})
+    assert tools.memo_get("semantic", "a") == 0.1          # a use refreshes recency
+    assert tools.run_memo_export(memo)["semantic"] == {"c": 0.3, "a": 0.1}
+
+
+def test_run_diff_reports_added_removed_and_changed():
+    def item(doc_id, band, score):
+        return ResultItem(docId=doc_id, title="t", court="c", band=band, score=score)
+
+    previous = [{"id": 1, "results": [item("a", "GREEN", 0.9).model_dump(),
+                                      item("b", "YELLOW", 0.7).model_dump(),
+                                      item("c", "GREEN", 0.8).model_dump()]}]
+    response = SearchResponse(sessionId="s", issues=[
+        IssueResults(id=1, issue="i", results=[item("a", "GREEN", 0.9), item("b", "GREEN", 0.82),
+                                               item("d", "YELLOW", 0.76)]),
+        IssueResults(id=2, issue="j", results=[item("e", "GREEN", 0.85)]),
+    ])
+    stats = Counter(verifications_reused=2, verifications_fresh=1, semantic_reused=5)
+    diff = agents.run_diff(previous, response, stats)
+    assert diff["issues"]["1"] == {
+        "added": ["d"], "removed": ["c"], "unchanged": 1,
+        "changed": [{"docId": "b", "band": ["YELLOW", "GREEN"], "score": [0.7, 0.82]}],
+    }
+    assert diff["issues"]["2"]["added"] == ["e"]
+    assert diff["reused"] == {"semantic": 5, "verifications": 2}
+    assert diff["fresh"] == {"semantic": 0, "verifications": 1}
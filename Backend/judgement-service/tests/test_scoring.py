@@ -81,3 +81,36 @@ def test_bands_follow_configured_thresholds():
     assert band_for((green + yellow) / 2) == "YELLOW"
     assert band_for(yellow) == "YELLOW"
     assert band_for(yellow - 0.05) == "RED"
+
+
+def test_columnar_scores_match_the_scalar_formula():
+    """composite_scores (the whole pool as arrays) must give every result
+    the exact score, gate and breakdown composite_score gives it alone."""
+    import random
+
+    from tools import composite_scores
+    rng = random.Random(11)
+    maybe = lambda: None if rng.random() < 0.3 else rng.random()  # noqa: E731
+    pool = [SignalSet(semantic_match=rng.random(), keyword_match=rng.random(),
+                      authority=maybe(), good_law_status=maybe(), party_fit=maybe(),
+                      fact_match=maybe(),
+                      good_law_status_label=rng.choice([None, "valid", "review", "overruled"]))
+            for _ in range(2000)]
+    for weights in (W1, W2, PHASE_WEIGHT_PRESETS[3]):
+        batch = composite_scores(pool, weights)
+        for signals, result in zip(pool, batch):
+            single = composite_score(signals, weights)
+            assert (result.score, result.red_flag) == (single.score, single.red_flag)
+            assert result.breakdown is signals
+    assert composite_scores([], W1) == []
+
+
+def test_court_tiers_are_memoised_per_docsource():
+    from schemas import Candidate
+    from tools import _court_tier, authority_signal
+    _court_tier.cache_clear()
+    for i in range(50):
+        authority_signal(Candidate(doc_id=str(i), title="t", court="Bombay High Court"))
+    assert _court_tier.cache_info().misses == 1
+    value, label = authority_signal(Candidate(doc_id="x", title="t", court="Gram Nyayalaya"))
+    assert (value, label) == (round(0.7 * 0.3, 4), "Gram Nyayalaya")
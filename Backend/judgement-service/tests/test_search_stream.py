@@ -0,0 +1,146 @@
+"""Streaming search run (POST /api/v1/search/{id}/run/stream).
+
+/run gathers every issue before answering, so the UI waited on the slowest
+issue's verifier wave. The stream sends each issue's guardian-verified
+results the moment that issue's round completes, then a summary event.
+These tests lock in completion-order delivery, that the guardian still
+runs on streamed results, the event protocol (ending in [DONE] on success
+and failure), and that a client hanging up cancels the run cleanly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+import agents
+import api
+import auth
+from api import app
+from schemas import Candidate, CaseContext, Issue, RunSearchRequest, ScoredResult, SignalSet
+from stores import postgres, sessions
+
+client = TestClient(app)
+DELAYS = {1: 0.3, 2: 0.0}
+
+
+@pytest.fixture(autouse=True)
+def _offline(monkeypatch):
+    monkeypatch.setattr(postgres, "session_upsert", lambda sid, payload: True)
+    monkeypatch.setattr(postgres, "session_select", lambda sid: None)
+    monkeypatch.setattr(postgres, "usage_insert_events", lambda rows: 0)
+    monkeypatch.setattr(auth, "_jwt_secret", lambda: None)
+
+    async def fake_process(issue, context, pre_keywords=None, curated=False,
+                           query_style="simple", page_map=None):
+        await asyncio.sleep(DELAYS[issue.id])
+        doc = f"{issue.id}00"
+        cand = Candidate(doc_id=doc, title=f"Case {doc}", court="Supreme Court of India",
+                         doc_text="The FIR discloses no offence.")
+        results = [ScoredResult(doc_id=doc, score=0.9, band="GREEN",
+                                breakdown=SignalSet(semantic_match=0.9, keyword_match=0.5),
+                                pinpoint="the FIR discloses no offence"),
+                   # never fetched — the guardian must drop it from the stream too
+                   ScoredResult(doc_id="999", score=0.99, band="GREEN",
+                                breakdown=SignalSet(semantic_match=0.99, keyword_match=0.5))]
+        return {"issue": issue, "keywords": None, "candidates": {doc: cand}, "scored": results}
+
+    monkeypatch.setattr(agents, "_process_issue", fake_process)
+
+
+def _seed(session_id: str) -> None:
+    sessions.save(session_id, {
+        "caseContext": {"document_type": "note"},
+        "suggestedIssues": [Issue(id=1, issue="slow issue").model_dump(),
+                            Issue(id=2, issue="fast issue").model_dump()],
+        "issues": [],
+    })
+
+
+async def test_issues_are_delivered_in_completion_order():
+    sid = "stream-order"
+    _seed(sid)
+    arrived: list[tuple[int, float]] = []
+    start = time.perf_counter()
+
+    async def on_issue(issue):
+        arrived.append((issue.id, time.perf_counter() - start))
+
+    issues = [Issue(id=1, issue="slow issue"), Issue(id=2, issue="fast issue")]
+    response = await agents.run_issue_search(sid, CaseContext(document_type="note"),
+                                             issues, on_issue=on_issue)
+    assert [i for i, _ in arrived] == [2, 1]
+    assert arrived[0][1] < DELAYS[1] / 2                 # fast issue did not wait
+    assert [i.id for i in response.issues] == [1, 2]     # final payload keeps issue order
+    assert response.guardianDropped == 2
+    assert sessions.load(sid)["issues"][0]["results"][0]["docId"] == "100"
+    assert "runMemo" not in sessions.load(sid)              # memo lives under its own key
+    assert set(sessions.load_run_memo(sid)) == {"semantic", "verifications"}
+
+
+def test_stream_emits_issue_events_then_summary():
+    sid = "stream-api"
+    _seed(sid)
+    with client.stream("POST", f"/api/v1/search/{sid}/run/stream", json={}) as resp:
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        lines = [line[len("data: "):] for line in resp.iter_lines() if line.startswith("data: ")]
+    assert lines[-1] == "[DONE]"
+    events = [json.loads(line) for line in lines[:-1]]
+    assert [e["type"] for e in events] == ["issue", "issue", "summary"]
+    assert [e["issue"]["id"] for e in events[:2]] == [2, 1]
+    assert all([r["docId"] for r in e["issue"]["results"]] == [f"{e['issue']['id']}00"]
+               for e in events[:2])
+    summary = events[2]
+    assert summary["sessionId"] == sid and summary["guardianDropped"] == 2
+    assert summary["issueOrder"] == [1, 2] and "issues" not in summary
+    assert set(summary["cost"]) == {"aiInr", "ikInr", "sessionTotalInr"}
+
+
+def test_stream_unknown_session_is_a_plain_404():
+    resp = client.post("/api/v1/search/nope/run/stream", json={})
+    assert resp.status_code == 404
+
+
+def test_failed_run_still_ends_with_done(monkeypatch):
+    sid = "stream-fail"
+    _seed(sid)
+
+    async def broken(*args, **kwargs):
+        raise RuntimeError("verifier exploded")
+
+    monkeypatch.setattr(api, "run_issue_search", broken)
+    with client.stream("POST", f"/api/v1/search/{sid}/run/stream", json={}) as resp:
+        lines = [line[len("data: "):] for line in resp.iter_lines() if line.startswith("data: ")]
+    assert lines[-1] == "[DONE]"
+    assert [json.loads(line)["type"] for line in lines[:-1]] == ["error"]
+
+
+async def test_client_hanging_up_cancels_the_run(monkeypatch):
+    sid = "stream-hangup"
+    _seed(sid)
+    fast_process = agents._process_issue
+    cancelled = asyncio.Event()
+
+    async def slow_first(issue, context, *args, **kwargs):
+        if issue.id == 2:
+            return await fast_process(issue, context, *args, **kwargs)
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    monkeypatch.setattr(agents, "_process_issue", slow_first)
+    request = Request({"type": "http", "method": "POST", "headers": [], "path": "/"})
+    resp = await api.search_run_stream(sid, RunSearchRequest(), request)
+    stream = resp.body_iterator
+    first = await stream.__anext__()
+    assert '"type": "issue"' in first
+    await stream.aclose()                                # no yield from finally → closes cleanly
+    await asyncio.wait_for(cancelled.wait(), 1)
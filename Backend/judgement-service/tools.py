@@ -11,17 +11,21 @@ never originate a citation.
 from __future__ import annotations
 
 import asyncio
+import bisect
 import contextvars
 import hashlib
 import logging
 import math
 import re
+import time
 import uuid
-from collections import Counter
+from collections import Counter, OrderedDict
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
 import httpx
+import numpy as np
 
 from config import get_settings
 from schemas import (
@@ -35,7 +39,7 @@ from schemas import (
     SignalSet,
     SourcePage,
 )
-from stores import cache, neo4j_store, qdrant
+from stores import cache, doc_store, neo4j_store, qdrant
 
 logger = logging.getLogger(__name__)
 
@@ -575,6 +579,11 @@ class IndianKanoonClient:
         # token expired). Surfaced to the UI so an auth failure never
         # masquerades as an honest "0 citations". Cleared by the next 200.
         self.auth_failed = False
+        # Single-flight registry: (path, params) → the in-flight request.
+        # Concurrent issues often send the same wire query or fetch the same
+        # /doc/ at the same moment; they share ONE paid call instead of each
+        # missing the cache and billing its own.
+        self._inflight: dict[tuple, asyncio.Task] = {}
 
     @property
     def _token(self) -> str | None:
@@ -601,6 +610,22 @@ class IndianKanoonClient:
             await self._http.aclose()
 
     async def _request(self, path: str, params: dict[str, Any] | None = None) -> Any | None:
+        """Coalescing front of _request_once: an identical request already in
+        flight is awaited instead of re-sent. The shared task is shielded, so
+        one cancelled caller never cancels the call for the others."""
+        key = (path, tuple(sorted((params or {}).items())))
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+        if task is not None and task.get_loop() is loop:
+            _ik_count_coalesced()
+            return await asyncio.shield(task)
+        task = loop.create_task(self._request_once(path, params))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._inflight.pop(key, None)
+                               if self._inflight.get(key) is done else None)
+        return await asyncio.shield(task)
+
+    async def _request_once(self, path: str, params: dict[str, Any] | None = None) -> Any | None:
         token = self._token
         if not token:
             logger.warning("[IK] token not configured — skipping %s", path)
@@ -655,20 +680,28 @@ class IndianKanoonClient:
                 return None
         return None
 
-    async def search(self, query: str, pagenum: int = 0) -> list[dict[str, Any]]:
+    @staticmethod
+    def _search_key(query: str, pagenum: int) -> str:
         norm = normalize_ws(query)
-        cache_key = f"ik:search:{hashlib.sha1(norm.encode()).hexdigest()}:{pagenum}"
-        cached = cache.get_json(cache_key)
+        return f"ik:search:{hashlib.sha1(norm.encode()).hexdigest()}:{pagenum}"
+
+    async def search(self, query: str, pagenum: int = 0) -> list[dict[str, Any]]:
+        cache_key = self._search_key(query, pagenum)
+        cached = await cache.aget_json(cache_key)
         if cached is not None:
             _ik_count_cached()
             return cached
+        docs = await self._search_page(query, pagenum)
+        await cache.aset_json(cache_key, docs, ttl=86400)
+        return docs
+
+    async def _search_page(self, query: str, pagenum: int) -> list[dict[str, Any]]:
+        """One uncached /search/ call → its docs. Callers own the cache."""
         # maxpages=1 pins the bill to exactly ONE page (₹0.50) per call —
         # IK bills per page returned, and pagenum jumps are free.
         data = await self._request("/search/", {"formInput": query, "pagenum": pagenum,
                                                 "maxpages": 1})
-        docs = (data or {}).get("docs") or []
-        cache.set_json(cache_key, docs, ttl=86400)
-        return docs
+        return (data or {}).get("docs") or []
 
     async def search_raw(self, query: str, pagenum: int = 0) -> dict[str, Any] | None:
         """Raw /search/ call for the user-facing Advanced Search: preserves
@@ -677,7 +710,7 @@ class IndianKanoonClient:
         token rejected), distinct from an honest zero-result response."""
         norm = normalize_ws(query)
         cache_key = f"ik:searchraw:{hashlib.sha1(norm.encode()).hexdigest()}:{pagenum}"
-        cached = cache.get_json(cache_key)
+        cached = await cache.aget_json(cache_key)
         if cached is not None:
             _ik_count_cached()
             return cached
@@ -685,19 +718,23 @@ class IndianKanoonClient:
                                                 "maxpages": 1})
         if data is None:
             return None
-        cache.set_json(cache_key, data, ttl=86400)
+        await cache.aset_json(cache_key, data, ttl=86400)
         return data
 
     async def fetch_doc_bundle(self, doc_id: str) -> tuple[str | None, dict[str, Any]]:
         """One /doc call → (full text, info). info carries publish date and
         cite/citedby samples+totals for the report's citation-context
         section. Both parts cached 7 days so a report view after a search
-        never re-bills the document."""
-        text = cache.get(f"ik:doc:{doc_id}")
-        # v2 cache key: samples carry docId dicts, not bare title strings.
-        info = cache.get_json(f"ik:docinfo2:{doc_id}")
+        never re-bills the document. The paragraph index pinpoints and the
+        guardian read (DocAnalysis) is warmed here too, once per document."""
+        # Text lives in the compressed document tier ("z" keys); v2 info
+        # key: samples carry docId dicts, not bare title strings.
+        text, info = await asyncio.gather(doc_store.aget_text(f"ik:docz:{doc_id}"),
+                                          cache.aget_json(f"ik:docinfo2:{doc_id}"))
         if text is not None and info is not None:
             _ik_count_cached()
+            if text:
+                await warm_doc_analysis(doc_id, text)
             return text or None, info
         # maxcites/maxcitedby are REQUIRED for IK to include citeList /
         # citedbyList in the response — without them both come back empty.
@@ -726,8 +763,10 @@ class IndianKanoonClient:
             "casesCitedSample": _extract_samples(cite_list)[:20],
             "citedBySample": _extract_samples(citedby_list)[:20],
         }
-        cache.set(f"ik:doc:{doc_id}", full_text, ttl=7 * 86400)
-        cache.set_json(f"ik:docinfo2:{doc_id}", info, ttl=7 * 86400)
+        await asyncio.gather(doc_store.aset_text(f"ik:docz:{doc_id}", full_text, ttl=7 * 86400),
+                             cache.aset_json(f"ik:docinfo2:{doc_id}", info, ttl=7 * 86400))
+        if full_text:
+            await warm_doc_analysis(doc_id, full_text, fresh=True)
         return full_text or None, info
 
     async def fetch_doc_text(self, doc_id: str) -> str | None:
@@ -741,8 +780,8 @@ class IndianKanoonClient:
         in-app page renders like Indian Kanoon's doc page. Cached 7 days,
         separate from the pipeline's stripped-text cache. None = the call
         itself failed (network / token rejected)."""
-        cache_key = f"ik:docraw:{doc_id}"
-        cached = cache.get_json(cache_key)
+        cache_key = f"ik:docrawz:{doc_id}"
+        cached = await doc_store.aget_json(cache_key)
         if cached is not None:
             _ik_count_cached()
             return cached
@@ -771,14 +810,14 @@ class IndianKanoonClient:
             "casesCited": _samples(cite_list),
             "citedBy": _samples(citedby_list),
         }
-        cache.set_json(cache_key, raw, ttl=7 * 86400)
+        await doc_store.aset_json(cache_key, raw, ttl=7 * 86400)
         return raw
 
     async def fetch_doc_meta(self, doc_id: str) -> dict[str, Any]:
         """/docmeta/ — cheap metadata call (author, bench, publish date).
         Cached 7 days; returns {} when unavailable."""
         cache_key = f"ik:docmeta:{doc_id}"
-        cached = cache.get_json(cache_key)
+        cached = await cache.aget_json(cache_key)
         if cached is not None:
             _ik_count_cached()
             return cached
@@ -786,7 +825,7 @@ class IndianKanoonClient:
         meta = {k: strip_html(str(v)).strip() for k, v in data.items()
                 if isinstance(v, (str, int, float)) and k in
                 ("title", "publishdate", "author", "bench", "docsource", "doctype")}
-        cache.set_json(cache_key, meta, ttl=7 * 86400)
+        await cache.aset_json(cache_key, meta, ttl=7 * 86400)
         return meta
 
     async def fanout_and_fetch(self, keywords: KeywordSet, cap: int | None = None,
@@ -843,9 +882,19 @@ class IndianKanoonClient:
             page = page_map.get(wire, -1) + 1
             page_map[wire] = page
             pages.append(page)
-        results = await asyncio.gather(
-            *(self.search(wire, pagenum=page)
-              for (_label, wire, _weight, _take), page in zip(queries, pages)))
+        # One MGET for the whole fan-out; only cache misses go to IK, and
+        # their pages are written back in one pipelined MSET.
+        keys = [self._search_key(wire, page) for (_label, wire, _weight, _take), page in zip(queries, pages)]
+        cached = await cache.amget_json(keys)
+        misses = [i for i, docs in enumerate(cached) if docs is None]
+        for _hit in range(len(queries) - len(misses)):
+            _ik_count_cached()
+        fetched = await asyncio.gather(*(self._search_page(queries[i][1], pages[i]) for i in misses))
+        results = list(cached)
+        for i, docs in zip(misses, fetched):
+            results[i] = docs
+        if misses:
+            await cache.amset_json({keys[i]: docs for i, docs in zip(misses, fetched)}, ttl=86400)
 
         by_id: dict[str, Candidate] = {}
         hits: Counter[str] = Counter()
@@ -933,7 +982,7 @@ def ik_cost_start() -> dict:
     """Begin tracking IK calls AND AI-model token usage for the current task
     tree (fan-out child tasks — and asyncio.to_thread workers — inherit the
     context, so a whole pipeline phase reports into one tracker)."""
-    tracker: dict = {"billed": Counter(), "cached": 0,
+    tracker: dict = {"billed": Counter(), "cached": 0, "coalesced": 0,
                      "llm": {}, "embed_calls": 0, "embed_tokens_est": 0,
                      "grounding_calls": 0, "cache_storage": {}}
     _ik_cost_tracker.set(tracker)
@@ -964,6 +1013,13 @@ def _ik_count_cached() -> None:
         tracker["cached"] += 1
 
 
+def _ik_count_coalesced() -> None:
+    """A call that joined an identical in-flight request (no bill of its own)."""
+    tracker = _ik_cost_tracker.get()
+    if tracker is not None:
+        tracker["coalesced"] = tracker.get("coalesced", 0) + 1
+
+
 # Console labels per pipeline task (agent name → readable step).
 _TASK_LABELS = {
     "doc_classify": "1 Document classification",
@@ -1069,6 +1125,7 @@ def merge_cost_ledger(ledger: dict | None, tracker: dict) -> dict:
         "llm": {model: dict(row) for model, row in (led.get("llm") or {}).items()},
         "billed": dict(led.get("billed") or {}),
         "cached": int(led.get("cached") or 0),
+        "coalesced": int(led.get("coalesced") or 0),
         "embed_calls": int(led.get("embed_calls") or 0),
         "embed_tokens_est": int(led.get("embed_tokens_est") or 0),
         "grounding_calls": int(led.get("grounding_calls") or 0),
@@ -1080,6 +1137,7 @@ def merge_cost_ledger(ledger: dict | None, tracker: dict) -> dict:
     for kind, count in dict(tracker.get("billed") or {}).items():
         out["billed"][kind] = out["billed"].get(kind, 0) + count
     out["cached"] += tracker.get("cached", 0)
+    out["coalesced"] += tracker.get("coalesced", 0)
     out["embed_calls"] += tracker.get("embed_calls", 0)
     out["embed_tokens_est"] += tracker.get("embed_tokens_est", 0)
     out["grounding_calls"] += tracker.get("grounding_calls", 0)
@@ -1190,6 +1248,15 @@ def _usage_rows(tracker: dict, session_id: str | None, stage: str) -> list[dict[
                      "cache_hit": True,
                      "metadata": {"cache_method": "response_cache"},
                      "producer_cost_inr": 0.0})
+    if tracker.get("coalesced"):
+        n = int(tracker["coalesced"])
+        rows.append({**base, "provider": "indian_kanoon", "service": "indian_kanoon",
+                     "operation": "coalesced", "model": None,
+                     "unit": "calls", "quantity": n, "calls": n,
+                     "input_tokens": 0, "output_tokens": 0,
+                     "cache_hit": True,
+                     "metadata": {"cache_method": "single_flight"},
+                     "producer_cost_inr": 0.0})
     for step_no, row in enumerate(rows):
         row["step_no"] = step_no
         row["event_key"] = (f"jud:{run_id}:{step_no}:{row['operation']}:"
@@ -1299,7 +1366,7 @@ def run_cost_log(tracker: dict, tag: str, step: dict | None = None) -> None:
 
     billed: Counter = tracker["billed"]
     ik_total = sum(IK_RATES_INR[kind] * count for kind, count in billed.items())
-    if billed or tracker.get("cached"):
+    if billed or tracker.get("cached") or tracker.get("coalesced"):
         logger.info("[cost] %s", dash)
         logger.info("[cost] %-28s %6s %12s %12s %9s",
                     "Indian Kanoon", "Calls", "Rate", "", "Cost INR")
@@ -1313,6 +1380,9 @@ def run_cost_log(tracker: dict, tag: str, step: dict | None = None) -> None:
         if tracker.get("cached"):
             logger.info("[cost] %-28s %6d %12s %12s %9.2f",
                         "Cache hits (free)", tracker["cached"], "-", "", 0.0)
+        if tracker.get("coalesced"):
+            logger.info("[cost] %-28s %6d %12s %12s %9.2f",
+                        "Coalesced in-flight (free)", tracker["coalesced"], "-", "", 0.0)
         logger.info("[cost] %-28s %6s %12s %12s %9.2f",
                     "IK subtotal", "", "", "", ik_total)
 
@@ -1336,7 +1406,17 @@ class EmbeddingTool:
     def __init__(self) -> None:
         self._client = None
         self._failed = False
-        self._local: dict[str, list[float]] = {}
+        # Bounded LRU (docId → vector) in front of Qdrant.
+        self._local: OrderedDict[str, list[float]] = OrderedDict()
+        # Cumulative per-phase counters: hits/misses per tier and the wall
+        # time spent in each remote phase.
+        self.stats: Counter[str] = Counter()
+
+    def _remember(self, doc_id: str, vec: list[float]) -> None:
+        self._local[doc_id] = vec
+        self._local.move_to_end(doc_id)
+        while len(self._local) > get_settings().embed_local_cache_size:
+            self._local.popitem(last=False)
 
     def _genai(self):
         if self._client is not None or self._failed:
@@ -1390,41 +1470,52 @@ class EmbeddingTool:
 
     async def embed_candidates(self, candidates: list[Candidate]) -> dict[str, list[float]]:
         """Segment-level embeddings (headnote/top snippet — never the whole
-        judgment). Qdrant cache first; only misses hit the embedding API.
-        Cache lookups and write-backs run concurrently — sequential remote
-        round-trips here used to add a full pool-size × latency wait."""
+        judgment). Local LRU, then Qdrant; only misses hit the embedding API.
+        The Qdrant lookup and write-back are ONE multi-point call each — a
+        per-candidate thread hop + round trip used to cost pool-size × latency."""
         out: dict[str, list[float]] = {}
         unknown: list[Candidate] = []
         for cand in candidates:
             vec = self._local.get(cand.doc_id)
             if vec is not None:
+                self._local.move_to_end(cand.doc_id)
                 out[cand.doc_id] = vec
             else:
                 unknown.append(cand)
+        self.stats["local_hits"] += len(out)
 
         misses: list[Candidate] = []
         if unknown:
-            cached = await asyncio.gather(
-                *(asyncio.to_thread(qdrant.get_vector, c.doc_id) for c in unknown))
-            for cand, vec in zip(unknown, cached):
+            started = time.perf_counter()
+            cached = await asyncio.to_thread(qdrant.get_vectors, [c.doc_id for c in unknown])
+            self.stats["qdrant_get_ms"] += int((time.perf_counter() - started) * 1000)
+            for cand in unknown:
+                vec = cached.get(cand.doc_id)
                 if vec is not None:
-                    self._local[cand.doc_id] = vec
+                    self._remember(cand.doc_id, vec)
                     out[cand.doc_id] = vec
                 else:
                     misses.append(cand)
+            self.stats["qdrant_hits"] += len(unknown) - len(misses)
 
         if misses:
             segments = [f"{c.title}. {c.headline}"[:1500] for c in misses]
+            started = time.perf_counter()
             vectors = await asyncio.to_thread(self._embed_batch, segments, "RETRIEVAL_DOCUMENT")
+            self.stats["embed_ms"] += int((time.perf_counter() - started) * 1000)
             if vectors:
+                self.stats["embedded"] += len(vectors)
                 for cand, vec in zip(misses, vectors):
                     out[cand.doc_id] = vec
-                    self._local[cand.doc_id] = vec
-                await asyncio.gather(*(
-                    asyncio.to_thread(
-                        qdrant.put_vector, cand.doc_id, vec,
-                        {"title": cand.title, "court": cand.court, "year": cand.year})
-                    for cand, vec in zip(misses, vectors)))
+                    self._remember(cand.doc_id, vec)
+                started = time.perf_counter()
+                await asyncio.to_thread(qdrant.put_vectors, [
+                    (cand.doc_id, vec, {"title": cand.title, "court": cand.court, "year": cand.year})
+                    for cand, vec in zip(misses, vectors)])
+                self.stats["qdrant_put_ms"] += int((time.perf_counter() - started) * 1000)
+        logger.debug("[embed] %d candidate(s): local=%d qdrant=%d embedded=%d",
+                    len(candidates), len(candidates) - len(unknown),
+                    len(unknown) - len(misses), len(misses))
         return out
 
 
@@ -1707,21 +1798,97 @@ def judged_band(band: str, ai_relevance: float | None, judge_ran: bool) -> str:
     return band
 
 
+# ─── Session re-run memo ─────────────────────────────────────────────────────
+# Re-running a session (next IK page, curated queries) used to re-pay rerank
+# embeddings and a verifier call for every candidate it had already judged.
+# The memo keeps those per (issue hash, docId, model) under the session's
+# own memo key (SessionStore.save_run_memo — never in the session payload);
+# a run installs it for its task tree, like the cost tracker above.
+
+_MEMO_TABLES = ("semantic", "verifications")
+
+_run_memo: "contextvars.ContextVar[dict | None]" = contextvars.ContextVar(
+    "run_memo", default=None)
+
+
+def run_memo_start(stored: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Install the session's memo (as persisted by run_memo_export) for the
+    current run. Hit/miss counters start at zero every run."""
+    stored = stored if isinstance(stored, dict) else {}
+    memo: dict[str, Any] = {t: dict(stored.get(t) or {}) for t in _MEMO_TABLES}
+    memo["stats"] = Counter()
+    _run_memo.set(memo)
+    return memo
+
+
+def run_memo_export(memo: dict[str, Any]) -> dict[str, Any]:
+    """Persistable form, newest entries kept up to rerun_memo_max_entries
+    per table (dicts keep insertion order; hits are re-inserted on use)."""
+    cap = get_settings().rerun_memo_max_entries
+    return {t: dict(list(memo[t].items())[-cap:]) for t in _MEMO_TABLES}
+
+
+def memo_key(scope: str, doc_id: str, model: str) -> str:
+    """(issue hash, docId, model) key. scope is whatever text the memoised
+    result depends on — the issue text for rerank, the verifier's issue
+    block (issue + client context) for verdicts."""
+    return f"{hashlib.sha1(scope.encode()).hexdigest()[:16]}:{doc_id}:{model}"
+
+
+def memo_get(table: str, key: str, *, count: bool = True) -> Any:
+    """Memoised value or None. count=False leaves the hit/miss counters to
+    the caller, for a logical lookup that may try more than one key."""
+    memo = _run_memo.get()
+    if memo is None:
+        return None
+    value = memo[table].pop(key, None)
+    if value is not None:
+        memo[table][key] = value
+    if count:
+        memo_count(table, reused=value is not None)
+    return value
+
+
+def memo_count(table: str, *, reused: bool) -> None:
+    memo = _run_memo.get()
+    if memo is not None:
+        memo["stats"][f"{table}_{'reused' if reused else 'fresh'}"] += 1
+
+
+def memo_put(table: str, key: str, value: Any) -> None:
+    memo = _run_memo.get()
+    if memo is not None:
+        memo[table][key] = value
+
+
 async def rerank(issue_text: str, candidates: list[Candidate]) -> dict[str, float]:
     """Semantic closeness of each candidate segment to THIS issue (never the
     whole case; cross-issue precedents never compete). Returns doc_id →
-    cosine in [0, 1]."""
+    cosine in [0, 1]. Inside a re-run, scores memoised by an earlier run
+    are reused — a pool with no new candidates makes no embedding call."""
     if not candidates:
         return {}
-    issue_vec = await embedder.embed_query(issue_text)
-    vectors = await embedder.embed_candidates(candidates) if issue_vec else {}
+    model = get_settings().gemini_embedding_model
     scores: dict[str, float] = {}
+    fresh: list[Candidate] = []
     for cand in candidates:
+        known = memo_get("semantic", memo_key(issue_text, cand.doc_id, model))
+        if known is not None:
+            scores[cand.doc_id] = float(known)
+        else:
+            fresh.append(cand)
+    if not fresh:
+        return scores
+    issue_vec = await embedder.embed_query(issue_text)
+    vectors = await embedder.embed_candidates(fresh) if issue_vec else {}
+    for cand in fresh:
         vec = vectors.get(cand.doc_id)
         if issue_vec is not None and vec is not None:
             scores[cand.doc_id] = max(0.0, cosine(issue_vec, vec))
+            memo_put("semantic", memo_key(issue_text, cand.doc_id, model), scores[cand.doc_id])
         else:
-            # degraded lexical fallback — logged once per request by caller
+            # degraded lexical fallback — logged once per request by caller;
+            # never memoised, so a later run with embeddings back re-scores
             scores[cand.doc_id] = tf_cosine(issue_text, f"{cand.title}. {cand.headline}")
     return scores
 
@@ -1730,14 +1897,25 @@ def keyword_signal(candidate: Candidate, keywords: KeywordSet) -> float:
     """Deterministic lexical-fit signal: how many search terms hit this
     candidate, across how many of the four axes, plus a bonus when a
     high-precision anchor query (statute + doctrine combo) found it."""
-    matched = {t.lower() for t in candidate.matched_terms}
-    axes = [keywords.doctrinal, keywords.statutory, keywords.factual, keywords.outcome]
-    axes_hit = sum(1 for axis in axes if any(t.lower() in matched for t in axis))
-    total = len(keywords.all_terms()) or 1
-    coverage = min(1.0, len(matched) / min(6, total))
-    anchor_hit = any(a.strip().lower() in matched for a in keywords.anchor_queries)
-    score = 0.5 * (axes_hit / 4) + 0.35 * coverage + (0.15 if anchor_hit else 0.0)
-    return round(min(1.0, score), 4)
+    return keyword_signals([candidate], keywords)[0]
+
+
+def keyword_signals(candidates: list[Candidate], keywords: KeywordSet) -> list[float]:
+    """keyword_signal for a whole pool — the axis/anchor term sets are
+    lowered once per issue instead of once per candidate."""
+    axes = [{t.lower() for t in axis}
+            for axis in (keywords.doctrinal, keywords.statutory, keywords.factual, keywords.outcome)]
+    coverage_base = min(6, len(keywords.all_terms()) or 1)
+    anchors = {a.strip().lower() for a in keywords.anchor_queries}
+    out: list[float] = []
+    for cand in candidates:
+        matched = {t.lower() for t in cand.matched_terms}
+        axes_hit = sum(1 for axis in axes if not axis.isdisjoint(matched))
+        coverage = min(1.0, len(matched) / coverage_base)
+        anchor_hit = not anchors.isdisjoint(matched)
+        score = 0.5 * (axes_hit / 4) + 0.35 * coverage + (0.15 if anchor_hit else 0.0)
+        out.append(round(min(1.0, score), 4))
+    return out
 
 
 # ─── Precision layers (Section 9, Phase A/B) ─────────────────────────────────
@@ -1751,13 +1929,21 @@ _COURT_TIERS = (
 )
 
 
+@lru_cache(maxsize=4096)
+def _court_tier(court: str) -> tuple[int, float, str | None]:
+    """(bench rank, authority tier, tier name) for one IK docsource line.
+    Memoised: a pool repeats a few dozen distinct docsources, so the tier
+    regexes run once per court instead of once per candidate per sort."""
+    for idx, (pattern, value, name) in enumerate(_COURT_TIERS):
+        if pattern.search(court):
+            return idx, value, name
+    return len(_COURT_TIERS), 0.3, None
+
+
 def court_rank(court: str) -> int:
     """Bench-wise ordering rank: Supreme Court first, then Privy Council,
     High Courts, tribunals, district courts, everything else last."""
-    for idx, (pattern, _value, _name) in enumerate(_COURT_TIERS):
-        if pattern.search(court or ""):
-            return idx
-    return len(_COURT_TIERS)
+    return _court_tier(court or "")[0]
 
 
 # ─── Forum-state High Court focus ────────────────────────────────────────────
@@ -1921,11 +2107,8 @@ def authority_signal(candidate: Candidate) -> tuple[float, str]:
     """Court tier blended with citation-count-as-influence proxy. This is a
     reordering weight, never a filter — it can rank a strong lower-court
     match appropriately but can never bury it."""
-    tier, label = 0.3, (candidate.court or "Court")
-    for pattern, value, name in _COURT_TIERS:
-        if pattern.search(candidate.court or ""):
-            tier, label = value, name
-            break
+    _rank, tier, name = _court_tier(candidate.court or "")
+    label = name or candidate.court or "Court"
     influence = min(1.0, math.log10(1 + max(0, candidate.num_citedby)) / 3.0)
     return round(0.7 * tier + 0.3 * influence, 4), label
 
@@ -2062,6 +2245,189 @@ def fact_match_signal(candidate: Candidate, context: CaseContext) -> float | Non
     return None
 
 
+# ─── Per-document analysis (paragraph index for pinpoints + guardian) ───────
+
+_PARA_SPLIT_RE = re.compile(r"\n\s*\n|\n(?=\d{1,3}\.\s)")
+_PARA_REF_RE = re.compile(r"(\d{1,3})\.\s")  # .match(text, pos): anchored at pos
+_PINPOINT_STOPWORDS = frozenset({"the", "of", "and", "in", "a", "to", "is", "for", "under", "whether"})
+_ANALYSIS_VERSION = 1
+_ANALYSIS_OFFLOAD_CHARS = 64 * 1024
+
+
+class DocAnalysis:
+    """Everything pinpoint selection and the CitationGuardian need from one
+    judgment, built ONCE per document instead of once per issue × candidate:
+
+    - ``spans``/``refs``: offsets of the substantive paragraphs (> 120 chars
+      stripped) in the fetched text and their "para N" references;
+    - ``sizes`` + ``postings``: distinct-token count per paragraph and an
+      inverted index token → paragraph ids (len(postings[t]) is the df);
+    - ``norm``: the whitespace-normalized, lowercased text the guardian
+      checks against, with a sparse offset map back into the raw text.
+      Built lazily — only documents that carry a pinpoint need it."""
+
+    __slots__ = ("text", "spans", "refs", "sizes", "postings", "_norm", "_breaks")
+
+    def __init__(self, text: str, spans: list[tuple[int, int]],
+                 tokens: list[list[str]]) -> None:
+        self.text = text
+        self.spans = spans
+        self.refs: list[str] = []
+        self.sizes: list[int] = []
+        self.postings: dict[str, list[int]] = {}
+        for idx, ((start, _end), para_tokens) in enumerate(zip(spans, tokens)):
+            ref_match = _PARA_REF_RE.match(text, start)
+            self.refs.append(f"para {ref_match.group(1)}" if ref_match else f"para {idx + 1}")
+            self.sizes.append(len(para_tokens))
+            for tok in para_tokens:
+                self.postings.setdefault(tok, []).append(idx)
+        self._norm: str | None = None
+        self._breaks: tuple[list[int], list[int]] | None = None
+
+    @classmethod
+    def build(cls, text: str) -> "DocAnalysis":
+        spans: list[tuple[int, int]] = []
+        tokens: list[list[str]] = []
+        bounds = [0]
+        for sep in _PARA_SPLIT_RE.finditer(text):
+            bounds += [sep.start(), sep.end()]
+        bounds.append(len(text))
+        for start, end in zip(bounds[::2], bounds[1::2]):
+            para = text[start:end]
+            stripped = para.strip()
+            if len(stripped) <= 120:
+                continue
+            start += len(para) - len(para.lstrip())
+            spans.append((start, start + len(stripped)))
+            tokens.append(sorted(set(_tokens(stripped))))
+        return cls(text, spans, tokens)
+
+    # -- persisted form (doc_store, next to the judgment text) -------------
+
+    @staticmethod
+    def fingerprint(text: str) -> str:
+        return hashlib.sha1(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+    def to_json(self) -> dict[str, Any]:
+        inverse: list[list[str]] = [[] for _ in self.spans]
+        for tok, ids in self.postings.items():
+            for idx in ids:
+                inverse[idx].append(tok)
+        return {"v": _ANALYSIS_VERSION, "len": len(self.text), "sha1": self.fingerprint(self.text),
+                "spans": [list(s) for s in self.spans], "tokens": [" ".join(t) for t in inverse]}
+
+    @classmethod
+    def from_json(cls, data: Any, text: str) -> "DocAnalysis | None":
+        """None unless the stored index was built from exactly this text."""
+        if (not isinstance(data, dict) or data.get("v") != _ANALYSIS_VERSION
+                or data.get("len") != len(text) or data.get("sha1") != cls.fingerprint(text)):
+            return None
+        try:
+            spans = [(int(s), int(e)) for s, e in data["spans"]]
+            tokens = [t.split() for t in data["tokens"]]
+        except (KeyError, TypeError, ValueError):
+            return None
+        if len(spans) != len(tokens):
+            return None
+        return cls(text, spans, tokens)
+
+    # -- lookups -----------------------------------------------------------
+
+    def paragraph(self, idx: int) -> str:
+        start, end = self.spans[idx]
+        return self.text[start:end]
+
+    def best_paragraph(self, terms: set[str], min_overlap: int = 3) -> int | None:
+        """Paragraph with the highest overlap / sqrt(distinct tokens + 1),
+        first one winning ties — only paragraphs sharing a term are visited."""
+        overlap: Counter[int] = Counter()
+        for term in terms:
+            overlap.update(self.postings.get(term, ()))
+        best = max(((count / math.sqrt(self.sizes[idx] + 1), -idx)
+                    for idx, count in overlap.items() if count >= min_overlap), default=None)
+        return -best[1] if best else None
+
+    @property
+    def norm(self) -> str:
+        if self._norm is None:
+            self._norm = normalize_ws(self.text)
+        return self._norm
+
+    def contains(self, snippet: str) -> bool:
+        """The guardian's check: normalized snippet ⊂ normalized document."""
+        return bool(self.norm) and normalize_ws(snippet) in self.norm
+
+    def locate(self, snippet: str) -> tuple[int, int] | None:
+        """Raw-text span of the first whitespace/case-insensitive match of
+        ``snippet``, via the offset map; None when absent."""
+        needle = normalize_ws(snippet)
+        pos = self.norm.find(needle) if needle else -1
+        if pos < 0:
+            return None
+        return self._raw_offset(pos), self._raw_offset(pos + len(needle) - 1) + 1
+
+    def _raw_offset(self, norm_pos: int) -> int:
+        # Breakpoints only where raw and normalized text drift apart (a
+        # leading strip or a whitespace run other than one plain space), so
+        # the map stays small even for 2MB judgments.
+        if self._breaks is None:
+            starts, deltas, delta, out = [0], [0], 0, 0
+            for word in re.finditer(r"\S+", self.text):
+                if word.start() - out != delta:
+                    delta = word.start() - out
+                    starts.append(out)
+                    deltas.append(delta)
+                out += word.end() - word.start() + 1
+            self._breaks = (starts, deltas)
+        starts, deltas = self._breaks
+        return min(norm_pos + deltas[bisect.bisect_right(starts, norm_pos) - 1], len(self.text))
+
+
+_analyses: OrderedDict[str, tuple[int, DocAnalysis]] = OrderedDict()
+
+
+def _remember_analysis(key: str, text: str, analysis: DocAnalysis) -> DocAnalysis:
+    _analyses[key] = (hash(text), analysis)
+    _analyses.move_to_end(key)
+    while len(_analyses) > max(1, get_settings().doc_analysis_cache_size):
+        _analyses.popitem(last=False)
+    return analysis
+
+
+def doc_analysis(doc_id: str | None, text: str) -> DocAnalysis:
+    """Analysis of this judgment text from the process-local LRU, building
+    it on a miss. Entries are keyed by docId and validated against the text
+    itself (str hashes are cached on the object, so the check is O(1) for
+    the Candidate.doc_text every issue shares)."""
+    key = doc_id or f"#{hash(text)}"
+    hit = _analyses.get(key)
+    if hit is not None and hit[0] == hash(text) and hit[1].text == text:
+        _analyses.move_to_end(key)
+        return hit[1]
+    return _remember_analysis(key, text, DocAnalysis.build(text))
+
+
+async def warm_doc_analysis(doc_id: str, text: str, *, fresh: bool = False) -> None:
+    """Fetch-time warm-up: load the persisted index stored next to the text
+    (``ik:docidx:*``), or build it — off the loop for long judgments — and
+    persist it for other workers. ``fresh`` = the text was just downloaded,
+    so any stored index is stale by definition."""
+    key = f"ik:docidx:{doc_id}"
+    hit = _analyses.get(doc_id)
+    if hit is not None and hit[1].text == text:
+        return
+    analysis = None if fresh else DocAnalysis.from_json(await doc_store.aget_json(key), text)
+    if analysis is None:
+        if len(text) > _ANALYSIS_OFFLOAD_CHARS:
+            analysis = await asyncio.to_thread(DocAnalysis.build, text)
+            payload = await asyncio.to_thread(analysis.to_json)
+        else:
+            analysis = DocAnalysis.build(text)
+            payload = analysis.to_json()
+        await doc_store.aset_json(key, payload, ttl=7 * 86400)
+    _remember_analysis(doc_id, text, analysis)
+
+
 def find_pinpoint(candidate: Candidate, issue_text: str,
                   keywords: KeywordSet) -> tuple[str | None, str | None]:
     """Most on-point paragraph of the fetched judgment, with a pinpoint ref.
@@ -2072,28 +2438,16 @@ def find_pinpoint(candidate: Candidate, issue_text: str,
     text = candidate.doc_text
     if not text:
         return None, None
-    paragraphs = [p.strip() for p in re.split(r"\n\s*\n|\n(?=\d{1,3}\.\s)", text) if len(p.strip()) > 120]
-    if not paragraphs:
-        return None, None
+    analysis = doc_analysis(candidate.doc_id, text)
     issue_tokens = set(_tokens(issue_text)) | {t.lower() for t in keywords.all_terms()}
-    issue_tokens -= {"the", "of", "and", "in", "a", "to", "is", "for", "under", "whether"}
-    best_idx, best_score = -1, 0.0
-    for idx, para in enumerate(paragraphs):
-        para_tokens = set(_tokens(para))
-        overlap = len(issue_tokens & para_tokens)
-        if overlap >= 3:
-            score = overlap / math.sqrt(len(para_tokens) + 1)
-            if score > best_score:
-                best_idx, best_score = idx, score
-    if best_idx < 0:
+    best_idx = analysis.best_paragraph(issue_tokens - _PINPOINT_STOPWORDS)
+    if best_idx is None:
         return None, None
-    para = paragraphs[best_idx]
+    para = analysis.paragraph(best_idx)
     if len(para) > 500:  # trim at a word boundary, keep exact-substring property
         cut = para[:500]
         para = cut[:cut.rfind(" ")] if " " in cut else cut
-    ref_match = re.match(r"^(\d{1,3})\.\s", paragraphs[best_idx])
-    ref = f"para {ref_match.group(1)}" if ref_match else f"para {best_idx + 1}"
-    return para, ref
+    return para, analysis.refs[best_idx]
 
 
 # ─── Composite scoring (Section 8 — exact formula) ───────────────────────────
@@ -2120,6 +2474,29 @@ def composite_score(signals: SignalSet, phase_weights: dict[str, float]) -> Scor
     return ScoredResult(doc_id="", score=round(score, 4), red_flag=False, breakdown=signals)
 
 
+_WEIGHT_COLUMNS = ("semantic", "keyword", "authority", "good_law", "party", "fact")
+
+
+def composite_scores(signal_sets: list[SignalSet],
+                     phase_weights: dict[str, float]) -> list[ScoredResult]:
+    """composite_score for a whole pool in one pass: one column per
+    weighted signal, the weights applied as a single array op and the
+    good-law gate as a mask. Columns are summed in the formula's order, so
+    every score is identical to composite_score's; each result still
+    carries its own SignalSet as the breakdown."""
+    if not signal_sets:
+        return []
+    columns = np.array([(s.semantic_match, s.keyword_match, s.authority or 0.0,
+                         s.good_law_status or 0.0, s.party_fit or 0.0, s.fact_match or 0.0)
+                        for s in signal_sets], dtype=np.float64)
+    weights = np.array([phase_weights[k] for k in _WEIGHT_COLUMNS], dtype=np.float64)
+    scores = (columns * weights).sum(axis=1)
+    overruled = np.array([s.good_law_status_label == "overruled" for s in signal_sets])
+    scores = np.where(overruled, np.minimum(scores, get_settings().good_law_gate_cap), scores)
+    return [ScoredResult(doc_id="", score=round(score, 4), red_flag=flag, breakdown=signals)
+            for score, flag, signals in zip(scores.tolist(), overruled.tolist(), signal_sets)]
+
+
 # ─── Citation Guardian (Section 1 — THE load-bearing safety component) ───────
 
 class CitationGuardian:
@@ -2150,9 +2527,8 @@ class CitationGuardian:
                 )
                 continue
             if result.pinpoint:
-                doc_norm = normalize_ws(candidate.doc_text or "")
-                pin_norm = normalize_ws(result.pinpoint)
-                if not doc_norm or pin_norm not in doc_norm:
+                text = candidate.doc_text or ""
+                if not text or not doc_analysis(candidate.doc_id, text).contains(result.pinpoint):
                     drops.append({"docId": result.doc_id, "reason": "pinpoint_not_in_document"})
                     logger.error(
                         "[CitationGuardian] DROP %s — pinpoint text not found in "